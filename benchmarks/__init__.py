@@ -0,0 +1,3 @@
+"""Micro-benchmarks for performance-sensitive picker code paths."""
+
+__all__: list[str] = []
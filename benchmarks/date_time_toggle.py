@@ -0,0 +1,67 @@
+"""
+Time Date / Custom range toggles with rebuilt versus stacked input layouts.
+
+Run with ``QT_QPA_PLATFORM=offscreen python -m benchmarks.date_time_toggle``.
+For both ``RenderingOptions.stacked_date_time_inputs`` settings the benchmark
+switches one shown picker between ``DATE`` and ``CUSTOM_RANGE`` and flushes
+each switch with ``processEvents`` and the deferred deletes it queued, so
+widget construction, teardown, layout and repainting are all included. The
+first switch into each mode is reported separately because stacked layouts
+build a mode's inputs on first use.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication
+
+from date_range_popover import DatePickerConfig, DateRangePicker, PickerMode, RenderingOptions
+
+
+def _switch(app: QApplication, picker: DateRangePicker, mode: PickerMode) -> float:
+    started = time.perf_counter()
+    picker.set_mode(mode)
+    app.processEvents()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    return (time.perf_counter() - started) * 1000
+
+
+def _measure(app: QApplication, *, stacked: bool, toggles: int) -> None:
+    picker = DateRangePicker(
+        DatePickerConfig(rendering=RenderingOptions(stacked_date_time_inputs=stacked))
+    )
+    picker.show()
+    app.processEvents()
+
+    first = _switch(app, picker, PickerMode.CUSTOM_RANGE)
+    samples: dict[PickerMode, list[float]] = {PickerMode.DATE: [], PickerMode.CUSTOM_RANGE: []}
+    samples[PickerMode.DATE].append(_switch(app, picker, PickerMode.DATE))
+    for _ in range(toggles):
+        for mode in (PickerMode.CUSTOM_RANGE, PickerMode.DATE):
+            samples[mode].append(_switch(app, picker, mode))
+
+    print("stacked layouts:" if stacked else "rebuilt layouts:")
+    print(f"  first switch to custom range   {first:7.3f} ms")
+    for mode, values in samples.items():
+        label = f"switch to {mode.name.lower().replace('_', ' ')}"
+        print(f"  {label:30s} mean {sum(values) / len(values):7.3f} ms")
+    picker.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--toggles", type=int, default=50, help="round trips per setting")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    assert isinstance(app, QApplication)
+    for stacked in (False, True):
+        _measure(app, stacked=stacked, toggles=args.toggles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare day-state computation strategies for one and many month grids.
+
+Run with ``python -m benchmarks.day_flags``. The ``legacy`` row reproduces the
+original per-cell loop (42 ``QDate`` objects from ``addDays`` plus
+``qdate_is_before``/``qdate_is_after`` per cell); the other rows feed the
+cached :class:`MonthLayout` integers into :func:`compute_day_flags`. The NumPy
+row is only printed when the optional ``numpy`` extra is installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from array import array
+from collections.abc import Callable
+
+from date_range_popover.core.day_grid import compute_day_flags, numpy_available
+from date_range_popover.utils import month_layout, qdate_is_after, qdate_is_before
+from PySide6.QtCore import QDate
+
+_TODAY = QDate(2024, 6, 20)
+_SELECTED = QDate(2024, 6, 14)
+_RANGE = (QDate(2024, 6, 3), QDate(2024, 6, 11))
+_BOUNDS = (QDate(2023, 1, 1), QDate(2025, 12, 31))
+
+
+def _legacy(months: list[QDate]) -> None:
+    start, end = _RANGE
+    min_date, max_date = _BOUNDS
+    for visible in months:
+        first = QDate(visible.year(), visible.month(), 1)
+        grid_start = first.addDays(-((first.dayOfWeek() - 1) % 7))
+        for index in range(42):
+            day = grid_start.addDays(index)
+            _ = day.month() == visible.month() and day.year() == visible.year()
+            _ = day.toJulianDay() == _SELECTED.toJulianDay()
+            _ = qdate_is_before(day, min_date) or qdate_is_after(day, max_date)
+            julian = day.toJulianDay()
+            _ = julian == start.toJulianDay() or julian == end.toJulianDay()
+            _ = start.toJulianDay() < julian < end.toJulianDay()
+            _ = day.toJulianDay() == _TODAY.toJulianDay()
+
+
+def _batched(months: list[QDate], *, use_numpy: bool) -> Callable[[], None]:
+    julian_days: array[int] = array("q")
+    in_month: array[int] = array("b")
+    for visible in months:
+        layout = month_layout(visible.year(), visible.month())
+        julian_days.extend(layout.julian_days)
+        in_month.extend(layout.in_month)
+    start, end = _RANGE
+    min_date, max_date = _BOUNDS
+
+    def run() -> None:
+        compute_day_flags(
+            julian_days,
+            in_month,
+            selected=_SELECTED.toJulianDay(),
+            today=_TODAY.toJulianDay(),
+            range_start=start.toJulianDay(),
+            range_end=end.toJulianDay(),
+            min_julian=min_date.toJulianDay(),
+            max_julian=max_date.toJulianDay(),
+            use_numpy=use_numpy,
+        )
+
+    return run
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--number", type=int, default=2000, help="iterations per timing")
+    args = parser.parse_args(argv)
+
+    for month_count in (1, 12):
+        months = [QDate(2024, 1, 1).addMonths(offset) for offset in range(month_count)]
+        cases: dict[str, Callable[[], None]] = {
+            "legacy": lambda months=months: _legacy(months),
+            "python": _batched(months, use_numpy=False),
+        }
+        if numpy_available():
+            cases["numpy"] = _batched(months, use_numpy=True)
+        print(f"{month_count} month(s), {month_count * 42} cells:")
+        for name, func in cases.items():
+            seconds = timeit.timeit(func, number=args.number)
+            print(f"  {name:<8} {seconds / args.number * 1e6:9.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
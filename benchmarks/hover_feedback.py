@@ -0,0 +1,80 @@
+"""
+Time hover feedback with per-state stylesheets versus palette states.
+
+Run with ``QT_QPA_PLATFORM=offscreen python -m benchmarks.hover_feedback``.
+For both ``RenderingOptions.palette_states`` settings the benchmark sends
+Enter/Leave pairs to the button strip buttons, the date/time inputs and the
+visible day cells of one picker, and flushes each pair with ``processEvents``
+so restyling, polishing and repainting are all included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, cast
+
+from PySide6.QtCore import QEvent, QPointF
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from date_range_popover import DatePickerConfig, DateRangePicker, PickerMode, RenderingOptions
+
+
+def _hover(app: QApplication, widget: QWidget) -> float:
+    point = QPointF(widget.rect().center())
+    started = time.perf_counter()
+    app.sendEvent(widget, QEnterEvent(point, point, widget.mapToGlobal(point)))
+    app.processEvents()
+    app.sendEvent(widget, QEvent(QEvent.Type.Leave))
+    app.processEvents()
+    return (time.perf_counter() - started) * 1000
+
+
+def _measure(app: QApplication, *, palette_states: bool, sweeps: int) -> None:
+    picker = DateRangePicker(
+        DatePickerConfig(rendering=RenderingOptions(palette_states=palette_states))
+    )
+    picker.show()
+    picker.set_mode(PickerMode.CUSTOM_RANGE)
+    app.processEvents()
+
+    internals = cast(Any, picker)
+    targets: dict[str, list[QWidget]] = {
+        "button strip": [
+            internals._button_strip.date_button,
+            internals._button_strip.custom_range_button,
+        ],
+        "inputs": [
+            *internals._date_time_selector._date_inputs,
+            *internals._date_time_selector._time_inputs,
+        ],
+        "day cells": [
+            cell._button
+            for cell in internals._calendar._day_view._cells
+            if cell._button.isVisible()
+        ],
+    }
+
+    label = "palette states" if palette_states else "stylesheets"
+    print(f"{label}:")
+    for name, widgets in targets.items():
+        samples = [_hover(app, widget) for _ in range(sweeps) for widget in widgets]
+        print(f"  {name:13s} enter+leave mean {sum(samples) / len(samples):6.3f} ms")
+    picker.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--sweeps", type=int, default=20, help="hover passes per widget")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    assert isinstance(app, QApplication)
+    for palette_states in (False, True):
+        _measure(app, palette_states=palette_states, sweeps=args.sweeps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Time rasterising a theme's icons one by one versus through an icon atlas.
+
+Run with ``QT_QPA_PLATFORM=offscreen python -m benchmarks.icon_atlas``. At
+device pixel ratios 1, 1.5 and 2 the benchmark renders every icon variant a
+default picker uses, first as separate pixmaps and then as a single atlas that
+the variants are cut from, starting from empty icon caches each repeat.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from date_range_popover.api.picker import CLOSE_ICON_PATH
+from date_range_popover.api.picker_layouts import picker_icon_variants
+from date_range_popover.styles.theme import ColorPalette
+from date_range_popover.utils.icon_atlas import IconAtlas, IconVariant
+from date_range_popover.utils.svg_loader import SvgIconCache, clear_icon_cache
+from PySide6.QtWidgets import QApplication
+
+_RATIOS = (1.0, 1.5, 2.0)
+
+
+def _individual(variants: tuple[IconVariant, ...], dpr: float) -> float:
+    clear_icon_cache()
+    cache = SvgIconCache()
+    started = time.perf_counter()
+    for variant in variants:
+        cache.pixmap(variant.source, variant.size, variant.color, dpr)
+    return (time.perf_counter() - started) * 1000
+
+
+def _atlas(variants: tuple[IconVariant, ...], dpr: float) -> float:
+    clear_icon_cache()
+    started = time.perf_counter()
+    atlas = IconAtlas(variants, dpr)
+    for variant in variants:
+        atlas.cut(variant)
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--repeats", type=int, default=50, help="renders per ratio and mode")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    assert isinstance(app, QApplication)
+    variants = picker_icon_variants(ColorPalette(), close_icon_path=CLOSE_ICON_PATH)
+    print(f"{len(variants)} icon variants")
+    for dpr in _RATIOS:
+        for name, measure in (("individual", _individual), ("atlas", _atlas)):
+            samples = [measure(variants, dpr) for _ in range(args.repeats)]
+            print(f"  {dpr:3.1f}x {name:10s} mean {sum(samples) / len(samples):6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Check cold import times of the package against a budget.
+
+Run with ``python -m benchmarks.import_time``. Each scenario is imported in
+fresh interpreters and the median wall time of the import statement is
+compared with its budget; the command exits with status 1 when any scenario
+is over budget, so it can gate CI. Scenarios that need Qt budget only the
+package's overhead: the median of their baseline statement, measured in the
+same run, is subtracted first so a slower machine or Qt build does not fail
+the check. ``--profile`` adds the slowest modules of each scenario as
+reported by ``python -X importtime``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import NamedTuple
+
+
+class Scenario(NamedTuple):
+    name: str
+    statement: str
+    budget_ms: float
+    baseline: str | None = None
+
+
+QT_CORE_BASELINE = "import PySide6.QtCore"
+
+SCENARIOS = (
+    Scenario("package", "import date_range_popover", 50.0),
+    Scenario(
+        "headless",
+        "from date_range_popover import DateRange, PickerMode; "
+        "import date_range_popover.core.state_logic",
+        50.0,
+        baseline=QT_CORE_BASELINE,
+    ),
+)
+
+_TIMER = "import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+
+
+def cold_import_ms(statement: str) -> float:
+    """Return the wall time of ``statement`` in a fresh interpreter, in milliseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(completed.stdout.strip()) * 1000
+
+
+def median_import_ms(statement: str, repeats: int) -> float:
+    """Return the median of ``repeats`` cold imports of ``statement``, in milliseconds."""
+    return statistics.median(cold_import_ms(statement) for _ in range(repeats))
+
+
+def slowest_modules(statement: str, limit: int = 8) -> list[tuple[str, int]]:
+    """Return the ``limit`` modules with the highest self time (µs) under ``-X importtime``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    timings = []
+    for line in completed.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            timings.append((fields[2].strip(), int(fields[0])))
+    return sorted(timings, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--repeats", type=int, default=7, help="fresh interpreters per scenario")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget")
+    parser.add_argument("--profile", action="store_true", help="list the slowest modules")
+    args = parser.parse_args(argv)
+
+    baselines: dict[str, float] = {}
+    over_budget = False
+    for scenario in SCENARIOS:
+        median = median_import_ms(scenario.statement, args.repeats)
+        cost, detail = median, ""
+        if scenario.baseline is not None:
+            if scenario.baseline not in baselines:
+                baselines[scenario.baseline] = median_import_ms(scenario.baseline, args.repeats)
+            baseline = baselines[scenario.baseline]
+            cost = median - baseline
+            detail = f"  ({median:.1f} ms - {baseline:.1f} ms for {scenario.baseline!r})"
+        budget = scenario.budget_ms * args.scale
+        status = "ok" if cost <= budget else "OVER BUDGET"
+        over_budget = over_budget or cost > budget
+        print(
+            f"{scenario.name:9s} median {cost:7.1f} ms  budget {budget:6.1f} ms  {status}{detail}"
+        )
+        if args.profile:
+            for module, self_us in slowest_modules(scenario.statement):
+                print(f"    {self_us / 1000:7.2f} ms  {module}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
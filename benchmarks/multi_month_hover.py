@@ -0,0 +1,68 @@
+"""
+Time range-preview hover updates on a :class:`MultiMonthCalendar`.
+
+Run with ``python -m benchmarks.multi_month_hover`` (set
+``QT_QPA_PLATFORM=offscreen`` on headless machines). After anchoring a range
+start, the benchmark sweeps the pointer across every visible day and reports
+the mean and worst cost of one preview update—flag recomputation, diffing and
+the resulting partial repaint—against a 60 Hz frame budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from date_range_popover.components.calendar import MultiMonthCalendar
+from PySide6.QtCore import QDate, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication
+
+_FRAME_BUDGET_MS = 1000 / 60
+
+
+def _mouse_event(
+    calendar: MultiMonthCalendar,
+    index: int,
+    kind: QMouseEvent.Type,
+    button: Qt.MouseButton = Qt.MouseButton.NoButton,
+) -> QMouseEvent:
+    point = QPointF(calendar.cell_rect(index).center())
+    return QMouseEvent(
+        kind, point, calendar.mapToGlobal(point), button, button, Qt.KeyboardModifier.NoModifier
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--months", type=int, default=12, help="visible months")
+    parser.add_argument("--columns", type=int, default=4, help="months per row")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    calendar = MultiMonthCalendar(months=args.months, columns=args.columns)
+    calendar.set_first_month(QDate(2024, 1, 1))
+    calendar.show()
+    app.processEvents()
+
+    # Anchor the range on a mid-month cell of the first month.
+    press = _mouse_event(calendar, 16, QMouseEvent.Type.MouseButtonPress, Qt.MouseButton.LeftButton)
+    calendar.mousePressEvent(press)
+    calendar.mouseReleaseEvent(press)
+
+    samples: list[float] = []
+    for index in range(args.months * 42):
+        event = _mouse_event(calendar, index, QMouseEvent.Type.MouseMove)
+        started = time.perf_counter()
+        calendar.mouseMoveEvent(event)
+        app.processEvents()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    mean = sum(samples) / len(samples)
+    print(f"{args.months} month(s), {len(samples)} hover updates:")
+    print(f"  mean  {mean:7.2f} ms")
+    print(f"  worst {max(samples):7.2f} ms (frame budget {_FRAME_BUDGET_MS:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
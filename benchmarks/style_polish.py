@@ -0,0 +1,83 @@
+"""
+Compare per-widget stylesheets with the compiled picker stylesheet.
+
+Run with ``QT_QPA_PLATFORM=offscreen python -m benchmarks.style_polish``. For
+both ``RenderingOptions.compiled_stylesheet`` settings the benchmark reports
+how many widgets carry a stylesheet of their own, the cost of building and
+polishing a picker, and the cost of a range selection that restyles most of
+the day grid, each step flushed with ``processEvents`` so polishing and
+repainting are included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from PySide6.QtCore import QDate, QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from date_range_popover import DatePickerConfig, DateRangePicker, PickerMode, RenderingOptions
+
+
+def _own_stylesheets(picker: DateRangePicker) -> int:
+    return sum(1 for widget in picker.findChildren(QWidget) if widget.styleSheet())
+
+
+def _dispose(app: QApplication, picker: DateRangePicker) -> None:
+    # ``processEvents`` does not run deferred deletes; flush them explicitly so
+    # earlier pickers (and their application event filters) do not pile up.
+    picker.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _measure(app: QApplication, *, compiled: bool, pickers: int, steps: int) -> None:
+    config = DatePickerConfig(rendering=RenderingOptions(compiled_stylesheet=compiled))
+
+    build_ms: list[float] = []
+    picker: DateRangePicker | None = None
+    for _ in range(pickers):
+        if picker is not None:
+            _dispose(app, picker)
+        started = time.perf_counter()
+        picker = DateRangePicker(config)
+        picker.show()
+        app.processEvents()
+        build_ms.append((time.perf_counter() - started) * 1000)
+    assert picker is not None
+    picker.set_mode(PickerMode.CUSTOM_RANGE)
+
+    # The default configuration caps selections at today, so use the previous month.
+    month = QDate.currentDate().addMonths(-1)
+    first = QDate(month.year(), month.month(), 1)
+    toggle_ms: list[float] = []
+    for step in range(steps):
+        # Alternate between a long and a short range so most cells change state.
+        end = first.addDays(20 if step % 2 == 0 else 2)
+        started = time.perf_counter()
+        picker.select_range(first, end)
+        app.processEvents()
+        toggle_ms.append((time.perf_counter() - started) * 1000)
+
+    label = "compiled" if compiled else "per-widget"
+    print(f"{label}:")
+    print(f"  widgets with their own stylesheet {_own_stylesheets(picker):5d}")
+    print(f"  build + first polish  mean {sum(build_ms) / len(build_ms):7.2f} ms")
+    print(f"  range restyle         mean {sum(toggle_ms) / len(toggle_ms):7.2f} ms")
+    _dispose(app, picker)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--pickers", type=int, default=10, help="pickers built per mode")
+    parser.add_argument("--steps", type=int, default=50, help="range selections per mode")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    assert isinstance(app, QApplication)
+    for compiled in (False, True):
+        _measure(app, compiled=compiled, pickers=args.pickers, steps=args.steps)
+
+
+if __name__ == "__main__":
+    main()
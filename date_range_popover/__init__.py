@@ -1,10 +1,58 @@
-from .api import DatePickerConfig, DateRange, DateRangePicker, PickerMode
-from .date_range_popover import DateRangePopover
+"""
+Date range popover widgets for PySide6.
+
+Public names are imported on first access (PEP 562), so headless code that
+only needs :class:`DateRange`, :class:`PickerMode` or the ``core`` helpers
+does not load the Qt widget or SVG modules.
+"""
+
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .api import (
+        DatePickerConfig,
+        DateRange,
+        DateRangePicker,
+        DateRangePickerPool,
+        PickerMode,
+        PickerPoolStats,
+        RenderingOptions,
+    )
+    from .date_range_popover import DateRangePopover
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DateRangePopover": ".date_range_popover",
+        "DateRangePicker": ".api",
+        "DateRangePickerPool": ".api",
+        "PickerPoolStats": ".api",
+        "DatePickerConfig": ".api.config",
+        "DateRange": ".api.config",
+        "PickerMode": ".api.config",
+        "RenderingOptions": ".api.config",
+        "animation": ".animation",
+        "api": ".api",
+        "components": ".components",
+        "core": ".core",
+        "exceptions": ".exceptions",
+        "managers": ".managers",
+        "styles": ".styles",
+        "types": ".types",
+        "utils": ".utils",
+        "validation": ".validation",
+    },
+)
 
 __all__ = [
     "DateRangePopover",
     "DateRangePicker",
+    "DateRangePickerPool",
+    "PickerPoolStats",
     "DatePickerConfig",
     "DateRange",
     "PickerMode",
+    "RenderingOptions",
 ]
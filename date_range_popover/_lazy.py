@@ -0,0 +1,53 @@
+"""
+PEP 562 helpers for package ``__init__`` modules that import exports on demand.
+
+Package initialisers declare which submodule provides each public name and
+install the returned ``__getattr__``/``__dir__`` pair. Nothing is imported
+until a name is first accessed, so importing :mod:`date_range_popover` for
+``DateRange`` or ``PickerMode`` never loads the Qt widget, GUI or SVG modules.
+Static type checkers keep seeing the real names through ``TYPE_CHECKING``
+imports next to the mapping.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` for ``package``.
+
+    Args:
+        package: ``__name__`` of the package installing the hooks.
+        exports: Public name to relative module path (``".picker"``). A name
+            equal to its module's last component (``"constants"`` for
+            ``".constants"``) resolves to the submodule itself.
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package namespace. Resolved
+        names are cached in the package so each is imported once.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        module = importlib.import_module(module_name, package)
+        value = module if module_name.rpartition(".")[2] == name else getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+__all__ = ["lazy_exports"]
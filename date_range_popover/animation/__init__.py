@@ -1,5 +1,15 @@
 """Animation helpers for the date range picker."""
 
-from .slide_animator import AnimationStrategy, SlideAnimator
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .slide_animator import AnimationStrategy, SlideAnimator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"AnimationStrategy": ".slide_animator", "SlideAnimator": ".slide_animator"},
+)
 
 __all__ = ["AnimationStrategy", "SlideAnimator"]
@@ -1,6 +1,33 @@
 """Public API for the date range picker."""
 
-from .config import DatePickerConfig, DateRange, PickerMode
-from .picker import DateRangePicker
+from typing import TYPE_CHECKING
 
-__all__ = ["DateRangePicker", "DatePickerConfig", "DateRange", "PickerMode"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import DatePickerConfig, DateRange, PickerMode, RenderingOptions
+    from .picker import DateRangePicker
+    from .pool import DateRangePickerPool, PickerPoolStats
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DateRangePicker": ".picker",
+        "DateRangePickerPool": ".pool",
+        "PickerPoolStats": ".pool",
+        "DatePickerConfig": ".config",
+        "DateRange": ".config",
+        "PickerMode": ".config",
+        "RenderingOptions": ".config",
+    },
+)
+
+__all__ = [
+    "DateRangePicker",
+    "DateRangePickerPool",
+    "PickerPoolStats",
+    "DatePickerConfig",
+    "DateRange",
+    "PickerMode",
+    "RenderingOptions",
+]
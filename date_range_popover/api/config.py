@@ -11,6 +11,7 @@ from ..utils import qdate_is_after, qdate_is_before
 from ..validation import validate_date_range, validate_dimension, validate_qdate
 
 _DEFAULT_LAYOUT = LayoutConfig()
+MAX_PREFETCH_MONTHS = 12
 
 
 @dataclass(slots=True)
@@ -74,6 +75,81 @@ class DateRange:
             raise InvalidConfigurationError(f"{field_name} is not a valid time: {value}")
 
 
+@dataclass(frozen=True, slots=True)
+class RenderingOptions:
+    """
+    Opt-in rendering strategies for hosts that embed many pickers.
+
+    Every option defaults to the classic widget-per-element behaviour, so
+    existing embedders see no visual or behavioural change unless they opt in.
+
+    Args:
+        painted_day_grid: Render the day grid with a single painted widget
+            instead of 42 ``CalendarDayCell`` widgets.
+        prefetch_months: Number of months on either side of the visible one
+            whose day states (and painted grids) are computed during idle time
+            so previous/next navigation is instant. ``0`` disables prefetching.
+        prebuild_calendar_views: Build the month and year views during idle
+            time right after the calendar is first shown instead of on the
+            first header click.
+        scrollable_year_picker: Replace the paged year grid with a scrollable,
+            model-backed year list that only paints visible rows and accepts a
+            typed year.
+        compiled_stylesheet: Style the picker with one stylesheet compiled from
+            the theme and set on the picker root; components switch state by
+            flipping dynamic properties instead of replacing their own
+            stylesheets.
+        palette_states: Paint the hover, focus and selection states of the
+            button strip, the inputs and the widget-backed day cells directly,
+            using ``QColor`` objects looked up once per colour token and shared
+            across the process (:func:`~date_range_popover.styles.state_colors.state_color`),
+            so a state change is a repaint instead of a stylesheet re-parse.
+            Cannot be combined with ``compiled_stylesheet``.
+        stacked_date_time_inputs: Build the date/time input rows of each mode
+            once, on first use, and keep them on separate pages; switching
+            between ``DATE`` and ``CUSTOM_RANGE`` then only swaps the visible
+            page instead of rebuilding the inputs.
+
+    Raises:
+        InvalidConfigurationError: If an option has the wrong type.
+    """
+
+    painted_day_grid: bool = False
+    prefetch_months: int = 0
+    prebuild_calendar_views: bool = False
+    scrollable_year_picker: bool = False
+    compiled_stylesheet: bool = False
+    palette_states: bool = False
+    stacked_date_time_inputs: bool = False
+
+    def __post_init__(self) -> None:
+        """Reject wrongly typed options so typos in settings files fail loudly."""
+        if not isinstance(self.painted_day_grid, bool):
+            raise InvalidConfigurationError("painted_day_grid must be a bool")
+        if (
+            isinstance(self.prefetch_months, bool)
+            or not isinstance(self.prefetch_months, int)
+            or not 0 <= self.prefetch_months <= MAX_PREFETCH_MONTHS
+        ):
+            raise InvalidConfigurationError(
+                f"prefetch_months must be an integer between 0 and {MAX_PREFETCH_MONTHS}"
+            )
+        if not isinstance(self.prebuild_calendar_views, bool):
+            raise InvalidConfigurationError("prebuild_calendar_views must be a bool")
+        if not isinstance(self.scrollable_year_picker, bool):
+            raise InvalidConfigurationError("scrollable_year_picker must be a bool")
+        if not isinstance(self.compiled_stylesheet, bool):
+            raise InvalidConfigurationError("compiled_stylesheet must be a bool")
+        if not isinstance(self.palette_states, bool):
+            raise InvalidConfigurationError("palette_states must be a bool")
+        if not isinstance(self.stacked_date_time_inputs, bool):
+            raise InvalidConfigurationError("stacked_date_time_inputs must be a bool")
+        if self.palette_states and self.compiled_stylesheet:
+            raise InvalidConfigurationError(
+                "palette_states cannot be combined with compiled_stylesheet"
+            )
+
+
 @dataclass(slots=True)
 class DatePickerConfig:
     """
@@ -97,6 +173,7 @@ class DatePickerConfig:
         max_date: Absolute upper bound for selection/navigation. Defaults to
             ``QDate.currentDate()`` when omitted to prevent future selections.
         time_step_minutes: Step interval for the time selector component.
+        rendering: :class:`RenderingOptions` selecting opt-in rendering paths.
 
     Raises:
         InvalidConfigurationError: For any inconsistent value (dimensions out of
@@ -120,6 +197,7 @@ class DatePickerConfig:
     min_date: QDate | None = None
     max_date: QDate | None = None
     time_step_minutes: int = 15
+    rendering: RenderingOptions = field(default_factory=RenderingOptions)
 
     def __post_init__(self) -> None:
         """
@@ -159,6 +237,9 @@ class DatePickerConfig:
         theme_value = object.__getattribute__(self, "theme")
         if not isinstance(theme_value, Theme):
             raise InvalidConfigurationError("theme must be an instance of Theme")
+        rendering_value = object.__getattribute__(self, "rendering")
+        if not isinstance(rendering_value, RenderingOptions):
+            raise InvalidConfigurationError("rendering must be an instance of RenderingOptions")
         self.min_date = validate_qdate(self.min_date, field_name="min_date", allow_none=True)
         max_candidate = validate_qdate(self.max_date, field_name="max_date", allow_none=True)
         self.max_date = max_candidate or QDate.currentDate()
@@ -189,4 +270,23 @@ class DatePickerConfig:
             raise InvalidConfigurationError(f"{field_name} must be on or before max_date")
 
 
-__all__ = ["DatePickerConfig", "DateRange", "PickerMode"]
+def is_reconfigurable(current: DatePickerConfig, target: DatePickerConfig) -> bool:
+    """
+    Return whether a picker built from ``current`` can be reconfigured to ``target``.
+
+    ``rendering`` and ``time_step_minutes`` decide which widgets are built, so
+    only configurations that agree on both can share a widget tree.
+    """
+    return (
+        current.rendering == target.rendering
+        and current.time_step_minutes == target.time_step_minutes
+    )
+
+
+__all__ = [
+    "DatePickerConfig",
+    "DateRange",
+    "PickerMode",
+    "RenderingOptions",
+    "is_reconfigurable",
+]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from PySide6.QtCore import QDate, Qt, QTime, Signal
+from PySide6.QtCore import QDate, QEvent, Qt, QTime, Signal
 from PySide6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
 
 from ..animation import AnimationStrategy, SlideAnimator
@@ -10,25 +12,45 @@ from ..components.buttons import BasicButton, ButtonStrip
 from ..components.calendar import CalendarWidget
 from ..components.inputs import CUSTOM_DATE_RANGE, GO_TO_DATE, DateTimeSelector
 from ..components.layout import DraggableHeaderStrip, SlidingTrackIndicator
+from ..exceptions import InvalidConfigurationError
 from ..managers.coordinator import DatePickerCoordinator
 from ..managers.state_manager import DatePickerStateManager, PickerMode
 from ..managers.style_manager import StyleManager
+from ..styles.compiled_qss import ROOT_OBJECT_NAME
 from ..styles.style_registry import StyleRegistry
+from ..styles.style_templates import container_qss, divider_qss
+from ..styles.theme import Theme
+from ..styles.theme_diff import ThemeDiff, ThemeTarget, diff_themes
 from ..types.selection import SelectionCallback, SelectionSnapshot
 from ..utils import connect_signal, get_logger
-from .config import DatePickerConfig, DateRange
+from ..utils.icon_atlas import IconAtlas, icon_atlas
+from .config import DatePickerConfig, DateRange, is_reconfigurable
 from .picker_layouts import (
+    apply_close_icon,
     build_actions_section,
     build_button_section,
     build_content_container,
     build_divider,
     build_header_layout,
+    picker_icon_variants,
+    style_close_button,
 )
 
 LOGGER = get_logger(__name__)
 
 CLOSE_ICON_PATH = Path(__file__).resolve().parents[1] / "assets" / "cross.svg"
 
+# Events after which the window may sit on a screen with another device pixel
+# ratio. ``DevicePixelRatioChange`` only exists from Qt 6.6.
+_SCREEN_CHANGE_EVENTS = frozenset(
+    event_type
+    for event_type in (
+        QEvent.Type.ScreenChangeInternal,
+        getattr(QEvent.Type, "DevicePixelRatioChange", None),
+    )
+    if event_type is not None
+)
+
 
 class DateRangePicker(QWidget):
     """
@@ -85,7 +107,7 @@ class DateRangePicker(QWidget):
 
         self._config = config or DatePickerConfig()
 
-        registry = StyleRegistry(self._config.theme)
+        registry = StyleRegistry.shared(self._config.theme)
         self._style_manager = StyleManager(registry)
         self._layout_config = self._config.theme.layout
         self._state_manager = DatePickerStateManager(
@@ -93,17 +115,30 @@ class DateRangePicker(QWidget):
             max_date=self._config.max_date,
         )
         self._coordinator = DatePickerCoordinator(self._state_manager, self._style_manager)
+        # Every icon variant of the theme, rasterised once at this screen's DPR;
+        # the icon cache cuts the components' icons out of it.
+        self._icon_atlas = self._build_icon_atlas()
         self._animator: AnimationStrategy = SlideAnimator(parent=self)
         self._current_track_position = 0
         self._current_track_width = self._layout_config.date_indicator_width
         self._selection_callbacks: list[SelectionCallback] = []
+        self._batch_depth = 0
+        self._batch_restore_updates = True
 
         self._header_strip = DraggableHeaderStrip(self, palette=self._style_manager.theme.palette)
-        self._button_strip = ButtonStrip(self, layout_config=self._layout_config)
+        compiled_style = self._config.rendering.compiled_stylesheet
+        palette_states = self._config.rendering.palette_states
+        self._button_strip = ButtonStrip(
+            self,
+            layout_config=self._layout_config,
+            compiled_style=compiled_style,
+            palette_states=palette_states,
+        )
         self._sliding_track = SlidingTrackIndicator(
             self,
             palette=self._style_manager.theme.palette,
             layout=self._layout_config,
+            compiled_style=compiled_style,
         )
         (
             default_start_date,
@@ -120,8 +155,21 @@ class DateRangePicker(QWidget):
             primary_time=default_start_time,
             secondary_time=default_end_time,
             time_step_minutes=self._config.time_step_minutes,
+            compiled_style=compiled_style,
+            palette_states=palette_states,
+            stacked_layouts=self._config.rendering.stacked_date_time_inputs,
+        )
+        self._calendar = CalendarWidget(
+            self,
+            style=registry.calendar_config(),
+            layout=self._layout_config,
+            painted_day_grid=self._config.rendering.painted_day_grid,
+            prefetch_months=self._config.rendering.prefetch_months,
+            prebuild_views=self._config.rendering.prebuild_calendar_views,
+            scrollable_year_view=self._config.rendering.scrollable_year_picker,
+            compiled_style=compiled_style,
+            palette_states=palette_states,
         )
-        self._calendar = CalendarWidget(self, style=registry.calendar_config())
         self._calendar.set_constraints(
             min_date=self._config.min_date, max_date=self._config.max_date
         )
@@ -132,7 +180,8 @@ class DateRangePicker(QWidget):
 
         self._build_ui()
         self._connect_signals()
-        self._initialize_state()
+        with self.batch_updates():
+            self._initialize_state()
 
     # Public API --------------------------------------------------------------------
 
@@ -185,6 +234,135 @@ class DateRangePicker(QWidget):
         LOGGER.debug("Switching picker mode via API: %s", mode.name)
         self._coordinator.switch_mode(mode)
 
+    def select_date(self, date: QDate) -> None:
+        """
+        Programmatically select a single date.
+
+        Args:
+            date: Valid ``QDate`` within ``[min_date, max_date]``.
+
+        Raises:
+            InvalidDateError: If ``date`` is invalid or outside the bounds.
+
+        Notes:
+            Runs inside :meth:`batch_updates`, so the calendar refreshes once.
+        """
+        with self.batch_updates():
+            self._coordinator.select_date(date)
+
+    def select_range(self, start: QDate, end: QDate) -> None:
+        """
+        Programmatically select an inclusive date range.
+
+        The calendar highlights the range while the picker is in
+        ``PickerMode.CUSTOM_RANGE``; the inputs update in either mode.
+
+        Args:
+            start: Range start within ``[min_date, max_date]``.
+            end: Range end within ``[min_date, max_date]``.
+
+        Raises:
+            InvalidDateError: If an endpoint is invalid or outside the bounds.
+
+        Notes:
+            Runs inside :meth:`batch_updates`, so the calendar refreshes once.
+        """
+        with self.batch_updates():
+            self._coordinator.select_range(start, end)
+
+    def set_constraints(self, *, min_date: QDate | None, max_date: QDate | None) -> None:
+        """
+        Replace the selectable bounds at runtime.
+
+        The current selection and visible month are clamped into the new
+        bounds; clamped selections are re-emitted through the usual signals.
+
+        Args:
+            min_date: New lower bound, or ``None`` for unbounded.
+            max_date: New upper bound, or ``None`` for unbounded.
+
+        Raises:
+            InvalidDateError: If ``min_date`` is after ``max_date``.
+        """
+        with self.batch_updates():
+            self._coordinator.set_constraints(min_date=min_date, max_date=max_date)
+
+    @property
+    def config(self) -> DatePickerConfig:
+        """Configuration the picker was built with or last reconfigured to."""
+        return self._config
+
+    @property
+    def theme(self) -> Theme:
+        """Theme currently applied to the picker."""
+        return self._style_manager.theme
+
+    def set_theme(self, theme: Theme) -> ThemeDiff:
+        """
+        Swap the picker to ``theme`` without rebuilding it.
+
+        The old and new palette/layout are compared field by field and only
+        the components reading a changed token are restyled; geometry is
+        recomputed only when a layout token changed. Everything happens inside
+        :meth:`batch_updates`, so the swap ends in a single repaint. The shared
+        icon caches are left alone because other pickers may still use the old
+        theme; its atlas and icons age out of their bounded LRU caches.
+
+        Args:
+            theme: Fully built :class:`Theme` to apply.
+
+        Returns:
+            The :class:`ThemeDiff` that was applied (empty when ``theme``
+            carries the same tokens as the current theme).
+
+        Raises:
+            InvalidConfigurationError: If ``theme`` is not a :class:`Theme`.
+        """
+        if not isinstance(theme, Theme):
+            raise InvalidConfigurationError("theme must be an instance of Theme")
+        diff = diff_themes(self._style_manager.theme, theme)
+        if diff.is_empty:
+            return diff
+        LOGGER.debug(
+            "Swapping theme: restyle=%s relayout=%s",
+            sorted(diff.restyle),
+            sorted(diff.relayout),
+        )
+        self._style_manager.use_theme(theme)
+        self._layout_config = theme.layout
+        self._icon_atlas = self._build_icon_atlas()
+        with self.batch_updates():
+            self._restyle_components(diff.restyle)
+            if diff.relayout:
+                self._relayout_components(diff.relayout)
+        return diff
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Group several programmatic changes into one relayout and repaint.
+
+        Repaints are suspended for the whole picker and every calendar refresh
+        requested inside the block (including nested blocks) is collapsed into
+        a single refresh when the outermost block exits.
+
+        Example:
+            >>> with picker.batch_updates():
+            ...     picker.set_constraints(min_date=start, max_date=end)
+            ...     picker.select_range(start, end)
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._batch_restore_updates = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+        try:
+            with self._calendar.batch_updates():
+                yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.setUpdatesEnabled(self._batch_restore_updates)
+
     def reset(self) -> None:
         """
         Reset the picker state to match the initial configuration.
@@ -198,8 +376,47 @@ class DateRangePicker(QWidget):
         """
         LOGGER.info("Resetting DateRangePicker to configuration defaults")
         self._animator.stop()
-        self._state_manager.reset()
-        self._initialize_state()
+        with self.batch_updates():
+            self._state_manager.reset()
+            self._initialize_state()
+
+    def reconfigure(self, config: DatePickerConfig) -> None:
+        """
+        Apply a new configuration to the existing widget tree and reset to it.
+
+        The theme is swapped with :meth:`set_theme`, the bounds are replaced
+        with :meth:`set_constraints`, the inputs are re-seeded and
+        :meth:`reset` re-applies the initial mode and selection, all inside
+        one :meth:`batch_updates` block. Nothing is rebuilt, which is what
+        lets :class:`DateRangePickerPool` hand out pre-built pickers.
+
+        Args:
+            config: Configuration to adopt.
+
+        Raises:
+            InvalidConfigurationError: If ``config`` is not a
+                :class:`DatePickerConfig`, or changes ``rendering`` or
+                ``time_step_minutes``; both shape the widget tree and are
+                fixed once the picker is built.
+        """
+        if not isinstance(config, DatePickerConfig):
+            raise InvalidConfigurationError("config must be a DatePickerConfig instance")
+        if not is_reconfigurable(self._config, config):
+            raise InvalidConfigurationError(
+                "rendering and time_step_minutes cannot change after the picker is built"
+            )
+        self._config = config
+        with self.batch_updates():
+            self.set_theme(config.theme)
+            self._coordinator.set_constraints(min_date=config.min_date, max_date=config.max_date)
+            start_date, end_date, start_time, end_time = self._resolve_initial_input_values()
+            self._date_time_selector.set_default_values(
+                primary_date=start_date,
+                secondary_date=end_date,
+                primary_time=start_time,
+                secondary_time=end_time,
+            )
+            self.reset()
 
     def cleanup(self) -> None:
         """
@@ -244,8 +461,36 @@ class DateRangePicker(QWidget):
         except ValueError:
             pass
 
+    def clear_selection_callbacks(self) -> None:
+        """Remove every registered selection callback."""
+        self._selection_callbacks.clear()
+
     # Internal setup ----------------------------------------------------------------
 
+    def event(self, event: QEvent) -> bool:
+        if event.type() in _SCREEN_CHANGE_EVENTS:
+            self._sync_icon_resolution()
+        return super().event(event)
+
+    def _build_icon_atlas(self) -> IconAtlas:
+        variants = picker_icon_variants(
+            self._style_manager.theme.palette, close_icon_path=CLOSE_ICON_PATH
+        )
+        return icon_atlas(variants, self.devicePixelRatioF())
+
+    def _sync_icon_resolution(self) -> None:
+        """Re-render icons only when the window now has a different device pixel ratio."""
+        if self.devicePixelRatioF() == self._icon_atlas.dpr:
+            return
+        self._icon_atlas = self._build_icon_atlas()
+        apply_close_icon(
+            self._close_button,
+            palette=self._style_manager.theme.palette,
+            close_icon_path=CLOSE_ICON_PATH,
+        )
+        self._calendar.refresh_icons()
+        self.update()
+
     def _build_ui(self) -> None:
         """Assemble the widget tree and persist references to core components."""
         self._setup_window()
@@ -256,7 +501,7 @@ class DateRangePicker(QWidget):
             close_icon_path=CLOSE_ICON_PATH,
         )
 
-        button_section = build_button_section(
+        self._button_section = build_button_section(
             parent=self,
             palette=self._style_manager.theme.palette,
             layout_config=self._layout_config,
@@ -264,14 +509,15 @@ class DateRangePicker(QWidget):
             sliding_track=self._sliding_track,
             date_time_selector=self._date_time_selector,
             calendar=self._calendar,
+            compiled_style=self._config.rendering.compiled_stylesheet,
         )
-        content_container = build_content_container(
+        self._content_container = build_content_container(
             parent=self,
             layout_config=self._layout_config,
             header_strip=self._header_strip,
-            button_section=button_section,
+            button_section=self._button_section,
         )
-        actions_wrapper = build_actions_section(
+        self._actions_wrapper = build_actions_section(
             parent=self,
             palette=self._style_manager.theme.palette,
             layout_config=self._layout_config,
@@ -282,17 +528,17 @@ class DateRangePicker(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, self._layout_config.main_padding)
         main_layout.setSpacing(0)
-        main_layout.addWidget(content_container)
+        main_layout.addWidget(self._content_container)
         main_layout.addStretch(1)
         main_layout.addSpacing(16)
 
-        divider = build_divider(
+        self._divider = build_divider(
             parent=self,
             palette=self._style_manager.theme.palette,
         )
-        main_layout.addWidget(divider)
+        main_layout.addWidget(self._divider)
         main_layout.addSpacing(16)
-        main_layout.addWidget(actions_wrapper)
+        main_layout.addWidget(self._actions_wrapper)
 
         self._configure_components()
 
@@ -303,12 +549,23 @@ class DateRangePicker(QWidget):
         self._apply_window_height(layout_config.window_min_height)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setStyleSheet(
-            f"background-color: {self._style_manager.theme.palette.window_background}; "
-            f"border-radius: {layout_config.window_radius}px;"
-        )
+        if self._config.rendering.compiled_stylesheet:
+            self.setObjectName(ROOT_OBJECT_NAME)
+        self._apply_window_style()
         self.setWindowFlags(Qt.WindowType.Window)
 
+    def _apply_window_style(self) -> None:
+        """Set the root stylesheet, skipping the re-polish when it is unchanged."""
+        if self._config.rendering.compiled_stylesheet:
+            stylesheet = self._style_manager.compiled_stylesheet()
+        else:
+            stylesheet = (
+                f"background-color: {self._style_manager.theme.palette.window_background}; "
+                f"border-radius: {self._layout_config.window_radius}px;"
+            )
+        if self.styleSheet() != stylesheet:
+            self.setStyleSheet(stylesheet)
+
     def _configure_components(self) -> None:
         """Register child widgets with their coordinators and apply styles."""
         self._coordinator.register_button_strip(self._button_strip)
@@ -316,16 +573,88 @@ class DateRangePicker(QWidget):
         self._coordinator.register_date_time_selector(self._date_time_selector)
         self._coordinator.register_calendar(self._calendar)
         self._coordinator.set_sliding_track_animator(self._animate_sliding_track)
+        self._apply_action_button_styles()
 
+    def _apply_action_button_styles(self) -> None:
+        """Apply the ghost/accent variants to the Cancel and Go To buttons."""
         self._style_manager.apply_basic_button(
             self._cancel_button,
-            variant=self._style_manager.registry.BUTTON_GHOST,
+            variant=StyleRegistry.BUTTON_GHOST,
         )
         self._style_manager.apply_basic_button(
             self._go_to_button,
-            variant=self._style_manager.registry.BUTTON_ACCENT,
+            variant=StyleRegistry.BUTTON_ACCENT,
         )
 
+    def _restyle_components(self, targets: frozenset[ThemeTarget]) -> None:
+        """Re-apply theme styles to the components named in ``targets``."""
+        palette = self._style_manager.theme.palette
+        compiled = self._config.rendering.compiled_stylesheet
+        # The compiled sheet carries every component's rules, so any restyle
+        # may change it; ``_apply_window_style`` skips unchanged sheets.
+        if compiled or "window" in targets:
+            self._apply_window_style()
+        if "window" in targets:
+            if not compiled:
+                self._button_section.setStyleSheet(
+                    container_qss(palette.button_container_background, radius=0, border="none")
+                )
+            self._divider.setStyleSheet(divider_qss(palette.divider_color))
+            self._actions_wrapper.setStyleSheet(
+                container_qss(palette.window_background, radius=0, border="none")
+            )
+        if "header" in targets:
+            self._style_manager.apply_header(self._header_strip)
+            style_close_button(self._close_button, palette=palette, close_icon_path=CLOSE_ICON_PATH)
+        if "button_strip" in targets:
+            self._style_manager.apply_button_strip(self._button_strip)
+        if "sliding_track" in targets:
+            self._style_manager.apply_sliding_track(self._sliding_track)
+        if "inputs" in targets:
+            self._style_manager.apply_date_time_selector(self._date_time_selector)
+        if "calendar" in targets:
+            self._style_manager.apply_calendar(self._calendar)
+        if "actions" in targets:
+            self._apply_action_button_styles()
+
+    def _relayout_components(self, targets: frozenset[ThemeTarget]) -> None:
+        """Push new layout tokens to the components named in ``targets``."""
+        layout_config = self._layout_config
+        padding = layout_config.main_padding
+        if "window" in targets:
+            self.setFixedWidth(layout_config.window_min_width)
+            self._on_mode_changed(self._state_manager.state.mode)
+            main_layout = self.layout()
+            if main_layout is not None:
+                main_layout.setContentsMargins(0, 0, 0, padding)
+            content_layout = self._content_container.layout()
+            if content_layout is not None:
+                content_layout.setContentsMargins(padding, 0, padding, 0)
+        if "header" in targets:
+            header_layout = self._header_strip.layout()
+            if header_layout is not None:
+                header_layout.setContentsMargins(0, padding, 0, layout_config.header_bottom_margin)
+        if "button_strip" in targets:
+            self._button_strip.apply_layout(layout_config)
+        if "sliding_track" in targets:
+            self._sliding_track.apply_layout(layout_config)
+            # Snap the indicator to the current mode under the new dimensions.
+            self._animator.stop()
+            position, width = self._track_target(self._state_manager.state.mode)
+            self._sliding_track.set_state(position=position, width=width)
+            self._current_track_position = position
+            self._current_track_width = width
+        if "calendar" in targets:
+            self._calendar.apply_layout(layout_config)
+        if "actions" in targets:
+            self._cancel_button.apply_layout(layout_config)
+            self._go_to_button.apply_layout(layout_config)
+            # Vertical padding is part of the button stylesheets.
+            self._apply_action_button_styles()
+            actions_layout = self._actions_wrapper.layout()
+            if actions_layout is not None:
+                actions_layout.setContentsMargins(padding, 0, padding, 0)
+
     def _connect_signals(self) -> None:
         """Wire child widget signals to both Qt signals and internal handlers."""
         connect_signal(self._close_button.clicked, self.cancelled.emit)
@@ -364,16 +693,7 @@ class DateRangePicker(QWidget):
 
     def _animate_sliding_track(self, mode: PickerMode) -> None:
         """Animate the sliding indicator whenever the picker mode changes."""
-        indicator_width = self._layout_config.date_indicator_width
-        custom_width = self._layout_config.custom_range_indicator_width
-        button_gap = self._layout_config.button_gap
-
-        if mode is PickerMode.DATE:
-            target_position = 0
-            target_width = indicator_width
-        else:
-            target_position = indicator_width + button_gap
-            target_width = custom_width
+        target_position, target_width = self._track_target(mode)
 
         current_position = self._sliding_track.current_position
         current_width = self._sliding_track.current_width or self._current_track_width
@@ -390,6 +710,16 @@ class DateRangePicker(QWidget):
             on_complete=lambda pos, width: self._sliding_track.set_state(position=pos, width=width),
         )
 
+    def _track_target(self, mode: PickerMode) -> tuple[int, int]:
+        """Return the indicator position and width that highlight ``mode``'s button."""
+        indicator_width = self._layout_config.date_indicator_width
+        if mode is PickerMode.DATE:
+            return 0, indicator_width
+        return (
+            indicator_width + self._layout_config.button_gap,
+            self._layout_config.custom_range_indicator_width,
+        )
+
     def _handle_selected_date(self, date: QDate) -> None:
         """Emit ``date_selected`` and notify Python callbacks."""
         self.date_selected.emit(date)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Final
 
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtWidgets import (
@@ -17,9 +18,17 @@ from PySide6.QtWidgets import (
 
 from ..components.buttons import ButtonStrip
 from ..components.calendar import CalendarWidget
+from ..components.calendar.navigation import (
+    NAV_ICON_SIZE,
+    NAV_LEFT_ICON_PATH,
+    NAV_RIGHT_ICON_PATH,
+)
 from ..components.inputs import DateTimeSelector
+from ..components.inputs.date_time_selector import CALENDAR_ICON_PATH, CLOCK_ICON_PATH
+from ..components.inputs.input_with_icon import DEFAULT_ICON_SIZE
 from ..components.layout import DraggableHeaderStrip, SlidingTrackIndicator
 from ..styles import constants
+from ..styles.compiled_qss import BUTTON_SECTION
 from ..styles.style_templates import (
     TransparentButtonStyle,
     container_qss,
@@ -27,8 +36,33 @@ from ..styles.style_templates import (
     transparent_button_qss,
 )
 from ..styles.theme import ColorPalette, LayoutConfig
+from ..utils.icon_atlas import IconVariant
 from ..utils.svg_loader import load_colored_svg_icon
 
+CLOSE_ICON_SIZE: Final[int] = 18
+
+
+def picker_icon_variants(
+    palette: ColorPalette, *, close_icon_path: Path
+) -> tuple[IconVariant, ...]:
+    """List every icon variant a picker themed with ``palette`` can show."""
+
+    nav_colors = (palette.calendar_nav_icon_color, palette.calendar_muted_day_text_color)
+    input_colors = (palette.input_icon_color, palette.input_icon_hover_color)
+    return (
+        IconVariant(str(close_icon_path), CLOSE_ICON_SIZE, palette.button_selected_color),
+        *(
+            IconVariant(str(path), NAV_ICON_SIZE, color)
+            for path in (NAV_LEFT_ICON_PATH, NAV_RIGHT_ICON_PATH)
+            for color in nav_colors
+        ),
+        *(
+            IconVariant(str(path), DEFAULT_ICON_SIZE, color)
+            for path in (CALENDAR_ICON_PATH, CLOCK_ICON_PATH)
+            for color in input_colors
+        ),
+    )
+
 
 def build_header_layout(
     *,
@@ -57,13 +91,25 @@ def build_header_layout(
     layout.addWidget(title, alignment=Qt.AlignmentFlag.AlignLeft)
 
     close_button = QPushButton(header_strip)
-    icon_size = QSize(18, 18)
-    close_button.setIcon(load_colored_svg_icon(close_icon_path, 18, palette.button_selected_color))
-    close_button.setIconSize(icon_size)
+    close_button.setIconSize(QSize(CLOSE_ICON_SIZE, CLOSE_ICON_SIZE))
     close_button.setFixedSize(30, 30)
     close_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
     close_button.setCursor(Qt.CursorShape.PointingHandCursor)
     close_button.setToolTip("Close")
+    style_close_button(close_button, palette=palette, close_icon_path=close_icon_path)
+    layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignRight)
+    return close_button
+
+
+def style_close_button(
+    close_button: QPushButton,
+    *,
+    palette: ColorPalette,
+    close_icon_path: Path,
+) -> None:
+    """Tint the close icon and apply the transparent button stylesheet."""
+
+    apply_close_icon(close_button, palette=palette, close_icon_path=close_icon_path)
     close_button.setStyleSheet(
         transparent_button_qss(
             TransparentButtonStyle(
@@ -73,8 +119,24 @@ def build_header_layout(
             )
         )
     )
-    layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignRight)
-    return close_button
+
+
+def apply_close_icon(
+    close_button: QPushButton,
+    *,
+    palette: ColorPalette,
+    close_icon_path: Path,
+) -> None:
+    """Set the tinted close icon at the button's current device pixel ratio."""
+
+    close_button.setIcon(
+        load_colored_svg_icon(
+            close_icon_path,
+            CLOSE_ICON_SIZE,
+            palette.button_selected_color,
+            close_button.devicePixelRatioF(),
+        )
+    )
 
 
 def build_button_section(
@@ -86,18 +148,23 @@ def build_button_section(
     sliding_track: SlidingTrackIndicator,
     date_time_selector: DateTimeSelector,
     calendar: CalendarWidget,
+    compiled_style: bool = False,
 ) -> QWidget:
     """Create the container that hosts buttons, inputs, and the calendar."""
 
     button_container = QWidget(parent)
+    button_container.setObjectName(BUTTON_SECTION)
     button_container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-    button_container.setStyleSheet(
-        container_qss(
-            palette.button_container_background,
-            radius=0,
-            border="none",
+    if not compiled_style:
+        # A sheet here would outrank the picker's compiled rules for every
+        # component below it, so compiled mode styles it from the root.
+        button_container.setStyleSheet(
+            container_qss(
+                palette.button_container_background,
+                radius=0,
+                border="none",
+            )
         )
-    )
     layout = QVBoxLayout(button_container)
     layout.setContentsMargins(0, 0, 0, 0)
     layout.setSpacing(0)
@@ -181,9 +248,13 @@ def build_actions_section(
 
 
 __all__ = [
+    "CLOSE_ICON_SIZE",
+    "apply_close_icon",
     "build_actions_section",
     "build_button_section",
     "build_content_container",
     "build_divider",
     "build_header_layout",
+    "picker_icon_variants",
+    "style_close_button",
 ]
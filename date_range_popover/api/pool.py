@@ -0,0 +1,187 @@
+"""
+Pool of pre-built, hidden :class:`DateRangePicker` instances.
+
+Building a picker builds its whole widget tree, which is noticeable when a
+form opens one on demand. :class:`DateRangePickerPool` builds pickers ahead of
+time, one per event-loop pass so the UI stays responsive, and hands them out
+already reconfigured through :meth:`DateRangePicker.reconfigure`. Returned
+pickers are detached from their host and kept for the next request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from PySide6.QtCore import QMetaMethod, QObject, QTimer
+
+from ..exceptions import InvalidConfigurationError
+from ..utils import connect_signal, get_logger
+from .config import DatePickerConfig, is_reconfigurable
+from .picker import DateRangePicker
+
+DEFAULT_POOL_SIZE = 2
+
+LOGGER = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PickerPoolStats:
+    """Snapshot of the pool counters."""
+
+    hits: int
+    misses: int
+    prewarmed: int
+    idle: int
+    max_size: int
+
+
+class DateRangePickerPool(QObject):
+    """
+    Hand out pre-built pickers instead of constructing them on demand.
+
+    Pickers are built with the pool's base configuration. :meth:`acquire`
+    reuses an idle picker whose ``rendering`` and ``time_step_minutes`` match
+    the requested configuration (a hit) and builds a new one otherwise (a
+    miss). :meth:`release` hides a picker, drops its host connections and
+    keeps it while fewer than ``size`` pickers are idle.
+
+    Example:
+        >>> pool = DateRangePickerPool(size=2)
+        >>> pool.prewarm()
+        >>> picker = pool.acquire(DatePickerConfig(mode=PickerMode.CUSTOM_RANGE))
+        >>> picker.range_selected.connect(on_range)
+        >>> picker.show()
+        >>> ...
+        >>> pool.release(picker)
+    """
+
+    def __init__(
+        self,
+        config: DatePickerConfig | None = None,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        parent: QObject | None = None,
+    ) -> None:
+        """
+        Create an empty pool; call :meth:`prewarm` to start building pickers.
+
+        Args:
+            config: Base configuration for pre-built pickers.
+            size: Maximum number of idle pickers kept.
+            parent: Optional Qt parent for lifetime management.
+
+        Raises:
+            InvalidConfigurationError: If ``size`` is not positive.
+        """
+        super().__init__(parent)
+        if size <= 0:
+            raise InvalidConfigurationError("size must be positive")
+        self._config = config or DatePickerConfig()
+        self._max_size = size
+        self._idle: list[DateRangePicker] = []
+        self._prewarm_target = 0
+        self._hits = 0
+        self._misses = 0
+        self._prewarmed = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        connect_signal(self._timer.timeout, self._prewarm_one)
+
+    @property
+    def config(self) -> DatePickerConfig:
+        """Base configuration used for pre-built pickers."""
+        return self._config
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def prewarm(self, count: int | None = None) -> None:
+        """
+        Build pickers in the background until ``count`` are idle.
+
+        One picker is built per event-loop pass, so input and painting keep
+        being processed in between.
+
+        Args:
+            count: Number of idle pickers to reach; capped at and defaulting
+                to the pool size.
+        """
+        target = self._max_size if count is None else min(count, self._max_size)
+        self._prewarm_target = max(self._prewarm_target, target)
+        if len(self._idle) < self._prewarm_target:
+            self._timer.start()
+
+    def acquire(self, config: DatePickerConfig | None = None) -> DateRangePicker:
+        """
+        Return a hidden picker configured with ``config`` (the base config by default).
+
+        Raises:
+            InvalidConfigurationError: Propagated from
+                :meth:`DateRangePicker.reconfigure` for invalid configurations.
+        """
+        target = config or self._config
+        for index, picker in enumerate(self._idle):
+            if is_reconfigurable(picker.config, target):
+                del self._idle[index]
+                self._hits += 1
+                picker.reconfigure(target)
+                return picker
+        self._misses += 1
+        LOGGER.debug("Picker pool miss; building a new picker")
+        return DateRangePicker(target)
+
+    def release(self, picker: DateRangePicker) -> None:
+        """
+        Take ``picker`` back for reuse.
+
+        The picker is hidden, unparented, and loses every connection to its
+        ``date_selected``/``range_selected``/``cancelled`` signals and every
+        selection callback. When the pool is full it is cleaned up and deleted.
+        """
+        if picker in self._idle:
+            return
+        picker.hide()
+        for signal in (picker.date_selected, picker.range_selected, picker.cancelled):
+            if picker.isSignalConnected(QMetaMethod.fromSignal(signal)):
+                signal.disconnect()
+        picker.clear_selection_callbacks()
+        if len(self._idle) >= self._max_size:
+            _discard(picker)
+            return
+        if picker.parent() is not None:
+            picker.setParent(None, picker.windowFlags())
+        self._idle.append(picker)
+
+    def stats(self) -> PickerPoolStats:
+        """Return the current hit/miss counters and pool occupancy."""
+        return PickerPoolStats(
+            hits=self._hits,
+            misses=self._misses,
+            prewarmed=self._prewarmed,
+            idle=len(self._idle),
+            max_size=self._max_size,
+        )
+
+    def clear(self) -> None:
+        """Stop pre-warming and delete every idle picker."""
+        self._timer.stop()
+        self._prewarm_target = 0
+        for picker in self._idle:
+            _discard(picker)
+        self._idle.clear()
+
+    def _prewarm_one(self) -> None:
+        if len(self._idle) >= self._prewarm_target:
+            self._timer.stop()
+            return
+        self._idle.append(DateRangePicker(self._config))
+        self._prewarmed += 1
+
+
+def _discard(picker: DateRangePicker) -> None:
+    picker.cleanup()
+    picker.deleteLater()
+
+
+__all__ = ["DEFAULT_POOL_SIZE", "DateRangePickerPool", "PickerPoolStats"]
@@ -1,15 +1,37 @@
 """UI components used by the date range picker."""
 
-from .buttons import BasicButton, ButtonStrip
-from .calendar import CalendarViewMode, CalendarWidget
-from .inputs import (
-    CUSTOM_DATE_RANGE,
-    GO_TO_DATE,
-    DateTimeSelector,
-    InputWithIcon,
-    ModeLiteral,
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .buttons import BasicButton, ButtonStrip
+    from .calendar import CalendarViewMode, CalendarWidget
+    from .inputs import (
+        CUSTOM_DATE_RANGE,
+        GO_TO_DATE,
+        DateTimeSelector,
+        InputWithIcon,
+        ModeLiteral,
+    )
+    from .layout import DraggableHeaderStrip, SlidingTrackIndicator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BasicButton": ".buttons",
+        "ButtonStrip": ".buttons",
+        "CalendarWidget": ".calendar",
+        "CalendarViewMode": ".calendar",
+        "DateTimeSelector": ".inputs",
+        "ModeLiteral": ".inputs",
+        "GO_TO_DATE": ".inputs",
+        "CUSTOM_DATE_RANGE": ".inputs",
+        "DraggableHeaderStrip": ".layout",
+        "InputWithIcon": ".inputs",
+        "SlidingTrackIndicator": ".layout",
+    },
 )
-from .layout import DraggableHeaderStrip, SlidingTrackIndicator
 
 __all__ = [
     "BasicButton",
@@ -1,6 +1,15 @@
 """Button components used within the picker."""
 
-from .basic_button import BasicButton
-from .button_strip import ButtonStrip
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .basic_button import BasicButton
+    from .button_strip import ButtonStrip
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"BasicButton": ".basic_button", "ButtonStrip": ".button_strip"}
+)
 
 __all__ = ["BasicButton", "ButtonStrip"]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QPushButton, QSizePolicy, QWidget
 
 from ...styles import constants
@@ -23,13 +22,12 @@ class BasicButton(QPushButton):
         super().__init__(label, parent)
 
         self._layout_config = layout or LayoutConfig()
+        self._explicit_height = height
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        font = constants.create_button_font()
-        font.setWeight(QFont.Weight.Normal)
-        self.setFont(font)
+        self.setFont(constants.create_action_button_font())
 
         if width is None:
             self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -48,6 +46,13 @@ class BasicButton(QPushButton):
     def apply_stylesheet(self, stylesheet: str) -> None:
         self.setStyleSheet(stylesheet)
 
+    def apply_layout(self, layout: LayoutConfig) -> None:
+        """Resize to the layout's action button height unless a height was given."""
+        if self._explicit_height is None:
+            self.setFixedHeight(layout.action_button_height)
+            self._vertical_padding = self._compute_vertical_padding(layout.action_button_height)
+        self._layout_config = layout
+
     def _compute_vertical_padding(self, final_height: int) -> int:
         font_height = self.fontMetrics().height()
         available_space = max(0, final_height - font_height)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from PySide6.QtCore import QEvent, QObject, Qt, Signal
+from PySide6.QtGui import QPainter, QPaintEvent
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
@@ -9,20 +10,75 @@ from PySide6.QtWidgets import (
 )
 
 from ...styles import constants
+from ...styles.compiled_qss import (
+    BUTTON_STRIP,
+    BUTTON_STRIP_BUTTON,
+    STATE_DEFAULT,
+    STATE_PROPERTY,
+    STATE_SELECTED,
+    set_style_property,
+)
+from ...styles.state_colors import state_color
 from ...styles.theme import ColorPalette, LayoutConfig
 from ...utils import connect_signal
 
+# Palette mode keeps this sheet fixed; the buttons paint their text colour.
+_PALETTE_BUTTON_QSS = "text-align: left; padding: 0; margin: 0; border: none; outline: none;"
+
+
+class _StripButton(QPushButton):
+    """Strip button that paints its label in a colour set without a stylesheet."""
+
+    def __init__(self, text: str, parent: QWidget) -> None:
+        super().__init__(text, parent)
+        self._text_color = ""
+        self.setStyleSheet(_PALETTE_BUTTON_QSS)
+
+    def set_text_color(self, color: str) -> None:
+        if color == self._text_color:
+            return
+        self._text_color = color
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        painter = QPainter(self)
+        painter.setPen(state_color(self._text_color))
+        painter.setFont(self.font())
+        painter.drawText(
+            self.rect(),
+            Qt.AlignmentFlag.AlignLeft
+            | Qt.AlignmentFlag.AlignVCenter
+            | Qt.TextFlag.TextShowMnemonic,
+            self.text(),
+        )
+
 
 class ButtonStrip(QWidget):
-    """Displays Date and Custom Range buttons."""
+    """
+    Displays Date and Custom Range buttons.
+
+    With ``compiled_style=True`` the buttons only flip their ``state``
+    property; colours (including hover) come from the picker's compiled
+    stylesheet. With ``palette_states=True`` the buttons keep one static
+    stylesheet and paint their text colour, so hover and selection changes
+    only repaint them.
+    """
 
     date_selected = Signal()
     custom_range_selected = Signal()
 
     def __init__(
-        self, parent: QWidget | None = None, *, layout_config: LayoutConfig | None = None
+        self,
+        parent: QWidget | None = None,
+        *,
+        layout_config: LayoutConfig | None = None,
+        compiled_style: bool = False,
+        palette_states: bool = False,
     ) -> None:
         super().__init__(parent)
+        self.setObjectName(BUTTON_STRIP)
+        self._compiled_style = compiled_style
+        self._palette_states = palette_states
 
         self._selected_button = "date"
         self._hovered_button: str | None = None
@@ -37,21 +93,26 @@ class ButtonStrip(QWidget):
         layout.setContentsMargins(0, 0, 0, self._layout_config.button_strip_bottom_margin)
         layout.setSpacing(0)
 
-        self.date_button = QPushButton("Date", self)
+        button_class = _StripButton if palette_states else QPushButton
+        self.date_button = button_class("Date", self)
+        self.date_button.setObjectName(BUTTON_STRIP_BUTTON)
         self.date_button.setFont(constants.create_button_font())
         self.date_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.date_button.setFixedWidth(self._layout_config.date_button_width)
         self.date_button.setMinimumHeight(0)
         self.date_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
-        self.date_button.installEventFilter(self)
+        if not compiled_style:
+            self.date_button.installEventFilter(self)
 
-        self.custom_range_button = QPushButton("Custom range", self)
+        self.custom_range_button = button_class("Custom range", self)
+        self.custom_range_button.setObjectName(BUTTON_STRIP_BUTTON)
         self.custom_range_button.setFont(constants.create_button_font())
         self.custom_range_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.custom_range_button.setFixedWidth(self._layout_config.custom_range_button_width)
         self.custom_range_button.setMinimumHeight(0)
         self.custom_range_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
-        self.custom_range_button.installEventFilter(self)
+        if not compiled_style:
+            self.custom_range_button.installEventFilter(self)
 
         layout.addWidget(
             self.date_button,
@@ -98,12 +159,16 @@ class ButtonStrip(QWidget):
     def apply_palette(self, palette: ColorPalette) -> None:
         """Apply the supplied color palette to the strip."""
         self._palette = palette
-        self.setStyleSheet(f"background-color: {palette.button_container_background};")
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {palette.button_container_background};")
         self._update_button_styles()
 
     def apply_layout(self, layout_config: LayoutConfig) -> None:
         """Update layout-driven dimensions such as widths and gaps."""
         self._layout_config = layout_config
+        strip_layout = self.layout()
+        if strip_layout is not None:
+            strip_layout.setContentsMargins(0, 0, 0, layout_config.button_strip_bottom_margin)
         self.date_button.setFixedWidth(layout_config.date_button_width)
         self.custom_range_button.setFixedWidth(layout_config.custom_range_button_width)
         if self._gap is not None:
@@ -115,14 +180,20 @@ class ButtonStrip(QWidget):
         self._apply_style(self.custom_range_button, "custom_range")
 
     def _apply_style(self, button: QPushButton, button_name: str) -> None:
+        if self._compiled_style:
+            state = STATE_SELECTED if self._selected_button == button_name else STATE_DEFAULT
+            set_style_property(button, STATE_PROPERTY, state)
+            return
         if self._selected_button == button_name:
             color = self._palette.button_selected_color
         elif self._hovered_button == button_name:
             color = self._palette.button_hover_color
         else:
             color = self._palette.button_default_color
-        button.setStyleSheet(
-            f"""
+        if isinstance(button, _StripButton):
+            button.set_text_color(color)
+            return
+        stylesheet = f"""
             text-align: left;
             padding: 0;
             margin: 0;
@@ -130,7 +201,7 @@ class ButtonStrip(QWidget):
             outline: none;
             color: {color};
             """
-        )
+        button.setStyleSheet(stylesheet)
 
 
 __all__ = ["ButtonStrip"]
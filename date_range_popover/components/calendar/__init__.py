@@ -1,11 +1,42 @@
 """Calendar components for the date picker."""
 
-from .calendar_widget import CalendarViewMode, CalendarWidget
-from .day_cell import CalendarDayCell
-from .day_view import CalendarDayView
-from .month_view import CalendarMonthView
-from .navigation import CalendarNavigation
-from .year_view import CalendarYearView
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .calendar_widget import CalendarViewMode, CalendarWidget
+    from .day_cell import CalendarDayCell
+    from .day_view import CalendarDayView
+    from .month_prefetch import MonthPrefetcher, MonthSnapshot, PrefetchStats
+    from .month_view import CalendarMonthView
+    from .multi_month import MAX_VISIBLE_MONTHS, MultiMonthCalendar
+    from .navigation import CalendarNavigation
+    from .painted_day_view import CalendarPaintedDayView
+    from .year_list_view import CalendarYearListView, YearItemDelegate, YearListModel
+    from .year_view import CalendarYearView
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CalendarWidget": ".calendar_widget",
+        "CalendarViewMode": ".calendar_widget",
+        "CalendarDayCell": ".day_cell",
+        "CalendarDayView": ".day_view",
+        "CalendarMonthView": ".month_view",
+        "CalendarNavigation": ".navigation",
+        "CalendarPaintedDayView": ".painted_day_view",
+        "CalendarYearListView": ".year_list_view",
+        "CalendarYearView": ".year_view",
+        "MonthPrefetcher": ".month_prefetch",
+        "MonthSnapshot": ".month_prefetch",
+        "MultiMonthCalendar": ".multi_month",
+        "MAX_VISIBLE_MONTHS": ".multi_month",
+        "PrefetchStats": ".month_prefetch",
+        "YearItemDelegate": ".year_list_view",
+        "YearListModel": ".year_list_view",
+    },
+)
 
 __all__ = [
     "CalendarWidget",
@@ -14,5 +45,14 @@ __all__ = [
     "CalendarDayView",
     "CalendarMonthView",
     "CalendarNavigation",
+    "CalendarPaintedDayView",
+    "CalendarYearListView",
     "CalendarYearView",
+    "MonthPrefetcher",
+    "MonthSnapshot",
+    "MultiMonthCalendar",
+    "MAX_VISIBLE_MONTHS",
+    "PrefetchStats",
+    "YearItemDelegate",
+    "YearListModel",
 ]
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import calendar
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum, auto
 from typing import cast
 
-from PySide6.QtCore import QDate, Qt, Signal
+from PySide6.QtCore import QDate, Qt, QTimer, Signal
+from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QSizePolicy, QStackedWidget, QVBoxLayout, QWidget
 
 from ...exceptions import InvalidDateError
+from ...styles.compiled_qss import CALENDAR_MODE_LABEL, CALENDAR_WIDGET
 from ...styles.style_templates import (
     ModeLabelStyle,
     mode_label_container_qss,
@@ -16,9 +20,12 @@ from ...styles.style_templates import (
 from ...styles.theme import CalendarStyleConfig, LayoutConfig
 from ...utils import connect_signal, first_of_month, qdate_is_after, qdate_is_before
 from ...validation import validate_date_range, validate_qdate
-from .day_view import CalendarDayView
+from .day_view import CalendarDayView, DayState, compute_day_states
+from .month_prefetch import MonthPrefetcher, MonthSnapshot, PrefetchStats
 from .month_view import CalendarMonthView
 from .navigation import CalendarNavigation
+from .painted_day_view import CalendarPaintedDayView
+from .year_list_view import CalendarYearListView
 from .year_range_utils import (
     clamp_year_range_start,
     compute_year_range_start,
@@ -34,7 +41,38 @@ class CalendarViewMode(Enum):
 
 
 class CalendarWidget(QWidget):
-    """Coordinator widget that wraps day/month/year views."""
+    """
+    Coordinator widget that wraps day/month/year views.
+
+    Pass ``painted_day_grid=True`` to render the day grid with
+    :class:`CalendarPaintedDayView` (one widget, one paint pass) instead of
+    the 42-widget :class:`CalendarDayView`.
+
+    ``prefetch_months=N`` computes the states (and, for the painted grid, an
+    offscreen rendering) of the ``N`` months on either side of the visible one
+    during idle time so previous/next navigation can swap them in directly.
+    :attr:`prefetch_stats` reports the resulting hit rate.
+
+    Wrap several programmatic changes in :meth:`batch_updates` to collapse
+    their refreshes into a single relayout and repaint.
+
+    The month and year views are only built the first time the header opens
+    them; pass ``prebuild_views=True`` to build them during idle time right
+    after the widget is first shown instead.
+
+    ``scrollable_year_view=True`` swaps the paged 20-button year grid for
+    :class:`CalendarYearListView`, which scrolls through every allowed year
+    and can jump straight to a typed one.
+
+    ``compiled_style=True`` is set by pickers rendering with
+    ``RenderingOptions.compiled_stylesheet``: the calendar and its views set
+    no stylesheets of their own and only flip the dynamic properties matched
+    by the picker's compiled stylesheet.
+
+    ``palette_states=True`` (``RenderingOptions.palette_states``) makes the
+    widget-backed day cells paint their state colours, so hover and selection
+    changes only repaint them.
+    """
 
     date_selected = Signal(QDate)
 
@@ -48,8 +86,16 @@ class CalendarWidget(QWidget):
         *,
         style: CalendarStyleConfig | None = None,
         layout: LayoutConfig | None = None,
+        painted_day_grid: bool = False,
+        prefetch_months: int = 0,
+        prebuild_views: bool = False,
+        scrollable_year_view: bool = False,
+        compiled_style: bool = False,
+        palette_states: bool = False,
     ) -> None:
         super().__init__(parent)
+        self.setObjectName(CALENDAR_WIDGET)
+        self._compiled_style = compiled_style
 
         if style is None:
             style = CalendarStyleConfig(
@@ -89,15 +135,39 @@ class CalendarWidget(QWidget):
             max_year=self._MAX_YEAR,
         )
 
-        self._navigation = CalendarNavigation(style=self._style)
-        self._day_view = CalendarDayView(style=self._style, layout=self._layout_config)
-        self._month_view = CalendarMonthView(style=self._style, layout=self._layout_config)
-        self._year_view = CalendarYearView(
-            style=self._style,
-            layout=self._layout_config,
-            range_size=self._YEAR_RANGE_SIZE,
-            grid_columns=self._YEAR_GRID_COLUMNS,
-        )
+        self._navigation = CalendarNavigation(style=self._style, compiled_style=compiled_style)
+        self._day_view: CalendarDayView | CalendarPaintedDayView
+        if painted_day_grid:
+            self._day_view = CalendarPaintedDayView(style=self._style, layout=self._layout_config)
+        else:
+            self._day_view = CalendarDayView(
+                style=self._style,
+                layout=self._layout_config,
+                compiled_style=compiled_style,
+                palette_states=palette_states,
+            )
+        self._month_view: CalendarMonthView | None = None
+        self._year_view: CalendarYearView | CalendarYearListView | None = None
+        self._scrollable_year_view = scrollable_year_view
+        self._prebuild_views = prebuild_views
+        self._shown_once = False
+        self._batch_depth = 0
+        self._batch_restore_updates = True
+        self._refresh_pending = False
+        self._pending_snapshot: MonthSnapshot | None = None
+        self._prefetch_months = max(0, prefetch_months)
+        self._prefetcher: MonthPrefetcher | None = None
+        if self._prefetch_months:
+            self._prefetcher = MonthPrefetcher(
+                self._compute_states,
+                render_pixmap=(
+                    self._day_view.render_states
+                    if isinstance(self._day_view, CalendarPaintedDayView)
+                    else None
+                ),
+                capacity=2 * self._prefetch_months + 2,
+                parent=self,
+            )
         self._content_stack = QStackedWidget(self)
         self._mode_label_container: QWidget | None = None
         self._mode_label: QLabel | None = None
@@ -108,11 +178,19 @@ class CalendarWidget(QWidget):
 
     def apply_style(self, style: CalendarStyleConfig) -> None:
         self._style = style
-        self.setStyleSheet(f"background-color: {style.background};")
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {style.background};")
         self._navigation.apply_style(style)
         self._day_view.apply_style(style)
-        self._month_view.apply_style(style)
-        self._year_view.apply_style(style)
+        if self._prefetcher is not None:
+            # Prefetched pixmaps were painted with the previous colours.
+            self._prefetcher.clear()
+        if self._month_view is not None:
+            self._month_view.apply_style(style)
+        if self._year_view is not None:
+            self._year_view.apply_style(style)
+        if self._compiled_style:
+            return
         mode_label_style = ModeLabelStyle(
             background=style.mode_label_background,
             text_color=style.muted_day_text_color,
@@ -123,18 +201,78 @@ class CalendarWidget(QWidget):
         if self._mode_label is not None:
             self._mode_label.setStyleSheet(mode_label_text_qss(mode_label_style))
 
+    def apply_layout(self, layout: LayoutConfig) -> None:
+        """
+        Apply the calendar geometry tokens of ``layout``.
+
+        The day view is resized in place. Month and year views that were
+        already built are discarded and rebuilt with the new geometry the next
+        time they are shown.
+        """
+        with self.batch_updates():
+            self._layout_config = layout
+            root_layout = self.layout()
+            if root_layout is not None:
+                root_layout.setContentsMargins(0, layout.calendar_top_margin, 0, 0)
+                root_layout.setSpacing(layout.calendar_header_bottom_margin)
+            self._day_view.apply_layout(layout)
+            self._content_stack.setMinimumWidth(self._secondary_views_width())
+            for view in (self._month_view, self._year_view):
+                if view is not None:
+                    self._content_stack.removeWidget(view)
+                    view.deleteLater()
+            self._month_view = None
+            self._year_view = None
+            if self._prefetcher is not None:
+                # Prefetched pixmaps were painted with the previous geometry.
+                self._prefetcher.clear()
+            self._switch_view(self._view_mode)
+        if self._prebuild_views and self._shown_once:
+            QTimer.singleShot(0, self._build_secondary_views)
+
+    def refresh_icons(self) -> None:
+        """Re-fetch icons at the current device pixel ratio."""
+        self._navigation.refresh_icons()
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Suspend repaints and collapse refreshes until the outermost block exits.
+
+        Blocks may be nested; every refresh requested inside them is deferred
+        and performed exactly once (followed by a single repaint) on exit.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._batch_restore_updates = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                try:
+                    if self._refresh_pending:
+                        snapshot = self._pending_snapshot
+                        self._refresh_pending = False
+                        self._pending_snapshot = None
+                        self._refresh_views(snapshot=snapshot)
+                finally:
+                    self.setUpdatesEnabled(self._batch_restore_updates)
+
     def set_constraints(self, *, min_date: QDate | None, max_date: QDate | None) -> None:
         """Limit selectable dates and navigation range."""
-        self._min_date = QDate(min_date) if isinstance(min_date, QDate) else None
-        self._max_date = QDate(max_date) if isinstance(max_date, QDate) else None
-        if self._range_start is not None:
-            self._range_start = self._clamp_date(self._range_start)
-        if self._range_end is not None:
-            self._range_end = self._clamp_date(self._range_end)
-        self._selected_date = self._clamp_date(self._selected_date)
-        self._visible_month = self._clamp_month(self._visible_month)
-        self._ensure_year_range_contains(self._visible_month.year())
-        self._refresh_views()
+        with self.batch_updates():
+            self._min_date = QDate(min_date) if isinstance(min_date, QDate) else None
+            self._max_date = QDate(max_date) if isinstance(max_date, QDate) else None
+            if self._range_start is not None:
+                self._range_start = self._clamp_date(self._range_start)
+            if self._range_end is not None:
+                self._range_end = self._clamp_date(self._range_end)
+            self._selected_date = self._clamp_date(self._selected_date)
+            self._visible_month = self._clamp_month(self._visible_month)
+            self._ensure_year_range_contains(self._visible_month.year())
+            self._refresh_views()
 
     def set_selected_date(self, date: QDate) -> None:
         """Set the selected date and make it visible."""
@@ -181,6 +319,21 @@ class CalendarWidget(QWidget):
         self._ensure_year_range_contains(target.year())
         self._refresh_views()
 
+    @property
+    def prefetch_stats(self) -> PrefetchStats:
+        """Return navigation hit/miss counters for the month prefetcher."""
+        if self._prefetcher is None:
+            return PrefetchStats()
+        return self._prefetcher.stats
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._shown_once:
+            return
+        self._shown_once = True
+        if self._prebuild_views:
+            QTimer.singleShot(0, self._build_secondary_views)
+
     # Internal logic -----------------------------------------------------------------
 
     def _build_ui(self) -> None:
@@ -197,17 +350,63 @@ class CalendarWidget(QWidget):
             self._day_view.sizePolicy().horizontalPolicy(),
             self._day_view.sizePolicy().verticalPolicy(),
         )
+        # Reserve the width of the lazily built month/year grids up front so the
+        # calendar geometry does not shift the first time they are opened.
+        self._content_stack.setMinimumWidth(self._secondary_views_width())
         layout.addWidget(self._content_stack, alignment=Qt.AlignmentFlag.AlignCenter)
         self._content_stack.addWidget(self._day_view)
-        self._content_stack.addWidget(self._month_view)
-        self._content_stack.addWidget(self._year_view)
 
         connect_signal(self._navigation.previous_clicked, self._on_previous_clicked)
         connect_signal(self._navigation.next_clicked, self._on_next_clicked)
         connect_signal(self._navigation.header_clicked, self._on_header_clicked)
         connect_signal(self._day_view.day_selected, self._on_day_selected)
-        connect_signal(self._month_view.month_selected, self._on_month_selected)
-        connect_signal(self._year_view.year_selected, self._on_year_selected)
+
+    def _secondary_views_width(self) -> int:
+        return max(
+            CalendarMonthView.grid_width(self._layout_config),
+            CalendarYearView.grid_width(self._layout_config, self._YEAR_GRID_COLUMNS),
+        )
+
+    def _ensure_month_view(self) -> CalendarMonthView:
+        if self._month_view is None:
+            view = CalendarMonthView(
+                style=self._style,
+                layout=self._layout_config,
+                compiled_style=self._compiled_style,
+            )
+            self._content_stack.addWidget(view)
+            connect_signal(view.month_selected, self._on_month_selected)
+            self._month_view = view
+        return self._month_view
+
+    def _ensure_year_view(self) -> CalendarYearView | CalendarYearListView:
+        if self._year_view is None:
+            view: CalendarYearView | CalendarYearListView
+            if self._scrollable_year_view:
+                view = CalendarYearListView(
+                    style=self._style,
+                    layout=self._layout_config,
+                    grid_columns=self._YEAR_GRID_COLUMNS,
+                    visible_rows=self._YEAR_RANGE_SIZE // self._YEAR_GRID_COLUMNS,
+                    compiled_style=self._compiled_style,
+                )
+                connect_signal(view.visible_years_changed, self._on_visible_years_changed)
+            else:
+                view = CalendarYearView(
+                    style=self._style,
+                    layout=self._layout_config,
+                    range_size=self._YEAR_RANGE_SIZE,
+                    grid_columns=self._YEAR_GRID_COLUMNS,
+                    compiled_style=self._compiled_style,
+                )
+            self._content_stack.addWidget(view)
+            connect_signal(view.year_selected, self._on_year_selected)
+            self._year_view = view
+        return self._year_view
+
+    def _build_secondary_views(self) -> None:
+        self._ensure_month_view()
+        self._ensure_year_view()
 
     def _on_day_selected(self, date: QDate) -> None:
         self._selected_date = self._ensure_within_bounds(date, "selected_date")
@@ -225,6 +424,12 @@ class CalendarWidget(QWidget):
         self._visible_month = self._clamp_month(candidate)
         self._switch_view(CalendarViewMode.MONTH)
 
+    def _on_visible_years_changed(self, first_year: int, _last_year: int) -> None:
+        # Free scrolling in the year list moves the "page" the arrows step from.
+        self._year_range_start = first_year
+        self._update_header()
+        self._update_navigation_state()
+
     def _on_header_clicked(self) -> None:
         if self._view_mode is CalendarViewMode.DAY:
             self._switch_view(CalendarViewMode.MONTH)
@@ -256,12 +461,12 @@ class CalendarWidget(QWidget):
             if self._mode_label_container is not None:
                 self._mode_label_container.setVisible(False)
         elif view is CalendarViewMode.MONTH:
-            self._content_stack.setCurrentWidget(self._month_view)
+            self._content_stack.setCurrentWidget(self._ensure_month_view())
             if self._mode_label_container is not None and self._mode_label is not None:
                 self._mode_label_container.setVisible(True)
                 self._mode_label.setText("Months")
         else:
-            self._content_stack.setCurrentWidget(self._year_view)
+            self._content_stack.setCurrentWidget(self._ensure_year_view())
             self._ensure_year_range_contains(self._visible_month.year())
             if self._mode_label_container is not None and self._mode_label is not None:
                 self._mode_label_container.setVisible(True)
@@ -300,7 +505,10 @@ class CalendarWidget(QWidget):
         candidate = self._visible_month.addMonths(delta)
         self._visible_month = self._clamp_month(candidate)
         self._ensure_year_range_contains(self._visible_month.year())
-        self._refresh_views()
+        snapshot = None
+        if self._prefetcher is not None:
+            snapshot = self._prefetcher.take(self._visible_month, self._prefetch_context())
+        self._refresh_views(snapshot=snapshot)
 
     def _change_year(self, delta: int) -> None:
         candidate = self._visible_month.addYears(delta)
@@ -335,26 +543,68 @@ class CalendarWidget(QWidget):
                 max_year=self._MAX_YEAR,
             )
 
-    def _refresh_views(self) -> None:
-        self._day_view.update_days(
-            visible_month=self._visible_month,
-            today=self._today,
-            selected_date=self._selected_date,
-            range_start=self._range_start,
-            range_end=self._range_end,
-            min_date=self._min_date,
-            max_date=self._max_date,
-        )
+    def _refresh_views(self, *, snapshot: MonthSnapshot | None = None) -> None:
+        if self._batch_depth:
+            # The last request wins: any later state change would have issued
+            # another refresh, so its snapshot (if any) is still current.
+            self._refresh_pending = True
+            self._pending_snapshot = snapshot
+            return
+        if snapshot is None:
+            self._day_view.set_states(self._compute_states(self._visible_month))
+        elif isinstance(self._day_view, CalendarPaintedDayView):
+            self._day_view.set_states(snapshot.states, pixmap=snapshot.pixmap)
+        else:
+            self._day_view.set_states(snapshot.states)
         if self._view_mode is CalendarViewMode.MONTH:
-            self._month_view.set_selected_month(self._visible_month.month())
+            self._ensure_month_view().set_selected_month(self._visible_month.month())
         elif self._view_mode is CalendarViewMode.YEAR:
             self._ensure_year_range_contains(self._visible_month.year())
-            self._year_view.set_year_range(
+            year_view = self._ensure_year_view()
+            if isinstance(year_view, CalendarYearListView):
+                year_view.set_year_bounds(self._min_year() or 1, self._max_year() or self._MAX_YEAR)
+            year_view.set_year_range(
                 self._year_range_start,
                 current_year=self._visible_month.year(),
             )
         self._update_header()
         self._update_navigation_state()
+        self._schedule_prefetch()
+
+    def _compute_states(self, month: QDate) -> list[DayState]:
+        return compute_day_states(
+            visible_month=month,
+            today=self._today,
+            selected_date=self._selected_date,
+            range_start=self._range_start,
+            range_end=self._range_end,
+            min_date=self._min_date,
+            max_date=self._max_date,
+        )
+
+    def _prefetch_context(self) -> tuple[object, ...]:
+        """Describe everything besides the month that changes the rendered states."""
+        return tuple(
+            date.toJulianDay() if date is not None and date.isValid() else None
+            for date in (
+                self._today,
+                self._selected_date,
+                self._range_start,
+                self._range_end,
+                self._min_date,
+                self._max_date,
+            )
+        )
+
+    def _schedule_prefetch(self) -> None:
+        if self._prefetcher is None or self._view_mode is not CalendarViewMode.DAY:
+            return
+        months: list[QDate] = []
+        for distance in range(1, self._prefetch_months + 1):
+            for delta in (distance, -distance):
+                if self._can_move_month(delta):
+                    months.append(first_of_month(self._visible_month.addMonths(delta)))
+        self._prefetcher.schedule(months, self._prefetch_context())
 
     def _ensure_within_bounds(self, date: QDate, field_name: str) -> QDate:
         if self._min_date is not None and qdate_is_before(date, self._min_date):
@@ -432,6 +682,7 @@ class CalendarWidget(QWidget):
         """Build the optional mode label container embedded below the nav."""
 
         container = QWidget(self)
+        container.setObjectName(CALENDAR_MODE_LABEL)
         container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         container.setSizePolicy(
             QSizePolicy.Policy.Expanding,
@@ -1,16 +1,217 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QDate, QEvent, QObject, Qt, Signal
-from PySide6.QtGui import QResizeEvent
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from PySide6.QtCore import QDate, QEvent, QObject, QRect, QRectF, Qt, Signal
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QResizeEvent
 from PySide6.QtWidgets import QPushButton, QSizePolicy, QWidget
 
 from ...styles import constants
+from ...styles.compiled_qss import (
+    CALENDAR_DAY_BUTTON,
+    CALENDAR_DAY_UNDERLINE,
+    HOVERED_PROPERTY,
+    STATE_DEFAULT,
+    STATE_PROPERTY,
+    day_cell_state,
+    set_style_property,
+)
+from ...styles.qss_cache import apply_stylesheet, cached_qss
+from ...styles.state_colors import state_color
+from ...styles.style_templates import DayCellStyle, day_cell_qss, day_cell_underline_qss
 from ...styles.theme import CalendarStyleConfig, LayoutConfig
 from ...utils import connect_signal
 
 
+@dataclass(frozen=True, slots=True)
+class DayCellAppearance:
+    """Resolved colour tokens for a single, visible day cell."""
+
+    background: str
+    text_color: str
+    hover_background: str
+    hover_text_color: str
+    underline_color: str
+    hover_underline_color: str
+    enabled: bool
+
+
+def resolve_day_cell_appearance(
+    style: CalendarStyleConfig,
+    *,
+    is_selected: bool,
+    is_disabled: bool = False,
+    is_range_start: bool = False,
+    is_range_end: bool = False,
+    is_in_range: bool = False,
+    is_today: bool = False,
+) -> DayCellAppearance:
+    """
+    Map day-cell state flags onto :class:`CalendarStyleConfig` tokens.
+
+    Shared by the widget-backed and painted day grids so both render the
+    exact same colours for a given state. Empty underline colours mean the
+    today underline is hidden.
+    """
+
+    text_color = style.muted_day_text_color if is_disabled else style.day_text_color
+    background = "transparent"
+    hover_background = style.day_hover_background
+    hover_text = style.day_hover_text_color
+
+    is_range_edge = is_range_start or is_range_end
+    if is_range_edge and not is_disabled:
+        background = style.range_edge_background
+        hover_background = style.range_edge_background
+        text_color = style.range_edge_text_color
+        hover_text = style.range_edge_text_color
+    elif is_in_range and not is_disabled:
+        background = style.range_between_background
+        hover_background = style.range_between_background
+        text_color = style.range_between_text_color
+        hover_text = style.range_between_text_color
+    elif is_selected and not is_disabled:
+        background = style.today_background
+        hover_background = style.today_background
+        hover_text = style.today_text_color
+        text_color = style.today_text_color
+
+    underline_color = text_color if is_today else ""
+    hover_underline_color = (hover_text if is_today else "") or underline_color
+    return DayCellAppearance(
+        background=background,
+        text_color=text_color,
+        hover_background=hover_background,
+        hover_text_color=hover_text,
+        underline_color=underline_color,
+        hover_underline_color=hover_underline_color,
+        enabled=not is_disabled,
+    )
+
+
+def paint_day_cell(
+    painter: QPainter,
+    rect: QRect,
+    day: int,
+    appearance: DayCellAppearance,
+    *,
+    hovered: bool,
+    layout: LayoutConfig,
+    color: Callable[[str], QColor],
+) -> None:
+    """
+    Paint one visible day cell with the colours of its resolved appearance.
+
+    Shared by the painted day grids and by palette-mode :class:`CalendarDayCell`
+    buttons.
+
+    ``color`` resolves style tokens to (cached) ``QColor`` instances; the
+    painter's font must already be the calendar day font.
+    """
+    if hovered:
+        background = appearance.hover_background
+        text_color = appearance.hover_text_color
+        underline_color = appearance.hover_underline_color
+    else:
+        background = appearance.background
+        text_color = appearance.text_color
+        underline_color = appearance.underline_color
+
+    if background != "transparent":
+        radius = layout.calendar_day_cell_radius
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color(background))
+        painter.drawRoundedRect(QRectF(rect), radius, radius)
+
+    painter.setPen(color(text_color))
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(day))
+
+    if underline_color:
+        underline = day_underline_rect(rect, layout)
+        if not underline.isEmpty():
+            radius = max(0, layout.calendar_day_underline_height // 2)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(color(underline_color))
+            painter.drawRoundedRect(QRectF(underline), radius, radius)
+
+
+def day_underline_rect(cell: QRect, layout: LayoutConfig) -> QRect:
+    """Mirror :meth:`CalendarDayCell._position_elements` for the painted underline."""
+    size = layout.calendar_day_cell_size
+    underline_height = max(layout.calendar_day_underline_height, 0)
+    underline_offset = max(layout.calendar_day_underline_offset, 0)
+    underline_width = max(layout.calendar_day_underline_width, 0)
+
+    usable_height = max(0, min(underline_height, size))
+    usable_width = max(0, min(underline_width, size))
+    max_offset = max(0, min(underline_offset, size - usable_height))
+    underline_x = (size - usable_width) // 2 if usable_width > 0 else 0
+    return QRect(
+        cell.x() + underline_x,
+        cell.y() + size - usable_height - max_offset,
+        usable_width,
+        usable_height,
+    )
+
+
+class _PaintedDayButton(QPushButton):
+    """Day button that paints its resolved appearance instead of using a stylesheet."""
+
+    def __init__(self, parent: QWidget, *, layout: LayoutConfig) -> None:
+        super().__init__(parent)
+        self._layout = layout
+        self._day = 0
+        self._appearance: DayCellAppearance | None = None
+        self._hovered = False
+
+    def set_appearance(self, day: int, appearance: DayCellAppearance) -> None:
+        if (day, appearance) == (self._day, self._appearance):
+            return
+        self._day = day
+        self._appearance = appearance
+        self.update()
+
+    def set_layout(self, layout: LayoutConfig) -> None:
+        self._layout = layout
+        self.update()
+
+    def set_hovered(self, hovered: bool) -> None:
+        if hovered == self._hovered:
+            return
+        self._hovered = hovered
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        appearance = self._appearance
+        if appearance is None or not self._day:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        paint_day_cell(
+            painter,
+            self.rect(),
+            self._day,
+            appearance,
+            hovered=self._hovered and appearance.enabled,
+            layout=self._layout,
+            color=state_color,
+        )
+
+
 class CalendarDayCell(QWidget):
-    """Visual representation of a day cell in the calendar grid."""
+    """
+    Visual representation of a day cell in the calendar grid.
+
+    With ``compiled_style=True`` the cell carries no stylesheet of its own;
+    it flips the ``state``/``hovered`` properties matched by the picker's
+    compiled stylesheet (see :mod:`~date_range_popover.styles.compiled_qss`).
+
+    With ``palette_states=True`` the button paints its colours, hover
+    background and today underline itself, so hovering or restyling a cell
+    only repaints it.
+    """
 
     clicked = Signal(QDate)
 
@@ -20,6 +221,8 @@ class CalendarDayCell(QWidget):
         *,
         style: CalendarStyleConfig | None = None,
         layout: LayoutConfig | None = None,
+        compiled_style: bool = False,
+        palette_states: bool = False,
     ) -> None:
         try:
             super().__init__(parent)
@@ -33,8 +236,16 @@ class CalendarDayCell(QWidget):
         self._date = QDate()
         self._style = style
         self._layout = layout or LayoutConfig()
+        self._compiled_style = compiled_style
 
-        self._button = QPushButton(self)
+        self._painted_button: _PaintedDayButton | None = None
+        self._button: QPushButton
+        if palette_states:
+            self._painted_button = _PaintedDayButton(self, layout=self._layout)
+            self._button = self._painted_button
+        else:
+            self._button = QPushButton(self)
+        self._button.setObjectName(CALENDAR_DAY_BUTTON)
         self._button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self._button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self._button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -50,12 +261,14 @@ class CalendarDayCell(QWidget):
             # afterwards so we still get the desired stacking order.
             self._underline = QWidget()
             self._underline.setParent(self._button)
+        self._underline.setObjectName(CALENDAR_DAY_UNDERLINE)
         self._underline.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self._underline.hide()
         self._underline.raise_()
 
         self._is_today = False
         self._is_hovered = False
+        self._state = STATE_DEFAULT
         self._underline_color = ""
         self._hover_underline_color = ""
 
@@ -73,6 +286,15 @@ class CalendarDayCell(QWidget):
 
     def apply_style(self, style: CalendarStyleConfig) -> None:
         self._style = style
+        if self._compiled_style:
+            self._set_state(STATE_DEFAULT)
+            return
+        if self._painted_button is not None:
+            day = self._date.day() if self._date.isValid() else 0
+            self._painted_button.set_appearance(
+                day, resolve_day_cell_appearance(style, is_selected=False)
+            )
+            return
         self._update_stylesheet(
             background="transparent",
             text_color=style.day_text_color,
@@ -80,6 +302,19 @@ class CalendarDayCell(QWidget):
             hover_text=style.day_hover_text_color,
         )
 
+    def apply_layout(self, layout: LayoutConfig) -> None:
+        """
+        Resize the cell and its today underline for ``layout``.
+
+        The cell radius is part of the cell's look, so call :meth:`set_day`
+        afterwards to pick up a changed ``calendar_day_cell_radius``.
+        """
+        self._layout = layout
+        if self._painted_button is not None:
+            self._painted_button.set_layout(layout)
+        self.setFixedSize(layout.calendar_day_cell_size, layout.calendar_day_cell_size)
+        self._position_elements()
+
     def set_day(
         self,
         date: QDate,
@@ -108,50 +343,49 @@ class CalendarDayCell(QWidget):
         self._button.setVisible(True)
         self._button.setText(str(date.day()))
         self._button.setEnabled(not is_disabled)
-
         if is_disabled:
-            text_color = self._style.muted_day_text_color
             self._button.setCursor(Qt.CursorShape.ArrowCursor)
         else:
-            text_color = self._style.day_text_color
             self._button.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        background = "transparent"
-        hover_background = self._style.day_hover_background
-        hover_text = self._style.day_hover_text_color
-
-        is_range_edge = is_range_start or is_range_end
-        if is_range_edge and not is_disabled:
-            background = self._style.range_edge_background
-            hover_background = self._style.range_edge_background
-            text_color = self._style.range_edge_text_color
-            hover_text = self._style.range_edge_text_color
-        elif is_in_range and not is_disabled:
-            background = self._style.range_between_background
-            hover_background = self._style.range_between_background
-            text_color = self._style.range_between_text_color
-            hover_text = self._style.range_between_text_color
-        elif is_selected and not is_disabled:
-            background = self._style.today_background
-            hover_background = self._style.today_background
-            hover_text = self._style.today_text_color
-            text_color = self._style.today_text_color
-
-        underline_color = text_color if is_today else None
-        hover_underline_color = hover_text if is_today else None
-
-        self._update_stylesheet(
-            background=background,
-            text_color=text_color,
-            hover_background=hover_background,
-            hover_text=hover_text,
+        appearance = resolve_day_cell_appearance(
+            self._style,
+            is_selected=is_selected,
+            is_disabled=is_disabled,
+            is_range_start=is_range_start,
+            is_range_end=is_range_end,
+            is_in_range=is_in_range,
+            is_today=is_today,
         )
+        if self._compiled_style:
+            self._set_state(
+                day_cell_state(
+                    is_selected=is_selected,
+                    is_disabled=is_disabled,
+                    is_range_start=is_range_start,
+                    is_range_end=is_range_end,
+                    is_in_range=is_in_range,
+                )
+            )
+        elif self._painted_button is not None:
+            self._painted_button.set_appearance(date.day(), appearance)
+        else:
+            self._update_stylesheet(
+                background=appearance.background,
+                text_color=appearance.text_color,
+                hover_background=appearance.hover_background,
+                hover_text=appearance.hover_text_color,
+            )
 
         self._is_today = is_today
-        self._underline_color = underline_color or ""
-        self._hover_underline_color = hover_underline_color or underline_color or ""
+        self._underline_color = appearance.underline_color
+        self._hover_underline_color = appearance.hover_underline_color
         self._update_underline()
 
+    def set_date(self, date: QDate) -> None:
+        """Point the cell at ``date`` without touching its visuals."""
+        self._date = date
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
         self._position_elements()
@@ -190,35 +424,43 @@ class CalendarDayCell(QWidget):
         hover_background: str,
         hover_text: str,
     ) -> None:
-        radius = self._layout.calendar_day_cell_radius
-        self._button.setStyleSheet(
-            "QPushButton {"
-            f"background-color: {background};"
-            f"color: {text_color};"
-            "border: none;"
-            f"border-radius: {radius}px;"
-            "padding: 0;"
-            "outline: none;"
-            "}"
-            "QPushButton:hover {"
-            f"background-color: {hover_background};"
-            f"color: {hover_text};"
-            "outline: none;"
-            "}"
+        sheet = cached_qss(
+            day_cell_qss,
+            DayCellStyle(
+                background=background,
+                text_color=text_color,
+                hover_background=hover_background,
+                hover_text_color=hover_text,
+                radius=self._layout.calendar_day_cell_radius,
+            ),
         )
+        apply_stylesheet(self._button, sheet)
+
+    def _set_state(self, state: str) -> None:
+        # The underline picks the state up in ``_update_underline`` and only
+        # while it is visible, so hidden underlines are never re-polished.
+        self._state = state
+        set_style_property(self._button, STATE_PROPERTY, state)
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         if watched is self._button:
             if event.type() == QEvent.Type.Enter:
                 self._is_hovered = True
-                self._update_underline()
+                self._update_hover()
             elif event.type() == QEvent.Type.Leave:
                 self._is_hovered = False
-                self._update_underline()
+                self._update_hover()
         return super().eventFilter(watched, event)
 
+    def _update_hover(self) -> None:
+        if self._painted_button is not None:
+            self._painted_button.set_hovered(self._is_hovered)
+        else:
+            self._update_underline()
+
     def _update_underline(self) -> None:
-        if not self._is_today:
+        if not self._is_today or self._painted_button is not None:
+            # Painted buttons draw the today underline themselves.
             self._underline.hide()
             return
 
@@ -227,12 +469,21 @@ class CalendarDayCell(QWidget):
             self._underline.hide()
             return
 
-        height = self._layout.calendar_day_underline_height
-        radius = max(0, height // 2)
-        self._underline.setStyleSheet(
-            f"background-color: {color};" "border: none;" f"border-radius: {radius}px;"
-        )
+        if self._compiled_style:
+            set_style_property(self._underline, STATE_PROPERTY, self._state)
+            hovered = "true" if self._is_hovered else "false"
+            set_style_property(self._underline, HOVERED_PROPERTY, hovered)
+        else:
+            height = self._layout.calendar_day_underline_height
+            radius = max(0, height // 2)
+            apply_stylesheet(self._underline, cached_qss(day_cell_underline_qss, color, radius))
         self._underline.show()
 
 
-__all__ = ["CalendarDayCell"]
+__all__ = [
+    "CalendarDayCell",
+    "DayCellAppearance",
+    "day_underline_rect",
+    "paint_day_cell",
+    "resolve_day_cell_appearance",
+]
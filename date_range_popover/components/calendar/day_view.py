@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import calendar
-from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import NamedTuple, cast
 
 from PySide6.QtCore import QDate, Qt, Signal
 from PySide6.QtWidgets import (
@@ -13,14 +14,111 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ...core.day_grid import (
+    CellUpdateStats,
+    DayCellFlag,
+    DayCellRecord,
+    compute_day_flags,
+    make_day_cell_record,
+)
 from ...styles import constants
+from ...styles.compiled_qss import CALENDAR_DAY_LABELS, CALENDAR_DAY_VIEW
 from ...styles.theme import CalendarStyleConfig, LayoutConfig
-from ...utils import connect_signal, iter_month_days, qdate_is_after, qdate_is_before
+from ...utils import connect_signal, month_layout, qdate_to_ordinal
 from .day_cell import CalendarDayCell
 
 
+class DayState(NamedTuple):
+    """Per-cell state flags shared by the widget-backed and painted day grids."""
+
+    date: QDate
+    in_current_month: bool
+    is_selected: bool
+    is_disabled: bool
+    is_range_start: bool
+    is_range_end: bool
+    is_in_range: bool
+    is_today: bool
+    julian_day: int
+    day: int
+    flags: int
+
+
+def compute_day_states(
+    *,
+    visible_month: QDate,
+    today: QDate,
+    selected_date: QDate,
+    range_start: QDate | None = None,
+    range_end: QDate | None = None,
+    min_date: QDate | None = None,
+    max_date: QDate | None = None,
+) -> list[DayState]:
+    """
+    Return the 42 :class:`DayState` entries rendered for ``visible_month``.
+
+    Flags for the whole grid come from :func:`compute_day_flags`, which works
+    on the integer Julian days of the cached
+    :class:`~date_range_popover.utils.month_grid.MonthLayout`; the only
+    per-cell ``QDate`` work is constructing the date each state carries.
+    """
+    layout = month_layout(visible_month.year(), visible_month.month())
+    all_flags = compute_day_flags(
+        layout.julian_days,
+        layout.in_month,
+        selected=_julian_or_none(selected_date),
+        today=_julian_or_none(today),
+        range_start=_julian_or_none(range_start),
+        range_end=_julian_or_none(range_end),
+        min_julian=qdate_to_ordinal(min_date) if min_date is not None else None,
+        max_julian=qdate_to_ordinal(max_date) if max_date is not None else None,
+    )
+    return [
+        DayState(
+            date=QDate.fromJulianDay(julian),
+            in_current_month=bool(flags & DayCellFlag.IN_MONTH),
+            is_selected=bool(flags & DayCellFlag.SELECTED),
+            is_disabled=bool(flags & DayCellFlag.DISABLED),
+            is_range_start=bool(flags & DayCellFlag.RANGE_START),
+            is_range_end=bool(flags & DayCellFlag.RANGE_END),
+            is_in_range=bool(flags & DayCellFlag.IN_RANGE),
+            is_today=bool(flags & DayCellFlag.TODAY),
+            julian_day=julian,
+            day=day,
+            flags=flags,
+        )
+        for julian, day, flags in zip(layout.julian_days, layout.days, all_flags)
+    ]
+
+
+def _julian_or_none(date: QDate | None) -> int | None:
+    if date is None or not date.isValid():
+        return None
+    return date.toJulianDay()
+
+
+def weekday_names() -> list[str]:
+    """Return the two-letter weekday labels shown above the day grid."""
+    locale = calendar.LocaleTextCalendar(firstweekday=0)
+    labels: list[str] = []
+    for day_index in range(7):
+        label = locale.formatweekday(day_index, width=2).strip()
+        labels.append(label.capitalize())
+    return labels
+
+
 class CalendarDayView(QWidget):
-    """Displays the day grid with weekday labels."""
+    """
+    Displays the day grid with weekday labels.
+
+    ``update_days`` keeps a :class:`DayCellRecord` per cell and only restyles
+    the cells whose record changed; :attr:`update_stats` reports how many cell
+    updates were applied versus skipped.
+
+    ``compiled_style=True`` leaves styling to the picker's compiled
+    stylesheet: the view, its labels and its cells set no stylesheets.
+    ``palette_states=True`` makes the cells paint their own state colours.
+    """
 
     day_selected = Signal(QDate)
 
@@ -30,6 +128,8 @@ class CalendarDayView(QWidget):
         *,
         style: CalendarStyleConfig | None = None,
         layout: LayoutConfig | None = None,
+        compiled_style: bool = False,
+        palette_states: bool = False,
     ) -> None:
         super().__init__(parent)
 
@@ -56,12 +156,15 @@ class CalendarDayView(QWidget):
             )
         self._style = style
         self._layout_config = layout or LayoutConfig()
+        self._compiled_style = compiled_style
+        self.setObjectName(CALENDAR_DAY_VIEW)
 
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(0, 0, 0, 0)
         root_layout.setSpacing(self._layout_config.calendar_grid_spacing)
 
         self._labels_container = QWidget(self)
+        self._labels_container.setObjectName(CALENDAR_DAY_LABELS)
         self._labels_container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._labels_container.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         root_layout.addWidget(self._labels_container, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -71,7 +174,7 @@ class CalendarDayView(QWidget):
         labels_layout.setSpacing(self._layout_config.calendar_grid_spacing)
 
         self._weekday_labels: list[QLabel] = []
-        for day_name in self._weekday_names():
+        for day_name in weekday_names():
             label = QLabel(day_name)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             label.setFont(constants.create_calendar_day_label_font())
@@ -92,11 +195,17 @@ class CalendarDayView(QWidget):
         grid_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self._cells: list[CalendarDayCell] = []
+        self._records: list[DayCellRecord | None] = [None] * (6 * 7)
+        self._style_key = 0
+        self._applied_updates = 0
+        self._skipped_updates = 0
         for index in range(6 * 7):
             cell = CalendarDayCell(
                 self._grid_container,
                 style=self._style,
                 layout=self._layout_config,
+                compiled_style=compiled_style,
+                palette_states=palette_states,
             )
             connect_signal(cell.clicked, self.day_selected.emit)
             row = index // 7
@@ -108,20 +217,55 @@ class CalendarDayView(QWidget):
 
     def apply_style(self, style: CalendarStyleConfig) -> None:
         self._style = style
-        self.setStyleSheet(f"background-color: {style.background};")
-        self._labels_container.setStyleSheet(
-            f"background-color: {style.day_label_background};"
-            " border-radius: 4px;"
-            " border: none;"
-        )
-        for label in self._weekday_labels:
-            label.setStyleSheet(
-                f"color: {style.muted_day_text_color};"
-                " background-color: transparent;"
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {style.background};")
+            self._labels_container.setStyleSheet(
+                f"background-color: {style.day_label_background};"
+                " border-radius: 4px;"
                 " border: none;"
             )
+            for label in self._weekday_labels:
+                label.setStyleSheet(
+                    f"color: {style.muted_day_text_color};"
+                    " background-color: transparent;"
+                    " border: none;"
+                )
         for cell in self._cells:
             cell.apply_style(style)
+        # ``CalendarDayCell.apply_style`` resets each cell to its neutral look, so
+        # every record is stale until the next refresh.
+        self._style_key += 1
+        self._records = [None] * len(self._cells)
+
+    def apply_layout(self, layout: LayoutConfig) -> None:
+        """Resize the weekday labels and day cells and respace the grid for ``layout``."""
+        self._layout_config = layout
+        spacing = layout.calendar_grid_spacing
+        for container_layout in (self.layout(), self._labels_container.layout()):
+            if container_layout is not None:
+                container_layout.setSpacing(spacing)
+        grid_layout = cast(QGridLayout | None, self._grid_container.layout())
+        if grid_layout is not None:
+            grid_layout.setHorizontalSpacing(spacing)
+            grid_layout.setVerticalSpacing(spacing)
+        for label in self._weekday_labels:
+            label.setFixedWidth(layout.calendar_day_cell_size)
+            label.setFixedHeight(layout.calendar_day_label_height)
+        for cell in self._cells:
+            cell.apply_layout(layout)
+        # Cell stylesheets carry the radius, so re-render every cell on the next refresh.
+        self._style_key += 1
+        self._records = [None] * len(self._cells)
+
+    @property
+    def update_stats(self) -> CellUpdateStats:
+        """Return how many cell updates were applied versus skipped so far."""
+        return CellUpdateStats(applied=self._applied_updates, skipped=self._skipped_updates)
+
+    def reset_update_stats(self) -> None:
+        """Reset the applied/skipped counters reported by :attr:`update_stats`."""
+        self._applied_updates = 0
+        self._skipped_updates = 0
 
     def update_days(
         self,
@@ -134,52 +278,38 @@ class CalendarDayView(QWidget):
         min_date: QDate | None = None,
         max_date: QDate | None = None,
     ) -> None:
-        start_julian: int | None = None
-        end_julian: int | None = None
-        if range_start is not None and range_start.isValid():
-            start_julian = range_start.toJulianDay()
-        if range_end is not None and range_end.isValid():
-            end_julian = range_end.toJulianDay()
-        if start_julian is not None and end_julian is not None and start_julian > end_julian:
-            start_julian, end_julian = end_julian, start_julian
-
-        for index, day_date in enumerate(iter_month_days(visible_month)):
-            cell = self._cells[index]
-            in_current_month = (
-                day_date.month() == visible_month.month()
-                and day_date.year() == visible_month.year()
-            )
-            is_selected: bool = day_date.toJulianDay() == selected_date.toJulianDay()
-            is_disabled = (min_date is not None and qdate_is_before(day_date, min_date)) or (
-                max_date is not None and qdate_is_after(day_date, max_date)
-            )
-            day_julian = day_date.toJulianDay()
-            is_range_start = start_julian is not None and day_julian == start_julian
-            is_range_end = end_julian is not None and day_julian == end_julian
-            is_in_range = (
-                start_julian is not None
-                and end_julian is not None
-                and start_julian < day_julian < end_julian
+        self.set_states(
+            compute_day_states(
+                visible_month=visible_month,
+                today=today,
+                selected_date=selected_date,
+                range_start=range_start,
+                range_end=range_end,
+                min_date=min_date,
+                max_date=max_date,
             )
-            is_today = day_date.toJulianDay() == today.toJulianDay()
+        )
+
+    def set_states(self, states: Sequence[DayState]) -> None:
+        """Render precomputed states (e.g. from :class:`MonthPrefetcher`)."""
+        for index, (cell, state) in enumerate(zip(self._cells, states)):
+            record = make_day_cell_record(state.day, state.flags, self._style_key)
+            if record == self._records[index]:
+                cell.set_date(state.date)
+                self._skipped_updates += 1
+                continue
+            self._records[index] = record
+            self._applied_updates += 1
             cell.set_day(
-                day_date,
-                in_current_month=in_current_month,
-                is_selected=is_selected and not is_disabled,
-                is_disabled=is_disabled,
-                is_range_start=is_range_start,
-                is_range_end=is_range_end,
-                is_in_range=is_in_range,
-                is_today=is_today,
+                state.date,
+                in_current_month=state.in_current_month,
+                is_selected=state.is_selected,
+                is_disabled=state.is_disabled,
+                is_range_start=state.is_range_start,
+                is_range_end=state.is_range_end,
+                is_in_range=state.is_in_range,
+                is_today=state.is_today,
             )
 
-    def _weekday_names(self) -> Iterable[str]:
-        locale = calendar.LocaleTextCalendar(firstweekday=0)
-        labels: list[str] = []
-        for day_index in range(7):
-            label = locale.formatweekday(day_index, width=2).strip()
-            labels.append(label.capitalize())
-        return labels
-
 
-__all__ = ["CalendarDayView"]
+__all__ = ["CalendarDayView", "DayState", "compute_day_states", "weekday_names"]
@@ -0,0 +1,145 @@
+"""
+Idle-time prefetching of the months adjacent to the visible one.
+
+Navigating with the previous/next arrows used to compute every cell state (and
+repaint the whole grid) synchronously inside the click handler. The
+:class:`MonthPrefetcher` below computes those results for the neighbouring
+months from a zero-interval timer—one month per event-loop turn—so the
+navigation handler can swap in a ready-made :class:`MonthSnapshot` instead.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+
+from PySide6.QtCore import QDate, QObject, QTimer
+from PySide6.QtGui import QPixmap
+
+from ...utils import connect_signal
+from .day_view import DayState
+
+StatesFactory = Callable[[QDate], list[DayState]]
+PixmapRenderer = Callable[[Sequence[DayState]], QPixmap]
+
+
+@dataclass(frozen=True, slots=True)
+class MonthSnapshot:
+    """Precomputed day states (and optionally a rendered grid) for one month."""
+
+    month: QDate
+    states: tuple[DayState, ...]
+    pixmap: QPixmap | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PrefetchStats:
+    """Counters describing how often navigation found a prefetched month."""
+
+    hits: int = 0
+    misses: int = 0
+    prefetched: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (``0.0`` before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MonthPrefetcher(QObject):
+    """
+    Compute :class:`MonthSnapshot` objects for upcoming months during idle time.
+
+    ``compute_states`` builds the states for a month using the owner's current
+    selection and constraints; ``render_pixmap`` (painted grids only) turns
+    them into an offscreen image. Callers describe that selection state with a
+    hashable ``context``—any change drops the cached snapshots because they
+    would no longer match what the grid should show.
+    """
+
+    def __init__(
+        self,
+        compute_states: StatesFactory,
+        *,
+        render_pixmap: PixmapRenderer | None = None,
+        capacity: int = 8,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._compute_states = compute_states
+        self._render_pixmap = render_pixmap
+        self._capacity = max(1, capacity)
+        self._snapshots: OrderedDict[int, MonthSnapshot] = OrderedDict()
+        self._queue: deque[QDate] = deque()
+        self._context: Hashable = None
+        self._hits = 0
+        self._misses = 0
+        self._prefetched = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        connect_signal(self._timer.timeout, self._process_next)
+
+    @property
+    def stats(self) -> PrefetchStats:
+        return PrefetchStats(hits=self._hits, misses=self._misses, prefetched=self._prefetched)
+
+    @property
+    def pending(self) -> int:
+        """Number of months still waiting in the idle queue."""
+        return len(self._queue)
+
+    def schedule(self, months: Sequence[QDate], context: Hashable) -> None:
+        """Queue ``months`` for idle computation under ``context``."""
+        if context != self._context:
+            self._context = context
+            self._snapshots.clear()
+        self._queue = deque(
+            QDate(month) for month in months if month.toJulianDay() not in self._snapshots
+        )
+        if self._queue:
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def take(self, month: QDate, context: Hashable) -> MonthSnapshot | None:
+        """Return the snapshot for ``month`` if one was prefetched under ``context``."""
+        snapshot = None
+        if context == self._context:
+            snapshot = self._snapshots.get(month.toJulianDay())
+        if snapshot is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._snapshots.move_to_end(month.toJulianDay())
+        return snapshot
+
+    def clear(self) -> None:
+        """Drop cached snapshots and pending work (e.g. after a style change)."""
+        self._timer.stop()
+        self._queue.clear()
+        self._snapshots.clear()
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._prefetched = 0
+
+    def _process_next(self) -> None:
+        if not self._queue:
+            return
+        month = self._queue.popleft()
+        states = tuple(self._compute_states(month))
+        pixmap = self._render_pixmap(states) if self._render_pixmap is not None else None
+        self._snapshots[month.toJulianDay()] = MonthSnapshot(month, states, pixmap)
+        self._prefetched += 1
+        while len(self._snapshots) > self._capacity:
+            self._snapshots.popitem(last=False)
+        if self._queue:
+            self._timer.start()
+
+
+__all__ = ["MonthPrefetcher", "MonthSnapshot", "PrefetchStats"]
@@ -13,6 +13,15 @@ from PySide6.QtWidgets import (
 
 from ...exceptions import InvalidDateError
 from ...styles import constants
+from ...styles.compiled_qss import (
+    CALENDAR_CHOICE_BUTTON,
+    CALENDAR_MONTH_VIEW,
+    STATE_DEFAULT,
+    STATE_PROPERTY,
+    STATE_SELECTED,
+    set_style_property,
+)
+from ...styles.qss_cache import apply_stylesheet, cached_qss
 from ...styles.style_templates import (
     CircularButtonHoverStyle,
     CircularButtonStyle,
@@ -22,6 +31,9 @@ from ...styles.style_templates import (
 from ...styles.theme import CalendarStyleConfig, LayoutConfig
 from ...utils import connect_signal
 
+MONTH_BUTTON_WIDTH = 86
+_MONTH_GRID_COLUMNS = 3
+
 
 class CalendarMonthView(QWidget):
     """Month selection grid."""
@@ -34,8 +46,11 @@ class CalendarMonthView(QWidget):
         *,
         style: CalendarStyleConfig | None = None,
         layout: LayoutConfig | None = None,
+        compiled_style: bool = False,
     ) -> None:
         super().__init__(parent)
+        self._compiled_style = compiled_style
+        self.setObjectName(CALENDAR_MONTH_VIEW)
         if style is None:
             style = CalendarStyleConfig(
                 background="#1f1f1f",
@@ -74,15 +89,16 @@ class CalendarMonthView(QWidget):
         for index in range(1, 13):
             month_name = calendar.month_abbr[index]
             button = QPushButton(month_name, self)
+            button.setObjectName(CALENDAR_CHOICE_BUTTON)
             button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
             button.setCursor(Qt.CursorShape.PointingHandCursor)
             button.setFont(constants.create_calendar_day_font())
-            button.setFixedWidth(86)
+            button.setFixedWidth(MONTH_BUTTON_WIDTH)
             button.setFixedHeight(self._layout_config.calendar_day_cell_size)
             button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
             connect_signal(button.clicked, self._make_handler(index))
-            row = (index - 1) // 3
-            column = (index - 1) % 3
+            row = (index - 1) // _MONTH_GRID_COLUMNS
+            column = (index - 1) % _MONTH_GRID_COLUMNS
             grid_layout.addWidget(button, row, column)
             grid_layout.setColumnStretch(column, 1)
             grid_layout.setRowStretch(row, 1)
@@ -91,9 +107,16 @@ class CalendarMonthView(QWidget):
         self._selected_month = 1
         self.apply_style(self._style)
 
+    @staticmethod
+    def grid_width(layout: LayoutConfig) -> int:
+        """Return the width the month grid occupies, without building it."""
+        spacing = layout.calendar_grid_spacing
+        return _MONTH_GRID_COLUMNS * MONTH_BUTTON_WIDTH + (_MONTH_GRID_COLUMNS - 1) * spacing
+
     def apply_style(self, style: CalendarStyleConfig) -> None:
         self._style = style
-        self.setStyleSheet(f"background-color: {style.background};")
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {style.background};")
         self._refresh_button_styles()
 
     def set_selected_month(self, month: int) -> None:
@@ -112,29 +135,35 @@ class CalendarMonthView(QWidget):
                 self._apply_default_style(button)
 
     def _apply_selected_style(self, button: QPushButton) -> None:
+        if self._compiled_style:
+            set_style_property(button, STATE_PROPERTY, STATE_SELECTED)
+            return
         radius = self._layout_config.calendar_day_cell_radius
-        button.setStyleSheet(
-            circular_button_selected_qss(
-                CircularButtonStyle(
-                    background=self._style.today_background,
-                    text_color=self._style.today_text_color,
-                    radius=radius,
-                )
-            )
+        sheet = cached_qss(
+            circular_button_selected_qss,
+            CircularButtonStyle(
+                background=self._style.today_background,
+                text_color=self._style.today_text_color,
+                radius=radius,
+            ),
         )
+        apply_stylesheet(button, sheet)
 
     def _apply_default_style(self, button: QPushButton) -> None:
+        if self._compiled_style:
+            set_style_property(button, STATE_PROPERTY, STATE_DEFAULT)
+            return
         radius = self._layout_config.calendar_day_cell_radius
-        button.setStyleSheet(
-            circular_button_default_qss(
-                CircularButtonHoverStyle(
-                    text_color=self._style.day_text_color,
-                    hover_background=self._style.day_hover_background,
-                    hover_text_color=self._style.day_hover_text_color,
-                    radius=radius,
-                )
-            )
+        sheet = cached_qss(
+            circular_button_default_qss,
+            CircularButtonHoverStyle(
+                text_color=self._style.day_text_color,
+                hover_background=self._style.day_hover_background,
+                hover_text_color=self._style.day_hover_text_color,
+                radius=radius,
+            ),
         )
+        apply_stylesheet(button, sheet)
 
     def _make_handler(self, month: int) -> Callable[[], None]:
         def handler() -> None:
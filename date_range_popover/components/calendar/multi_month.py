@@ -0,0 +1,517 @@
+"""
+Painted calendar showing several consecutive months side by side.
+
+Reporting hosts want 2, 3, 6 or 12 months on screen at once with range bands
+that continue across month boundaries. Stacking that many
+:class:`CalendarWidget` instances would multiply widgets, stylesheets and
+per-month state computation. :class:`MultiMonthCalendar` instead paints every
+month in one widget and shares its work across all of them:
+
+* the cached :func:`~date_range_popover.utils.month_grid.month_layout` grids
+  are concatenated into one Julian-day array, so a single
+  :func:`compute_day_flags` call covers every visible cell;
+* one appearance cache maps flag values to resolved colours for all months;
+* one flat hit-test index maps a point to a cell without per-month lookups.
+
+While the first end of a range is picked, hovering previews the range; each
+preview recomputes the flags in one batch and repaints only the cells whose
+flags changed.
+"""
+
+from __future__ import annotations
+
+import calendar
+from array import array
+from typing import Final
+
+from PySide6.QtCore import QDate, QEvent, QPoint, QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QEnterEvent, QMouseEvent, QPainter, QPaintEvent
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+from ...core.day_grid import CellUpdateStats, DayCellFlag, compute_day_flags
+from ...exceptions import InvalidConfigurationError
+from ...styles import constants
+from ...styles.theme import CalendarStyleConfig, LayoutConfig
+from ...utils import first_of_month, month_layout
+from .day_cell import DayCellAppearance, paint_day_cell, resolve_day_cell_appearance
+from .day_view import weekday_names
+
+MAX_VISIBLE_MONTHS: Final[int] = 12
+
+_GRID_ROWS = 6
+_GRID_COLUMNS = 7
+_CELLS_PER_MONTH = _GRID_ROWS * _GRID_COLUMNS
+_LABEL_RADIUS = 4
+_MONTH_GAP = 16
+
+
+class MultiMonthCalendar(QWidget):
+    """
+    Range picker that paints ``months`` consecutive months in a grid.
+
+    The first click anchors a range and hovering previews it; the second
+    click completes it and emits :attr:`range_selected` with the dates in
+    chronological order. :attr:`update_stats` counts repainted versus
+    unchanged cells across refreshes.
+    """
+
+    range_selected = Signal(QDate, QDate)
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        *,
+        style: CalendarStyleConfig | None = None,
+        layout: LayoutConfig | None = None,
+        months: int = 3,
+        columns: int | None = None,
+    ) -> None:
+        super().__init__(parent)
+
+        if isinstance(months, bool) or not 1 <= months <= MAX_VISIBLE_MONTHS:
+            raise InvalidConfigurationError(
+                f"months must be an integer between 1 and {MAX_VISIBLE_MONTHS}"
+            )
+        if columns is None:
+            columns = min(months, 3)
+        if isinstance(columns, bool) or not 1 <= columns <= months:
+            raise InvalidConfigurationError("columns must be between 1 and months")
+
+        if style is None:
+            style = CalendarStyleConfig(
+                background="#1f1f1f",
+                header_text_color="#f5f5f5",
+                day_text_color="#f5f5f5",
+                muted_day_text_color="#8c8c8c",
+                today_background="#f5f5f5",
+                today_text_color="#1f1f1f",
+                today_underline_color="#1f1f1f",
+                day_hover_background="#2e2e2e",
+                day_hover_text_color="#f5f5f5",
+                nav_icon_color="#dbdbdb",
+                day_label_background="#2e2e2e",
+                mode_label_background="#2e2e2e",
+                header_hover_background="#2e2e2e",
+                header_hover_text_color="#ffffff",
+                range_edge_background="#f2f2f2",
+                range_edge_text_color="#1f1f1f",
+                range_between_background="#2e2e2e",
+                range_between_text_color="#ffffff",
+            )
+        self._style = style
+        self._layout_config = layout or LayoutConfig()
+        self._months = months
+        self._columns = columns
+
+        self._title_font = constants.create_calendar_header_font()
+        self._label_font = constants.create_calendar_day_label_font()
+        self._day_font = constants.create_calendar_day_font()
+        self._weekday_labels = weekday_names()
+        self._colors: dict[str, QColor] = {}
+        self._appearances: dict[int, DayCellAppearance | None] = {}
+
+        today = QDate.currentDate()
+        self._today = today.toJulianDay()
+        self._first_month = first_of_month(today)
+        self._min_julian: int | None = None
+        self._max_julian: int | None = None
+        self._range_start: int | None = None
+        self._range_end: int | None = None
+        self._anchor: int | None = None
+        self._preview: int | None = None
+
+        self._julians: array[int] = array("q")
+        self._days: array[int] = array("b")
+        self._in_month: array[int] = array("b")
+        self._flags: list[int] = []
+        self._applied_updates = 0
+        self._skipped_updates = 0
+        self._hover_index: int | None = None
+        self._pressed_index: int | None = None
+        self._pointer_cursor = False
+
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setMouseTracking(True)
+        rows = -(-months // columns)
+        self.setFixedSize(
+            columns * self._block_width() + (columns - 1) * _MONTH_GAP,
+            rows * self._block_height() + (rows - 1) * _MONTH_GAP,
+        )
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+
+        self._load_months()
+
+    # Public API ---------------------------------------------------------------------
+
+    @property
+    def months(self) -> int:
+        return self._months
+
+    @property
+    def first_month(self) -> QDate:
+        return QDate(self._first_month)
+
+    @property
+    def selected_range(self) -> tuple[QDate | None, QDate | None]:
+        """Return the committed range (``end`` is ``None`` while a range is being picked)."""
+        return _to_qdate(self._range_start), _to_qdate(self._range_end)
+
+    @property
+    def update_stats(self) -> CellUpdateStats:
+        """Return how many cell repaints were applied versus skipped so far."""
+        return CellUpdateStats(applied=self._applied_updates, skipped=self._skipped_updates)
+
+    def reset_update_stats(self) -> None:
+        """Reset the applied/skipped counters reported by :attr:`update_stats`."""
+        self._applied_updates = 0
+        self._skipped_updates = 0
+
+    def apply_style(self, style: CalendarStyleConfig) -> None:
+        self._style = style
+        self._colors.clear()
+        self._appearances.clear()
+        self.update()
+
+    def set_first_month(self, month: QDate) -> None:
+        """Show ``months`` consecutive months starting with ``month``."""
+        target = first_of_month(month)
+        if target == self._first_month:
+            return
+        self._first_month = target
+        self._load_months()
+
+    def shift_months(self, delta: int) -> None:
+        """Move the visible window by ``delta`` months."""
+        self.set_first_month(self._first_month.addMonths(delta))
+
+    def set_range(self, start: QDate | None, end: QDate | None) -> None:
+        """Programmatically select ``start``..``end`` (order-insensitive)."""
+        first = _to_julian(start)
+        second = _to_julian(end)
+        if first is not None and second is not None and first > second:
+            first, second = second, first
+        self._range_start = first
+        self._range_end = second
+        self._anchor = None
+        self._preview = None
+        self._refresh_flags()
+
+    def set_constraints(self, *, min_date: QDate | None, max_date: QDate | None) -> None:
+        """Disable every day outside ``min_date``..``max_date``."""
+        self._min_julian = _to_julian(min_date)
+        self._max_julian = _to_julian(max_date)
+        self._refresh_flags()
+
+    def date_at(self, pos: QPoint) -> QDate | None:
+        """Return the visible date under ``pos`` (``None`` for titles, gaps and padding)."""
+        index = self._visible_index_at(pos)
+        return QDate.fromJulianDay(self._julians[index]) if index is not None else None
+
+    def index_at(self, pos: QPoint) -> int | None:
+        """Return the flat cell index under ``pos`` across all months."""
+        block_width = self._block_width()
+        block_height = self._block_height()
+        if pos.x() < 0 or pos.y() < 0:
+            return None
+        slot_column, x = divmod(pos.x(), block_width + _MONTH_GAP)
+        slot_row, y = divmod(pos.y(), block_height + _MONTH_GAP)
+        if slot_column >= self._columns or x >= block_width or y >= block_height:
+            return None
+        slot = slot_row * self._columns + slot_column
+        if slot >= self._months:
+            return None
+
+        cell_size = self._layout_config.calendar_day_cell_size
+        pitch = cell_size + self._layout_config.calendar_grid_spacing
+        y -= self._grid_top()
+        if y < 0:
+            return None
+        column, column_offset = divmod(x, pitch)
+        row, row_offset = divmod(y, pitch)
+        if row >= _GRID_ROWS or column_offset >= cell_size or row_offset >= cell_size:
+            return None
+        return slot * _CELLS_PER_MONTH + row * _GRID_COLUMNS + column
+
+    def cell_rect(self, index: int) -> QRect:
+        """Return the widget-relative rectangle occupied by flat cell ``index``."""
+        slot, cell = divmod(index, _CELLS_PER_MONTH)
+        origin = self._block_origin(slot)
+        cell_size = self._layout_config.calendar_day_cell_size
+        pitch = cell_size + self._layout_config.calendar_grid_spacing
+        row, column = divmod(cell, _GRID_COLUMNS)
+        return QRect(
+            origin.x() + column * pitch,
+            origin.y() + self._grid_top() + row * pitch,
+            cell_size,
+            cell_size,
+        )
+
+    # Qt events ----------------------------------------------------------------------
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.fillRect(dirty, self._color(self._style.background))
+        for slot in range(self._months):
+            header = QRect(self._block_origin(slot), self._header_size())
+            if header.intersects(dirty):
+                self._paint_header(painter, slot, header)
+
+        painter.setFont(self._day_font)
+        for index, flags in enumerate(self._flags):
+            if not flags & DayCellFlag.IN_MONTH:
+                continue
+            rect = self.cell_rect(index)
+            if not rect.intersects(dirty):
+                continue
+            appearance = self._appearance(flags)
+            if appearance is None:
+                continue
+            paint_day_cell(
+                painter,
+                rect,
+                self._days[index],
+                appearance,
+                hovered=index == self._hover_index and appearance.enabled,
+                layout=self._layout_config,
+                color=self._color,
+            )
+        painter.end()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        self._set_hover_index(self._visible_index_at(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def enterEvent(self, event: QEnterEvent) -> None:  # noqa: N802
+        self._set_hover_index(self._visible_index_at(event.position().toPoint()))
+        super().enterEvent(event)
+
+    def leaveEvent(self, event: QEvent) -> None:  # noqa: N802
+        self._set_hover_index(None)
+        self._set_preview(None)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._pressed_index = self._enabled_index_at(event.position().toPoint())
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        if event.button() == Qt.MouseButton.LeftButton:
+            pressed = self._pressed_index
+            self._pressed_index = None
+            released = self._enabled_index_at(event.position().toPoint())
+            if pressed is not None and pressed == released:
+                self._on_day_clicked(self._julians[released])
+        super().mouseReleaseEvent(event)
+
+    # Internal helpers ---------------------------------------------------------------
+
+    def _set_preview(self, julian: int | None) -> None:
+        if julian == self._preview:
+            return
+        self._preview = julian
+        if self._anchor is not None:
+            # The preview band may change anywhere, so re-diff the whole batch.
+            self._refresh_flags()
+
+    def _on_day_clicked(self, julian: int) -> None:
+        self._preview = None
+        if self._anchor is None:
+            self._anchor = julian
+            self._range_start = julian
+            self._range_end = None
+            self._refresh_flags()
+            return
+        start, end = sorted((self._anchor, julian))
+        self._anchor = None
+        self._range_start = start
+        self._range_end = end
+        self._refresh_flags()
+        self.range_selected.emit(QDate.fromJulianDay(start), QDate.fromJulianDay(end))
+
+    def _load_months(self) -> None:
+        julians: array[int] = array("q")
+        days: array[int] = array("b")
+        in_month: array[int] = array("b")
+        for slot in range(self._months):
+            month = self._first_month.addMonths(slot)
+            grid = month_layout(month.year(), month.month())
+            julians.extend(grid.julian_days)
+            days.extend(grid.days)
+            in_month.extend(grid.in_month)
+        self._julians = julians
+        self._days = days
+        self._in_month = in_month
+        # Every cell moves to a new date, so repaint everything.
+        self._flags = []
+        self._refresh_flags()
+
+    def _refresh_flags(self) -> None:
+        range_start, range_end = self._effective_range()
+        flags = compute_day_flags(
+            self._julians,
+            self._in_month,
+            today=self._today,
+            range_start=range_start,
+            range_end=range_end,
+            min_julian=self._min_julian,
+            max_julian=self._max_julian,
+        )
+        previous = self._flags
+        self._flags = flags
+        if len(previous) != len(flags):
+            self._applied_updates += len(flags)
+            self.update()
+        else:
+            for index, value in enumerate(flags):
+                if value == previous[index]:
+                    self._skipped_updates += 1
+                    continue
+                self._applied_updates += 1
+                self.update(self.cell_rect(index))
+        self._sync_cursor()
+
+    def _effective_range(self) -> tuple[int | None, int | None]:
+        if self._anchor is None:
+            return self._range_start, self._range_end
+        if self._preview is None:
+            return self._anchor, None
+        start, end = sorted((self._anchor, self._preview))
+        return start, end
+
+    def _appearance(self, flags: int) -> DayCellAppearance | None:
+        if flags in self._appearances:
+            return self._appearances[flags]
+        appearance = None
+        if flags & DayCellFlag.IN_MONTH:
+            appearance = resolve_day_cell_appearance(
+                self._style,
+                is_selected=bool(flags & DayCellFlag.SELECTED),
+                is_disabled=bool(flags & DayCellFlag.DISABLED),
+                is_range_start=bool(flags & DayCellFlag.RANGE_START),
+                is_range_end=bool(flags & DayCellFlag.RANGE_END),
+                is_in_range=bool(flags & DayCellFlag.IN_RANGE),
+                is_today=bool(flags & DayCellFlag.TODAY),
+            )
+        self._appearances[flags] = appearance
+        return appearance
+
+    def _visible_index_at(self, pos: QPoint) -> int | None:
+        index = self.index_at(pos)
+        if index is None or index >= len(self._flags):
+            return None
+        if not self._flags[index] & DayCellFlag.IN_MONTH:
+            return None
+        return index
+
+    def _enabled_index_at(self, pos: QPoint) -> int | None:
+        index = self._visible_index_at(pos)
+        if index is None or self._flags[index] & DayCellFlag.DISABLED:
+            return None
+        return index
+
+    def _set_hover_index(self, index: int | None) -> None:
+        if index == self._hover_index:
+            return
+        previous = self._hover_index
+        self._hover_index = index
+        if self._anchor is not None and index is not None:
+            # Keep the last preview while the pointer crosses gaps between cells.
+            self._set_preview(self._julians[index])
+        if previous is not None:
+            self.update(self.cell_rect(previous))
+        if index is not None:
+            self.update(self.cell_rect(index))
+        self._sync_cursor()
+
+    def _sync_cursor(self) -> None:
+        index = self._hover_index
+        wants_pointer = index is not None and not self._flags[index] & DayCellFlag.DISABLED
+        if wants_pointer == self._pointer_cursor:
+            return
+        self._pointer_cursor = wants_pointer
+        if wants_pointer:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.unsetCursor()
+
+    def _paint_header(self, painter: QPainter, slot: int, header: QRect) -> None:
+        layout = self._layout_config
+        month = self._first_month.addMonths(slot)
+        title_height = layout.calendar_day_cell_size
+        painter.setFont(self._title_font)
+        painter.setPen(self._color(self._style.header_text_color))
+        painter.drawText(
+            QRect(header.x(), header.y(), header.width(), title_height),
+            Qt.AlignmentFlag.AlignCenter,
+            f"{calendar.month_name[month.month()]} {month.year()}",
+        )
+
+        label_top = header.y() + title_height + layout.calendar_grid_spacing
+        label_height = layout.calendar_day_label_height
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._color(self._style.day_label_background))
+        painter.drawRoundedRect(
+            QRectF(header.x(), label_top, header.width(), label_height),
+            _LABEL_RADIUS,
+            _LABEL_RADIUS,
+        )
+        painter.setFont(self._label_font)
+        painter.setPen(self._color(self._style.muted_day_text_color))
+        pitch = layout.calendar_day_cell_size + layout.calendar_grid_spacing
+        for column, label in enumerate(self._weekday_labels):
+            rect = QRect(
+                header.x() + column * pitch, label_top, layout.calendar_day_cell_size, label_height
+            )
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+
+    def _color(self, value: str) -> QColor:
+        color = self._colors.get(value)
+        if color is None:
+            color = QColor(value)
+            self._colors[value] = color
+        return color
+
+    def _block_origin(self, slot: int) -> QPoint:
+        row, column = divmod(slot, self._columns)
+        return QPoint(
+            column * (self._block_width() + _MONTH_GAP),
+            row * (self._block_height() + _MONTH_GAP),
+        )
+
+    def _header_size(self) -> QSize:
+        return QSize(self._block_width(), self._grid_top())
+
+    def _block_width(self) -> int:
+        cell_size = self._layout_config.calendar_day_cell_size
+        spacing = self._layout_config.calendar_grid_spacing
+        return _GRID_COLUMNS * cell_size + (_GRID_COLUMNS - 1) * spacing
+
+    def _block_height(self) -> int:
+        cell_size = self._layout_config.calendar_day_cell_size
+        spacing = self._layout_config.calendar_grid_spacing
+        return self._grid_top() + _GRID_ROWS * cell_size + (_GRID_ROWS - 1) * spacing
+
+    def _grid_top(self) -> int:
+        layout = self._layout_config
+        return (
+            layout.calendar_day_cell_size
+            + layout.calendar_grid_spacing
+            + layout.calendar_day_label_height
+            + layout.calendar_grid_spacing
+        )
+
+
+def _to_julian(date: QDate | None) -> int | None:
+    if date is None or not date.isValid():
+        return None
+    return date.toJulianDay()
+
+
+def _to_qdate(julian: int | None) -> QDate | None:
+    return QDate.fromJulianDay(julian) if julian is not None else None
+
+
+__all__ = ["MAX_VISIBLE_MONTHS", "MultiMonthCalendar"]
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
 )
 
 from ...styles import constants
+from ...styles.compiled_qss import CALENDAR_HEADER_BUTTON, CALENDAR_NAV_BUTTON
 from ...styles.theme import CalendarStyleConfig
 from ...utils import connect_signal
 from ...utils.svg_loader import load_colored_svg_icon
@@ -32,8 +33,10 @@ class CalendarNavigation(QWidget):
         parent: QWidget | None = None,
         *,
         style: CalendarStyleConfig | None = None,
+        compiled_style: bool = False,
     ) -> None:
         super().__init__(parent)
+        self._compiled_style = compiled_style
 
         if style is None:
             style = CalendarStyleConfig(
@@ -80,21 +83,37 @@ class CalendarNavigation(QWidget):
 
     def apply_style(self, style: CalendarStyleConfig) -> None:
         self._style = style
-        self._header_button.setStyleSheet(
-            "QPushButton {"
-            "background-color: transparent;"
-            f"color: {style.header_text_color};"
-            "border: none;"
-            "padding: 4px 11px 4px 11px;"
-            "border-radius: 4px;"
-            "outline: none;"
-            "}"
-            "QPushButton:hover {"
-            f"background-color: {style.header_hover_background};"
-            f"color: {style.header_hover_text_color};"
-            "outline: none;"
-            "}"
-        )
+        if not self._compiled_style:
+            self._header_button.setStyleSheet(
+                "QPushButton {"
+                "background-color: transparent;"
+                f"color: {style.header_text_color};"
+                "border: none;"
+                "padding: 4px 11px 4px 11px;"
+                "border-radius: 4px;"
+                "outline: none;"
+                "}"
+                "QPushButton:hover {"
+                f"background-color: {style.header_hover_background};"
+                f"color: {style.header_hover_text_color};"
+                "outline: none;"
+                "}"
+            )
+            nav_style = (
+                "QPushButton {"
+                "background-color: transparent;"
+                "border: none;"
+                "padding: 0px;"
+                "border-radius: 4px;"
+                "outline: none;"
+                "}"
+                "QPushButton:hover {"
+                f"background-color: {style.day_hover_background};"
+                "outline: none;"
+                "}"
+            )
+            self._previous_button.setStyleSheet(nav_style)
+            self._next_button.setStyleSheet(nav_style)
         self._update_nav_icons()
 
     def set_header_text(self, text: str) -> None:
@@ -105,6 +124,10 @@ class CalendarNavigation(QWidget):
         self._next_button.setEnabled(next_enabled)
         self._update_nav_icons()
 
+    def refresh_icons(self) -> None:
+        """Re-fetch the arrow icons, e.g. after the window moved to a screen with another DPR."""
+        self._update_nav_icons()
+
     def _update_nav_icons(self) -> None:
         prev_enabled = self._previous_button.isEnabled()
         next_enabled = self._next_button.isEnabled()
@@ -115,8 +138,9 @@ class CalendarNavigation(QWidget):
             self._style.nav_icon_color if next_enabled else self._style.muted_day_text_color
         )
 
-        prev_icon = load_colored_svg_icon(NAV_LEFT_ICON_PATH, NAV_ICON_SIZE, prev_color)
-        next_icon = load_colored_svg_icon(NAV_RIGHT_ICON_PATH, NAV_ICON_SIZE, next_color)
+        dpr = self.devicePixelRatioF()
+        prev_icon = load_colored_svg_icon(NAV_LEFT_ICON_PATH, NAV_ICON_SIZE, prev_color, dpr)
+        next_icon = load_colored_svg_icon(NAV_RIGHT_ICON_PATH, NAV_ICON_SIZE, next_color, dpr)
         self._previous_button.setIcon(prev_icon)
         self._next_button.setIcon(next_icon)
         icon_qsize = QSize(NAV_ICON_SIZE, NAV_ICON_SIZE)
@@ -133,30 +157,19 @@ class CalendarNavigation(QWidget):
 
     def _create_nav_button(self, role: str) -> QPushButton:
         button = QPushButton(self)
+        button.setObjectName(CALENDAR_NAV_BUTTON)
         button.setAccessibleName(f"calendar-navigation-{role}")
         button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         button.setFixedSize(32, 32)
         button.setCursor(Qt.CursorShape.PointingHandCursor)
         button.setFlat(True)
         button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        button.setStyleSheet(
-            "QPushButton {"
-            "background-color: transparent;"
-            "border: none;"
-            "padding: 0px;"
-            "border-radius: 4px;"
-            "outline: none;"
-            "}"
-            "QPushButton:hover {"
-            f"background-color: {self._style.day_hover_background};"
-            "outline: none;"
-            "}"
-        )
         button.setText("")
         return button
 
     def _create_header_button(self) -> QPushButton:
         button = QPushButton(self)
+        button.setObjectName(CALENDAR_HEADER_BUTTON)
         button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         button.setFlat(True)
         button.setCursor(Qt.CursorShape.PointingHandCursor)
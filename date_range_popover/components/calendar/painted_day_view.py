@@ -0,0 +1,397 @@
+"""
+Single-widget day grid that renders every cell with one ``QPainter`` pass.
+
+:class:`CalendarDayView` builds 42 :class:`CalendarDayCell` widgets (each with
+a button, an underline widget, and an event filter). Hosts that embed dozens
+of pickers pay for that widget count during construction and polish. The
+painted view below keeps the exact same public surface—``day_selected``,
+``apply_style``, and ``update_days``—but draws weekday labels, cells, hover
+feedback, range bands, and the today underline itself and performs its own
+hit testing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from PySide6.QtCore import QDate, QEvent, QPoint, QRect, QRectF, Qt, Signal
+from PySide6.QtGui import QColor, QEnterEvent, QMouseEvent, QPainter, QPaintEvent, QPixmap
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+from ...core.day_grid import CellUpdateStats, DayCellRecord, make_day_cell_record
+from ...styles import constants
+from ...styles.theme import CalendarStyleConfig, LayoutConfig
+from .day_cell import DayCellAppearance, paint_day_cell, resolve_day_cell_appearance
+from .day_view import DayState, compute_day_states, weekday_names
+
+_GRID_ROWS = 6
+_GRID_COLUMNS = 7
+_LABEL_RADIUS = 4
+
+
+class CalendarPaintedDayView(QWidget):
+    """
+    Day grid that paints weekday labels and all cells inside one widget.
+
+    Like :class:`CalendarDayView`, refreshes are diffed per cell: only the
+    rectangles of cells whose :class:`DayCellRecord` changed are repainted.
+    """
+
+    day_selected = Signal(QDate)
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        *,
+        style: CalendarStyleConfig | None = None,
+        layout: LayoutConfig | None = None,
+    ) -> None:
+        super().__init__(parent)
+
+        if style is None:
+            style = CalendarStyleConfig(
+                background="#1f1f1f",
+                header_text_color="#f5f5f5",
+                day_text_color="#f5f5f5",
+                muted_day_text_color="#8c8c8c",
+                today_background="#f5f5f5",
+                today_text_color="#1f1f1f",
+                today_underline_color="#1f1f1f",
+                day_hover_background="#2e2e2e",
+                day_hover_text_color="#f5f5f5",
+                nav_icon_color="#dbdbdb",
+                day_label_background="#2e2e2e",
+                mode_label_background="#2e2e2e",
+                header_hover_background="#2e2e2e",
+                header_hover_text_color="#ffffff",
+                range_edge_background="#f2f2f2",
+                range_edge_text_color="#1f1f1f",
+                range_between_background="#2e2e2e",
+                range_between_text_color="#ffffff",
+            )
+        self._style = style
+        self._layout_config = layout or LayoutConfig()
+
+        self._day_font = constants.create_calendar_day_font()
+        self._label_font = constants.create_calendar_day_label_font()
+        self._weekday_labels = weekday_names()
+        self._colors: dict[str, QColor] = {}
+        self._states: list[DayState] = []
+        self._appearances: list[DayCellAppearance | None] = []
+        self._records: list[DayCellRecord] = []
+        self._pixmap: QPixmap | None = None
+        self._style_key = 0
+        self._applied_updates = 0
+        self._skipped_updates = 0
+        self._hover_index: int | None = None
+        self._pressed_index: int | None = None
+        self._pointer_cursor = False
+
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setMouseTracking(True)
+        self.setFixedSize(self._grid_width(), self._grid_top() + self._grid_height())
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+
+        self.apply_style(self._style)
+
+    def apply_style(self, style: CalendarStyleConfig) -> None:
+        self._style = style
+        self._colors.clear()
+        self._style_key += 1
+        self._pixmap = None
+        self._appearances = [self._resolve_appearance(state) for state in self._states]
+        self._records = [self._record_for(state) for state in self._states]
+        self.update()
+
+    def apply_layout(self, layout: LayoutConfig) -> None:
+        """Resize the grid for ``layout`` and repaint it from scratch."""
+        self._layout_config = layout
+        self.setFixedSize(self._grid_width(), self._grid_top() + self._grid_height())
+        self._hover_index = None
+        self._pixmap = None
+        self.update()
+
+    @property
+    def update_stats(self) -> CellUpdateStats:
+        """Return how many cell repaints were applied versus skipped so far."""
+        return CellUpdateStats(applied=self._applied_updates, skipped=self._skipped_updates)
+
+    def reset_update_stats(self) -> None:
+        """Reset the applied/skipped counters reported by :attr:`update_stats`."""
+        self._applied_updates = 0
+        self._skipped_updates = 0
+
+    def update_days(
+        self,
+        *,
+        visible_month: QDate,
+        today: QDate,
+        selected_date: QDate,
+        range_start: QDate | None = None,
+        range_end: QDate | None = None,
+        min_date: QDate | None = None,
+        max_date: QDate | None = None,
+    ) -> None:
+        self.set_states(
+            compute_day_states(
+                visible_month=visible_month,
+                today=today,
+                selected_date=selected_date,
+                range_start=range_start,
+                range_end=range_end,
+                min_date=min_date,
+                max_date=max_date,
+            )
+        )
+
+    def set_states(self, states: Sequence[DayState], *, pixmap: QPixmap | None = None) -> None:
+        """
+        Render precomputed states, optionally with a matching prerendered grid.
+
+        ``pixmap`` must come from :meth:`render_states` for the same ``states``
+        (as produced by :class:`MonthPrefetcher`); it is blitted instead of
+        painting every cell until the style or states change again.
+        """
+        states = list(states)
+        previous = self._records
+        records = [self._record_for(state) for state in states]
+        self._states = states
+        self._records = records
+        if pixmap is not None and pixmap.deviceIndependentSize().toSize() != self.size():
+            pixmap = None
+        self._pixmap = pixmap
+        if len(previous) != len(records):
+            self._applied_updates += len(records)
+            self._appearances = [self._resolve_appearance(state) for state in states]
+            self.update()
+        else:
+            for index, record in enumerate(records):
+                if record == previous[index]:
+                    self._skipped_updates += 1
+                    continue
+                self._applied_updates += 1
+                self._appearances[index] = self._resolve_appearance(states[index])
+                self.update(self.cell_rect(index))
+        self._sync_cursor()
+
+    def render_states(self, states: Sequence[DayState]) -> QPixmap:
+        """Paint ``states`` (without hover feedback) into an offscreen pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            max(1, round(self.width() * ratio)),
+            max(1, round(self.height() * ratio)),
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        appearances = [self._resolve_appearance(state) for state in states]
+        painter = QPainter(pixmap)
+        self._paint_grid(painter, self.rect(), states, appearances, None)
+        painter.end()
+        return pixmap
+
+    def index_at(self, pos: QPoint) -> int | None:
+        """Return the grid index under ``pos`` or ``None`` for labels and gaps."""
+        cell_size = self._layout_config.calendar_day_cell_size
+        pitch = cell_size + self._layout_config.calendar_grid_spacing
+        x = pos.x()
+        y = pos.y() - self._grid_top()
+        if x < 0 or y < 0:
+            return None
+        column, column_offset = divmod(x, pitch)
+        row, row_offset = divmod(y, pitch)
+        if column >= _GRID_COLUMNS or row >= _GRID_ROWS:
+            return None
+        if column_offset >= cell_size or row_offset >= cell_size:
+            return None
+        return row * _GRID_COLUMNS + column
+
+    def cell_rect(self, index: int) -> QRect:
+        """Return the widget-relative rectangle occupied by cell ``index``."""
+        cell_size = self._layout_config.calendar_day_cell_size
+        pitch = cell_size + self._layout_config.calendar_grid_spacing
+        row, column = divmod(index, _GRID_COLUMNS)
+        return QRect(column * pitch, self._grid_top() + row * pitch, cell_size, cell_size)
+
+    # Qt events ----------------------------------------------------------------------
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        dirty = event.rect()
+        painter = QPainter(self)
+        if self._pixmap is None:
+            self._paint_grid(painter, dirty, self._states, self._appearances, self._hover_index)
+            painter.end()
+            return
+
+        painter.drawPixmap(0, 0, self._pixmap)
+        index = self._hover_index
+        appearance = self._appearances[index] if index is not None else None
+        if index is not None and appearance is not None and appearance.enabled:
+            rect = self.cell_rect(index)
+            if rect.intersects(dirty):
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                painter.fillRect(rect, self._color(self._style.background))
+                painter.setFont(self._day_font)
+                paint_day_cell(
+                    painter,
+                    rect,
+                    self._states[index].day,
+                    appearance,
+                    hovered=True,
+                    layout=self._layout_config,
+                    color=self._color,
+                )
+        painter.end()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        self._set_hover_index(self._visible_index_at(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def enterEvent(self, event: QEnterEvent) -> None:  # noqa: N802
+        self._set_hover_index(self._visible_index_at(event.position().toPoint()))
+        super().enterEvent(event)
+
+    def leaveEvent(self, event: QEvent) -> None:  # noqa: N802
+        self._set_hover_index(None)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._pressed_index = self._enabled_index_at(event.position().toPoint())
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        if event.button() == Qt.MouseButton.LeftButton:
+            pressed = self._pressed_index
+            self._pressed_index = None
+            released = self._enabled_index_at(event.position().toPoint())
+            if pressed is not None and pressed == released:
+                self.day_selected.emit(QDate(self._states[released].date))
+        super().mouseReleaseEvent(event)
+
+    # Internal helpers ---------------------------------------------------------------
+
+    def _record_for(self, state: DayState) -> DayCellRecord:
+        return make_day_cell_record(state.day, state.flags, self._style_key)
+
+    def _resolve_appearance(self, state: DayState) -> DayCellAppearance | None:
+        if not state.in_current_month:
+            return None
+        return resolve_day_cell_appearance(
+            self._style,
+            is_selected=state.is_selected,
+            is_disabled=state.is_disabled,
+            is_range_start=state.is_range_start,
+            is_range_end=state.is_range_end,
+            is_in_range=state.is_in_range,
+            is_today=state.is_today,
+        )
+
+    def _paint_grid(
+        self,
+        painter: QPainter,
+        dirty: QRect,
+        states: Sequence[DayState],
+        appearances: Sequence[DayCellAppearance | None],
+        hover_index: int | None,
+    ) -> None:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.fillRect(dirty, self._color(self._style.background))
+        if dirty.top() < self._layout_config.calendar_day_label_height:
+            self._paint_labels(painter)
+        painter.setFont(self._day_font)
+        for index, appearance in enumerate(appearances):
+            if appearance is None:
+                continue
+            rect = self.cell_rect(index)
+            if not rect.intersects(dirty):
+                continue
+            hovered = index == hover_index and appearance.enabled
+            paint_day_cell(
+                painter,
+                rect,
+                states[index].day,
+                appearance,
+                hovered=hovered,
+                layout=self._layout_config,
+                color=self._color,
+            )
+
+    def _paint_labels(self, painter: QPainter) -> None:
+        label_height = self._layout_config.calendar_day_label_height
+        cell_size = self._layout_config.calendar_day_cell_size
+        pitch = cell_size + self._layout_config.calendar_grid_spacing
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._color(self._style.day_label_background))
+        painter.drawRoundedRect(
+            QRectF(0, 0, self._grid_width(), label_height), _LABEL_RADIUS, _LABEL_RADIUS
+        )
+        painter.setFont(self._label_font)
+        painter.setPen(self._color(self._style.muted_day_text_color))
+        for column, label in enumerate(self._weekday_labels):
+            rect = QRect(column * pitch, 0, cell_size, label_height)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+
+    def _visible_index_at(self, pos: QPoint) -> int | None:
+        index = self.index_at(pos)
+        if index is None or index >= len(self._appearances):
+            return None
+        if self._appearances[index] is None:
+            return None
+        return index
+
+    def _enabled_index_at(self, pos: QPoint) -> int | None:
+        index = self._visible_index_at(pos)
+        if index is None:
+            return None
+        appearance = self._appearances[index]
+        if appearance is None or not appearance.enabled:
+            return None
+        return index
+
+    def _set_hover_index(self, index: int | None) -> None:
+        if index == self._hover_index:
+            return
+        previous = self._hover_index
+        self._hover_index = index
+        if previous is not None:
+            self.update(self.cell_rect(previous))
+        if index is not None:
+            self.update(self.cell_rect(index))
+        self._sync_cursor()
+
+    def _sync_cursor(self) -> None:
+        index = self._hover_index
+        if index is not None and index >= len(self._appearances):
+            self._hover_index = index = None
+        appearance = self._appearances[index] if index is not None else None
+        wants_pointer = appearance is not None and appearance.enabled
+        if wants_pointer == self._pointer_cursor:
+            return
+        self._pointer_cursor = wants_pointer
+        if wants_pointer:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.unsetCursor()
+
+    def _color(self, value: str) -> QColor:
+        color = self._colors.get(value)
+        if color is None:
+            color = QColor(value)
+            self._colors[value] = color
+        return color
+
+    def _grid_width(self) -> int:
+        cell_size = self._layout_config.calendar_day_cell_size
+        spacing = self._layout_config.calendar_grid_spacing
+        return _GRID_COLUMNS * cell_size + (_GRID_COLUMNS - 1) * spacing
+
+    def _grid_height(self) -> int:
+        cell_size = self._layout_config.calendar_day_cell_size
+        spacing = self._layout_config.calendar_grid_spacing
+        return _GRID_ROWS * cell_size + (_GRID_ROWS - 1) * spacing
+
+    def _grid_top(self) -> int:
+        layout = self._layout_config
+        return layout.calendar_day_label_height + layout.calendar_grid_spacing
+
+
+__all__ = ["CalendarPaintedDayView"]
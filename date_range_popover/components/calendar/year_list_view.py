@@ -0,0 +1,418 @@
+"""
+Scrollable year picker backed by a model and a painting delegate.
+
+:class:`CalendarYearView` lays out a fixed page of 20 buttons, so crossing a
+wide ``min_date``/``max_date`` span means paging through it one page per
+click, restyling every button each time. :class:`CalendarYearListView` keeps
+the same public surface (``year_selected``, ``apply_style``,
+``set_year_range``) but exposes every allowed year through
+:class:`YearListModel`—which computes rows on demand instead of storing
+them—and paints them with :class:`YearItemDelegate`, so only the rows in the
+viewport are ever drawn. A "jump to year" field scrolls straight to a typed
+year.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol, cast
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor, QIntValidator, QPainter
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QLineEdit,
+    QListView,
+    QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ...exceptions import InvalidDateError
+from ...styles import constants
+from ...styles.compiled_qss import CALENDAR_YEAR_JUMP_FIELD, CALENDAR_YEAR_LIST
+from ...styles.qss_cache import apply_stylesheet, cached_qss
+from ...styles.style_templates import YearJumpFieldStyle, year_jump_field_qss, year_list_qss
+from ...styles.theme import CalendarStyleConfig, LayoutConfig
+from ...utils import connect_signal
+from .year_view import YEAR_BUTTON_WIDTH, CalendarYearView
+
+MAX_YEAR = 9999
+YEAR_ROLE = Qt.ItemDataRole.UserRole + 1
+
+_JUMP_FIELD_HEIGHT = 28
+
+ModelIndex = QModelIndex | QPersistentModelIndex
+
+
+class _ItemOption(Protocol):
+    """The ``QStyleOptionViewItem`` members the delegate reads; not every stub declares them."""
+
+    state: QStyle.StateFlag
+    rect: QRect
+
+
+class YearListModel(QAbstractListModel):
+    """
+    List model exposing every year between two inclusive bounds.
+
+    Rows are derived arithmetically from the bounds, so the model costs the
+    same whether it spans a decade or all 9999 years.
+    """
+
+    def __init__(
+        self,
+        first_year: int = 1,
+        last_year: int = MAX_YEAR,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        _validate_bounds(first_year, last_year)
+        self._first_year = first_year
+        self._last_year = last_year
+
+    @property
+    def first_year(self) -> int:
+        return self._first_year
+
+    @property
+    def last_year(self) -> int:
+        return self._last_year
+
+    def set_year_bounds(self, first_year: int, last_year: int) -> None:
+        """Replace the inclusive year bounds, resetting the model only if they change."""
+        _validate_bounds(first_year, last_year)
+        if (first_year, last_year) == (self._first_year, self._last_year):
+            return
+        self.beginResetModel()
+        self._first_year = first_year
+        self._last_year = last_year
+        self.endResetModel()
+
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return self._last_year - self._first_year + 1
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        if not index.isValid() or not 0 <= index.row() < self.rowCount():
+            return None
+        year = self._first_year + index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(year)
+        if role == YEAR_ROLE:
+            return year
+        return None
+
+    def year_at(self, row: int) -> int:
+        """Return the year shown in ``row``."""
+        return self._first_year + row
+
+    def row_for_year(self, year: int) -> int | None:
+        """Return the row showing ``year``, or ``None`` when it is out of bounds."""
+        if not self._first_year <= year <= self._last_year:
+            return None
+        return year - self._first_year
+
+
+def _validate_bounds(first_year: int, last_year: int) -> None:
+    if not 1 <= first_year <= last_year <= MAX_YEAR:
+        raise InvalidDateError(
+            f"Year bounds must satisfy 1 <= first_year <= last_year <= {MAX_YEAR}"
+        )
+
+
+class YearItemDelegate(QStyledItemDelegate):
+    """Paint one year as the same rounded pill :class:`CalendarYearView` uses."""
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        style: CalendarStyleConfig,
+        layout: LayoutConfig,
+    ) -> None:
+        super().__init__(parent)
+        self._style = style
+        self._layout_config = layout
+        self._font = constants.create_calendar_day_font()
+        self._colors: dict[str, QColor] = {}
+        self.cell_size = QSize(YEAR_BUTTON_WIDTH, layout.calendar_day_cell_size)
+        self.current_year = 0
+
+    def set_style(self, style: CalendarStyleConfig) -> None:
+        self._style = style
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: ModelIndex) -> None:
+        year = index.data(YEAR_ROLE)
+        if not isinstance(year, int):
+            return
+        item = cast(_ItemOption, option)
+        state = item.state
+        rect = item.rect
+        if year == self.current_year:
+            background = self._style.today_background
+            text_color = self._style.today_text_color
+        elif state & QStyle.StateFlag.State_MouseOver:
+            background = self._style.day_hover_background
+            text_color = self._style.day_hover_text_color
+        else:
+            background = "transparent"
+            text_color = self._style.day_text_color
+
+        pill = self._pill_rect(rect)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        if background != "transparent":
+            radius = self._layout_config.calendar_day_cell_radius
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._color(background))
+            painter.drawRoundedRect(QRectF(pill), radius, radius)
+        painter.setFont(self._font)
+        painter.setPen(self._color(text_color))
+        painter.drawText(pill, Qt.AlignmentFlag.AlignCenter, str(year))
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: ModelIndex) -> QSize:  # noqa: N802
+        return self.cell_size
+
+    def _pill_rect(self, rect: QRect) -> QRect:
+        height = self._layout_config.calendar_day_cell_size
+        return QRect(
+            rect.x() + (rect.width() - YEAR_BUTTON_WIDTH) // 2,
+            rect.y() + (rect.height() - height) // 2,
+            YEAR_BUTTON_WIDTH,
+            height,
+        )
+
+    def _color(self, value: str) -> QColor:
+        color = self._colors.get(value)
+        if color is None:
+            color = QColor(value)
+            self._colors[value] = color
+        return color
+
+
+class CalendarYearListView(QWidget):
+    """
+    Scrollable year selection list with a "jump to year" field.
+
+    ``visible_years_changed`` reports the first and last fully laid out year
+    whenever the list scrolls so the owning calendar can keep its header in
+    sync.
+    """
+
+    year_selected = Signal(int)
+    visible_years_changed = Signal(int, int)
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        *,
+        style: CalendarStyleConfig | None = None,
+        layout: LayoutConfig | None = None,
+        grid_columns: int = 4,
+        visible_rows: int = 5,
+        compiled_style: bool = False,
+    ) -> None:
+        super().__init__(parent)
+        self._compiled_style = compiled_style
+        self.setObjectName(CALENDAR_YEAR_LIST)
+        if style is None:
+            style = CalendarStyleConfig(
+                background="#1f1f1f",
+                header_text_color="#f5f5f5",
+                day_text_color="#f5f5f5",
+                muted_day_text_color="#8c8c8c",
+                today_background="#f5f5f5",
+                today_text_color="#1f1f1f",
+                today_underline_color="#1f1f1f",
+                day_hover_background="#2e2e2e",
+                day_hover_text_color="#f5f5f5",
+                nav_icon_color="#dbdbdb",
+                day_label_background="#2e2e2e",
+                mode_label_background="#2e2e2e",
+                header_hover_background="#2e2e2e",
+                header_hover_text_color="#ffffff",
+                range_edge_background="#f2f2f2",
+                range_edge_text_color="#1f1f1f",
+                range_between_background="#2e2e2e",
+                range_between_text_color="#ffffff",
+            )
+        self._style = style
+        self._layout_config = layout or LayoutConfig()
+        self._grid_columns = grid_columns
+        self._current_year = 1
+
+        spacing = self._layout_config.calendar_grid_spacing
+        width = CalendarYearView.grid_width(self._layout_config, grid_columns)
+        # Wrapping list views need one spare pixel per row to fit the last column.
+        cell_size = QSize(
+            (width - 1) // grid_columns,
+            self._layout_config.calendar_day_cell_size + spacing,
+        )
+
+        root_layout = QVBoxLayout(self)
+        root_layout.setContentsMargins(0, 0, 0, 0)
+        root_layout.setSpacing(spacing)
+
+        self._jump_field = QLineEdit(self)
+        self._jump_field.setObjectName(CALENDAR_YEAR_JUMP_FIELD)
+        self._jump_field.setPlaceholderText("Jump to year")
+        self._jump_field.setFont(constants.create_calendar_day_font())
+        self._jump_field.setFixedSize(width, _JUMP_FIELD_HEIGHT)
+        self._jump_field.setValidator(QIntValidator(1, MAX_YEAR, self._jump_field))
+        root_layout.addWidget(self._jump_field, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        self._model = YearListModel(parent=self)
+        self._delegate = YearItemDelegate(self, style=self._style, layout=self._layout_config)
+        self._delegate.cell_size = cell_size
+
+        self._list = QListView(self)
+        self._list.setModel(self._model)
+        self._list.setItemDelegate(self._delegate)
+        self._list.setViewMode(QListView.ViewMode.ListMode)
+        self._list.setFlow(QListView.Flow.LeftToRight)
+        self._list.setWrapping(True)
+        self._list.setResizeMode(QListView.ResizeMode.Fixed)
+        self._list.setMovement(QListView.Movement.Static)
+        self._list.setUniformItemSizes(True)
+        self._list.setGridSize(cell_size)
+        self._list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._list.setMouseTracking(True)
+        self._list.setFrameShape(QListView.Shape.NoFrame)
+        self._list.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self._list.setFixedSize(
+            grid_columns * cell_size.width() + 1, visible_rows * cell_size.height()
+        )
+        self._list.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        root_layout.addWidget(self._list, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        connect_signal(self._list.clicked, self._on_index_clicked)
+        connect_signal(self._list.verticalScrollBar().valueChanged, self._on_scrolled)
+        connect_signal(self._jump_field.returnPressed, self._on_jump_requested)
+
+        self.apply_style(self._style)
+
+    @property
+    def model(self) -> YearListModel:
+        return self._model
+
+    @property
+    def current_year(self) -> int:
+        return self._current_year
+
+    def apply_style(self, style: CalendarStyleConfig) -> None:
+        self._style = style
+        self._delegate.set_style(style)
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {style.background};")
+            apply_stylesheet(self._list, cached_qss(year_list_qss, style.background))
+            apply_stylesheet(
+                self._jump_field,
+                cached_qss(
+                    year_jump_field_qss,
+                    YearJumpFieldStyle(
+                        background=style.day_label_background,
+                        text_color=style.day_text_color,
+                        radius=self._layout_config.calendar_day_cell_radius,
+                    ),
+                ),
+            )
+        self._list.viewport().update()
+
+    def set_year_bounds(self, first_year: int, last_year: int) -> None:
+        """Limit the list to ``first_year``..``last_year`` (inclusive)."""
+        self._model.set_year_bounds(first_year, last_year)
+        validator = self._jump_field.validator()
+        if isinstance(validator, QIntValidator):
+            validator.setRange(first_year, last_year)
+
+    def set_year_range(self, start_year: int, *, current_year: int) -> None:
+        """Highlight ``current_year`` and scroll ``start_year`` to the top of the list."""
+        if start_year < 1 or current_year < 1:
+            raise InvalidDateError("Years must be positive integers")
+        self._set_current_year(current_year)
+        self._scroll_to_year(start_year)
+
+    def jump_to_year(self, year: int) -> bool:
+        """
+        Scroll to and highlight ``year``.
+
+        Returns ``False`` (leaving the list untouched) when ``year`` is outside
+        the configured bounds.
+        """
+        if self._model.row_for_year(year) is None:
+            return False
+        self._set_current_year(year)
+        self._scroll_to_year(year, hint=QAbstractItemView.ScrollHint.PositionAtCenter)
+        return True
+
+    def visible_years(self) -> tuple[int, int]:
+        """Return the first and last year currently laid out in the viewport."""
+        viewport = self._list.viewport().rect()
+        first = self._list.indexAt(viewport.topLeft() + QPoint(1, 1))
+        last = self._list.indexAt(viewport.bottomLeft() + QPoint(1, -1))
+        first_row = first.row() if first.isValid() else 0
+        if last.isValid():
+            last_row = min(last.row() + self._grid_columns - 1, self._model.rowCount() - 1)
+        else:
+            last_row = self._model.rowCount() - 1
+        return self._model.year_at(first_row), self._model.year_at(last_row)
+
+    def _set_current_year(self, year: int) -> None:
+        if year == self._current_year:
+            return
+        self._current_year = year
+        self._delegate.current_year = year
+        self._list.viewport().update()
+
+    def _scroll_to_year(
+        self,
+        year: int,
+        *,
+        hint: QAbstractItemView.ScrollHint = QAbstractItemView.ScrollHint.PositionAtTop,
+    ) -> None:
+        clamped = min(max(year, self._model.first_year), self._model.last_year)
+        row = self._model.row_for_year(clamped)
+        if row is None:
+            return
+        self._list.scrollTo(self._model.index(row, 0), hint)
+
+    def _on_index_clicked(self, index: QModelIndex) -> None:
+        year = index.data(YEAR_ROLE)
+        if not isinstance(year, int):
+            return
+        self._set_current_year(year)
+        self.year_selected.emit(year)
+
+    def _on_jump_requested(self) -> None:
+        text = self._jump_field.text()
+        if not text.isdigit() or not self.jump_to_year(int(text)):
+            return
+        self._jump_field.clear()
+        self.year_selected.emit(self._current_year)
+
+    def _on_scrolled(self, _value: int) -> None:
+        self.visible_years_changed.emit(*self.visible_years())
+
+
+__all__ = ["CalendarYearListView", "YearItemDelegate", "YearListModel"]
@@ -12,6 +12,15 @@ from PySide6.QtWidgets import (
 
 from ...exceptions import InvalidDateError
 from ...styles import constants
+from ...styles.compiled_qss import (
+    CALENDAR_CHOICE_BUTTON,
+    CALENDAR_YEAR_VIEW,
+    STATE_DEFAULT,
+    STATE_PROPERTY,
+    STATE_SELECTED,
+    set_style_property,
+)
+from ...styles.qss_cache import apply_stylesheet, cached_qss
 from ...styles.style_templates import (
     CircularButtonHoverStyle,
     CircularButtonStyle,
@@ -21,6 +30,8 @@ from ...styles.style_templates import (
 from ...styles.theme import CalendarStyleConfig, LayoutConfig
 from ...utils import connect_signal
 
+YEAR_BUTTON_WIDTH = 64
+
 
 class CalendarYearView(QWidget):
     """Year range selection grid."""
@@ -35,8 +46,11 @@ class CalendarYearView(QWidget):
         layout: LayoutConfig | None = None,
         range_size: int = 20,
         grid_columns: int = 4,
+        compiled_style: bool = False,
     ) -> None:
         super().__init__(parent)
+        self._compiled_style = compiled_style
+        self.setObjectName(CALENDAR_YEAR_VIEW)
         if style is None:
             style = CalendarStyleConfig(
                 background="#1f1f1f",
@@ -72,10 +86,11 @@ class CalendarYearView(QWidget):
         self._buttons: list[QPushButton] = []
         for index in range(self._range_size):
             button = QPushButton("", self)
+            button.setObjectName(CALENDAR_CHOICE_BUTTON)
             button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
             button.setCursor(Qt.CursorShape.PointingHandCursor)
             button.setFont(constants.create_calendar_day_font())
-            button.setFixedWidth(64)
+            button.setFixedWidth(YEAR_BUTTON_WIDTH)
             button.setFixedHeight(self._layout_config.calendar_day_cell_size)
             button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
             connect_signal(button.clicked, self._make_handler(button))
@@ -88,9 +103,15 @@ class CalendarYearView(QWidget):
         self._range_start = 1
         self.apply_style(self._style)
 
+    @staticmethod
+    def grid_width(layout: LayoutConfig, grid_columns: int) -> int:
+        """Return the width the year grid occupies, without building it."""
+        return grid_columns * YEAR_BUTTON_WIDTH + (grid_columns - 1) * layout.calendar_grid_spacing
+
     def apply_style(self, style: CalendarStyleConfig) -> None:
         self._style = style
-        self.setStyleSheet(f"background-color: {style.background};")
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {style.background};")
         self._refresh_button_styles()
 
     def set_year_range(self, start_year: int, *, current_year: int) -> None:
@@ -113,29 +134,35 @@ class CalendarYearView(QWidget):
                 self._apply_default_style(button)
 
     def _apply_selected_style(self, button: QPushButton) -> None:
+        if self._compiled_style:
+            set_style_property(button, STATE_PROPERTY, STATE_SELECTED)
+            return
         radius = self._layout_config.calendar_day_cell_radius
-        button.setStyleSheet(
-            circular_button_selected_qss(
-                CircularButtonStyle(
-                    background=self._style.today_background,
-                    text_color=self._style.today_text_color,
-                    radius=radius,
-                )
-            )
+        sheet = cached_qss(
+            circular_button_selected_qss,
+            CircularButtonStyle(
+                background=self._style.today_background,
+                text_color=self._style.today_text_color,
+                radius=radius,
+            ),
         )
+        apply_stylesheet(button, sheet)
 
     def _apply_default_style(self, button: QPushButton) -> None:
+        if self._compiled_style:
+            set_style_property(button, STATE_PROPERTY, STATE_DEFAULT)
+            return
         radius = self._layout_config.calendar_day_cell_radius
-        button.setStyleSheet(
-            circular_button_default_qss(
-                CircularButtonHoverStyle(
-                    text_color=self._style.day_text_color,
-                    hover_background=self._style.day_hover_background,
-                    hover_text_color=self._style.day_hover_text_color,
-                    radius=radius,
-                )
-            )
+        sheet = cached_qss(
+            circular_button_default_qss,
+            CircularButtonHoverStyle(
+                text_color=self._style.day_text_color,
+                hover_background=self._style.day_hover_background,
+                hover_text_color=self._style.day_hover_text_color,
+                radius=radius,
+            ),
         )
+        apply_stylesheet(button, sheet)
 
     def _make_handler(self, button: QPushButton) -> Callable[[], None]:
         def handler() -> None:
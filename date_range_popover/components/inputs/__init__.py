@@ -1,12 +1,28 @@
 """Input widgets used within the picker."""
 
-from .date_time_selector import (
-    CUSTOM_DATE_RANGE,
-    GO_TO_DATE,
-    DateTimeSelector,
-    ModeLiteral,
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .date_time_selector import (
+        CUSTOM_DATE_RANGE,
+        GO_TO_DATE,
+        DateTimeSelector,
+        ModeLiteral,
+    )
+    from .input_with_icon import InputWithIcon
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DateTimeSelector": ".date_time_selector",
+        "InputWithIcon": ".input_with_icon",
+        "ModeLiteral": ".date_time_selector",
+        "GO_TO_DATE": ".date_time_selector",
+        "CUSTOM_DATE_RANGE": ".date_time_selector",
+    },
 )
-from .input_with_icon import InputWithIcon
 
 __all__ = [
     "DateTimeSelector",
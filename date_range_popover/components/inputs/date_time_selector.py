@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Final, Literal, cast
 
@@ -9,24 +10,26 @@ from PySide6.QtCore import (
     QDate,
     QEvent,
     QObject,
-    QStringListModel,
     Qt,
     QTime,
     Signal,
 )
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QLineEdit, QVBoxLayout, QWidget
+from PySide6.QtWidgets import (
+    QApplication,
+    QHBoxLayout,
+    QLayout,
+    QLineEdit,
+    QVBoxLayout,
+    QWidget,
+)
 from shiboken6 import Shiboken
 
-from ...styles.theme import ColorPalette
+from ...styles.compiled_qss import DATE_TIME_SELECTOR
+from ...styles.theme import ColorPalette, InputStyleConfig
 from ...utils import connect_signal
 from .input_with_icon import InputWithIcon
-from .time_completer import (
-    create_time_completer,
-    dismiss_time_popup,
-    generate_time_options,
-    show_time_popup,
-)
+from .time_completer import dismiss_time_popup, shared_time_completer, show_time_popup
 
 ModeLiteral = Literal["go_to_date", "custom_date_range"]
 GO_TO_DATE: Final[ModeLiteral] = "go_to_date"
@@ -35,8 +38,24 @@ CALENDAR_ICON_PATH: Final[Path] = Path(__file__).resolve().parents[2] / "assets"
 CLOCK_ICON_PATH: Final[Path] = Path(__file__).resolve().parents[2] / "assets" / "clock.svg"
 
 
+@dataclass(slots=True)
+class _InputPage:
+    """One mode's inputs, kept alive on their own page when layouts are stacked."""
+
+    widget: QWidget
+    date_inputs: list[InputWithIcon]
+    time_inputs: list[InputWithIcon]
+
+
 class DateTimeSelector(QWidget):
-    """Widget hosting date/time inputs with selectable layout."""
+    """
+    Widget hosting date/time inputs with selectable layout.
+
+    By default :meth:`set_mode` rebuilds the input rows for the new mode. With
+    ``stacked_layouts=True`` each mode's rows are built once, on first use, on
+    a page of their own; switching modes then only swaps the visible page and
+    re-seeds its texts.
+    """
 
     date_input_valid = Signal(QDate)
 
@@ -51,30 +70,26 @@ class DateTimeSelector(QWidget):
         primary_time: QTime | None = None,
         secondary_time: QTime | None = None,
         time_step_minutes: int = 15,
+        input_style: InputStyleConfig | None = None,
+        compiled_style: bool = False,
+        palette_states: bool = False,
+        stacked_layouts: bool = False,
     ) -> None:
         super().__init__(parent)
+        self.setObjectName(DATE_TIME_SELECTOR)
+        self._compiled_style = compiled_style
+        self._palette_states = palette_states
+        self._stacked_layouts = stacked_layouts
+        self._pages: dict[ModeLiteral, _InputPage] = {}
+        self._seeding_texts = False
 
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._palette = palette or ColorPalette()
+        self._input_style = input_style
         self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
 
         self._mode: ModeLiteral = mode
-        self._default_single_date_text = self._format_date_text(primary_date)
-        range_start_text = self._default_single_date_text
-        range_end_text = (
-            self._format_date_text(secondary_date)
-            if secondary_date is not None and secondary_date.isValid()
-            else range_start_text
-        )
-        self._default_range_date_texts = (range_start_text, range_end_text)
-        self._default_single_time_text = self._format_time_text(primary_time)
-        range_start_time_text = self._default_single_time_text
-        range_end_time_text = (
-            self._format_time_text(secondary_time)
-            if secondary_time is not None and secondary_time.isValid()
-            else range_start_time_text
-        )
-        self._default_range_time_texts = (range_start_time_text, range_end_time_text)
+        self._store_default_values(primary_date, secondary_date, primary_time, secondary_time)
         self._time_step_minutes = max(1, min(time_step_minutes, 60))
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -85,7 +100,6 @@ class DateTimeSelector(QWidget):
         self._last_focused_date_input: InputWithIcon | None = None
         self._date_input_handlers: dict[InputWithIcon, Callable[[str], None]] = {}
         self._time_inputs: list[InputWithIcon] = []
-        self._time_model: QStringListModel | None = None
         self._installed_app: QCoreApplication | None = None
 
         self.apply_palette(self._palette)
@@ -98,7 +112,17 @@ class DateTimeSelector(QWidget):
 
     def apply_palette(self, palette: ColorPalette) -> None:
         self._palette = palette
-        self.setStyleSheet(f"background-color: {palette.window_background};")
+        if not self._compiled_style:
+            self.setStyleSheet(f"background-color: {palette.window_background};")
+        completer = shared_time_completer(self._time_step_minutes, palette)
+        for time_input in self._all_time_inputs():
+            time_input.input.setCompleter(completer)
+
+    def apply_input_style(self, style: InputStyleConfig) -> None:
+        """Restyle the current inputs and any inputs created by later mode switches."""
+        self._input_style = style
+        for input_with_icon in (*self._all_date_inputs(), *self._all_time_inputs()):
+            input_with_icon.apply_style(style)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         focus_cleared = self._clear_focus_from_inputs(
@@ -175,6 +199,19 @@ class DateTimeSelector(QWidget):
             self._date_inputs[0].set_text(start.toString("yyyy-MM-dd"))
             self._date_inputs[1].set_text(end.toString("yyyy-MM-dd"))
 
+    def set_default_values(
+        self,
+        *,
+        primary_date: QDate | None = None,
+        secondary_date: QDate | None = None,
+        primary_time: QTime | None = None,
+        secondary_time: QTime | None = None,
+    ) -> None:
+        """Replace the seeded date/time texts and write them into the current inputs."""
+        self._store_default_values(primary_date, secondary_date, primary_time, secondary_time)
+        self._write_default_texts()
+        self._last_focused_date_input = None
+
     def last_focused_date_index(self) -> int | None:
         if self._last_focused_date_input is None:
             return None
@@ -186,16 +223,15 @@ class DateTimeSelector(QWidget):
     def _build_ui(self) -> None:
         self._previously_focused_input = None
         self._last_focused_date_input = None
+        if self._stacked_layouts:
+            self._show_page()
+            return
+
         self._date_inputs = []
         self._go_to_date_input = None
         self._date_input_handlers = {}
         self._time_inputs = []
-
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            widget = cast(QWidget | None, item.widget())
-            if widget is not None:
-                widget.deleteLater()
+        _discard_layout_items(self._layout)
 
         if self._mode == GO_TO_DATE:
             self._layout.setSpacing(0)
@@ -215,6 +251,76 @@ class DateTimeSelector(QWidget):
                 )
             self._layout.addStretch()
 
+    def _show_page(self) -> None:
+        """Show the current mode's page, building it on first use, and hide the others."""
+        page = self._pages.get(self._mode)
+        if page is None:
+            page = self._build_page()
+            self._pages[self._mode] = page
+        else:
+            self._date_inputs = page.date_inputs
+            self._time_inputs = page.time_inputs
+            self._write_default_texts()
+        self._go_to_date_input = page.date_inputs[0] if self._mode == GO_TO_DATE else None
+        for mode, other in self._pages.items():
+            if mode != self._mode:
+                other.widget.hide()
+        page.widget.show()
+
+    def _build_page(self) -> _InputPage:
+        widget = QWidget(self)
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._date_inputs = []
+        self._time_inputs = []
+        if self._mode == GO_TO_DATE:
+            layout.setSpacing(0)
+            self._build_date_time_row(
+                date_text=self._default_single_date_text,
+                time_text=self._default_single_time_text,
+                parent=widget,
+                layout=layout,
+            )
+        else:
+            layout.setSpacing(16)
+            for index in range(2):
+                self._build_date_time_row(
+                    date_text=self._default_range_date_texts[index],
+                    time_text=self._default_range_time_texts[index],
+                    parent=widget,
+                    layout=layout,
+                )
+            layout.addStretch()
+        self._layout.addWidget(widget)
+        return _InputPage(widget, self._date_inputs, self._time_inputs)
+
+    def _write_default_texts(self) -> None:
+        """Seed the current inputs with the default texts without emitting ``date_input_valid``."""
+        if self._mode == GO_TO_DATE:
+            date_texts: tuple[str, ...] = (self._default_single_date_text,)
+            time_texts: tuple[str, ...] = (self._default_single_time_text,)
+        else:
+            date_texts = self._default_range_date_texts
+            time_texts = self._default_range_time_texts
+        self._seeding_texts = True
+        try:
+            for date_input, text in zip(self._date_inputs, date_texts):
+                date_input.set_text(text)
+            for time_input, text in zip(self._time_inputs, time_texts):
+                time_input.set_text(text)
+        finally:
+            self._seeding_texts = False
+
+    def _all_date_inputs(self) -> list[InputWithIcon]:
+        if not self._stacked_layouts:
+            return self._date_inputs
+        return [field for page in self._pages.values() for field in page.date_inputs]
+
+    def _all_time_inputs(self) -> list[InputWithIcon]:
+        if not self._stacked_layouts:
+            return self._time_inputs
+        return [field for page in self._pages.values() for field in page.time_inputs]
+
     def _create_input(
         self,
         parent: QWidget,
@@ -236,6 +342,9 @@ class DateTimeSelector(QWidget):
                 max_length=max_length,
                 regex_pattern=regex_pattern,
                 placeholder_text=placeholder,
+                style=self._input_style,
+                compiled_style=self._compiled_style,
+                palette_states=self._palette_states,
             )
         else:
             input_with_icon = InputWithIcon(
@@ -246,6 +355,9 @@ class DateTimeSelector(QWidget):
                 max_length=max_length,
                 regex_pattern=regex_pattern,
                 placeholder_text=placeholder,
+                style=self._input_style,
+                compiled_style=self._compiled_style,
+                palette_states=self._palette_states,
             )
         input_with_icon.installEventFilter(self)
         input_with_icon.input.installEventFilter(self)
@@ -266,24 +378,14 @@ class DateTimeSelector(QWidget):
         self._attach_time_completer(input_with_icon.input)
 
     def _attach_time_completer(self, line_edit: QLineEdit) -> None:
-        if self._time_model is None:
-            self._time_model = QStringListModel(
-                generate_time_options(self._time_step_minutes),
-                self,
-            )
-        completer = create_time_completer(
-            parent=self,
-            palette=self._palette,
-            time_model=self._time_model,
-        )
-        line_edit.setCompleter(completer)
+        line_edit.setCompleter(shared_time_completer(self._time_step_minutes, self._palette))
 
     def _dismiss_time_popups(self) -> None:
         for time_input in self._time_inputs:
             dismiss_time_popup(time_input.input)
 
     def _on_date_input_text_changed(self, target: InputWithIcon, text: str) -> None:
-        if target not in self._date_inputs:
+        if self._seeding_texts or target not in self._date_inputs:
             return
         stripped = text.strip()
         if len(stripped) != 10:
@@ -344,7 +446,12 @@ class DateTimeSelector(QWidget):
         return True
 
     def _build_date_time_row(
-        self, *, date_text: str, time_text: str
+        self,
+        *,
+        date_text: str,
+        time_text: str,
+        parent: QWidget | None = None,
+        layout: QVBoxLayout | None = None,
     ) -> tuple[InputWithIcon, InputWithIcon]:
         """Create a row containing paired date/time inputs."""
 
@@ -353,12 +460,12 @@ class DateTimeSelector(QWidget):
         row_layout.setSpacing(8)
 
         date_input = self._create_input(
-            self,
+            parent or self,
             text=date_text,
             is_date=True,
         )
         time_input = self._create_input(
-            self,
+            parent or self,
             text=time_text,
             width=100,
             icon_path=str(CLOCK_ICON_PATH),
@@ -368,7 +475,7 @@ class DateTimeSelector(QWidget):
         row_layout.addStretch()
         row_layout.addWidget(time_input)
         row_layout.setAlignment(time_input, Qt.AlignmentFlag.AlignRight)
-        self._layout.addLayout(row_layout)
+        (layout or self._layout).addLayout(row_layout)
         return date_input, time_input
 
     @staticmethod
@@ -401,6 +508,30 @@ class DateTimeSelector(QWidget):
         finally:
             self._installed_app = None
 
+    def _store_default_values(
+        self,
+        primary_date: QDate | None,
+        secondary_date: QDate | None,
+        primary_time: QTime | None,
+        secondary_time: QTime | None,
+    ) -> None:
+        self._default_single_date_text = self._format_date_text(primary_date)
+        range_start_text = self._default_single_date_text
+        range_end_text = (
+            self._format_date_text(secondary_date)
+            if secondary_date is not None and secondary_date.isValid()
+            else range_start_text
+        )
+        self._default_range_date_texts = (range_start_text, range_end_text)
+        self._default_single_time_text = self._format_time_text(primary_time)
+        range_start_time_text = self._default_single_time_text
+        range_end_time_text = (
+            self._format_time_text(secondary_time)
+            if secondary_time is not None and secondary_time.isValid()
+            else range_start_time_text
+        )
+        self._default_range_time_texts = (range_start_time_text, range_end_time_text)
+
     def _format_date_text(self, date: QDate | None) -> str:
         target = date if (date is not None and date.isValid()) else QDate.currentDate()
         return target.toString("yyyy-MM-dd")
@@ -410,6 +541,19 @@ class DateTimeSelector(QWidget):
         return target.toString("HH:mm")
 
 
+def _discard_layout_items(layout: QLayout) -> None:
+    """Empty ``layout``, deleting its widgets and nested row layouts."""
+    while layout.count():
+        item = layout.takeAt(0)
+        widget = cast(QWidget | None, item.widget())
+        if widget is not None:
+            widget.deleteLater()
+        nested = cast(QLayout | None, item.layout())
+        if nested is not None:
+            _discard_layout_items(nested)
+            nested.deleteLater()
+
+
 __all__ = [
     "DateTimeSelector",
     "ModeLiteral",
@@ -5,23 +5,98 @@ from pathlib import Path
 from re import Pattern
 from typing import Final
 
-from PySide6.QtCore import QEvent, QObject, Qt
-from PySide6.QtGui import QEnterEvent
-from PySide6.QtSvgWidgets import QSvgWidget
+from PySide6.QtCore import QEvent, QObject, QRectF, Qt
+from PySide6.QtGui import QEnterEvent, QPainter, QPaintEvent, QPen
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QLineEdit, QSizePolicy, QWidget
 
+from ...styles.compiled_qss import (
+    HOVERED_PROPERTY,
+    INPUT_FIELD,
+    INPUT_ICON,
+    INPUT_LETTER,
+    INPUT_WITH_ICON,
+    STATE_DEFAULT,
+    STATE_FOCUS,
+    STATE_HOVER,
+    STATE_PREVIOUS_FOCUS,
+    STATE_PROPERTY,
+    set_style_property,
+)
+from ...styles.state_colors import state_color
 from ...styles.theme import InputStyleConfig
 from ...utils import connect_signal
-from ...utils.svg_loader import load_svg_widget
+from ...utils.svg_assets import shared_svg_assets
+from ...utils.svg_loader import shared_icon_cache
 
 DEFAULT_HEIGHT: Final[int] = 34
 DEFAULT_WIDTH: Final[int] = 150
 DEFAULT_ICON_PLACEHOLDER_WIDTH: Final[int] = 32
 DEFAULT_ICON_SIZE: Final[int] = 28
+BORDER_RADIUS: Final[int] = 6
+
+
+class _LetterIcon(QLabel):
+    """Letter placeholder that paints its text in a colour set without a stylesheet."""
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__("M", parent)
+        self._text_color = ""
+        self.setStyleSheet("font-size: 12px; font-weight: 600;")
+
+    def set_text_color(self, color: str) -> None:
+        if color == self._text_color:
+            return
+        self._text_color = color
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        painter = QPainter(self)
+        painter.setPen(state_color(self._text_color))
+        painter.setFont(self.font())
+        painter.drawText(self.contentsRect(), Qt.AlignmentFlag.AlignCenter, self.text())
+
+
+class _PixmapIcon(QWidget):
+    """SVG icon painted from pixmaps pre-rasterised in the shared icon cache."""
+
+    def __init__(self, icon_path: Path, parent: QWidget) -> None:
+        super().__init__(parent)
+        self._icon_path = icon_path
+        self._colors = ("", "")
+        self._hovered = False
+        self.setFixedSize(DEFAULT_ICON_SIZE, DEFAULT_ICON_SIZE)
+
+    def set_colors(self, color: str, hover_color: str, *, hovered: bool) -> None:
+        """Select the normal or hover tint; new tints are rasterised once, up front."""
+        colors = (color, hover_color)
+        if colors != self._colors:
+            self._colors = colors
+            dpr = self.devicePixelRatioF()
+            for tint in colors:
+                shared_icon_cache().pixmap(self._icon_path, DEFAULT_ICON_SIZE, tint, dpr)
+        elif hovered == self._hovered:
+            return
+        self._hovered = hovered
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        color = self._colors[1] if self._hovered else self._colors[0]
+        pixmap = shared_icon_cache().pixmap(
+            self._icon_path, DEFAULT_ICON_SIZE, color, self.devicePixelRatioF()
+        )
+        QPainter(self).drawPixmap(0, 0, pixmap)
 
 
 class InputWithIcon(QWidget):
-    """Input widget that hosts a text field with an optional icon."""
+    """
+    Input widget that hosts a text field with an optional icon.
+
+    With ``compiled_style=True`` border and icon changes flip the ``state``
+    and ``hovered`` properties matched by the picker's compiled stylesheet
+    instead of replacing per-widget stylesheets. With ``palette_states=True``
+    the widget paints its own background and border and the letter icon
+    paints its own colour, so hover and focus changes only repaint.
+    """
 
     def __init__(
         self,
@@ -35,8 +110,15 @@ class InputWithIcon(QWidget):
         regex_pattern: str | None = None,
         revert_on_focus_out: bool = True,
         placeholder_text: str | None = None,
+        compiled_style: bool = False,
+        palette_states: bool = False,
     ) -> None:
         super().__init__(parent)
+        self.setObjectName(INPUT_WITH_ICON)
+        self._compiled_style = compiled_style
+        self._palette_states = palette_states
+        # (background, border colour, border width) painted in palette mode.
+        self._frame: tuple[str, str, int] | None = None
 
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setFixedHeight(DEFAULT_HEIGHT)
@@ -45,7 +127,6 @@ class InputWithIcon(QWidget):
 
         self._style = style or _default_style()
         self._icon_path = Path(icon_path) if icon_path is not None else None
-        self._icon_template: str | None = None
         self._is_hovered = False
         self._was_previously_focused = False
         self._max_length = max_length
@@ -63,6 +144,7 @@ class InputWithIcon(QWidget):
         root_layout.setSpacing(4)
 
         self.input = QLineEdit(self)
+        self.input.setObjectName(INPUT_FIELD)
         self.input.setText(text)
         if self._placeholder_text:
             self.input.setPlaceholderText(self._placeholder_text)
@@ -80,6 +162,7 @@ class InputWithIcon(QWidget):
         root_layout.addWidget(self.input, stretch=1)
 
         self.icon_placeholder = QWidget(self)
+        self.icon_placeholder.setObjectName(INPUT_ICON)
         self.icon_placeholder.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.icon_placeholder.setFixedWidth(DEFAULT_ICON_PLACEHOLDER_WIDTH)
         self.icon_placeholder.setSizePolicy(
@@ -115,6 +198,22 @@ class InputWithIcon(QWidget):
         self._update_icon_color()
         super().leaveEvent(event)
 
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        if not self._palette_states or self._frame is None:
+            super().paintEvent(event)
+            return
+        background, border, width = self._frame
+        inset = width / 2
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(state_color(border), width))
+        painter.setBrush(state_color(background))
+        painter.drawRoundedRect(
+            QRectF(self.rect()).adjusted(inset, inset, -inset, -inset),
+            BORDER_RADIUS - inset,
+            BORDER_RADIUS - inset,
+        )
+
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         if watched in {self.icon_placeholder, self._icon_widget}:
             if event.type() is QEvent.Type.MouseButtonPress:
@@ -195,32 +294,32 @@ class InputWithIcon(QWidget):
         if icon_path is None:
             return self._create_letter_placeholder()
 
-        loaded = load_svg_widget(icon_path, DEFAULT_ICON_SIZE)
-        if loaded is None:
+        if shared_svg_assets().template(icon_path) is None:
             return self._create_letter_placeholder()
-
-        widget, template = loaded
-        widget.setParent(self.icon_placeholder)
-        self._icon_template = template
-        return widget
+        return _PixmapIcon(icon_path, self.icon_placeholder)
 
     def _create_letter_placeholder(self) -> QLabel:
-        label = QLabel("M", self.icon_placeholder)
+        label = (
+            _LetterIcon(self.icon_placeholder)
+            if self._palette_states
+            else QLabel("M", self.icon_placeholder)
+        )
+        label.setObjectName(INPUT_LETTER)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         return label
 
     def _refresh_input_style(self) -> None:
+        if self._compiled_style:
+            return
         style = self._style
-        self.icon_placeholder.setStyleSheet(
-            f"""
+        stylesheet = f"""
             background-color: {style.background};
             border: none;
             border-top-right-radius: 8px;
             border-bottom-right-radius: 8px;
             """
-        )
-        self.input.setStyleSheet(
-            f"""
+        self.icon_placeholder.setStyleSheet(stylesheet)
+        stylesheet = f"""
             border: none;
             background-color: transparent;
             color: {style.text_color};
@@ -240,9 +339,20 @@ class InputWithIcon(QWidget):
                 outline: none;
             }}
             """
-        )
+        self.input.setStyleSheet(stylesheet)
 
     def _update_border_style(self) -> None:
+        if self._compiled_style:
+            if self.input.hasFocus():
+                state = STATE_FOCUS
+            elif self._is_hovered:
+                state = STATE_HOVER
+            elif self._was_previously_focused:
+                state = STATE_PREVIOUS_FOCUS
+            else:
+                state = STATE_DEFAULT
+            set_style_property(self, STATE_PROPERTY, state)
+            return
         style = self._style
         if self.input.hasFocus():
             border = style.border_focus
@@ -256,27 +366,37 @@ class InputWithIcon(QWidget):
         else:
             border = style.border_default
             width = style.border_default_width
-        self.setStyleSheet(
-            f"""
+        if self._palette_states:
+            frame = (style.background, border, width)
+            if self._frame != frame:
+                self._frame = frame
+                self.update()
+            return
+        stylesheet = f"""
             background-color: {style.background};
             border: {width}px solid {border};
-            border-radius: 6px;
+            border-radius: {BORDER_RADIUS}px;
             """
-        )
+        self.setStyleSheet(stylesheet)
 
     def _update_icon_color(self) -> None:
         color = self._style.icon_hover_color if self._is_hovered else self._style.icon_color
-        if isinstance(self._icon_widget, QLabel):
-            self._icon_widget.setStyleSheet(
-                f"""
+        if isinstance(self._icon_widget, QLabel) and self._compiled_style:
+            hovered = "true" if self._is_hovered else "false"
+            set_style_property(self._icon_widget, HOVERED_PROPERTY, hovered)
+        elif isinstance(self._icon_widget, _LetterIcon):
+            self._icon_widget.set_text_color(color)
+        elif isinstance(self._icon_widget, QLabel):
+            stylesheet = f"""
                 color: {color};
                 font-size: 12px;
                 font-weight: 600;
                 """
+            self._icon_widget.setStyleSheet(stylesheet)
+        elif isinstance(self._icon_widget, _PixmapIcon):
+            self._icon_widget.set_colors(
+                self._style.icon_color, self._style.icon_hover_color, hovered=self._is_hovered
             )
-        elif isinstance(self._icon_widget, QSvgWidget) and self._icon_template is not None:
-            svg_text = self._icon_template.replace("__SVG_COLOR__", color)
-            self._icon_widget.load(svg_text.encode("utf-8"))
 
     def _install_focus_forwarding(self, widget: QWidget | None) -> None:
         if widget is None:
@@ -288,7 +408,7 @@ class InputWithIcon(QWidget):
 def _default_style() -> InputStyleConfig:
     from ...styles.style_registry import StyleRegistry
 
-    registry = StyleRegistry()
+    registry = StyleRegistry.shared()
     return registry.input_config()
 
 
@@ -1,31 +1,146 @@
 """
 Helpers for constructing and managing the time entry completer popups.
+
+Time options, their models and the styled completers are shared by every
+picker in the process: :func:`shared_time_model` keeps one read-only model
+per step size and :func:`shared_time_completer` one completer per step size
+and popup style. ``QLineEdit`` re-targets a shared completer to whichever
+line edit has focus, so any number of time inputs can use the same popup.
 """
 
 from __future__ import annotations
 
-from typing import cast
+from functools import cache
+from typing import Any, cast
 
-from PySide6.QtCore import QStringListModel, Qt
-from PySide6.QtWidgets import QAbstractItemView, QCompleter, QLineEdit, QWidget
+from PySide6.QtCore import (
+    QCoreApplication,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QStringListModel,
+    Qt,
+)
+from PySide6.QtWidgets import QAbstractItemView, QCompleter, QLineEdit
+from shiboken6 import Shiboken
 
 from ...styles.style_templates import TimePopupStyle, time_popup_qss
 from ...styles.theme import ColorPalette
+from ...utils import connect_signal
 
 _POPUP_WIDTH = 98
 _MAX_VISIBLE_ITEMS = 7
 
 
+def _clamp_step(step_minutes: int) -> int:
+    return max(1, min(step_minutes, 60))
+
+
+@cache
+def _time_options(step: int) -> tuple[str, ...]:
+    return tuple(f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(0, 60, step))
+
+
+def time_options(step_minutes: int) -> tuple[str, ...]:
+    """Return the cached, immutable HH:MM options for the provided minute increment."""
+
+    return _time_options(_clamp_step(step_minutes))
+
+
 def generate_time_options(step_minutes: int) -> list[str]:
     """Generate HH:MM strings for the provided minute increment."""
 
-    step = max(1, min(step_minutes, 60))
-    return [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(0, 60, step)]
+    return list(time_options(step_minutes))
+
+
+class TimeOptionModel(QStringListModel):
+    """Read-only list of time options shared by every completer with the same step."""
+
+    def __init__(self, step_minutes: int, parent: QObject | None = None) -> None:
+        super().__init__(list(time_options(step_minutes)), parent)
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        return super().flags(index) & ~Qt.ItemFlag.ItemIsEditable
+
+    def setData(  # noqa: N802
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        return False
+
+
+_TIME_MODELS: dict[int, TimeOptionModel] = {}
+_TIME_COMPLETERS: dict[tuple[int, TimePopupStyle], QCompleter] = {}
+_WATCHED_APP: QCoreApplication | None = None
+
+
+def _application() -> QCoreApplication | None:
+    """Return the application, forgetting the shared objects once it quits."""
+
+    global _WATCHED_APP
+    app = QCoreApplication.instance()
+    if app is not None and app is not _WATCHED_APP:
+        _WATCHED_APP = app
+        connect_signal(app.aboutToQuit, clear_time_completers)
+    return app
+
+
+def shared_time_model(step_minutes: int) -> QStringListModel:
+    """
+    Return the process-wide read-only model of time options for ``step_minutes``.
+
+    Models are parented to the application so they are released with it.
+    """
+
+    step = _clamp_step(step_minutes)
+    model = _TIME_MODELS.get(step)
+    if model is None or not Shiboken.isValid(model):
+        model = TimeOptionModel(step, _application())
+        _TIME_MODELS[step] = model
+    return model
+
+
+def shared_time_completer(step_minutes: int, palette: ColorPalette) -> QCompleter:
+    """
+    Return the process-wide completer for ``step_minutes`` styled with ``palette``.
+
+    Completers are keyed by step and by the palette's popup tokens, so the
+    number of completers depends on the distinct themes in use, not on the
+    number of pickers. They have no Qt parent: the cache and every line edit
+    using a completer keep it alive, so it is released with its last user.
+    """
+
+    step = _clamp_step(step_minutes)
+    key = (step, time_popup_style(palette))
+    completer = _TIME_COMPLETERS.get(key)
+    if completer is None or not Shiboken.isValid(completer):
+        completer = create_time_completer(
+            parent=None,
+            palette=palette,
+            time_model=shared_time_model(step),
+        )
+        _TIME_COMPLETERS[key] = completer
+    return completer
+
+
+def clear_time_completers() -> None:
+    """
+    Forget the shared completers and models.
+
+    Called automatically when the application is about to quit. Only the
+    cache entries are dropped: inputs keep the completers they already use,
+    and each completer is released once no input refers to it any more.
+    """
+
+    _TIME_COMPLETERS.clear()
+    _TIME_MODELS.clear()
 
 
 def create_time_completer(
     *,
-    parent: QWidget,
+    parent: QObject | None,
     palette: ColorPalette,
     time_model: QStringListModel,
 ) -> QCompleter:
@@ -38,26 +153,37 @@ def create_time_completer(
     completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
     completer.setMaxVisibleItems(_MAX_VISIBLE_ITEMS)
 
+    apply_time_popup_palette(completer, palette)
     popup = cast(QAbstractItemView | None, completer.popup())
     if popup is not None:
-        popup.setStyleSheet(
-            time_popup_qss(
-                TimePopupStyle(
-                    background=palette.time_popup_background,
-                    text_color=palette.time_popup_text_color,
-                    hover_background=palette.time_popup_hover_background,
-                    hover_text_color=palette.time_popup_hover_text_color,
-                    selected_background=palette.time_popup_selected_background,
-                    selected_text_color=palette.time_popup_selected_text_color,
-                )
-            )
-        )
         popup.setFixedWidth(_POPUP_WIDTH)
         popup.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         popup.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
     return completer
 
 
+def time_popup_style(palette: ColorPalette) -> TimePopupStyle:
+    """Return the popup tokens ``palette`` defines for time completers."""
+
+    return TimePopupStyle(
+        background=palette.time_popup_background,
+        text_color=palette.time_popup_text_color,
+        hover_background=palette.time_popup_hover_background,
+        hover_text_color=palette.time_popup_hover_text_color,
+        selected_background=palette.time_popup_selected_background,
+        selected_text_color=palette.time_popup_selected_text_color,
+    )
+
+
+def apply_time_popup_palette(completer: QCompleter, palette: ColorPalette) -> None:
+    """Restyle the popup of an existing time completer with ``palette``."""
+
+    popup = cast(QAbstractItemView | None, completer.popup())
+    if popup is None:
+        return
+    popup.setStyleSheet(time_popup_qss(time_popup_style(palette)))
+
+
 def show_time_popup(line_edit: QLineEdit) -> None:
     """
     Display the completer popup for ``line_edit`` and scroll to the
@@ -67,6 +193,8 @@ def show_time_popup(line_edit: QLineEdit) -> None:
     completer = cast(QCompleter | None, line_edit.completer())
     if completer is None:
         return
+    if completer.widget() is not line_edit:
+        completer.setWidget(line_edit)
     popup = cast(QAbstractItemView | None, completer.popup())
     completer.setCompletionPrefix("")
     text = line_edit.text()
@@ -91,7 +219,7 @@ def dismiss_time_popup(line_edit: QLineEdit) -> None:
     """Hide the popup associated with ``line_edit`` if it is currently visible."""
 
     completer = cast(QCompleter | None, line_edit.completer())
-    if completer is None:
+    if completer is None or completer.widget() is not line_edit:
         return
     popup = cast(QAbstractItemView | None, completer.popup())
     if popup is not None and popup.isVisible():
@@ -99,8 +227,15 @@ def dismiss_time_popup(line_edit: QLineEdit) -> None:
 
 
 __all__ = [
+    "TimeOptionModel",
+    "apply_time_popup_palette",
+    "clear_time_completers",
     "create_time_completer",
     "dismiss_time_popup",
     "generate_time_options",
+    "shared_time_completer",
+    "shared_time_model",
     "show_time_popup",
+    "time_options",
+    "time_popup_style",
 ]
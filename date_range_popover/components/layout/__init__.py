@@ -1,6 +1,16 @@
 """Layout components for structuring the picker."""
 
-from .draggable_header import DraggableHeaderStrip
-from .sliding_track import SlidingTrackIndicator
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .draggable_header import DraggableHeaderStrip
+    from .sliding_track import SlidingTrackIndicator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"DraggableHeaderStrip": ".draggable_header", "SlidingTrackIndicator": ".sliding_track"},
+)
 
 __all__ = ["DraggableHeaderStrip", "SlidingTrackIndicator"]
@@ -9,11 +9,17 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ...styles.compiled_qss import SLIDING_TRACK, SLIDING_TRACK_GROOVE, SLIDING_TRACK_INDICATOR
 from ...styles.theme import ColorPalette, LayoutConfig
 
 
 class SlidingTrackIndicator(QWidget):
-    """Handles layout of the sliding indicator within its track."""
+    """
+    Handles layout of the sliding indicator within its track.
+
+    With ``compiled_style=True`` the track sets no stylesheets; its colours
+    come from the picker's compiled stylesheet.
+    """
 
     @staticmethod
     def _create_child_widget(parent: QWidget | None) -> QWidget:
@@ -38,8 +44,11 @@ class SlidingTrackIndicator(QWidget):
         *,
         palette: ColorPalette | None = None,
         layout: LayoutConfig | None = None,
+        compiled_style: bool = False,
     ) -> None:
         super().__init__(parent)
+        self.setObjectName(SLIDING_TRACK)
+        self._compiled_style = compiled_style
 
         self._palette = palette or ColorPalette()
         self._layout = layout or LayoutConfig()
@@ -51,6 +60,7 @@ class SlidingTrackIndicator(QWidget):
         wrapper_layout.setSpacing(0)
 
         self._track_container = self._create_child_widget(self)
+        self._track_container.setObjectName(SLIDING_TRACK_GROOVE)
         self._track_container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._track_container.setSizePolicy(
             QSizePolicy.Policy.Expanding,
@@ -67,6 +77,7 @@ class SlidingTrackIndicator(QWidget):
         self._left_spacer.setFixedWidth(0)
 
         self._indicator = self._create_child_widget(self._track_container)
+        self._indicator.setObjectName(SLIDING_TRACK_INDICATOR)
         self._indicator.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self._indicator.setFixedHeight(self._layout.sliding_indicator_height)
 
@@ -88,6 +99,8 @@ class SlidingTrackIndicator(QWidget):
     def apply_palette(self, palette: ColorPalette) -> None:
         """Apply the palette colors to the track and indicator."""
         self._palette = palette
+        if self._compiled_style:
+            return
         self.setStyleSheet(f"background-color: {palette.window_background};")
         radius = self._layout.sliding_indicator_radius
         self._track_container.setStyleSheet(
@@ -104,13 +117,15 @@ class SlidingTrackIndicator(QWidget):
         radius = layout.sliding_indicator_radius
         self._track_container.setFixedHeight(height)
         self._indicator.setFixedHeight(height)
-        self._track_container.setStyleSheet(
-            f"background-color: {self._palette.track_background}; " f"border-radius: {radius}px;"
-        )
-        self._indicator.setStyleSheet(
-            f"background-color: {self._palette.track_indicator_color}; "
-            f"border-radius: {radius}px;"
-        )
+        if not self._compiled_style:
+            self._track_container.setStyleSheet(
+                f"background-color: {self._palette.track_background}; "
+                f"border-radius: {radius}px;"
+            )
+            self._indicator.setStyleSheet(
+                f"background-color: {self._palette.track_indicator_color}; "
+                f"border-radius: {radius}px;"
+            )
         self._update_layout()
 
     @property
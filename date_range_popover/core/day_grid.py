@@ -0,0 +1,237 @@
+"""
+Pure helpers describing the visual state of calendar day-grid cells.
+
+The day views compare compact per-cell records between refreshes so they only
+restyle (or repaint) the cells whose state actually changed. Keeping the flag
+definitions here—free of Qt imports—lets the diffing logic be unit-tested in
+isolation and shared by every grid renderer.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import IntFlag
+from functools import cache
+from types import ModuleType
+from typing import Final, NamedTuple
+
+from ..exceptions import ValidationError
+
+# Batches smaller than this run faster in plain Python than through NumPy's
+# per-call overhead; a single 42-cell grid stays on the pure-Python path.
+NUMPY_MIN_CELLS: Final[int] = 256
+
+
+class DayCellFlag(IntFlag):
+    """Bit flags describing a single day cell."""
+
+    NONE = 0
+    IN_MONTH = 1 << 0
+    SELECTED = 1 << 1
+    DISABLED = 1 << 2
+    RANGE_START = 1 << 3
+    RANGE_END = 1 << 4
+    IN_RANGE = 1 << 5
+    TODAY = 1 << 6
+
+
+def pack_day_flags(
+    *,
+    in_current_month: bool,
+    is_selected: bool = False,
+    is_disabled: bool = False,
+    is_range_start: bool = False,
+    is_range_end: bool = False,
+    is_in_range: bool = False,
+    is_today: bool = False,
+) -> int:
+    """Pack boolean cell state into a :class:`DayCellFlag` integer."""
+    flags = 0
+    if in_current_month:
+        flags |= DayCellFlag.IN_MONTH
+    if is_selected:
+        flags |= DayCellFlag.SELECTED
+    if is_disabled:
+        flags |= DayCellFlag.DISABLED
+    if is_range_start:
+        flags |= DayCellFlag.RANGE_START
+    if is_range_end:
+        flags |= DayCellFlag.RANGE_END
+    if is_in_range:
+        flags |= DayCellFlag.IN_RANGE
+    if is_today:
+        flags |= DayCellFlag.TODAY
+    return flags
+
+
+_IN_MONTH: Final[int] = int(DayCellFlag.IN_MONTH)
+_SELECTED: Final[int] = int(DayCellFlag.SELECTED)
+_DISABLED: Final[int] = int(DayCellFlag.DISABLED)
+_RANGE_START: Final[int] = int(DayCellFlag.RANGE_START)
+_RANGE_END: Final[int] = int(DayCellFlag.RANGE_END)
+_IN_RANGE: Final[int] = int(DayCellFlag.IN_RANGE)
+_TODAY: Final[int] = int(DayCellFlag.TODAY)
+
+
+@cache
+def _numpy() -> ModuleType | None:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def numpy_available() -> bool:
+    """Return ``True`` when the optional NumPy backend can be used."""
+    return _numpy() is not None
+
+
+def compute_day_flags(
+    julian_days: Sequence[int],
+    in_month: Sequence[int],
+    *,
+    selected: int | None = None,
+    today: int | None = None,
+    range_start: int | None = None,
+    range_end: int | None = None,
+    min_julian: int | None = None,
+    max_julian: int | None = None,
+    use_numpy: bool | None = None,
+) -> list[int]:
+    """
+    Return the :class:`DayCellFlag` bits for every cell in one pass.
+
+    All arguments are Julian day numbers (``QDate.toJulianDay()``), so no
+    ``QDate`` is touched while computing flags. Range bounds are normalised if
+    given in reverse order and selection is suppressed on disabled cells.
+
+    ``use_numpy=None`` picks the NumPy backend automatically for batches of at
+    least :data:`NUMPY_MIN_CELLS` cells when NumPy is installed (the
+    ``numpy`` extra); ``True`` forces it and ``False`` forces pure Python.
+    """
+
+    if len(julian_days) != len(in_month):
+        raise ValidationError("julian_days and in_month must have the same length")
+    if range_start is not None and range_end is not None and range_start > range_end:
+        range_start, range_end = range_end, range_start
+
+    numpy = _numpy()
+    if use_numpy is None:
+        use_numpy = numpy is not None and len(julian_days) >= NUMPY_MIN_CELLS
+    elif use_numpy and numpy is None:
+        raise ModuleNotFoundError("NumPy is not installed; install the 'numpy' extra")
+
+    if use_numpy and numpy is not None:
+        return _compute_day_flags_numpy(
+            numpy,
+            julian_days,
+            in_month,
+            selected=selected,
+            today=today,
+            range_start=range_start,
+            range_end=range_end,
+            min_julian=min_julian,
+            max_julian=max_julian,
+        )
+
+    flags: list[int] = []
+    for julian, month_flag in zip(julian_days, in_month):
+        value = _IN_MONTH if month_flag else 0
+        if (min_julian is not None and julian < min_julian) or (
+            max_julian is not None and julian > max_julian
+        ):
+            value |= _DISABLED
+        elif julian == selected:
+            value |= _SELECTED
+        if julian == range_start:
+            value |= _RANGE_START
+        if julian == range_end:
+            value |= _RANGE_END
+        if range_start is not None and range_end is not None and range_start < julian < range_end:
+            value |= _IN_RANGE
+        if julian == today:
+            value |= _TODAY
+        flags.append(value)
+    return flags
+
+
+def _compute_day_flags_numpy(
+    np: ModuleType,
+    julian_days: Sequence[int],
+    in_month: Sequence[int],
+    *,
+    selected: int | None,
+    today: int | None,
+    range_start: int | None,
+    range_end: int | None,
+    min_julian: int | None,
+    max_julian: int | None,
+) -> list[int]:
+    julian = np.asarray(julian_days, dtype=np.int64)
+    flags = np.where(np.asarray(in_month, dtype=np.int64) != 0, _IN_MONTH, 0)
+    disabled = np.zeros(julian.shape, dtype=bool)
+    if min_julian is not None:
+        disabled |= julian < min_julian
+    if max_julian is not None:
+        disabled |= julian > max_julian
+    flags |= np.where(disabled, _DISABLED, 0)
+    if selected is not None:
+        flags |= np.where((julian == selected) & ~disabled, _SELECTED, 0)
+    if range_start is not None:
+        flags |= np.where(julian == range_start, _RANGE_START, 0)
+    if range_end is not None:
+        flags |= np.where(julian == range_end, _RANGE_END, 0)
+    if range_start is not None and range_end is not None:
+        flags |= np.where((julian > range_start) & (julian < range_end), _IN_RANGE, 0)
+    if today is not None:
+        flags |= np.where(julian == today, _TODAY, 0)
+    result: list[int] = flags.tolist()
+    return result
+
+
+class DayCellRecord(NamedTuple):
+    """
+    Compact visual-state record for one grid cell.
+
+    ``style_key`` identifies the style tokens the cell was rendered with
+    (views bump it whenever ``apply_style`` runs). Cells outside the visible
+    month all collapse onto the same record because they render identically.
+    """
+
+    day: int
+    flags: int
+    style_key: int
+
+
+def make_day_cell_record(day: int, flags: int, style_key: int) -> DayCellRecord:
+    """Return the record for a cell, collapsing hidden cells onto one value."""
+    if not flags & DayCellFlag.IN_MONTH:
+        return DayCellRecord(0, 0, style_key)
+    return DayCellRecord(day, flags, style_key)
+
+
+@dataclass(frozen=True, slots=True)
+class CellUpdateStats:
+    """Counters describing how many cell updates were applied versus skipped."""
+
+    applied: int = 0
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of cell refreshes requested."""
+        return self.applied + self.skipped
+
+
+__all__ = [
+    "CellUpdateStats",
+    "DayCellFlag",
+    "DayCellRecord",
+    "NUMPY_MIN_CELLS",
+    "compute_day_flags",
+    "make_day_cell_record",
+    "numpy_available",
+    "pack_day_flags",
+]
@@ -101,6 +101,22 @@ def apply_range_selection(
     )
 
 
+def apply_constraints(
+    state: DatePickerState,
+    min_date: QDate | None,
+    max_date: QDate | None,
+) -> DatePickerState:
+    """Return a snapshot whose selection and visible month respect new bounds."""
+    start, end = state.selected_dates
+    clamped_start = clamp_date(start, min_date, max_date) if start is not None else None
+    clamped_end = clamp_date(end, min_date, max_date) if end is not None else None
+    return replace(
+        state,
+        selected_dates=(clamped_start, clamped_end),
+        visible_month=clamp_visible_month(state.visible_month, min_date, max_date),
+    )
+
+
 def switch_mode(state: DatePickerState, mode: PickerMode) -> DatePickerState:
     """Return a new snapshot with the provided picker mode."""
     return replace(state, mode=mode)
@@ -109,6 +125,7 @@ def switch_mode(state: DatePickerState, mode: PickerMode) -> DatePickerState:
 __all__ = [
     "DatePickerState",
     "PickerMode",
+    "apply_constraints",
     "apply_range_selection",
     "apply_single_date",
     "build_initial_state",
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 
 class ValidationError(ValueError):
     """Base class for validation-related failures."""
@@ -15,6 +17,20 @@ class InvalidConfigurationError(ValidationError):
     """Raised when configuration objects contain invalid values."""
 
 
+class InvalidFieldsError(InvalidConfigurationError):
+    """
+    Raised when bulk validation finds one or more invalid fields.
+
+    ``errors`` maps every offending field name to its individual message so
+    callers can report all problems in one pass instead of fixing them one
+    exception at a time.
+    """
+
+    def __init__(self, errors: Mapping[str, str]) -> None:
+        self.errors: dict[str, str] = dict(errors)
+        super().__init__("; ".join(self.errors.values()))
+
+
 class InvalidThemeError(InvalidConfigurationError):
     """Raised when theme or palette definitions are inconsistent."""
 
@@ -23,5 +39,6 @@ __all__ = [
     "ValidationError",
     "InvalidDateError",
     "InvalidConfigurationError",
+    "InvalidFieldsError",
     "InvalidThemeError",
 ]
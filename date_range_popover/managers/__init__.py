@@ -1,8 +1,24 @@
 """Managers coordinating state, styling, and coordination logic."""
 
-from .coordinator import DatePickerCoordinator
-from .state_manager import DatePickerState, DatePickerStateManager, PickerMode
-from .style_manager import StyleManager
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .coordinator import DatePickerCoordinator
+    from .state_manager import DatePickerState, DatePickerStateManager, PickerMode
+    from .style_manager import StyleManager
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DatePickerCoordinator": ".coordinator",
+        "DatePickerStateManager": ".state_manager",
+        "DatePickerState": ".state_manager",
+        "PickerMode": ".state_manager",
+        "StyleManager": ".style_manager",
+    },
+)
 
 __all__ = [
     "DatePickerCoordinator",
@@ -74,7 +74,7 @@ class DatePickerCoordinator(QObject):
     def register_date_time_selector(self, selector: DateTimeSelector) -> None:
         """Attach the date-time selector and connect validation callbacks."""
         self._date_time_selector = selector
-        selector.apply_palette(self._style_manager.theme.palette)
+        self._style_manager.apply_date_time_selector(selector)
         connect_signal(selector.date_input_valid, self._on_date_input_valid)
         self._apply_mode_to_date_time_selector(self._state_manager.state.mode)
 
@@ -99,6 +99,22 @@ class DatePickerCoordinator(QObject):
         LOGGER.debug("Coordinator selecting date %s", date.toString("yyyy-MM-dd"))
         self._state_manager.select_date(date)
 
+    def select_range(self, start: QDate, end: QDate) -> None:
+        """Proxy to the state manager's ``select_range`` method."""
+        LOGGER.debug(
+            "Coordinator selecting range %s -> %s",
+            start.toString("yyyy-MM-dd"),
+            end.toString("yyyy-MM-dd"),
+        )
+        self._pending_range_start = None
+        self._state_manager.select_range(start, end)
+
+    def set_constraints(self, *, min_date: QDate | None, max_date: QDate | None) -> None:
+        """Apply new bounds to the calendar first, then clamp the shared state."""
+        if self._calendar is not None:
+            self._calendar.set_constraints(min_date=min_date, max_date=max_date)
+        self._state_manager.set_constraints(min_date=min_date, max_date=max_date)
+
     def switch_mode(self, mode: PickerMode) -> None:
         """Switch the picker mode via the state manager."""
         LOGGER.debug("Coordinator switching mode to %s", mode.name)
@@ -8,6 +8,7 @@ from PySide6.QtCore import QDate, QObject, Signal
 from ..core.state_logic import (
     DatePickerState,
     PickerMode,
+    apply_constraints,
     apply_range_selection,
     apply_single_date,
     build_initial_state,
@@ -49,14 +50,7 @@ class DatePickerStateManager(QObject):
         :raises InvalidDateError: If ``min_date`` is after ``max_date``.
         """
         super().__init__()
-        self._min_date = QDate(min_date) if isinstance(min_date, QDate) else None
-        self._max_date = QDate(max_date) if isinstance(max_date, QDate) else None
-        if (
-            self._min_date is not None
-            and self._max_date is not None
-            and qdate_is_after(self._min_date, self._max_date)
-        ):
-            raise InvalidDateError("min_date must be on or before max_date")
+        self._min_date, self._max_date = _copy_bounds(min_date, max_date)
         self._state = build_initial_state(self._min_date, self._max_date)
 
     @property
@@ -74,6 +68,31 @@ class DatePickerStateManager(QObject):
         """Configured upper bound for selection/navigation (defensive copy)."""
         return self._max_date
 
+    def set_constraints(self, *, min_date: QDate | None, max_date: QDate | None) -> None:
+        """
+        Replace the selection bounds and clamp the current state into them.
+
+        :param min_date: New lower bound; ``None`` means unbounded.
+        :param max_date: New upper bound; ``None`` means unbounded.
+        :raises InvalidDateError: If ``min_date`` is after ``max_date``.
+
+        Thread Safety:
+            Invoke from the Qt GUI thread; clamped selections are re-emitted.
+        """
+        self._min_date, self._max_date = _copy_bounds(min_date, max_date)
+        previous = self._state
+        self._state = apply_constraints(previous, self._min_date, self._max_date)
+        start, end = self._state.selected_dates
+        if self._state.selected_dates != previous.selected_dates and start is not None:
+            if end is None:
+                self.selected_date_changed.emit(start)
+            else:
+                self.selected_range_changed.emit(start, end)
+        if self._state.visible_month != previous.visible_month:
+            self.visible_month_changed.emit(self._state.visible_month)
+        if self._state != previous:
+            self.state_changed.emit(self._state)
+
     def set_mode(self, mode: PickerMode) -> None:
         """
         Update the active picker mode and notify listeners.
@@ -203,4 +222,14 @@ class DatePickerStateManager(QObject):
         self.state_changed.emit(self._state)
 
 
+def _copy_bounds(
+    min_date: QDate | None, max_date: QDate | None
+) -> tuple[QDate | None, QDate | None]:
+    lower = QDate(min_date) if isinstance(min_date, QDate) else None
+    upper = QDate(max_date) if isinstance(max_date, QDate) else None
+    if lower is not None and upper is not None and qdate_is_after(lower, upper):
+        raise InvalidDateError("min_date must be on or before max_date")
+    return lower, upper
+
+
 __all__ = ["DatePickerStateManager", "DatePickerState", "PickerMode"]
@@ -16,6 +16,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..components.buttons.basic_button import BasicButton
     from ..components.buttons.button_strip import ButtonStrip
     from ..components.calendar.calendar_widget import CalendarWidget
+    from ..components.inputs.date_time_selector import DateTimeSelector
     from ..components.inputs.input_with_icon import InputWithIcon
     from ..components.layout.draggable_header import DraggableHeaderStrip
     from ..components.layout.sliding_track import SlidingTrackIndicator
@@ -28,15 +29,27 @@ class StyleManager:
     The manager keeps :class:`StyleRegistry` lookups in one place so components
     do not each need to understand palette/layout internals. This makes it easy
     to swap entire themes when embedding the picker in different host apps.
+
+    Without an explicit registry the manager reads from the process-wide
+    :meth:`StyleRegistry.shared` registry and only forks a private copy when
+    :attr:`registry` is accessed, so custom variants never leak into other
+    managers or pickers.
     """
 
     def __init__(self, registry: StyleRegistry | None = None) -> None:
         """Initialise the manager with an optional pre-built registry."""
-        self._registry = registry or StyleRegistry()
+        self._registry = registry or StyleRegistry.shared()
 
     @property
     def registry(self) -> StyleRegistry:
-        """Access the underlying :class:`StyleRegistry`."""
+        """
+        Access this manager's :class:`StyleRegistry`.
+
+        A shared registry is forked into a private copy first, so variants
+        registered on the result only affect this manager.
+        """
+        if self._registry.is_shared:
+            self._registry = self._registry.fork()
         return self._registry
 
     @property
@@ -44,9 +57,13 @@ class StyleManager:
         """Return the current :class:`Theme` (palette + layout tokens)."""
         return self._registry.theme
 
+    def compiled_stylesheet(self) -> str:
+        """Return the picker-wide stylesheet compiled from the current registry."""
+        return self._registry.compiled_stylesheet()
+
     def use_theme(self, theme: Theme) -> None:
-        """Swap to a new :class:`Theme`, rebuilding the registry for future lookups."""
-        self._registry = StyleRegistry(theme)
+        """Swap to a new :class:`Theme`, switching to its shared registry for future lookups."""
+        self._registry = StyleRegistry.shared(theme)
 
     # Component-specific helpers -----------------------------------------------------
 
@@ -58,8 +75,9 @@ class StyleManager:
     ) -> None:
         """Apply the configured button variant stylesheet."""
         target_variant = variant or self._registry.BUTTON_DEFAULT
-        config = self._registry.button_config(target_variant)
-        stylesheet = config.stylesheet(vertical_padding=button.vertical_padding)
+        stylesheet = self._registry.button_stylesheet(
+            variant=target_variant, vertical_padding=button.vertical_padding
+        )
         button.apply_stylesheet(stylesheet)
 
     def apply_button_strip(self, button_strip: ButtonStrip) -> None:
@@ -89,6 +107,11 @@ class StyleManager:
         config = self._registry.input_config(target_variant)
         input_widget.apply_style(config)
 
+    def apply_date_time_selector(self, selector: DateTimeSelector) -> None:
+        """Push the palette and default input style to the date-time selector."""
+        selector.apply_palette(self.theme.palette)
+        selector.apply_input_style(self._registry.input_config())
+
     def apply_sliding_track(self, sliding_track: SlidingTrackIndicator) -> None:
         """Apply palette/layout tokens to the sliding track indicator."""
         sliding_track.apply_palette(self.theme.palette)
@@ -1,7 +1,24 @@
 """Styling helpers for the date range picker."""
 
-from . import constants, style_templates
-from .style_registry import StyleRegistry
-from .theme import DEFAULT_THEME, Theme
+from typing import TYPE_CHECKING
 
-__all__ = ["constants", "style_templates", "StyleRegistry", "DEFAULT_THEME", "Theme"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from . import constants, qss_cache, style_templates
+    from .style_registry import StyleRegistry
+    from .theme import DEFAULT_THEME, Theme
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "constants": ".constants",
+        "qss_cache": ".qss_cache",
+        "style_templates": ".style_templates",
+        "StyleRegistry": ".style_registry",
+        "DEFAULT_THEME": ".theme",
+        "Theme": ".theme",
+    },
+)
+
+__all__ = ["constants", "qss_cache", "style_templates", "StyleRegistry", "DEFAULT_THEME", "Theme"]
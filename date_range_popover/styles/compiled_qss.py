@@ -0,0 +1,377 @@
+"""
+One theme-compiled stylesheet for the whole picker.
+
+By default every component calls ``setStyleSheet`` on itself and its children,
+so a single picker carries well over a hundred separately parsed stylesheets
+and each state change swaps one of them. With
+``RenderingOptions.compiled_stylesheet`` the picker root instead receives the
+stylesheet built by :func:`compile_stylesheet` (cached per
+:class:`StyleRegistry`). Components identify themselves through the object
+names below and express state through dynamic properties. Changing a state
+then flips one property and re-polishes one widget instead of parsing a new
+stylesheet.
+
+Bare declarations applied to a container (``setStyleSheet("background: …")``)
+cascade to every descendant, so they compile to ``#name, #name *`` rules to
+keep the rendered result identical.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from PySide6.QtWidgets import QWidget
+
+from .style_templates import (
+    CircularButtonHoverStyle,
+    CircularButtonStyle,
+    DayCellStyle,
+    circular_button_default_qss,
+    circular_button_selected_qss,
+    container_qss,
+    day_cell_qss,
+    day_cell_underline_qss,
+    qss_rule,
+)
+from .theme import CalendarStyleConfig, InputStyleConfig, Theme
+
+ROOT_OBJECT_NAME: Final[str] = "DateRangePicker"
+STATE_PROPERTY: Final[str] = "state"
+HOVERED_PROPERTY: Final[str] = "hovered"
+
+BUTTON_SECTION: Final[str] = "pickerButtonSection"
+CALENDAR_WIDGET: Final[str] = "calendarWidget"
+CALENDAR_NAV_BUTTON: Final[str] = "calendarNavButton"
+CALENDAR_HEADER_BUTTON: Final[str] = "calendarHeaderButton"
+CALENDAR_DAY_VIEW: Final[str] = "calendarDayView"
+CALENDAR_DAY_LABELS: Final[str] = "calendarDayLabels"
+CALENDAR_MODE_LABEL: Final[str] = "calendarModeLabel"
+CALENDAR_DAY_BUTTON: Final[str] = "calendarDayButton"
+CALENDAR_DAY_UNDERLINE: Final[str] = "calendarDayUnderline"
+CALENDAR_MONTH_VIEW: Final[str] = "calendarMonthView"
+CALENDAR_YEAR_VIEW: Final[str] = "calendarYearView"
+CALENDAR_YEAR_LIST: Final[str] = "calendarYearList"
+CALENDAR_YEAR_JUMP_FIELD: Final[str] = "calendarYearJumpField"
+CALENDAR_CHOICE_BUTTON: Final[str] = "calendarChoiceButton"
+BUTTON_STRIP: Final[str] = "buttonStrip"
+BUTTON_STRIP_BUTTON: Final[str] = "buttonStripButton"
+SLIDING_TRACK: Final[str] = "slidingTrack"
+SLIDING_TRACK_GROOVE: Final[str] = "slidingTrackGroove"
+SLIDING_TRACK_INDICATOR: Final[str] = "slidingTrackIndicator"
+DATE_TIME_SELECTOR: Final[str] = "dateTimeSelector"
+INPUT_WITH_ICON: Final[str] = "inputWithIcon"
+INPUT_FIELD: Final[str] = "inputWithIconField"
+INPUT_ICON: Final[str] = "inputWithIconIcon"
+INPUT_LETTER: Final[str] = "inputWithIconLetter"
+
+STATE_DEFAULT: Final[str] = "default"
+STATE_SELECTED: Final[str] = "selected"
+STATE_DISABLED: Final[str] = "disabled"
+STATE_RANGE_EDGE: Final[str] = "range-edge"
+STATE_IN_RANGE: Final[str] = "in-range"
+STATE_HOVER: Final[str] = "hover"
+STATE_FOCUS: Final[str] = "focus"
+STATE_PREVIOUS_FOCUS: Final[str] = "previous-focus"
+
+DAY_CELL_STATES: Final[tuple[str, ...]] = (
+    STATE_DEFAULT,
+    STATE_DISABLED,
+    STATE_RANGE_EDGE,
+    STATE_IN_RANGE,
+    STATE_SELECTED,
+)
+INPUT_STATES: Final[tuple[str, ...]] = (
+    STATE_DEFAULT,
+    STATE_HOVER,
+    STATE_FOCUS,
+    STATE_PREVIOUS_FOCUS,
+)
+
+
+def day_cell_state(
+    *,
+    is_selected: bool,
+    is_disabled: bool = False,
+    is_range_start: bool = False,
+    is_range_end: bool = False,
+    is_in_range: bool = False,
+) -> str:
+    """Collapse day-cell flags onto the ``state`` property value (same precedence as the QSS)."""
+    if is_disabled:
+        return STATE_DISABLED
+    if is_range_start or is_range_end:
+        return STATE_RANGE_EDGE
+    if is_in_range:
+        return STATE_IN_RANGE
+    if is_selected:
+        return STATE_SELECTED
+    return STATE_DEFAULT
+
+
+def day_cell_style(style: CalendarStyleConfig, state: str, *, radius: int) -> DayCellStyle:
+    """
+    Return the colours a day cell in ``state`` is painted with.
+
+    Mirrors ``resolve_day_cell_appearance`` so both style modes render the
+    same tokens.
+    """
+    if state == STATE_RANGE_EDGE:
+        return DayCellStyle(
+            background=style.range_edge_background,
+            text_color=style.range_edge_text_color,
+            hover_background=style.range_edge_background,
+            hover_text_color=style.range_edge_text_color,
+            radius=radius,
+        )
+    if state == STATE_IN_RANGE:
+        return DayCellStyle(
+            background=style.range_between_background,
+            text_color=style.range_between_text_color,
+            hover_background=style.range_between_background,
+            hover_text_color=style.range_between_text_color,
+            radius=radius,
+        )
+    if state == STATE_SELECTED:
+        return DayCellStyle(
+            background=style.today_background,
+            text_color=style.today_text_color,
+            hover_background=style.today_background,
+            hover_text_color=style.today_text_color,
+            radius=radius,
+        )
+    return DayCellStyle(
+        background="transparent",
+        text_color=(
+            style.muted_day_text_color if state == STATE_DISABLED else style.day_text_color
+        ),
+        hover_background=style.day_hover_background,
+        hover_text_color=style.day_hover_text_color,
+        radius=radius,
+    )
+
+
+def set_style_property(widget: QWidget, name: str, value: str) -> bool:
+    """
+    Set a dynamic style property and re-polish ``widget`` only if it changed.
+
+    Returns ``True`` when the widget was re-polished.
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    return True
+
+
+def compile_stylesheet(
+    theme: Theme,
+    *,
+    calendar: CalendarStyleConfig,
+    input_style: InputStyleConfig,
+) -> str:
+    """Render every picker rule for ``theme`` into one stylesheet for the picker root."""
+    palette = theme.palette
+    layout = theme.layout
+    radius = layout.calendar_day_cell_radius
+    underline_radius = max(0, layout.calendar_day_underline_height // 2)
+    track_radius = layout.sliding_indicator_radius
+
+    rules = [
+        _cascade(
+            ROOT_OBJECT_NAME,
+            f"background-color: {palette.window_background}; "
+            f"border-radius: {layout.window_radius}px;",
+        ),
+        _cascade(
+            BUTTON_SECTION,
+            container_qss(palette.button_container_background, radius=0, border="none"),
+        ),
+        # Button strip and sliding track.
+        _cascade(BUTTON_STRIP, f"background-color: {palette.button_container_background};"),
+        qss_rule(
+            f"QPushButton#{BUTTON_STRIP_BUTTON}",
+            "text-align: left; padding: 0; margin: 0; border: none; outline: none;"
+            f"color: {palette.button_default_color};",
+        ),
+        qss_rule(
+            f"QPushButton#{BUTTON_STRIP_BUTTON}:hover",
+            f"color: {palette.button_hover_color};",
+        ),
+        qss_rule(
+            f"{_state(f'QPushButton#{BUTTON_STRIP_BUTTON}', STATE_SELECTED)}, "
+            f"{_state(f'QPushButton#{BUTTON_STRIP_BUTTON}', STATE_SELECTED)}:hover",
+            f"color: {palette.button_selected_color};",
+        ),
+        _cascade(SLIDING_TRACK, f"background-color: {palette.window_background};"),
+        _cascade(
+            SLIDING_TRACK_GROOVE,
+            f"background-color: {palette.track_background}; border-radius: {track_radius}px;",
+        ),
+        qss_rule(
+            f"#{SLIDING_TRACK_INDICATOR}",
+            f"background-color: {palette.track_indicator_color}; "
+            f"border-radius: {track_radius}px;",
+        ),
+        # Date/time inputs.
+        _cascade(DATE_TIME_SELECTOR, f"background-color: {palette.window_background};"),
+        *_input_rules(input_style),
+        # Calendar containers and navigation.
+        _cascade(CALENDAR_WIDGET, f"background-color: {calendar.background};"),
+        qss_rule(
+            f"QPushButton#{CALENDAR_NAV_BUTTON}",
+            "background-color: transparent; border: none; padding: 0px; "
+            "border-radius: 4px; outline: none;",
+        ),
+        qss_rule(
+            f"QPushButton#{CALENDAR_NAV_BUTTON}:hover",
+            f"background-color: {calendar.day_hover_background}; outline: none;",
+        ),
+        qss_rule(
+            f"QPushButton#{CALENDAR_HEADER_BUTTON}",
+            "background-color: transparent;"
+            f"color: {calendar.header_text_color};"
+            "border: none; padding: 4px 11px 4px 11px; border-radius: 4px; outline: none;",
+        ),
+        qss_rule(
+            f"QPushButton#{CALENDAR_HEADER_BUTTON}:hover",
+            f"background-color: {calendar.header_hover_background};"
+            f"color: {calendar.header_hover_text_color}; outline: none;",
+        ),
+        _cascade(CALENDAR_DAY_VIEW, f"background-color: {calendar.background};"),
+        _cascade(CALENDAR_MONTH_VIEW, f"background-color: {calendar.background};"),
+        _cascade(CALENDAR_YEAR_VIEW, f"background-color: {calendar.background};"),
+        _cascade(CALENDAR_YEAR_LIST, f"background-color: {calendar.background};"),
+        qss_rule(
+            f"#{CALENDAR_YEAR_LIST} QListView",
+            f"background-color: {calendar.background}; border: none; outline: none;",
+        ),
+        qss_rule(f"#{CALENDAR_YEAR_LIST} QScrollBar:vertical", "width: 0px;"),
+        qss_rule(f"#{CALENDAR_YEAR_LIST} QScrollBar:horizontal", "height: 0px;"),
+        qss_rule(
+            f"QLineEdit#{CALENDAR_YEAR_JUMP_FIELD}",
+            f"background-color: {calendar.day_label_background};"
+            f"color: {calendar.day_text_color};"
+            f"border: none; border-radius: {radius}px; padding: 0 8px;",
+        ),
+        _cascade(
+            CALENDAR_DAY_LABELS,
+            f"background-color: {calendar.day_label_background}; "
+            "border-radius: 4px; border: none;",
+        ),
+        qss_rule(
+            f"#{CALENDAR_DAY_LABELS} QLabel",
+            f"color: {calendar.muted_day_text_color}; "
+            "background-color: transparent; border: none;",
+        ),
+        _cascade(
+            CALENDAR_MODE_LABEL,
+            f"background-color: {calendar.mode_label_background}; "
+            "border-radius: 4px; border: none;",
+        ),
+        qss_rule(
+            f"#{CALENDAR_MODE_LABEL} QLabel",
+            f"color: {calendar.muted_day_text_color}; "
+            "background-color: transparent; border: none;",
+        ),
+        circular_button_default_qss(
+            CircularButtonHoverStyle(
+                text_color=calendar.day_text_color,
+                hover_background=calendar.day_hover_background,
+                hover_text_color=calendar.day_hover_text_color,
+                radius=radius,
+            ),
+            _state(f"QPushButton#{CALENDAR_CHOICE_BUTTON}", STATE_DEFAULT),
+        ),
+        circular_button_selected_qss(
+            CircularButtonStyle(
+                background=calendar.today_background,
+                text_color=calendar.today_text_color,
+                radius=radius,
+            ),
+            _state(f"QPushButton#{CALENDAR_CHOICE_BUTTON}", STATE_SELECTED),
+        ),
+    ]
+
+    for state in DAY_CELL_STATES:
+        cell = day_cell_style(calendar, state, radius=radius)
+        rules.append(day_cell_qss(cell, _state(f"QPushButton#{CALENDAR_DAY_BUTTON}", state)))
+        underline = _state(f"QWidget#{CALENDAR_DAY_UNDERLINE}", state)
+        rules.append(qss_rule(underline, day_cell_underline_qss(cell.text_color, underline_radius)))
+        rules.append(
+            qss_rule(
+                f'{underline}[{HOVERED_PROPERTY}="true"]',
+                f"background-color: {cell.hover_text_color};",
+            )
+        )
+    return "\n".join(rules)
+
+
+def _input_rules(style: InputStyleConfig) -> list[str]:
+    borders = {
+        STATE_DEFAULT: (style.border_default_width, style.border_default),
+        STATE_HOVER: (style.border_hover_width, style.border_hover),
+        STATE_FOCUS: (style.border_focus_width, style.border_focus),
+        STATE_PREVIOUS_FOCUS: (style.border_previous_focus_width, style.border_previous_focus),
+    }
+    rules = [
+        _cascade(
+            INPUT_WITH_ICON,
+            f"background-color: {style.background}; border: none; border-radius: 6px;",
+        )
+    ]
+    for state in INPUT_STATES:
+        width, color = borders[state]
+        rules.append(
+            qss_rule(_state(f"#{INPUT_WITH_ICON}", state), f"border: {width}px solid {color};")
+        )
+    rules.extend(
+        [
+            qss_rule(
+                f"QLineEdit#{INPUT_FIELD}",
+                "border: none; background-color: transparent;"
+                f"color: {style.text_color};"
+                "padding-left: 4px; padding-right: 8px; letter-spacing: 1px;"
+                'font-family: "Trebuchet MS"; outline: none;'
+                f"selection-background-color: {style.selection_background};"
+                f"selection-color: {style.selection_text_color};",
+            ),
+            qss_rule(
+                f"#{INPUT_ICON}",
+                f"background-color: {style.background}; border: none;"
+                "border-top-right-radius: 8px; border-bottom-right-radius: 8px;",
+            ),
+            qss_rule(
+                f"QLabel#{INPUT_LETTER}",
+                f"color: {style.icon_color}; font-size: 12px; font-weight: 600;",
+            ),
+            qss_rule(
+                f'QLabel#{INPUT_LETTER}[{HOVERED_PROPERTY}="true"]',
+                f"color: {style.icon_hover_color};",
+            ),
+        ]
+    )
+    return rules
+
+
+def _cascade(object_name: str, declarations: str) -> str:
+    return qss_rule(f"#{object_name}, #{object_name} *", declarations)
+
+
+def _state(selector: str, state: str) -> str:
+    return f'{selector}[{STATE_PROPERTY}="{state}"]'
+
+
+__all__ = [
+    "DAY_CELL_STATES",
+    "HOVERED_PROPERTY",
+    "INPUT_STATES",
+    "ROOT_OBJECT_NAME",
+    "STATE_PROPERTY",
+    "compile_stylesheet",
+    "day_cell_state",
+    "day_cell_style",
+    "set_style_property",
+]
@@ -1,6 +1,12 @@
 """Non-style constants for the date range picker widgets."""
 
-from PySide6.QtGui import QFont
+from typing import Final, Literal
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtGui import QFont, QGuiApplication
+
+from ..exceptions import InvalidConfigurationError
+from ..utils import connect_signal
 
 ACTION_BUTTON_VERTICAL_PADDING = 12
 
@@ -12,45 +18,109 @@ ANIMATION_DURATION_MS = 40
 # Fonts
 FONT_FAMILY = "Trebuchet MS"
 CALENDAR_DAY_FONT_POINT_SIZE = 12
+FONT_LETTER_SPACING = 96
+
+FontRole = Literal[
+    "header",
+    "button",
+    "action_button",
+    "label",
+    "calendar_header",
+    "calendar_day_label",
+    "calendar_day",
+]
+
+# Role -> (point size, weight); ``None`` keeps the application's point size.
+FONT_ROLES: Final[dict[str, tuple[int | None, QFont.Weight]]] = {
+    "header": (16, QFont.Weight.Bold),
+    "button": (12, QFont.Weight.Bold),
+    "action_button": (12, QFont.Weight.Normal),
+    "label": (None, QFont.Weight.Bold),
+    "calendar_header": (12, QFont.Weight.Bold),
+    "calendar_day_label": (10, QFont.Weight.Bold),
+    "calendar_day": (CALENDAR_DAY_FONT_POINT_SIZE, QFont.Weight.Normal),
+}
+
+_FONTS: dict[tuple[str, int | None, float], QFont] = {}
+_FONT_CACHE_APP: QCoreApplication | None = None
+
+
+def _screen_dpi() -> float:
+    screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+    return screen.logicalDotsPerInch() if screen is not None else 0.0
+
+
+def _watch_font_environment() -> None:
+    """Clear the cache when the application font or the set of screens changes."""
+    global _FONT_CACHE_APP
+    app = QGuiApplication.instance()
+    if app is _FONT_CACHE_APP or not isinstance(app, QGuiApplication):
+        return
+    _FONT_CACHE_APP = app
+    for signal in (app.fontChanged, app.screenAdded, app.screenRemoved, app.primaryScreenChanged):
+        connect_signal(signal, clear_font_cache)
+
+
+def shared_font(role: FontRole, point_size: int | None = None) -> QFont:
+    """
+    Return the picker font for ``role``, built once per point size and screen DPI.
+
+    The result is a copy of the cached font. ``QFont`` copies share their
+    private data until modified, so every widget and painter using the same
+    role reuses one resolved font engine and its metrics.
+
+    :param role: Key of :data:`FONT_ROLES`.
+    :param point_size: Overrides the role's point size.
+    :raises InvalidConfigurationError: If ``role`` is unknown.
+    """
+    spec = FONT_ROLES.get(role)
+    if spec is None:
+        raise InvalidConfigurationError(f"Unknown font role {role!r}")
+    size = point_size if point_size is not None else spec[0]
+    key = (role, size, _screen_dpi())
+    font = _FONTS.get(key)
+    if font is None:
+        _watch_font_environment()
+        font = QFont(FONT_FAMILY) if size is None else QFont(FONT_FAMILY, size)
+        font.setWeight(spec[1])
+        font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, FONT_LETTER_SPACING)
+        _FONTS[key] = font
+    return QFont(font)
+
+
+def clear_font_cache() -> None:
+    """Drop every cached font; the next :func:`shared_font` call rebuilds it."""
+    _FONTS.clear()
+
+
+def font_cache_size() -> int:
+    """Return the number of cached ``(role, point size, DPI)`` fonts."""
+    return len(_FONTS)
 
 
 def create_header_font() -> QFont:
-    font = QFont(FONT_FAMILY, 16)
-    font.setWeight(QFont.Weight.Bold)
-    font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 96)
-    return font
+    return shared_font("header")
 
 
 def create_button_font() -> QFont:
-    font = QFont(FONT_FAMILY, 12)
-    font.setWeight(QFont.Weight.Bold)
-    font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 96)
-    return font
+    return shared_font("button")
+
+
+def create_action_button_font() -> QFont:
+    return shared_font("action_button")
 
 
 def create_label_font() -> QFont:
-    font = QFont(FONT_FAMILY)
-    font.setWeight(QFont.Weight.Bold)
-    font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 96)
-    return font
+    return shared_font("label")
 
 
 def create_calendar_header_font() -> QFont:
-    font = QFont(FONT_FAMILY, 12)
-    font.setWeight(QFont.Weight.Bold)
-    font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 96)
-    return font
+    return shared_font("calendar_header")
 
 
 def create_calendar_day_label_font() -> QFont:
-    font = QFont(FONT_FAMILY, 10)
-    font.setWeight(QFont.Weight.Bold)
-    font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 96)
-    return font
+    return shared_font("calendar_day_label")
 
 
 def create_calendar_day_font() -> QFont:
-    font = QFont(FONT_FAMILY, CALENDAR_DAY_FONT_POINT_SIZE)
-    font.setWeight(QFont.Weight.Normal)
-    font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 96)
-    return font
+    return shared_font("calendar_day")
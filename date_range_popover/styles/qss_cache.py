@@ -0,0 +1,120 @@
+"""
+Process-wide cache for rendered QSS strings.
+
+Calendar views restyle dozens of buttons with a handful of distinct colour
+combinations. Rendering each stylesheet once and handing out the *same*
+string object means widgets can cheaply detect that their sheet is already
+current and skip ``setStyleSheet`` (and the re-polish it triggers).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Final
+
+from PySide6.QtWidgets import QWidget
+
+from ..exceptions import InvalidConfigurationError
+
+DEFAULT_QSS_CACHE_SIZE: Final[int] = 256
+
+
+@dataclass(frozen=True, slots=True)
+class QssCacheStats:
+    """Snapshot of the cache counters."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class QssCache:
+    """Bounded LRU cache mapping ``(template, args)`` to rendered stylesheets."""
+
+    def __init__(self, max_size: int = DEFAULT_QSS_CACHE_SIZE) -> None:
+        if max_size <= 0:
+            raise InvalidConfigurationError("max_size must be positive")
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[Hashable, ...], str] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def render(self, template: Callable[..., str], *args: Hashable) -> str:
+        """
+        Return ``template(*args)``, rendering it only on the first request.
+
+        ``args`` must be hashable (the frozen style dataclasses in
+        :mod:`style_templates` are). Repeated calls return the identical
+        string object until the entry is evicted.
+        """
+
+        key = (template, *args)
+        sheet = self._entries.get(key)
+        if sheet is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return sheet
+
+        self._misses += 1
+        sheet = template(*args)
+        self._entries[key] = sheet
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return sheet
+
+    def stats(self) -> QssCacheStats:
+        return QssCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached stylesheet and reset the counters."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+_SHARED_CACHE = QssCache()
+
+
+def shared_qss_cache() -> QssCache:
+    """Return the cache shared by every calendar view in the process."""
+    return _SHARED_CACHE
+
+
+def cached_qss(template: Callable[..., str], *args: Hashable) -> str:
+    """Render ``template(*args)`` through the shared cache."""
+    return _SHARED_CACHE.render(template, *args)
+
+
+def apply_stylesheet(widget: QWidget, sheet: str) -> bool:
+    """
+    Apply ``sheet`` to ``widget`` unless it is already the current stylesheet.
+
+    Returns ``True`` when ``setStyleSheet`` was called.
+    """
+
+    if widget.styleSheet() == sheet:
+        return False
+    widget.setStyleSheet(sheet)
+    return True
+
+
+__all__ = [
+    "DEFAULT_QSS_CACHE_SIZE",
+    "QssCache",
+    "QssCacheStats",
+    "apply_stylesheet",
+    "cached_qss",
+    "shared_qss_cache",
+]
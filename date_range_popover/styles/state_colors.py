@@ -0,0 +1,25 @@
+"""
+Shared ``QColor`` objects for ``RenderingOptions.palette_states``.
+
+In palette mode, hover, focus and selection feedback is painted directly.
+Each colour token is converted to a ``QColor`` once and shared by every
+widget in the process, so a state change is a repaint with no stylesheet or
+colour parsing.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PySide6.QtGui import QColor
+
+_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def state_color(token: str) -> QColor:
+    """Return the shared ``QColor`` for a theme colour token. Do not mutate it."""
+    return QColor(token)
+
+
+__all__ = ["state_color"]
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping
 from typing import Any, Literal
+from weakref import WeakValueDictionary
 
+from .compiled_qss import compile_stylesheet
 from .theme import (
     DEFAULT_THEME,
     ButtonStyleConfig,
@@ -16,6 +20,8 @@ ButtonVariant = Literal["primary", "accent", "ghost"]
 CalendarVariant = Literal["default"]
 InputVariant = Literal["default"]
 
+RenderKey = tuple[str | int, ...]
+
 
 class StyleRegistry:
     """
@@ -25,6 +31,10 @@ class StyleRegistry:
     that keeps per-component style tokens grouped by theme. Embedders
     typically do not interact with it directly; :class:`StyleManager`
     consumes it instead.
+
+    Pickers obtain registries through :meth:`shared`, so every picker using
+    an equal theme reuses one registry and the stylesheet strings it has
+    already rendered.
     """
 
     BUTTON_PRIMARY = "primary"
@@ -118,6 +128,49 @@ class StyleRegistry:
                 selection_text_color=palette.input_selection_text_color,
             )
         }
+        self._rendered: dict[RenderKey, str] = {}
+        self._shared = False
+
+    @classmethod
+    def shared(cls, theme: Theme | ThemeProvider | None = None) -> StyleRegistry:
+        """
+        Return the process-wide registry for ``theme``, building it on first use.
+
+        Registries are keyed by the theme's value—``Theme`` and its palette and
+        layout are frozen dataclasses, so equal tokens hash equally—and held
+        weakly: an entry disappears once no picker or manager references it.
+        Because the instance is shared, register custom variants on a private
+        ``StyleRegistry(theme)`` or a :meth:`fork` instead.
+        """
+        candidate = theme or DEFAULT_THEME
+        resolved = candidate.build_theme() if isinstance(candidate, ThemeProvider) else candidate
+        registry = _SHARED_REGISTRIES.get(resolved)
+        if registry is None:
+            registry = cls(resolved)
+            registry._shared = True
+            _SHARED_REGISTRIES[resolved] = registry
+        return registry
+
+    @property
+    def is_shared(self) -> bool:
+        """Return ``True`` for registries handed out by :meth:`shared`."""
+        return self._shared
+
+    def fork(self) -> StyleRegistry:
+        """
+        Return a private copy of this registry.
+
+        The copy starts with this registry's variants and rendered stylesheets,
+        so forking a warm shared registry renders nothing again; registering
+        variants on the copy leaves the original untouched.
+        """
+        registry = copy.copy(self)
+        registry.BUTTON_STYLES = dict(self.BUTTON_STYLES)
+        registry.CALENDAR_STYLES = dict(self.CALENDAR_STYLES)
+        registry.INPUT_STYLES = dict(self.INPUT_STYLES)
+        registry._rendered = dict(self._rendered)
+        registry._shared = False
+        return registry
 
     @property
     def theme(self) -> Theme:
@@ -147,6 +200,39 @@ class StyleRegistry:
             return self.input_stylesheet(variant=variant)
         raise KeyError(f"Unsupported component type: {component_type}")
 
+    def compiled_stylesheet(self) -> str:
+        """
+        Return the picker-wide stylesheet compiled from this registry's theme.
+
+        The sheet is rendered once per registry from the default calendar and
+        input variants; see :mod:`~date_range_popover.styles.compiled_qss`.
+        """
+        key = ("compiled",)
+        sheet = self._rendered.get(key)
+        if sheet is None:
+            sheet = compile_stylesheet(
+                self._theme,
+                calendar=self.calendar_config(),
+                input_style=self.input_config(),
+            )
+            self._rendered[key] = sheet
+        return sheet
+
+    def rendered_stylesheets(self) -> dict[RenderKey, str]:
+        """Return a copy of every stylesheet rendered so far, keyed by render key."""
+        return dict(self._rendered)
+
+    def preload_stylesheets(self, sheets: Mapping[RenderKey, str]) -> None:
+        """
+        Seed the render cache with stylesheets rendered elsewhere.
+
+        Used by :mod:`~date_range_popover.styles.theme_bundle` so pickers built
+        from a compiled bundle never render a stylesheet themselves. Entries
+        already rendered by this registry are kept.
+        """
+        for key, sheet in sheets.items():
+            self._rendered.setdefault(key, sheet)
+
     # Button helpers -----------------------------------------------------------------
 
     def button_config(self, variant: str | ButtonVariant = BUTTON_DEFAULT) -> ButtonStyleConfig:
@@ -159,6 +245,7 @@ class StyleRegistry:
     def register_button_style(self, name: str, config: ButtonStyleConfig) -> None:
         """Register or overwrite a named button style."""
         self.BUTTON_STYLES[name] = config
+        self._rendered.clear()
 
     def button_stylesheet(
         self,
@@ -166,9 +253,14 @@ class StyleRegistry:
         variant: str | ButtonVariant = BUTTON_DEFAULT,
         vertical_padding: int,
     ) -> str:
-        """Render the stylesheet for a button variant."""
-        config = self.button_config(variant)
-        return config.stylesheet(vertical_padding=vertical_padding)
+        """Render the stylesheet for a button variant (cached per padding)."""
+        key = ("button", variant, vertical_padding)
+        sheet = self._rendered.get(key)
+        if sheet is None:
+            config = self.button_config(variant)
+            sheet = config.stylesheet(vertical_padding=vertical_padding)
+            self._rendered[key] = sheet
+        return sheet
 
     # Calendar helpers ---------------------------------------------------------------
 
@@ -184,11 +276,17 @@ class StyleRegistry:
     def register_calendar_style(self, name: str, config: CalendarStyleConfig) -> None:
         """Register or overwrite a named calendar style."""
         self.CALENDAR_STYLES[name] = config
+        self._rendered.clear()
 
     def calendar_stylesheet(self, *, variant: str | CalendarVariant = CALENDAR_DEFAULT) -> str:
         """Render a simple background stylesheet for calendar containers."""
-        config = self.calendar_config(variant)
-        return f"background-color: {config.background};"
+        key = ("calendar", variant)
+        sheet = self._rendered.get(key)
+        if sheet is None:
+            config = self.calendar_config(variant)
+            sheet = f"background-color: {config.background};"
+            self._rendered[key] = sheet
+        return sheet
 
     # Input helpers ------------------------------------------------------------------
 
@@ -202,15 +300,25 @@ class StyleRegistry:
     def register_input_style(self, name: str, config: InputStyleConfig) -> None:
         """Register or overwrite an input style variant."""
         self.INPUT_STYLES[name] = config
+        self._rendered.clear()
 
     def input_stylesheet(self, *, variant: str | InputVariant = INPUT_DEFAULT) -> str:
         """Render a minimal stylesheet for icon-enabled inputs."""
-        config = self.input_config(variant)
-        return (
-            f"background-color: {config.background};"
-            f"border: 1px solid {config.border_default};"
-            "border-radius: 6px;"
-        )
+        key = ("input", variant)
+        sheet = self._rendered.get(key)
+        if sheet is None:
+            config = self.input_config(variant)
+            sheet = (
+                f"background-color: {config.background};"
+                f"border: 1px solid {config.border_default};"
+                "border-radius: 6px;"
+            )
+            self._rendered[key] = sheet
+        return sheet
+
+
+_SHARED_REGISTRIES: WeakValueDictionary[Theme, StyleRegistry] = WeakValueDictionary()
+"""Registries handed out by :meth:`StyleRegistry.shared`, keyed by theme value."""
 
 
 __all__ = [
@@ -218,5 +326,6 @@ __all__ = [
     "CalendarVariant",
     "ComponentType",
     "InputVariant",
+    "RenderKey",
     "StyleRegistry",
 ]
@@ -21,11 +21,11 @@ class CircularButtonStyle:
     radius: int
 
 
-def circular_button_selected_qss(style: CircularButtonStyle) -> str:
+def circular_button_selected_qss(style: CircularButtonStyle, selector: str = "QPushButton") -> str:
     """Return the selected-state stylesheet for circular calendar buttons."""
 
     return (
-        "QPushButton {"
+        f"{selector} {{"
         f"background-color: {style.background};"
         f"color: {style.text_color};"
         "border: none;"
@@ -46,11 +46,13 @@ class CircularButtonHoverStyle:
     radius: int
 
 
-def circular_button_default_qss(style: CircularButtonHoverStyle) -> str:
+def circular_button_default_qss(
+    style: CircularButtonHoverStyle, selector: str = "QPushButton"
+) -> str:
     """Return the default-state stylesheet with hover rules."""
 
     return (
-        "QPushButton {"
+        f"{selector} {{"
         "background-color: transparent;"
         f"color: {style.text_color};"
         "border: none;"
@@ -58,7 +60,7 @@ def circular_button_default_qss(style: CircularButtonHoverStyle) -> str:
         "padding: 0;"
         "outline: none;"
         "}"
-        "QPushButton:hover {"
+        f"{selector}:hover {{"
         f"background-color: {style.hover_background};"
         f"color: {style.hover_text_color};"
         "outline: none;"
@@ -66,6 +68,49 @@ def circular_button_default_qss(style: CircularButtonHoverStyle) -> str:
     )
 
 
+@dataclass(frozen=True, slots=True)
+class DayCellStyle:
+    """Parameters for a day-grid cell, including its hover colours."""
+
+    background: str
+    text_color: str
+    hover_background: str
+    hover_text_color: str
+    radius: int
+
+
+def day_cell_qss(style: DayCellStyle, selector: str = "QPushButton") -> str:
+    """Return the stylesheet for a day cell button and its hover state."""
+
+    return (
+        f"{selector} {{"
+        f"background-color: {style.background};"
+        f"color: {style.text_color};"
+        "border: none;"
+        f"border-radius: {style.radius}px;"
+        "padding: 0;"
+        "outline: none;"
+        "}"
+        f"{selector}:hover {{"
+        f"background-color: {style.hover_background};"
+        f"color: {style.hover_text_color};"
+        "outline: none;"
+        "}"
+    )
+
+
+def day_cell_underline_qss(color: str, radius: int) -> str:
+    """Return the stylesheet for the today underline inside a day cell."""
+
+    return f"background-color: {color};border: none;border-radius: {radius}px;"
+
+
+def qss_rule(selector: str, declarations: str) -> str:
+    """Wrap bare ``declarations`` (as passed to ``setStyleSheet``) in a ``selector`` block."""
+
+    return f"{selector} {{{declarations}}}"
+
+
 @dataclass(frozen=True, slots=True)
 class TimePopupStyle:
     """Visual tokens for the time completer popup."""
@@ -165,6 +210,43 @@ def transparent_button_qss(style: TransparentButtonStyle) -> str:
     )
 
 
+def year_list_qss(background: str) -> str:
+    """Return the stylesheet for the scrollable year list viewport."""
+
+    return (
+        "QListView {"
+        f"background-color: {background};"
+        "border: none;"
+        "outline: none;"
+        "}"
+        "QScrollBar:vertical { width: 0px; }"
+        "QScrollBar:horizontal { height: 0px; }"
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class YearJumpFieldStyle:
+    """Tokens for the "jump to year" input above the scrollable year list."""
+
+    background: str
+    text_color: str
+    radius: int
+
+
+def year_jump_field_qss(style: YearJumpFieldStyle) -> str:
+    """Return the stylesheet for the "jump to year" input."""
+
+    return (
+        "QLineEdit {"
+        f"background-color: {style.background};"
+        f"color: {style.text_color};"
+        "border: none;"
+        f"border-radius: {style.radius}px;"
+        "padding: 0 8px;"
+        "}"
+    )
+
+
 def container_qss(background: str, *, radius: int, border: str | None = None) -> str:
     """Generic container helper that applies background and radius."""
 
@@ -180,12 +262,16 @@ __all__ = [
     "ModeLabelStyle",
     "TimePopupStyle",
     "TransparentButtonStyle",
+    "YearJumpFieldStyle",
     "container_qss",
     "circular_button_default_qss",
     "circular_button_selected_qss",
     "divider_qss",
     "mode_label_container_qss",
     "mode_label_text_qss",
+    "qss_rule",
     "time_popup_qss",
     "transparent_button_qss",
+    "year_jump_field_qss",
+    "year_list_qss",
 ]
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field, fields
 from typing import Any, Protocol, runtime_checkable
 
 from ..exceptions import InvalidThemeError
-from ..validation import validate_dimension, validate_hex_color
+from ..validation import validate_dimensions, validate_hex_colors
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,7 +16,8 @@ class ColorPalette:
     All values are validated hex strings (``#RRGGBB`` or
     ``#RRGGBBAA``) so embedders can feed partially trusted
     configuration data into :class:`Theme` and rely on
-    :func:`validate_hex_color` for sanitisation.
+    :func:`validate_hex_color` for sanitisation. Every invalid token is
+    reported at once through :class:`InvalidFieldsError`.
     """
 
     window_background: str = "#1f1f1f"
@@ -73,11 +74,11 @@ class ColorPalette:
     close_button_pressed_background: str = "#2e2e2e99"
 
     def __post_init__(self) -> None:
-        """Validate every palette entry with :func:`validate_hex_color`."""
-        for definition in fields(self):
-            value = getattr(self, definition.name)
-            validated = validate_hex_color(value, field_name=definition.name)
-            object.__setattr__(self, definition.name, validated)
+        """Validate every palette entry with :func:`validate_hex_colors`."""
+        values = {name: getattr(self, name) for name in _PALETTE_FIELDS}
+        for name, validated in validate_hex_colors(values).items():
+            if validated is not values[name]:
+                object.__setattr__(self, name, validated)
 
 
 @dataclass(frozen=True, slots=True)
@@ -196,7 +197,8 @@ class LayoutConfig:
     Common spacing and dimension values used across the UI.
 
     Every integer is validated via :func:`validate_dimension` to guard
-    against negative or zero-sized widgets.
+    against negative or zero-sized widgets; all invalid fields are reported
+    together through :class:`InvalidFieldsError`.
     """
 
     window_min_width: int = 302
@@ -228,31 +230,33 @@ class LayoutConfig:
 
     def __post_init__(self) -> None:
         """Ensure all numeric values respect their minimum constraints."""
-        positive_fields = {
-            "window_min_width",
-            "window_min_height",
-            "window_min_height_custom_range",
-            "date_button_width",
-            "custom_range_button_width",
-            "date_indicator_width",
-            "custom_range_indicator_width",
-            "default_track_width",
-            "sliding_indicator_height",
-            "action_button_height",
-            "calendar_day_label_height",
-            "calendar_day_cell_size",
-            "calendar_day_underline_height",
-            "calendar_day_underline_width",
-        }
-        for definition in fields(self):
-            value = getattr(self, definition.name)
-            min_value = 1 if definition.name in positive_fields else 0
-            validated = validate_dimension(
-                value,
-                field_name=definition.name,
-                min_value=min_value,
-            )
-            object.__setattr__(self, definition.name, validated)
+        validate_dimensions(
+            {name: getattr(self, name) for name in _LAYOUT_FIELDS},
+            min_values=_LAYOUT_MINIMUMS,
+        )
+
+
+_PALETTE_FIELDS: tuple[str, ...] = tuple(definition.name for definition in fields(ColorPalette))
+_LAYOUT_FIELDS: tuple[str, ...] = tuple(definition.name for definition in fields(LayoutConfig))
+_LAYOUT_MINIMUMS: dict[str, int] = dict.fromkeys(
+    (
+        "window_min_width",
+        "window_min_height",
+        "window_min_height_custom_range",
+        "date_button_width",
+        "custom_range_button_width",
+        "date_indicator_width",
+        "custom_range_indicator_width",
+        "default_track_width",
+        "sliding_indicator_height",
+        "action_button_height",
+        "calendar_day_label_height",
+        "calendar_day_cell_size",
+        "calendar_day_underline_height",
+        "calendar_day_underline_width",
+    ),
+    1,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -303,6 +307,23 @@ def theme_from_mapping(payload: Mapping[str, Any]) -> Theme:
     return Theme(palette=palette, layout=layout)
 
 
+def theme_to_mapping(theme: Theme) -> dict[str, dict[str, Any]]:
+    """
+    Serialise ``theme`` into the mapping shape read by :func:`theme_from_mapping`.
+
+    Args:
+        theme: Theme to export.
+
+    Returns:
+        Plain ``{"palette": {...}, "layout": {...}}`` dictionary suitable for JSON.
+    """
+
+    return {
+        "palette": {name: getattr(theme.palette, name) for name in _PALETTE_FIELDS},
+        "layout": {name: getattr(theme.layout, name) for name in _LAYOUT_FIELDS},
+    }
+
+
 DEFAULT_THEME = Theme()
 """Default theme instance used when callers do not supply one."""
 
@@ -316,5 +337,6 @@ __all__ = [
     "Theme",
     "ThemeProvider",
     "theme_from_mapping",
+    "theme_to_mapping",
     "DEFAULT_THEME",
 ]
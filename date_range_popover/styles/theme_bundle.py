@@ -0,0 +1,283 @@
+"""
+Compiled theme bundles and theme import/export.
+
+Loading a theme from JSON normally parses the file, validates every token
+through :func:`theme_from_mapping` and leaves each stylesheet to be rendered
+later, widget by widget. A theme bundle is the compiled form of one theme
+source: a versioned file holding the validated palette and layout plus every
+stylesheet :class:`StyleRegistry` renders for them (each button variant at
+every vertical padding, the calendar and input variants and the compiled
+picker sheet).
+
+A bundle file is one JSON header line followed by a JSON body. The header
+records the format version, a fingerprint of the stylesheet templates, the
+hash of the source the bundle was compiled from and the SHA-256 of the body
+bytes, so :func:`read_theme_bundle` reads the file in one call and verifies it
+without re-serialising anything. Bundles compiled by another version of the
+templates are rejected rather than serving stale stylesheets after an upgrade.
+:func:`load_theme` keeps a bundle next to each theme source and recompiles it
+whenever the source's hash no longer matches or the bundle is rejected.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final
+
+from ..exceptions import InvalidThemeError
+from ..utils import get_logger
+from .constants import ACTION_BUTTON_VERTICAL_PADDING
+from .style_registry import RenderKey, StyleRegistry
+from .theme import Theme, theme_from_mapping, theme_to_mapping
+
+BUNDLE_FORMAT: Final[str] = "date-range-popover/theme-bundle"
+BUNDLE_VERSION: Final[int] = 1
+BUNDLE_SUFFIX: Final[str] = ".bundle"
+
+# Modules whose code decides the stylesheets a bundle stores.
+_TEMPLATE_MODULES: Final[tuple[str, ...]] = (
+    "compiled_qss.py",
+    "style_registry.py",
+    "style_templates.py",
+    "theme.py",
+)
+
+LOGGER = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeBundle:
+    """
+    A validated theme plus every stylesheet rendered for it.
+
+    Creating a bundle seeds the shared :class:`StyleRegistry` for
+    :attr:`theme` with :attr:`stylesheets` and keeps that registry alive, so
+    pickers configured with ``bundle.theme`` while the bundle is referenced
+    never render a stylesheet themselves.
+    """
+
+    theme: Theme
+    source_hash: str
+    stylesheets: Mapping[RenderKey, str] = field(default_factory=dict)
+    _registry: StyleRegistry = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Preload the shared registry for :attr:`theme`."""
+        registry = StyleRegistry.shared(self.theme)
+        registry.preload_stylesheets(self.stylesheets)
+        object.__setattr__(self, "_registry", registry)
+
+    @property
+    def registry(self) -> StyleRegistry:
+        """Return the shared, preloaded :class:`StyleRegistry` for :attr:`theme`."""
+        return self._registry
+
+
+@lru_cache(maxsize=1)
+def template_fingerprint() -> str:
+    """Return the SHA-256 of the modules that render bundle stylesheets."""
+    digest = hashlib.sha256()
+    for name in _TEMPLATE_MODULES:
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+
+def theme_source_hash(payload: Mapping[str, Any]) -> str:
+    """Return the SHA-256 of ``payload`` serialised as canonical JSON."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_theme_bundle(
+    source: Theme | Mapping[str, Any], *, source_hash: str | None = None
+) -> ThemeBundle:
+    """
+    Validate ``source`` and pre-render every registry stylesheet for it.
+
+    Args:
+        source: A :class:`Theme` or a mapping accepted by :func:`theme_from_mapping`.
+        source_hash: Hash identifying the source; defaults to
+            :func:`theme_source_hash` of the mapping (or of the exported theme).
+
+    Returns:
+        :class:`ThemeBundle` ready to be written with :func:`write_theme_bundle`.
+    """
+    if isinstance(source, Theme):
+        theme = source
+        payload: Mapping[str, Any] = theme_to_mapping(theme)
+    else:
+        theme = theme_from_mapping(source)
+        payload = source
+
+    registry = StyleRegistry.shared(theme)
+    for variant in registry.BUTTON_STYLES:
+        for padding in range(ACTION_BUTTON_VERTICAL_PADDING + 1):
+            registry.button_stylesheet(variant=variant, vertical_padding=padding)
+    for variant in registry.CALENDAR_STYLES:
+        registry.calendar_stylesheet(variant=variant)
+    for variant in registry.INPUT_STYLES:
+        registry.input_stylesheet(variant=variant)
+    registry.compiled_stylesheet()
+
+    return ThemeBundle(
+        theme=theme,
+        source_hash=source_hash or theme_source_hash(payload),
+        stylesheets=registry.rendered_stylesheets(),
+    )
+
+
+def write_theme_bundle(bundle: ThemeBundle, path: str | os.PathLike[str]) -> None:
+    """
+    Write ``bundle`` to ``path`` atomically.
+
+    Args:
+        bundle: Bundle to serialise.
+        path: Destination file; replaced in a single rename.
+    """
+    body = json.dumps(
+        {
+            **theme_to_mapping(bundle.theme),
+            "stylesheets": [[list(key), sheet] for key, sheet in bundle.stylesheets.items()],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    header = json.dumps(
+        {
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "templates": template_fingerprint(),
+            "source_hash": bundle.source_hash,
+            "content_hash": hashlib.sha256(body).hexdigest(),
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    target = Path(path)
+    staging = target.with_name(f".{target.name}.tmp")
+    staging.write_bytes(header + b"\n" + body)
+    os.replace(staging, target)
+
+
+def read_theme_bundle(path: str | os.PathLike[str]) -> ThemeBundle:
+    """
+    Read and verify a bundle written by :func:`write_theme_bundle`.
+
+    Args:
+        path: Bundle file to read.
+
+    Returns:
+        The :class:`ThemeBundle` stored in the file.
+
+    Raises:
+        InvalidThemeError: If the file is not a bundle, was written by a
+            different format version or template fingerprint, its content
+            hash does not match, or its body is malformed or holds invalid
+            theme tokens.
+        OSError: If the file cannot be read.
+    """
+    data = Path(path).read_bytes()
+    raw_header, _, body = data.partition(b"\n")
+    try:
+        header = json.loads(raw_header)
+    except ValueError as exc:
+        raise InvalidThemeError(f"{path} is not a theme bundle") from exc
+    if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+        raise InvalidThemeError(f"{path} is not a theme bundle")
+    if header.get("version") != BUNDLE_VERSION:
+        raise InvalidThemeError(
+            f"{path} has bundle version {header.get('version')!r}, expected {BUNDLE_VERSION}"
+        )
+    if header.get("templates") != template_fingerprint():
+        raise InvalidThemeError(f"{path} was compiled from different stylesheet templates")
+    if hashlib.sha256(body).hexdigest() != header.get("content_hash"):
+        raise InvalidThemeError(f"{path} failed its content hash check")
+
+    try:
+        payload = json.loads(body)
+        theme = theme_from_mapping(payload)
+        stylesheets = {tuple(key): sheet for key, sheet in payload["stylesheets"]}
+    except (KeyError, TypeError, ValueError) as exc:
+        raise InvalidThemeError(f"{path} has a malformed bundle body") from exc
+    return ThemeBundle(
+        theme=theme,
+        source_hash=str(header.get("source_hash")),
+        stylesheets=stylesheets,
+    )
+
+
+def load_theme(
+    source: str | os.PathLike[str], *, bundle_path: str | os.PathLike[str] | None = None
+) -> ThemeBundle:
+    """
+    Load the JSON theme at ``source`` through its compiled bundle.
+
+    The bundle (``<source>.bundle`` by default) is used as long as it carries
+    the SHA-256 of the current source bytes; otherwise the source is parsed,
+    compiled and the bundle rewritten. An unwritable bundle location only
+    costs the cache, not the load.
+
+    Args:
+        source: Theme JSON file in the :func:`theme_from_mapping` shape.
+        bundle_path: Where to keep the compiled bundle.
+
+    Returns:
+        :class:`ThemeBundle` for the current contents of ``source``.
+    """
+    source_path = Path(source)
+    raw = source_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    target = (
+        Path(bundle_path)
+        if bundle_path is not None
+        else source_path.with_name(source_path.name + BUNDLE_SUFFIX)
+    )
+
+    try:
+        bundle = read_theme_bundle(target)
+    except (OSError, ValueError):
+        bundle = None
+    if bundle is not None and bundle.source_hash == digest:
+        return bundle
+
+    bundle = compile_theme_bundle(json.loads(raw), source_hash=digest)
+    try:
+        write_theme_bundle(bundle, target)
+    except OSError as exc:
+        LOGGER.warning("Could not write theme bundle %s: %s", target, exc)
+    return bundle
+
+
+def export_theme(theme: Theme, path: str | os.PathLike[str]) -> None:
+    """Write ``theme`` to ``path`` as indented JSON readable by :func:`import_theme`."""
+    text = json.dumps(theme_to_mapping(theme), indent=2)
+    Path(path).write_text(text + "\n", encoding="utf-8")
+
+
+def import_theme(path: str | os.PathLike[str]) -> Theme:
+    """Read a JSON theme file written by :func:`export_theme` (or by hand)."""
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, Mapping):
+        raise InvalidThemeError(f"{path} must contain a JSON object")
+    return theme_from_mapping(payload)
+
+
+__all__ = [
+    "BUNDLE_FORMAT",
+    "BUNDLE_SUFFIX",
+    "BUNDLE_VERSION",
+    "ThemeBundle",
+    "compile_theme_bundle",
+    "export_theme",
+    "import_theme",
+    "load_theme",
+    "read_theme_bundle",
+    "template_fingerprint",
+    "theme_source_hash",
+    "write_theme_bundle",
+]
@@ -0,0 +1,176 @@
+"""
+Field-by-field comparison of two themes.
+
+:func:`diff_themes` reports which :class:`ColorPalette` and
+:class:`LayoutConfig` tokens differ between two themes and maps them onto the
+picker components that read them, so a live theme swap only restyles (and
+re-lays out) the parts of the picker that actually change.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Literal
+
+from .theme import ColorPalette, LayoutConfig, Theme
+
+ThemeTarget = Literal[
+    "window",
+    "header",
+    "button_strip",
+    "sliding_track",
+    "inputs",
+    "calendar",
+    "actions",
+]
+
+
+def _prefixed(cls: type[ColorPalette] | type[LayoutConfig], *prefixes: str) -> frozenset[str]:
+    return frozenset(
+        definition.name for definition in fields(cls) if definition.name.startswith(prefixes)
+    )
+
+
+# Tokens that end up in a component's stylesheet, icon or painted colours.
+# Palette and layout field names never collide, so one table covers both.
+_STYLE_TOKENS: dict[ThemeTarget, frozenset[str]] = {
+    "window": frozenset(
+        {"window_background", "button_container_background", "divider_color", "window_radius"}
+    ),
+    "header": frozenset(
+        {
+            "header_background",
+            "button_selected_color",
+            "close_button_background",
+            "close_button_hover_background",
+            "close_button_pressed_background",
+        }
+    ),
+    "button_strip": frozenset(
+        {
+            "button_container_background",
+            "button_selected_color",
+            "button_default_color",
+            "button_hover_color",
+        }
+    ),
+    "sliding_track": frozenset(
+        {
+            "window_background",
+            "track_background",
+            "track_indicator_color",
+            "sliding_indicator_radius",
+        }
+    ),
+    "inputs": _prefixed(ColorPalette, "input_", "time_popup_") | {"window_background"},
+    "calendar": _prefixed(ColorPalette, "calendar_")
+    | {"calendar_day_cell_radius", "calendar_day_underline_height"},
+    "actions": _prefixed(ColorPalette, "action_button_")
+    | {
+        "window_background",
+        "track_background",
+        "button_selected_color",
+        "button_default_color",
+        "button_hover_color",
+        "window_radius",
+    },
+}
+
+# Tokens that change widget geometry and therefore need a relayout.
+_GEOMETRY_TOKENS: dict[ThemeTarget, frozenset[str]] = {
+    "window": frozenset(
+        {
+            "window_min_width",
+            "window_min_height",
+            "window_min_height_custom_range",
+            "main_padding",
+        }
+    ),
+    "header": frozenset({"main_padding", "header_bottom_margin"}),
+    "button_strip": frozenset(
+        {
+            "button_strip_bottom_margin",
+            "date_button_width",
+            "custom_range_button_width",
+            "button_gap",
+        }
+    ),
+    "sliding_track": frozenset(
+        {
+            "sliding_indicator_height",
+            "default_track_width",
+            "date_indicator_width",
+            "custom_range_indicator_width",
+            "button_gap",
+        }
+    ),
+    "calendar": _prefixed(LayoutConfig, "calendar_"),
+    "actions": frozenset({"action_button_height", "main_padding"}),
+}
+
+# Tokens no picker component reads, so changing them needs no work.
+UNMAPPED_TOKENS: frozenset[str] = frozenset(
+    {"mode_label_container_background", "mode_label_text_color"}
+)
+
+
+def _changed_fields(
+    old: ColorPalette | LayoutConfig, new: ColorPalette | LayoutConfig
+) -> frozenset[str]:
+    return frozenset(
+        definition.name
+        for definition in fields(old)
+        if getattr(old, definition.name) != getattr(new, definition.name)
+    )
+
+
+def _targets(
+    table: dict[ThemeTarget, frozenset[str]], changed: frozenset[str]
+) -> frozenset[ThemeTarget]:
+    return frozenset(target for target, tokens in table.items() if tokens & changed)
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeDiff:
+    """
+    Tokens that differ between two themes and the components they affect.
+
+    ``restyle`` names the components whose colours or stylesheet-bound
+    dimensions changed; ``relayout`` names the components whose geometry
+    changed. A component can appear in both.
+    """
+
+    palette_fields: frozenset[str] = frozenset()
+    layout_fields: frozenset[str] = frozenset()
+    restyle: frozenset[ThemeTarget] = frozenset()
+    relayout: frozenset[ThemeTarget] = frozenset()
+
+    @property
+    def is_empty(self) -> bool:
+        """Return ``True`` when both themes carry identical tokens."""
+        return not (self.palette_fields or self.layout_fields)
+
+
+def diff_themes(old: Theme, new: Theme) -> ThemeDiff:
+    """
+    Compare ``old`` and ``new`` token by token.
+
+    Args:
+        old: Theme currently applied to the widgets.
+        new: Theme about to replace it.
+
+    Returns:
+        :class:`ThemeDiff` listing the changed fields and affected components.
+    """
+    palette_fields = _changed_fields(old.palette, new.palette)
+    layout_fields = _changed_fields(old.layout, new.layout)
+    changed = palette_fields | layout_fields
+    return ThemeDiff(
+        palette_fields=palette_fields,
+        layout_fields=layout_fields,
+        restyle=_targets(_STYLE_TOKENS, changed),
+        relayout=_targets(_GEOMETRY_TOKENS, layout_fields),
+    )
+
+
+__all__ = ["UNMAPPED_TOKENS", "ThemeDiff", "ThemeTarget", "diff_themes"]
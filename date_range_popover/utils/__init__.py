@@ -1,25 +1,75 @@
 """Utility helpers for the picker."""
 
-from .date_utils import (
-    copy_qdate,
-    first_of_month,
-    iter_month_days,
-    normalize_range,
-    qdate_is_after,
-    qdate_is_before,
-    qdate_to_ordinal,
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .date_utils import (
+        copy_qdate,
+        first_of_month,
+        iter_month_days,
+        normalize_range,
+        qdate_is_after,
+        qdate_is_before,
+        qdate_to_ordinal,
+    )
+    from .icon_atlas import IconAtlas, IconVariant
+    from .logging import configure_basic_logging, get_logger
+    from .month_grid import MonthLayout, clear_month_layout_cache, month_layout
+    from .signals import connect_if_present, connect_signal
+    from .svg_assets import SvgAssetRegistry, shared_svg_assets
+    from .svg_loader import (
+        clear_icon_cache,
+        load_colored_svg_icon,
+        load_svg_widget,
+        shared_icon_cache,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "load_colored_svg_icon": ".svg_loader",
+        "load_svg_widget": ".svg_loader",
+        "clear_icon_cache": ".svg_loader",
+        "shared_icon_cache": ".svg_loader",
+        "IconAtlas": ".icon_atlas",
+        "IconVariant": ".icon_atlas",
+        "SvgAssetRegistry": ".svg_assets",
+        "shared_svg_assets": ".svg_assets",
+        "copy_qdate": ".date_utils",
+        "first_of_month": ".date_utils",
+        "normalize_range": ".date_utils",
+        "iter_month_days": ".date_utils",
+        "MonthLayout": ".month_grid",
+        "month_layout": ".month_grid",
+        "clear_month_layout_cache": ".month_grid",
+        "qdate_is_before": ".date_utils",
+        "qdate_is_after": ".date_utils",
+        "qdate_to_ordinal": ".date_utils",
+        "get_logger": ".logging",
+        "configure_basic_logging": ".logging",
+        "connect_signal": ".signals",
+        "connect_if_present": ".signals",
+    },
 )
-from .logging import configure_basic_logging, get_logger
-from .signals import connect_if_present, connect_signal
-from .svg_loader import load_colored_svg_icon, load_svg_widget
 
 __all__ = [
     "load_colored_svg_icon",
     "load_svg_widget",
+    "clear_icon_cache",
+    "shared_icon_cache",
+    "IconAtlas",
+    "IconVariant",
+    "SvgAssetRegistry",
+    "shared_svg_assets",
     "copy_qdate",
     "first_of_month",
     "normalize_range",
     "iter_month_days",
+    "MonthLayout",
+    "month_layout",
+    "clear_month_layout_cache",
     "qdate_is_before",
     "qdate_is_after",
     "qdate_to_ordinal",
@@ -7,6 +7,7 @@ from collections.abc import Iterator
 from PySide6.QtCore import QDate
 
 from ..exceptions import InvalidDateError
+from .month_grid import month_layout
 
 
 def copy_qdate(date: QDate) -> QDate:
@@ -51,11 +52,10 @@ def normalize_range(start: QDate, end: QDate) -> tuple[QDate, QDate]:
 
 def iter_month_days(month: QDate) -> Iterator[QDate]:
     """Yield ``QDate`` instances for each day in the visible month grid."""
-    first = first_of_month(month)
-    start_offset = (first.dayOfWeek() - 1) % 7
-    start_date = first.addDays(-start_offset)
-    for index in range(6 * 7):
-        yield start_date.addDays(index)
+    if not month.isValid():
+        raise InvalidDateError(f"Cannot compute first of month for invalid QDate: {month}")
+    for julian in month_layout(month.year(), month.month()).julian_days:
+        yield QDate.fromJulianDay(julian)
 
 
 __all__ = [
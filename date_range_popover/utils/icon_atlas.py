@@ -0,0 +1,140 @@
+"""
+Multi-variant icon atlases rasterised at a screen's device pixel ratio.
+
+A picker shows a handful of icons in a few theme colours each. Instead of
+rasterising every ``(icon, size, colour)`` variant separately, :class:`IconAtlas`
+renders all of a theme's variants into one pixmap at the target device pixel
+ratio. :class:`~date_range_popover.utils.svg_loader.SvgIconCache` cuts its
+pixmaps out of a matching atlas when one exists, so a theme's icons cost one
+allocation and no per-icon SVG rendering. Atlases are kept per
+``(variants, dpr)``; moving a window to a screen with another ratio builds one
+new atlas for that ratio and leaves the existing ones untouched.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QPainter, QPixmap
+
+from .svg_assets import shared_svg_assets
+
+DEFAULT_ATLAS_CACHE_SIZE: Final[int] = 8
+ATLAS_MAX_ROW_WIDTH: Final[int] = 1024
+"""Row width in device pixels after which the packer starts a new shelf."""
+
+_ATLAS_PADDING: Final[int] = 1
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class IconVariant:
+    """One recoloured icon: SVG source (path or registered name), logical size and colour."""
+
+    source: str
+    size: int
+    color: str
+
+
+class IconAtlas:
+    """Every variant of an icon set packed into one pixmap at ``dpr``."""
+
+    def __init__(self, variants: Iterable[IconVariant], dpr: float = 1.0) -> None:
+        self._dpr = dpr
+        self._rects: dict[IconVariant, QRect] = {}
+        ordered = sorted(set(variants), key=lambda variant: (-variant.size, variant))
+
+        x = y = row_height = width = 0
+        for variant in ordered:
+            side = max(1, round(variant.size * dpr))
+            if x and x + side > ATLAS_MAX_ROW_WIDTH:
+                x, y, row_height = 0, y + row_height + _ATLAS_PADDING, 0
+            self._rects[variant] = QRect(x, y, side, side)
+            x += side + _ATLAS_PADDING
+            row_height = max(row_height, side)
+            width = max(width, x - _ATLAS_PADDING)
+
+        self._pixmap = QPixmap(max(1, width), max(1, y + row_height))
+        self._pixmap.fill(Qt.GlobalColor.transparent)
+        assets = shared_svg_assets()
+        painter = QPainter(self._pixmap)
+        for variant, rect in self._rects.items():
+            renderer = assets.renderer(variant.source, variant.color)
+            if renderer is not None:
+                renderer.render(painter, QRectF(rect))
+        painter.end()
+        self._pixmap.setDevicePixelRatio(dpr)
+
+    @property
+    def dpr(self) -> float:
+        return self._dpr
+
+    @property
+    def pixmap(self) -> QPixmap:
+        """The packed atlas; its device pixel ratio is :attr:`dpr`."""
+        return self._pixmap
+
+    @property
+    def variants(self) -> frozenset[IconVariant]:
+        return frozenset(self._rects)
+
+    def __contains__(self, variant: object) -> bool:
+        return variant in self._rects
+
+    def source_rect(self, variant: IconVariant) -> QRect:
+        """Return ``variant``'s area of :attr:`pixmap` in device pixels."""
+        return QRect(self._rects[variant])
+
+    def cut(self, variant: IconVariant) -> QPixmap:
+        """Copy ``variant`` out of the atlas as a standalone pixmap at :attr:`dpr`."""
+        pixmap = self._pixmap.copy(self._rects[variant])
+        pixmap.setDevicePixelRatio(self._dpr)
+        return pixmap
+
+
+_ATLASES: OrderedDict[tuple[tuple[IconVariant, ...], float], IconAtlas] = OrderedDict()
+
+
+def icon_atlas(variants: Iterable[IconVariant], dpr: float = 1.0) -> IconAtlas:
+    """
+    Return the shared atlas for ``variants`` at ``dpr``, building it on first use.
+
+    The most recently used :data:`DEFAULT_ATLAS_CACHE_SIZE` atlases are kept.
+    """
+    key = (tuple(sorted(set(variants))), dpr)
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = IconAtlas(key[0], dpr)
+        _ATLASES[key] = atlas
+        if len(_ATLASES) > DEFAULT_ATLAS_CACHE_SIZE:
+            _ATLASES.popitem(last=False)
+    else:
+        _ATLASES.move_to_end(key)
+    return atlas
+
+
+def find_icon_atlas(variant: IconVariant, dpr: float) -> IconAtlas | None:
+    """Return the most recently used shared atlas holding ``variant`` at ``dpr``."""
+    for (_, atlas_dpr), atlas in reversed(_ATLASES.items()):
+        if atlas_dpr == dpr and variant in atlas:
+            return atlas
+    return None
+
+
+def clear_icon_atlases() -> None:
+    """Drop every shared atlas."""
+    _ATLASES.clear()
+
+
+__all__ = [
+    "ATLAS_MAX_ROW_WIDTH",
+    "DEFAULT_ATLAS_CACHE_SIZE",
+    "IconAtlas",
+    "IconVariant",
+    "clear_icon_atlases",
+    "find_icon_atlas",
+    "icon_atlas",
+]
@@ -0,0 +1,110 @@
+"""
+Cached integer layouts for the 6x7 month grid.
+
+Rendering a month used to build 42 ``QDate`` objects and then query each of
+them repeatedly (``toJulianDay``, ``month``, ``year``), every one of which is
+a Shiboken round-trip. :func:`month_layout` performs a handful of ``QDate``
+calls per month, derives everything else with integer arithmetic, and caches
+the result so flicking back and forth between months is free.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final
+
+from PySide6.QtCore import QDate
+
+from ..exceptions import InvalidDateError
+
+GRID_CELLS: Final[int] = 6 * 7
+MONTH_LAYOUT_CACHE_SIZE: Final[int] = 128
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MonthLayout:
+    """
+    Julian days, day-of-month values, and in-month flags for one grid.
+
+    The arrays are shared between callers through the cache and must be
+    treated as read-only.
+    """
+
+    year: int
+    month: int
+    first_weekday: int
+    julian_days: array[int]
+    days: array[int]
+    in_month: array[int]
+    first_julian: int
+    last_julian: int
+
+    def qdate(self, index: int) -> QDate:
+        """Return the ``QDate`` shown at grid ``index``."""
+        return QDate.fromJulianDay(self.julian_days[index])
+
+
+@lru_cache(maxsize=MONTH_LAYOUT_CACHE_SIZE)
+def month_layout(year: int, month: int, first_weekday: int = 0) -> MonthLayout:
+    """
+    Return the cached grid layout for ``year``/``month``.
+
+    ``first_weekday`` follows :mod:`calendar` conventions (``0`` is Monday).
+    """
+
+    if not 1 <= month <= 12:
+        raise InvalidDateError("month must be between 1 and 12")
+    if not 0 <= first_weekday <= 6:
+        raise InvalidDateError("first_weekday must be between 0 and 6")
+    first = QDate(year, month, 1)
+    if not first.isValid():
+        raise InvalidDateError(f"Cannot build a month layout for {year}-{month:02d}")
+
+    first_julian = first.toJulianDay()
+    days_in_month = first.daysInMonth()
+    days_in_previous_month = first.addDays(-1).daysInMonth()
+    last_julian = first_julian + days_in_month - 1
+    # ``dayOfWeek`` is 1 (Monday) .. 7 (Sunday).
+    leading = (first.dayOfWeek() - 1 - first_weekday) % 7
+    start_julian = first_julian - leading
+
+    julian_days = array("q", range(start_julian, start_julian + GRID_CELLS))
+    days = array("b")
+    in_month = array("b")
+    for julian in julian_days:
+        if julian < first_julian:
+            days.append(days_in_previous_month - (first_julian - julian) + 1)
+            in_month.append(0)
+        elif julian > last_julian:
+            days.append(julian - last_julian)
+            in_month.append(0)
+        else:
+            days.append(julian - first_julian + 1)
+            in_month.append(1)
+
+    return MonthLayout(
+        year=year,
+        month=month,
+        first_weekday=first_weekday,
+        julian_days=julian_days,
+        days=days,
+        in_month=in_month,
+        first_julian=first_julian,
+        last_julian=last_julian,
+    )
+
+
+def clear_month_layout_cache() -> None:
+    """Drop every cached :class:`MonthLayout`."""
+    month_layout.cache_clear()
+
+
+__all__ = [
+    "GRID_CELLS",
+    "MONTH_LAYOUT_CACHE_SIZE",
+    "MonthLayout",
+    "clear_month_layout_cache",
+    "month_layout",
+]
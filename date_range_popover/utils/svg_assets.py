@@ -0,0 +1,206 @@
+"""
+Process-wide registry of colour-normalised SVG templates.
+
+Every icon the picker shows is a single-colour SVG that gets recoloured per
+theme and state. :class:`SvgAssetRegistry` reads each SVG once, replaces its
+colour with a placeholder, and then hands out the recoloured markup and shared,
+already parsed ``QSvgRenderer`` instances per colour, so widgets never touch
+the disk or re-parse markup for an icon they have seen before.
+
+The bundled assets are preloaded on first use. Host applications can add their
+own icon sets by name (:meth:`SvgAssetRegistry.register`,
+:meth:`~SvgAssetRegistry.register_directory`) or from a compiled Qt resource
+bundle (:meth:`~SvgAssetRegistry.register_resource_bundle`); every helper that
+accepts an icon path also accepts a registered name.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Final
+
+from PySide6.QtCore import QByteArray, QDir, QFile, QIODevice, QResource
+from PySide6.QtSvg import QSvgRenderer
+
+from ..exceptions import InvalidConfigurationError
+
+SVG_COLOR_PLACEHOLDER: Final[str] = "__SVG_COLOR__"
+BUNDLED_ASSETS_DIR: Final[Path] = Path(__file__).resolve().parents[1] / "assets"
+DEFAULT_RENDERER_CACHE_SIZE: Final[int] = 64
+
+# Colours the bundled and typical third-party icons are authored in. "#000" must
+# come after "#000000" so the longer form is replaced whole.
+_AUTHORED_COLORS: Final[tuple[str, ...]] = ("currentColor", "#8c8c8c", "#000000", "#000")
+
+
+def normalize_svg(svg_text: str) -> str:
+    """Replace the authored icon colours in ``svg_text`` with the colour placeholder."""
+    for authored in _AUTHORED_COLORS:
+        svg_text = svg_text.replace(authored, SVG_COLOR_PLACEHOLDER)
+    return svg_text
+
+
+def _read_source(source: str | Path) -> str | None:
+    location = str(source)
+    if location.startswith(":"):
+        resource = QFile(location)
+        if not resource.open(QIODevice.OpenModeFlag.ReadOnly):
+            return None
+        try:
+            data = bytes(resource.readAll().data())
+        finally:
+            resource.close()
+        return data.decode("utf-8", errors="ignore")
+    try:
+        return Path(location).read_bytes().decode("utf-8", errors="ignore")
+    except OSError:
+        return None
+
+
+class SvgAssetRegistry:
+    """Normalised SVG templates keyed by name or path, plus per-colour renderers."""
+
+    def __init__(self, max_renderers: int = DEFAULT_RENDERER_CACHE_SIZE) -> None:
+        if max_renderers <= 0:
+            raise InvalidConfigurationError("max_renderers must be positive")
+        self._max_renderers = max_renderers
+        self._templates: dict[str, str] = {}
+        self._renderers: OrderedDict[tuple[str, str], QSvgRenderer] = OrderedDict()
+        self._loads = 0
+
+    @property
+    def loads(self) -> int:
+        """Number of SVG sources read so far (bundled, registered or on demand)."""
+        return self._loads
+
+    def names(self) -> list[str]:
+        """Return every registered key (names and paths), sorted."""
+        return sorted(self._templates)
+
+    def register(self, name: str, source: str | Path) -> None:
+        """
+        Load ``source`` (a file or ``:/`` resource path) and register it as ``name``.
+
+        The template is also reachable through ``str(source)``, so code that
+        passes the original path hits the same entry.
+
+        :raises InvalidConfigurationError: If ``source`` cannot be read.
+        """
+        template = self._load(source)
+        if template is None:
+            raise InvalidConfigurationError(f"Cannot read SVG icon {name!r} from {source}")
+        self._templates[name] = template
+        self._drop_renderers(name)
+        self._drop_renderers(str(source))
+
+    def register_directory(self, directory: str | Path, *, prefix: str = "") -> list[str]:
+        """
+        Register every ``*.svg`` file in ``directory`` under ``prefix + stem``.
+
+        ``directory`` may be a filesystem path or a ``:/`` resource directory.
+
+        :returns: The names that were registered.
+        """
+        location = str(directory)
+        if location.startswith(":"):
+            entries = QDir(location).entryList(["*.svg"], QDir.Filter.Files, QDir.SortFlag.Name)
+            sources: list[str | Path] = [f"{location.rstrip('/')}/{entry}" for entry in entries]
+        else:
+            sources = sorted(Path(location).glob("*.svg"))
+        names = []
+        for source in sources:
+            name = prefix + Path(str(source)).stem
+            self.register(name, source)
+            names.append(name)
+        return names
+
+    def register_resource_bundle(
+        self, rcc_path: str | Path, *, root: str = ":/", prefix: str = ""
+    ) -> list[str]:
+        """
+        Register a compiled Qt resource bundle (``pyside6-rcc --binary``) and its icons.
+
+        :param rcc_path: The ``.rcc`` file to register with ``QResource``.
+        :param root: Resource directory holding the SVGs.
+        :param prefix: Prefix added to every registered name.
+        :raises InvalidConfigurationError: If Qt rejects the bundle.
+        """
+        if not QResource.registerResource(str(rcc_path)):
+            raise InvalidConfigurationError(f"Cannot register Qt resource bundle {rcc_path}")
+        return self.register_directory(root, prefix=prefix)
+
+    def template(self, source: str | Path) -> str | None:
+        """
+        Return the colour-placeholder template for a registered name or path.
+
+        Unknown paths are read once and remembered; ``None`` means the source
+        could not be read.
+        """
+        template = self._templates.get(str(source))
+        if template is None:
+            template = self._load(source)
+        return template
+
+    def svg_bytes(self, source: str | Path, color: str) -> bytes | None:
+        """Return the SVG markup for ``source`` recoloured to ``color``."""
+        template = self.template(source)
+        if template is None:
+            return None
+        return template.replace(SVG_COLOR_PLACEHOLDER, color).encode("utf-8")
+
+    def renderer(self, source: str | Path, color: str) -> QSvgRenderer | None:
+        """
+        Return a shared, parsed renderer for ``source`` in ``color``.
+
+        Renderers are kept in a bounded LRU and must not be modified by callers.
+        Returns ``None`` when the source is unreadable or not valid SVG.
+        """
+        key = (str(source), color)
+        renderer = self._renderers.get(key)
+        if renderer is None:
+            data = self.svg_bytes(source, color)
+            if data is None:
+                return None
+            renderer = QSvgRenderer(QByteArray(data))
+            self._renderers[key] = renderer
+            if len(self._renderers) > self._max_renderers:
+                self._renderers.popitem(last=False)
+        else:
+            self._renderers.move_to_end(key)
+        return renderer if renderer.isValid() else None
+
+    def _load(self, source: str | Path) -> str | None:
+        svg_text = _read_source(source)
+        if not svg_text:
+            return None
+        self._loads += 1
+        template = normalize_svg(svg_text)
+        self._templates[str(source)] = template
+        return template
+
+    def _drop_renderers(self, key: str) -> None:
+        for stale in [entry for entry in self._renderers if entry[0] == key]:
+            del self._renderers[stale]
+
+
+_SHARED_ASSETS: SvgAssetRegistry | None = None
+
+
+def shared_svg_assets() -> SvgAssetRegistry:
+    """Return the process-wide registry, preloading the bundled icons on first use."""
+    global _SHARED_ASSETS
+    if _SHARED_ASSETS is None:
+        _SHARED_ASSETS = SvgAssetRegistry()
+        _SHARED_ASSETS.register_directory(BUNDLED_ASSETS_DIR)
+    return _SHARED_ASSETS
+
+
+__all__ = [
+    "BUNDLED_ASSETS_DIR",
+    "DEFAULT_RENDERER_CACHE_SIZE",
+    "SVG_COLOR_PLACEHOLDER",
+    "SvgAssetRegistry",
+    "normalize_svg",
+    "shared_svg_assets",
+]
@@ -1,76 +1,174 @@
+"""
+SVG loading helpers with a process-wide icon cache.
+
+Recolouring an icon means fetching its template from the
+:mod:`~date_range_popover.utils.svg_assets` registry, rendering it with a
+shared ``QSvgRenderer`` and rasterising a pixmap. :func:`load_colored_svg_icon`
+does that once per ``(path, size, colour, device pixel ratio)`` and serves
+repeated requests—such as the calendar navigation arrows on every month
+change—from a bounded :class:`SvgIconCache`. Every ``path`` argument also
+accepts a name registered with the asset registry.
+"""
+
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
-from PySide6.QtCore import QByteArray, Qt
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QPainter, QPixmap
-from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtSvgWidgets import QSvgWidget
 
-_SVG_COLOR_PLACEHOLDER: Final[str] = "__SVG_COLOR__"
-
+from ..exceptions import InvalidConfigurationError
+from .icon_atlas import IconVariant, clear_icon_atlases, find_icon_atlas
+from .svg_assets import SVG_COLOR_PLACEHOLDER, shared_svg_assets
 
-def _read_svg_text(path: Path) -> str | None:
-    try:
-        return path.read_text(encoding="utf-8")
-    except OSError:
-        return None
+_DEFAULT_WIDGET_COLOR: Final[str] = "#8c8c8c"
+DEFAULT_ICON_CACHE_SIZE: Final[int] = 64
 
+_IconKey = tuple[str, int, str, float]
 
-def load_colored_svg_icon(path: str | Path, size: int, color: str) -> QIcon:
-    """Load an SVG and recolor it to build a ``QIcon``."""
-    svg_path = Path(path)
-    svg_text = _read_svg_text(svg_path)
-    if not svg_text:
-        return QIcon()
 
-    normalized = (
-        svg_text.replace("currentColor", _SVG_COLOR_PLACEHOLDER)
-        .replace("#000000", _SVG_COLOR_PLACEHOLDER)
-        .replace("#000", _SVG_COLOR_PLACEHOLDER)
-    )
-    colored_svg = normalized.replace(_SVG_COLOR_PLACEHOLDER, color)
+def _render_colored_pixmap(path: str | Path, size: int, color: str, dpr: float) -> QPixmap:
+    variant = IconVariant(str(path), size, color)
+    atlas = find_icon_atlas(variant, dpr)
+    if atlas is not None:
+        return atlas.cut(variant)
 
-    renderer = QSvgRenderer(QByteArray(colored_svg.encode("utf-8")))
-    if not renderer.isValid():
-        return QIcon()
+    renderer = shared_svg_assets().renderer(path, color)
+    if renderer is None:
+        return QPixmap()
 
-    pixmap = QPixmap(size, size)
+    device_size = max(1, round(size * dpr))
+    pixmap = QPixmap(device_size, device_size)
     pixmap.fill(Qt.GlobalColor.transparent)
     painter = QPainter(pixmap)
     renderer.render(painter)
     painter.end()
-    return QIcon(pixmap)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+@dataclass(frozen=True, slots=True)
+class IconCacheStats:
+    """Snapshot of the icon cache counters."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class SvgIconCache:
+    """Bounded LRU cache of recoloured SVG icons keyed by path, size, colour and DPR."""
+
+    def __init__(self, max_size: int = DEFAULT_ICON_CACHE_SIZE) -> None:
+        if max_size <= 0:
+            raise InvalidConfigurationError("max_size must be positive")
+        self._max_size = max_size
+        self._entries: OrderedDict[_IconKey, tuple[QIcon, QPixmap]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def icon(self, path: str | Path, size: int, color: str, dpr: float = 1.0) -> QIcon:
+        """
+        Return the icon for ``path`` tinted ``color`` at ``size`` logical pixels.
+
+        On a miss the pixmap is cut from a shared
+        :class:`~date_range_popover.utils.icon_atlas.IconAtlas` holding the
+        variant at ``dpr`` or, failing that, rasterised on its own at
+        ``size * dpr`` device pixels. Missing or invalid SVGs yield a null
+        ``QIcon``, which is cached like any other result.
+        """
+
+        return self._entry(path, size, color, dpr)[0]
+
+    def pixmap(self, path: str | Path, size: int, color: str, dpr: float = 1.0) -> QPixmap:
+        """
+        Return the rasterised pixmap behind :meth:`icon` for widgets that paint it directly.
+
+        The pixmap carries ``dpr`` as its device pixel ratio and is shared, so
+        callers must not paint onto it. Missing or invalid SVGs yield a null
+        pixmap.
+        """
+
+        return self._entry(path, size, color, dpr)[1]
+
+    def _entry(self, path: str | Path, size: int, color: str, dpr: float) -> tuple[QIcon, QPixmap]:
+        key = (str(path), size, color, dpr)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self._misses += 1
+        pixmap = _render_colored_pixmap(path, size, color, dpr)
+        entry = (QIcon() if pixmap.isNull() else QIcon(pixmap), pixmap)
+        self._entries[key] = entry
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> IconCacheStats:
+        return IconCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached icon and reset the counters."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+_SHARED_ICON_CACHE = SvgIconCache()
+
+
+def shared_icon_cache() -> SvgIconCache:
+    """Return the icon cache shared by every widget in the process."""
+    return _SHARED_ICON_CACHE
+
+
+def clear_icon_cache() -> None:
+    """Drop every shared cached icon and atlas, for every picker in the process."""
+    _SHARED_ICON_CACHE.clear()
+    clear_icon_atlases()
+
+
+def load_colored_svg_icon(path: str | Path, size: int, color: str, dpr: float = 1.0) -> QIcon:
+    """Load an SVG and recolor it to build a ``QIcon`` (cached, see :class:`SvgIconCache`)."""
+    return _SHARED_ICON_CACHE.icon(path, size, color, dpr)
 
 
 def load_svg_widget(path: str | Path, size: int) -> tuple[QSvgWidget, str] | None:
     """Load an SVG widget and return the widget and color template string."""
-    svg_path = Path(path)
-    try:
-        svg_data = svg_path.read_bytes()
-    except OSError:
-        return None
-    if not svg_data:
+    template = shared_svg_assets().template(path)
+    if template is None:
         return None
 
     svg_widget = QSvgWidget()
     svg_widget.setFixedSize(size, size)
     svg_widget.setStyleSheet("background-color: transparent;")
-
-    try:
-        svg_text = svg_data.decode("utf-8")
-    except UnicodeDecodeError:
-        svg_text = svg_data.decode("utf-8", errors="ignore")
-
-    template = (
-        svg_text.replace("currentColor", _SVG_COLOR_PLACEHOLDER)
-        .replace("#8c8c8c", _SVG_COLOR_PLACEHOLDER)
-        .replace("#000000", _SVG_COLOR_PLACEHOLDER)
-    )
-
-    svg_widget.load(template.replace(_SVG_COLOR_PLACEHOLDER, "#8c8c8c").encode("utf-8"))
+    svg_widget.load(template.replace(SVG_COLOR_PLACEHOLDER, _DEFAULT_WIDGET_COLOR).encode("utf-8"))
     return svg_widget, template
 
 
-__all__ = ["load_colored_svg_icon", "load_svg_widget"]
+__all__ = [
+    "DEFAULT_ICON_CACHE_SIZE",
+    "IconCacheStats",
+    "SvgIconCache",
+    "clear_icon_cache",
+    "load_colored_svg_icon",
+    "load_svg_widget",
+    "shared_icon_cache",
+]
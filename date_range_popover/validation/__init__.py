@@ -3,13 +3,17 @@
 from .validators import (
     validate_date_range,
     validate_dimension,
+    validate_dimensions,
     validate_hex_color,
+    validate_hex_colors,
     validate_qdate,
 )
 
 __all__ = [
     "validate_hex_color",
+    "validate_hex_colors",
     "validate_dimension",
+    "validate_dimensions",
     "validate_qdate",
     "validate_date_range",
 ]
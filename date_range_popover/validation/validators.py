@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Final
 
 from PySide6.QtCore import QDate
 
-from ..exceptions import InvalidConfigurationError, InvalidDateError, ValidationError
+from ..exceptions import (
+    InvalidConfigurationError,
+    InvalidDateError,
+    InvalidFieldsError,
+    ValidationError,
+)
 from ..utils import qdate_is_after
 
 _HEX_RE: Final[re.Pattern[str]] = re.compile(r"^#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$")
+_HEX_CACHE_SIZE: Final[int] = 1024
+
+
+@lru_cache(maxsize=_HEX_CACHE_SIZE)
+def _intern_hex(value: str) -> str | None:
+    """Return the interned, stripped form of ``value`` or ``None`` if it is not hex."""
+    normalized = value.strip()
+    if not _HEX_RE.fullmatch(normalized):
+        return None
+    return sys.intern(normalized)
 
 
 def validate_hex_color(value: object, *, field_name: str = "color") -> str:
@@ -21,17 +39,48 @@ def validate_hex_color(value: object, *, field_name: str = "color") -> str:
     :param field_name: Friendly label used in validation errors.
     :raises InvalidConfigurationError: If the value is not a valid hex
         string.
+
+    Results are memoised per input string, so repeated tokens (shared
+    defaults, palettes derived with :func:`dataclasses.replace`) skip the
+    regex and return one interned string object.
     """
     if not isinstance(value, str):
         raise InvalidConfigurationError(f"{field_name} must be a string, got {type(value)!r}")
-    normalized = value.strip()
-    if not _HEX_RE.fullmatch(normalized):
+    normalized = _intern_hex(value)
+    if normalized is None:
         raise InvalidConfigurationError(
             f"{field_name} must be a #RRGGBB or #RRGGBBAA value, got {value!r}"
         )
     return normalized
 
 
+def validate_hex_colors(values: Mapping[str, object]) -> dict[str, str]:
+    """
+    Validate several hex colors at once, reporting every invalid field.
+
+    :param values: Mapping of field name to candidate color.
+    :returns: Mapping of field name to normalised color, in input order.
+    :raises InvalidFieldsError: If any value is invalid; ``errors`` lists
+        each offending field.
+    """
+    validated: dict[str, str] = {}
+    for name, value in values.items():
+        normalized = _intern_hex(value) if isinstance(value, str) else None
+        if normalized is None:
+            break
+        validated[name] = normalized
+    else:
+        return validated
+
+    errors: dict[str, str] = {}
+    for name, value in values.items():
+        try:
+            validate_hex_color(value, field_name=name)
+        except InvalidConfigurationError as exc:
+            errors[name] = str(exc)
+    raise InvalidFieldsError(errors)
+
+
 def validate_dimension(
     value: object,
     *,
@@ -58,6 +107,37 @@ def validate_dimension(
     return value
 
 
+def validate_dimensions(
+    values: Mapping[str, object],
+    *,
+    min_values: Mapping[str, int] | None = None,
+    default_min: int = 0,
+) -> dict[str, int]:
+    """
+    Validate several UI dimensions at once, reporting every invalid field.
+
+    :param values: Mapping of field name to candidate dimension.
+    :param min_values: Per-field minimums overriding ``default_min``.
+    :param default_min: Minimum inclusive value for unlisted fields.
+    :returns: Mapping of field name to validated dimension, in input order.
+    :raises InvalidFieldsError: If any value is invalid; ``errors`` lists
+        each offending field.
+    """
+    minimums = min_values or {}
+    validated: dict[str, int] = {}
+    errors: dict[str, str] = {}
+    for name, value in values.items():
+        try:
+            validated[name] = validate_dimension(
+                value, field_name=name, min_value=minimums.get(name, default_min)
+            )
+        except InvalidConfigurationError as exc:
+            errors[name] = str(exc)
+    if errors:
+        raise InvalidFieldsError(errors)
+    return validated
+
+
 def validate_qdate(
     date: QDate | None,
     *,
@@ -117,7 +197,9 @@ def validate_date_range(
 
 __all__ = [
     "validate_hex_color",
+    "validate_hex_colors",
     "validate_dimension",
+    "validate_dimensions",
     "validate_qdate",
     "validate_date_range",
 ]
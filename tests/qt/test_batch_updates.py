@@ -0,0 +1,96 @@
+"""Tests for batched calendar and picker updates."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.calendar import CalendarWidget
+from date_range_popover.managers.state_manager import PickerMode
+from PySide6.QtCore import QDate
+from pytestqt.qtbot import QtBot
+
+
+def _count_refreshes(monkeypatch: pytest.MonkeyPatch, calendar: CalendarWidget) -> list[int]:
+    calls: list[int] = []
+    day_view = cast(Any, calendar)._day_view
+    original = day_view.set_states
+
+    def _record(*args: Any, **kwargs: Any) -> None:
+        calls.append(1)
+        original(*args, **kwargs)
+
+    monkeypatch.setattr(day_view, "set_states", _record)
+    return calls
+
+
+def test_nested_calendar_batches_refresh_once(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Refreshes requested inside nested blocks should collapse into one."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+    calls = _count_refreshes(monkeypatch, calendar)
+
+    with calendar.batch_updates():
+        calendar.set_visible_month(QDate(2024, 3, 1))
+        with calendar.batch_updates():
+            calendar.set_selected_range(QDate(2024, 3, 4), QDate(2024, 3, 8))
+            calendar.set_visible_month(QDate(2024, 4, 1))
+        assert not calendar.updatesEnabled()
+        assert calls == []
+
+    assert calls == [1]
+    assert calendar.updatesEnabled()
+    assert cast(Any, calendar)._navigation._header_button.text() == "April 2024"
+
+
+def test_batch_restores_updates_after_errors(qtbot: QtBot) -> None:
+    """An exception inside the block must not leave repaints disabled."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+
+    with pytest.raises(RuntimeError), calendar.batch_updates():
+        calendar.set_visible_month(QDate(2024, 3, 1))
+        raise RuntimeError("boom")
+
+    assert calendar.updatesEnabled()
+    assert cast(Any, calendar)._navigation._header_button.text() == "March 2024"
+
+
+def test_picker_select_range_refreshes_calendar_once(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """select_range emits several state signals but should refresh the grid once."""
+    picker = DateRangePicker(DatePickerConfig(mode=PickerMode.CUSTOM_RANGE))
+    qtbot.addWidget(picker)
+    calendar = cast(Any, picker)._calendar
+    calls = _count_refreshes(monkeypatch, calendar)
+    start = QDate.currentDate().addDays(-10)
+    end = QDate.currentDate().addDays(-3)
+
+    picker.select_range(start, end)
+
+    assert calls == [1]
+    assert picker.selected_range.start_date == start
+    assert picker.selected_range.end_date == end
+    assert picker.updatesEnabled()
+
+
+def test_picker_set_constraints_clamps_selection(qtbot: QtBot) -> None:
+    """Runtime constraints should clamp the shared state and the calendar."""
+    picker = DateRangePicker()
+    qtbot.addWidget(picker)
+    picker.select_date(QDate(2024, 5, 20))
+    emitted: list[QDate] = []
+    picker.date_selected.connect(emitted.append)
+
+    picker.set_constraints(min_date=QDate(2024, 6, 1), max_date=QDate(2024, 6, 30))
+
+    assert picker.selected_date == QDate(2024, 6, 1)
+    assert emitted == [QDate(2024, 6, 1)]
+    calendar = cast(Any, picker)._calendar
+    assert calendar._selected_date == QDate(2024, 6, 1)
+    assert calendar._max_date == QDate(2024, 6, 30)
@@ -0,0 +1,116 @@
+"""Tests for pickers styled by the compiled, root-scoped stylesheet."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.calendar import CalendarYearListView
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.managers.state_manager import PickerMode
+from date_range_popover.styles.compiled_qss import ROOT_OBJECT_NAME, STATE_PROPERTY
+from PySide6.QtCore import QDate
+from PySide6.QtWidgets import QWidget
+from pytestqt.qtbot import QtBot
+
+
+def _picker(qtbot: QtBot, *, compiled: bool) -> DateRangePicker:
+    picker = DateRangePicker(
+        DatePickerConfig(rendering=RenderingOptions(compiled_stylesheet=compiled))
+    )
+    qtbot.addWidget(picker)
+    picker.show()
+    return picker
+
+
+def _own_stylesheets(picker: DateRangePicker) -> int:
+    return sum(1 for widget in picker.findChildren(QWidget) if widget.styleSheet())
+
+
+def test_compiled_picker_renders_like_inline_picker(qtbot: QtBot) -> None:
+    """Both styling modes should produce the same pixels with far fewer stylesheets."""
+    inline = _picker(qtbot, compiled=False)
+    compiled = _picker(qtbot, compiled=True)
+    qtbot.waitExposed(compiled)
+
+    assert compiled.objectName() == ROOT_OBJECT_NAME
+    assert _own_stylesheets(compiled) * 4 < _own_stylesheets(inline)
+    # The inputs show the current time and a blinking cursor, so compare the rest.
+    for name in ("_button_strip", "_sliding_track", "_calendar"):
+        expected = getattr(inline, name).grab().toImage()
+        assert getattr(compiled, name).grab().toImage() == expected, name
+
+
+def test_compiled_mode_label_renders_like_inline_mode_label(qtbot: QtBot) -> None:
+    """The month/year mode label should be styled by the root sheet in compiled mode."""
+    inline = _picker(qtbot, compiled=False)
+    compiled = _picker(qtbot, compiled=True)
+    qtbot.waitExposed(compiled)
+    for picker in (inline, compiled):
+        cast(Any, picker)._calendar._on_header_clicked()
+
+    calendar = cast(Any, compiled)._calendar
+    assert calendar._mode_label_container.isVisible()
+    assert not calendar._mode_label_container.styleSheet()
+    assert not calendar._mode_label.styleSheet()
+    assert calendar.grab().toImage() == cast(Any, inline)._calendar.grab().toImage()
+
+
+def test_compiled_year_list_renders_like_inline_year_list(qtbot: QtBot) -> None:
+    """The scrollable year list should rely on the root sheet in compiled mode."""
+    views = []
+    for compiled in (False, True):
+        picker = DateRangePicker(
+            DatePickerConfig(
+                rendering=RenderingOptions(
+                    compiled_stylesheet=compiled, scrollable_year_picker=True
+                )
+            )
+        )
+        qtbot.addWidget(picker)
+        picker.show()
+        calendar = cast(Any, picker)._calendar
+        calendar._on_header_clicked()
+        calendar._on_header_clicked()
+        views.append(calendar._year_view)
+    inline, compiled_view = views
+    qtbot.waitExposed(compiled_view)
+
+    assert isinstance(compiled_view, CalendarYearListView)
+    assert not compiled_view.styleSheet()
+    assert not any(widget.styleSheet() for widget in compiled_view.findChildren(QWidget))
+    assert compiled_view.grab().toImage() == inline.grab().toImage()
+
+
+def test_range_selection_flips_day_cell_states(qtbot: QtBot) -> None:
+    """Selecting a range should only change the cells' ``state`` property."""
+    picker = _picker(qtbot, compiled=True)
+    picker.set_mode(PickerMode.CUSTOM_RANGE)
+    month = QDate.currentDate().addMonths(-1)
+    start = QDate(month.year(), month.month(), 10)
+    picker.select_range(start, start.addDays(4))
+
+    cells = cast(Any, picker)._calendar._day_view._cells
+    states = {cell._date: cell._button.property(STATE_PROPERTY) for cell in cells}
+    assert states[start] == "range-edge"
+    assert states[start.addDays(2)] == "in-range"
+    assert states[start.addDays(4)] == "range-edge"
+    assert not any(cell._button.styleSheet() for cell in cells)
+
+
+def test_button_strip_marks_selected_button(qtbot: QtBot) -> None:
+    """The strip should expose its selection through the ``state`` property."""
+    picker = _picker(qtbot, compiled=True)
+    strip = cast(Any, picker)._button_strip
+    strip.set_selected_button("custom_range")
+
+    assert strip.custom_range_button.property(STATE_PROPERTY) == "selected"
+    assert strip.date_button.property(STATE_PROPERTY) == "default"
+
+
+def test_rendering_options_reject_non_bool_compiled_stylesheet() -> None:
+    """``compiled_stylesheet`` must be a real bool."""
+    with pytest.raises(InvalidConfigurationError, match="compiled_stylesheet"):
+        RenderingOptions(compiled_stylesheet=cast(Any, 1))
@@ -0,0 +1,73 @@
+"""Tests for the diff-based day grid refresh."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from date_range_popover.components.calendar import CalendarDayView, CalendarPaintedDayView
+from PySide6.QtCore import QDate
+from pytestqt.qtbot import QtBot
+
+_TODAY = QDate(2024, 6, 20)
+
+
+def _refresh(view: CalendarDayView | CalendarPaintedDayView, selected: QDate) -> None:
+    view.update_days(visible_month=QDate(2024, 6, 1), today=_TODAY, selected_date=selected)
+
+
+def test_day_view_only_restyles_changed_cells(qtbot: QtBot) -> None:
+    """Moving the selection inside a month should only touch the two affected cells."""
+    view = CalendarDayView()
+    qtbot.addWidget(view)
+    _refresh(view, QDate(2024, 6, 3))
+    assert view.update_stats.applied == 42
+
+    view.reset_update_stats()
+    _refresh(view, QDate(2024, 6, 4))
+
+    assert view.update_stats.applied == 2
+    assert view.update_stats.skipped == 40
+
+
+def test_day_view_retargets_skipped_cells(qtbot: QtBot) -> None:
+    """Skipped cells must still emit the date of the newly visible month."""
+    view = CalendarDayView()
+    qtbot.addWidget(view)
+    # February and March 2021 both start on a Monday.
+    view.update_days(visible_month=QDate(2021, 2, 1), today=_TODAY, selected_date=QDate())
+    view.reset_update_stats()
+    view.update_days(visible_month=QDate(2021, 3, 1), today=_TODAY, selected_date=QDate())
+    emitted: list[QDate] = []
+    view.day_selected.connect(emitted.append)
+
+    assert view.update_stats.skipped > 0
+    cast(Any, view)._cells[0]._button.click()
+    assert emitted == [QDate(2021, 3, 1)]
+
+
+def test_apply_style_invalidates_cell_records(qtbot: QtBot) -> None:
+    """Restyling resets every cell, so the next refresh has to touch them all."""
+    view = CalendarDayView()
+    qtbot.addWidget(view)
+    _refresh(view, QDate(2024, 6, 3))
+    view.apply_style(cast(Any, view)._style)
+    view.reset_update_stats()
+    _refresh(view, QDate(2024, 6, 3))
+
+    assert view.update_stats.applied == 42
+    assert view.update_stats.skipped == 0
+
+
+def test_painted_view_diffs_cell_repaints(qtbot: QtBot) -> None:
+    """The painted grid should report the same applied/skipped split."""
+    view = CalendarPaintedDayView()
+    qtbot.addWidget(view)
+    _refresh(view, QDate(2024, 6, 3))
+    view.reset_update_stats()
+    _refresh(view, QDate(2024, 6, 4))
+
+    assert view.update_stats.applied == 2
+    assert view.update_stats.skipped == 40
+    states = cast(Any, view)._states
+    index = next(i for i, state in enumerate(states) if state.date == QDate(2024, 6, 4))
+    assert cast(Any, view)._appearances[index].background != "transparent"
@@ -0,0 +1,43 @@
+"""Tests for the cached pixmap icons painted by ``InputWithIcon``."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from date_range_popover.components.inputs.date_time_selector import CLOCK_ICON_PATH
+from date_range_popover.components.inputs.input_with_icon import InputWithIcon
+from date_range_popover.styles.style_registry import StyleRegistry
+from date_range_popover.utils.svg_loader import shared_icon_cache
+from PySide6.QtCore import QEvent, QPointF
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtSvgWidgets import QSvgWidget
+from PySide6.QtWidgets import QApplication
+from pytestqt.qtbot import QtBot
+
+
+def test_icon_hover_swaps_prerasterised_pixmaps(qtbot: QtBot) -> None:
+    """Hovering repaints with the cached hover pixmap instead of re-parsing the SVG."""
+    style = StyleRegistry().input_config()
+    widget = InputWithIcon(icon_path=CLOCK_ICON_PATH, style=style)
+    qtbot.addWidget(widget)
+    widget.show()
+    icon = cast(Any, widget)._icon_widget
+    assert not widget.findChildren(QSvgWidget)
+
+    before = icon.grab().toImage()
+    misses = shared_icon_cache().stats().misses
+    point = QPointF(widget.rect().center())
+    QApplication.sendEvent(widget, QEnterEvent(point, point, widget.mapToGlobal(point)))
+    hovered = icon.grab().toImage()
+    QApplication.sendEvent(widget, QEvent(QEvent.Type.Leave))
+
+    assert shared_icon_cache().stats().misses == misses
+    assert hovered != before
+    assert icon.grab().toImage() == before
+
+
+def test_unreadable_icon_falls_back_to_letter(qtbot: QtBot) -> None:
+    """A missing SVG keeps the letter placeholder."""
+    widget = InputWithIcon(icon_path="/nonexistent/icon.svg")
+    qtbot.addWidget(widget)
+    assert cast(Any, widget)._icon_widget.text() == "M"
@@ -0,0 +1,90 @@
+"""Tests for on-demand construction of the month and year views."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.calendar import (
+    CalendarMonthView,
+    CalendarWidget,
+    CalendarYearView,
+)
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.styles.theme import LayoutConfig
+from PySide6.QtCore import QDate
+from pytestqt.qtbot import QtBot
+
+
+def test_secondary_views_are_built_on_first_use(qtbot: QtBot) -> None:
+    """Only the day view should exist until the header opens the other views."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+    internals = cast(Any, calendar)
+    assert internals._month_view is None
+    assert internals._year_view is None
+    assert internals._content_stack.count() == 1
+
+    internals._on_header_clicked()
+    assert isinstance(internals._month_view, CalendarMonthView)
+    assert internals._year_view is None
+    assert internals._content_stack.currentWidget() is internals._month_view
+
+    internals._on_header_clicked()
+    assert isinstance(internals._year_view, CalendarYearView)
+    assert internals._content_stack.count() == 3
+
+
+def test_lazy_views_still_navigate(qtbot: QtBot) -> None:
+    """Selecting a year and month from the lazily built views should update the month."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+    calendar.set_visible_month(QDate(2024, 6, 1))
+    internals = cast(Any, calendar)
+    internals._on_header_clicked()
+    internals._on_header_clicked()
+
+    internals._year_view.year_selected.emit(2021)
+    internals._month_view.month_selected.emit(3)
+
+    assert internals._visible_month == QDate(2021, 3, 1)
+    assert internals._content_stack.currentWidget() is internals._day_view
+
+
+def test_prebuild_views_after_first_show(qtbot: QtBot) -> None:
+    """``prebuild_views`` should build both views in idle time once shown."""
+    calendar = CalendarWidget(prebuild_views=True)
+    qtbot.addWidget(calendar)
+    internals = cast(Any, calendar)
+    assert internals._month_view is None
+
+    calendar.show()
+    qtbot.waitUntil(lambda: internals._year_view is not None, timeout=2000)
+    assert internals._month_view is not None
+
+
+def test_size_hint_reserves_secondary_view_width(qtbot: QtBot) -> None:
+    """Building the views lazily must not change the calendar's size hint."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+    before = calendar.sizeHint()
+    cast(Any, calendar)._build_secondary_views()
+    assert calendar.sizeHint() == before
+    assert calendar.sizeHint().width() >= CalendarYearView.grid_width(LayoutConfig(), 4)
+
+
+def test_picker_forwards_prebuild_option(qtbot: QtBot) -> None:
+    """The picker should pass ``prebuild_calendar_views`` to its calendar."""
+    picker = DateRangePicker(
+        DatePickerConfig(rendering=RenderingOptions(prebuild_calendar_views=True))
+    )
+    qtbot.addWidget(picker)
+    assert cast(Any, picker)._calendar._prebuild_views is True
+
+
+def test_rendering_options_reject_non_bool_prebuild() -> None:
+    """``prebuild_calendar_views`` must be a real bool."""
+    with pytest.raises(InvalidConfigurationError, match="prebuild_calendar_views"):
+        RenderingOptions(prebuild_calendar_views=cast(Any, 1))
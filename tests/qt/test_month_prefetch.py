@@ -0,0 +1,104 @@
+"""Tests for idle-time prefetching of adjacent months."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.calendar import (
+    CalendarPaintedDayView,
+    CalendarWidget,
+    PrefetchStats,
+)
+from date_range_popover.core.day_grid import DayCellFlag
+from date_range_popover.exceptions import InvalidConfigurationError
+from PySide6.QtCore import QDate
+from pytestqt.qtbot import QtBot
+
+
+def _wait_for_prefetch(qtbot: QtBot, calendar: CalendarWidget) -> None:
+    prefetcher = cast(Any, calendar)._prefetcher
+    qtbot.waitUntil(lambda: prefetcher.pending == 0, timeout=2000)
+
+
+def test_navigation_swaps_in_prefetched_months(qtbot: QtBot) -> None:
+    """Previous/next clicks should be served from the idle-time cache."""
+    calendar = CalendarWidget(prefetch_months=1)
+    qtbot.addWidget(calendar)
+    calendar.set_visible_month(QDate(2024, 6, 1))
+    _wait_for_prefetch(qtbot, calendar)
+    assert calendar.prefetch_stats.prefetched >= 2
+
+    cast(Any, calendar)._on_next_clicked()
+    _wait_for_prefetch(qtbot, calendar)
+    cast(Any, calendar)._on_previous_clicked()
+
+    stats = calendar.prefetch_stats
+    assert (stats.hits, stats.misses) == (2, 0)
+    assert stats.hit_rate == 1.0
+    cells = cast(Any, calendar)._day_view._cells
+    assert any(cell._date == QDate(2024, 6, 30) for cell in cells)
+
+
+def test_selection_changes_invalidate_prefetched_months(qtbot: QtBot) -> None:
+    """Snapshots computed for a different selection must not be reused."""
+    calendar = CalendarWidget(prefetch_months=1)
+    qtbot.addWidget(calendar)
+    calendar.set_selected_date(QDate(2024, 6, 10))
+    _wait_for_prefetch(qtbot, calendar)
+
+    prefetcher = cast(Any, calendar)._prefetcher
+    assert prefetcher.take(QDate(2024, 7, 1), ("stale",)) is None
+    calendar.set_selected_range(QDate(2024, 6, 28), QDate(2024, 7, 3))
+    cast(Any, calendar)._on_next_clicked()
+
+    assert calendar.prefetch_stats.misses == 2
+    day_view = cast(Any, calendar)._day_view
+    index = next(i for i, cell in enumerate(day_view._cells) if cell._date == QDate(2024, 7, 2))
+    assert day_view._records[index].flags & DayCellFlag.IN_RANGE
+
+
+def test_painted_grid_prefetches_pixmaps(qtbot: QtBot) -> None:
+    """Painted grids should blit the prerendered month after navigating."""
+    calendar = CalendarWidget(painted_day_grid=True, prefetch_months=2)
+    qtbot.addWidget(calendar)
+    calendar.set_visible_month(QDate(2024, 6, 1))
+    _wait_for_prefetch(qtbot, calendar)
+
+    cast(Any, calendar)._on_previous_clicked()
+
+    day_view = cast(Any, calendar)._day_view
+    assert isinstance(day_view, CalendarPaintedDayView)
+    assert calendar.prefetch_stats.hits == 1
+    assert day_view._pixmap is not None
+    assert not day_view.grab().isNull()
+    day_view.apply_style(day_view._style)
+    assert day_view._pixmap is None
+
+
+def test_prefetch_is_disabled_by_default(qtbot: QtBot) -> None:
+    """Without opting in there is no prefetcher and the stats stay empty."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+    cast(Any, calendar)._on_next_clicked()
+
+    assert cast(Any, calendar)._prefetcher is None
+    assert calendar.prefetch_stats == PrefetchStats()
+    assert calendar.prefetch_stats.hit_rate == 0.0
+
+
+def test_picker_forwards_prefetch_window(qtbot: QtBot) -> None:
+    """RenderingOptions.prefetch_months should reach the calendar widget."""
+    picker = DateRangePicker(DatePickerConfig(rendering=RenderingOptions(prefetch_months=3)))
+    qtbot.addWidget(picker)
+
+    assert cast(Any, picker)._calendar._prefetch_months == 3
+
+
+@pytest.mark.parametrize("value", [-1, 13, True, 1.5])
+def test_rendering_options_reject_invalid_prefetch_window(value: object) -> None:
+    """The prefetch window must be a small non-negative integer."""
+    with pytest.raises(InvalidConfigurationError, match="prefetch_months"):
+        RenderingOptions(prefetch_months=cast(Any, value))
@@ -0,0 +1,104 @@
+"""Tests for the painted multi-month range calendar."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.components.calendar import MultiMonthCalendar
+from date_range_popover.core.day_grid import DayCellFlag
+from date_range_popover.exceptions import InvalidConfigurationError
+from PySide6.QtCore import QDate, QPoint, Qt
+from pytestqt.qtbot import QtBot
+
+
+def _index_of(calendar: MultiMonthCalendar, date: QDate, *, slot: int) -> int:
+    julians = cast(Any, calendar)._julians
+    start = slot * 42
+    return start + list(julians[start : start + 42]).index(date.toJulianDay())
+
+
+def _flags_for(calendar: MultiMonthCalendar, date: QDate, *, slot: int) -> int:
+    return int(cast(Any, calendar)._flags[_index_of(calendar, date, slot=slot)])
+
+
+def _click(qtbot: QtBot, calendar: MultiMonthCalendar, index: int) -> None:
+    qtbot.mouseClick(calendar, Qt.MouseButton.LeftButton, pos=calendar.cell_rect(index).center())
+
+
+@pytest.mark.parametrize(("months", "columns"), [(2, 2), (3, 3), (6, 3), (12, 4)])
+def test_layout_fits_requested_months(qtbot: QtBot, months: int, columns: int) -> None:
+    """Every month slot should map back to its own cells through one hit-test index."""
+    calendar = MultiMonthCalendar(months=months, columns=columns)
+    qtbot.addWidget(calendar)
+
+    last = months * 42 - 1
+    assert calendar.rect().contains(calendar.cell_rect(last))
+    assert calendar.index_at(calendar.cell_rect(last).center()) == last
+    assert calendar.index_at(QPoint(1, 1)) is None
+
+
+def test_range_band_continues_across_months(qtbot: QtBot) -> None:
+    """A range spanning a month boundary should be flagged in both months."""
+    calendar = MultiMonthCalendar(months=2)
+    qtbot.addWidget(calendar)
+    calendar.set_first_month(QDate(2024, 1, 1))
+    calendar.set_range(QDate(2024, 2, 10), QDate(2024, 1, 25))
+
+    assert _flags_for(calendar, QDate(2024, 1, 25), slot=0) & DayCellFlag.RANGE_START
+    assert _flags_for(calendar, QDate(2024, 1, 31), slot=0) & DayCellFlag.IN_RANGE
+    assert _flags_for(calendar, QDate(2024, 2, 1), slot=1) & DayCellFlag.IN_RANGE
+    assert _flags_for(calendar, QDate(2024, 2, 10), slot=1) & DayCellFlag.RANGE_END
+    assert calendar.selected_range == (QDate(2024, 1, 25), QDate(2024, 2, 10))
+
+
+def test_clicks_select_range_with_hover_preview(qtbot: QtBot) -> None:
+    """Hovering after the first click should preview the band before it is committed."""
+    calendar = MultiMonthCalendar(months=3)
+    qtbot.addWidget(calendar)
+    calendar.set_first_month(QDate(2024, 1, 1))
+    calendar.show()
+
+    end_index = _index_of(calendar, QDate(2024, 3, 5), slot=2)
+    _click(qtbot, calendar, _index_of(calendar, QDate(2024, 1, 20), slot=0))
+    calendar.reset_update_stats()
+    qtbot.mouseMove(calendar, calendar.cell_rect(end_index).center())
+    assert _flags_for(calendar, QDate(2024, 2, 15), slot=1) & DayCellFlag.IN_RANGE
+    stats = calendar.update_stats
+    assert 0 < stats.applied < stats.total
+
+    with qtbot.waitSignal(calendar.range_selected) as blocker:
+        _click(qtbot, calendar, end_index)
+    assert blocker.args == [QDate(2024, 1, 20), QDate(2024, 3, 5)]
+
+
+def test_disabled_days_are_not_clickable(qtbot: QtBot) -> None:
+    """Days outside the constraints should be flagged and ignore clicks."""
+    calendar = MultiMonthCalendar(months=2)
+    qtbot.addWidget(calendar)
+    calendar.set_first_month(QDate(2024, 1, 1))
+    calendar.set_constraints(min_date=QDate(2024, 1, 10), max_date=QDate(2024, 2, 20))
+    calendar.show()
+
+    blocked = _index_of(calendar, QDate(2024, 1, 5), slot=0)
+    assert _flags_for(calendar, QDate(2024, 1, 5), slot=0) & DayCellFlag.DISABLED
+    _click(qtbot, calendar, blocked)
+    assert calendar.selected_range == (None, None)
+    assert calendar.date_at(calendar.cell_rect(blocked).center()) == QDate(2024, 1, 5)
+
+
+def test_shift_months_moves_window(qtbot: QtBot) -> None:
+    """Shifting should load the next window of months."""
+    calendar = MultiMonthCalendar(months=6)
+    qtbot.addWidget(calendar)
+    calendar.set_first_month(QDate(2024, 3, 17))
+    calendar.shift_months(6)
+    assert calendar.first_month == QDate(2024, 9, 1)
+    assert calendar.months == 6
+
+
+@pytest.mark.parametrize(("months", "columns"), [(0, None), (13, None), (3, 4), (True, None)])
+def test_invalid_layouts_are_rejected(qapp: Any, months: int, columns: int | None) -> None:
+    """Month and column counts outside the supported range should raise."""
+    with pytest.raises(InvalidConfigurationError):
+        MultiMonthCalendar(months=months, columns=columns)
@@ -0,0 +1,54 @@
+"""Tests for cached calendar navigation icons."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from date_range_popover.components.calendar import CalendarWidget
+from date_range_popover.utils import svg_assets, svg_loader
+from PySide6.QtCore import QDate, QEvent, QSize
+from PySide6.QtWidgets import QApplication
+from pytestqt.qtbot import QtBot
+
+from date_range_popover import DateRangePicker
+
+
+def test_month_navigation_reuses_cached_icons(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Once the arrows are rendered, changing months must not read or parse SVGs."""
+    calendar = CalendarWidget()
+    qtbot.addWidget(calendar)
+    calendar.set_visible_month(QDate(2024, 3, 1))
+
+    def fail(source: str | Path) -> str | None:
+        raise AssertionError(f"unexpected read of {source}")
+
+    monkeypatch.setattr(svg_assets, "_read_source", fail)
+    hits = svg_loader.shared_icon_cache().stats().hits
+    for month in (4, 5, 4, 3):
+        calendar.set_visible_month(QDate(2024, month, 1))
+
+    assert svg_loader.shared_icon_cache().stats().hits > hits
+
+
+def test_picker_rebuilds_icons_only_when_the_ratio_changes(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A screen change with the same ratio is free; a new ratio re-renders once."""
+    picker = DateRangePicker()
+    qtbot.addWidget(picker)
+    internals = cast(Any, picker)
+    atlas = internals._icon_atlas
+
+    QApplication.sendEvent(picker, QEvent(QEvent.Type.ScreenChangeInternal))
+    assert internals._icon_atlas is atlas
+
+    for widget in (picker, internals._close_button):
+        monkeypatch.setattr(widget, "devicePixelRatioF", lambda: 2.0)
+    QApplication.sendEvent(picker, QEvent(QEvent.Type.ScreenChangeInternal))
+    assert internals._icon_atlas is not atlas
+    assert internals._icon_atlas.dpr == 2.0
+    assert internals._close_button.icon().pixmap(QSize(18, 18), 2.0).devicePixelRatio() == 2.0
@@ -0,0 +1,107 @@
+"""Tests for the single-widget painted day grid."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.calendar import CalendarPaintedDayView, CalendarWidget
+from date_range_popover.exceptions import InvalidConfigurationError
+from PySide6.QtCore import QDate, QPoint, Qt
+from PySide6.QtWidgets import QWidget
+from pytestqt.qtbot import QtBot
+
+
+def _index_of(view: CalendarPaintedDayView, date: QDate) -> int:
+    for index in range(42):
+        center = view.cell_rect(index).center()
+        if view.index_at(center) != index:
+            continue
+        if cast(Any, view)._states[index].date == date:
+            return index
+    raise AssertionError(f"{date.toString('yyyy-MM-dd')} is not part of the grid")
+
+
+def test_painted_view_emits_day_selected_on_click(qtbot: QtBot) -> None:
+    """Clicking a painted cell should emit the date under the cursor."""
+    view = CalendarPaintedDayView()
+    qtbot.addWidget(view)
+    view.update_days(
+        visible_month=QDate(2024, 6, 1),
+        today=QDate(2024, 6, 20),
+        selected_date=QDate(2024, 6, 3),
+    )
+    target = QDate(2024, 6, 14)
+    center = view.cell_rect(_index_of(view, target)).center()
+
+    with qtbot.waitSignal(view.day_selected, timeout=1000) as blocker:
+        qtbot.mouseClick(view, Qt.MouseButton.LeftButton, pos=center)
+
+    assert blocker.args == [target]
+    assert not view.grab().isNull()
+
+
+def test_painted_view_ignores_disabled_and_hidden_cells(qtbot: QtBot) -> None:
+    """Cells outside the bounds or the visible month must not emit selections."""
+    view = CalendarPaintedDayView()
+    qtbot.addWidget(view)
+    view.update_days(
+        visible_month=QDate(2024, 6, 1),
+        today=QDate(2024, 6, 20),
+        selected_date=QDate(2024, 6, 3),
+        max_date=QDate(2024, 6, 10),
+    )
+    emitted: list[QDate] = []
+    view.day_selected.connect(emitted.append)
+
+    disabled = view.cell_rect(_index_of(view, QDate(2024, 6, 20))).center()
+    qtbot.mouseClick(view, Qt.MouseButton.LeftButton, pos=disabled)
+    # June 2024 starts on a Saturday, so the first grid cell is a May date.
+    qtbot.mouseClick(view, Qt.MouseButton.LeftButton, pos=view.cell_rect(0).center())
+    qtbot.mouseClick(view, Qt.MouseButton.LeftButton, pos=QPoint(2, 2))
+
+    assert emitted == []
+
+
+def test_index_at_skips_grid_spacing(qtbot: QtBot) -> None:
+    """Hit testing should return ``None`` for the gaps between cells."""
+    view = CalendarPaintedDayView()
+    qtbot.addWidget(view)
+    first = view.cell_rect(0)
+    second = view.cell_rect(1)
+
+    assert view.index_at(first.center()) == 0
+    assert view.index_at(QPoint(first.right() + 1, first.center().y())) is None
+    assert view.index_at(second.topLeft()) == 1
+
+
+def test_calendar_widget_uses_painted_grid_when_requested(qtbot: QtBot) -> None:
+    """The painted grid should replace the 42 cell widgets entirely."""
+    classic = CalendarWidget()
+    painted = CalendarWidget(painted_day_grid=True)
+    qtbot.addWidget(classic)
+    qtbot.addWidget(painted)
+
+    assert isinstance(cast(Any, painted)._day_view, CalendarPaintedDayView)
+    classic_count = len(classic.findChildren(QWidget))
+    painted_count = len(painted.findChildren(QWidget))
+    assert classic_count - painted_count >= 42 * 2
+
+
+def test_picker_forwards_rendering_options(qtbot: QtBot) -> None:
+    """DatePickerConfig.rendering should reach the calendar widget."""
+    picker = DateRangePicker(DatePickerConfig(rendering=RenderingOptions(painted_day_grid=True)))
+    qtbot.addWidget(picker)
+
+    calendar = cast(Any, picker)._calendar
+    assert isinstance(calendar._day_view, CalendarPaintedDayView)
+
+
+def test_config_rejects_invalid_rendering_options() -> None:
+    """Rendering options must be a RenderingOptions instance with bool flags."""
+    with pytest.raises(InvalidConfigurationError, match="rendering"):
+        DatePickerConfig(rendering=cast(Any, {"painted_day_grid": True}))
+    with pytest.raises(InvalidConfigurationError, match="painted_day_grid"):
+        RenderingOptions(painted_day_grid=cast(Any, "yes"))
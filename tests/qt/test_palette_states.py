@@ -0,0 +1,156 @@
+"""Tests for the palette-driven hover and selection rendering path."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.buttons import ButtonStrip
+from date_range_popover.components.calendar.day_view import CalendarDayView
+from date_range_popover.components.inputs.input_with_icon import InputWithIcon
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.styles.style_registry import StyleRegistry
+from date_range_popover.styles.theme import ColorPalette
+from PySide6.QtCore import QDate, QEvent, QPointF
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtWidgets import QApplication, QWidget
+from pytestqt.qtbot import QtBot
+
+
+def _enter(widget: QWidget) -> None:
+    point = QPointF(widget.rect().center())
+    QApplication.sendEvent(widget, QEnterEvent(point, point, widget.mapToGlobal(point)))
+
+
+def _leave(widget: QWidget) -> None:
+    QApplication.sendEvent(widget, QEvent(QEvent.Type.Leave))
+
+
+def _day_view(qtbot: QtBot, *, palette_states: bool) -> CalendarDayView:
+    view = CalendarDayView(style=StyleRegistry().calendar_config(), palette_states=palette_states)
+    qtbot.addWidget(view)
+    today = QDate.currentDate()
+    first = QDate(today.year(), today.month(), 1)
+    view.update_days(
+        visible_month=first,
+        today=today,
+        selected_date=today,
+        range_start=first.addDays(1),
+        range_end=first.addDays(5),
+    )
+    view.show()
+    return view
+
+
+def test_strip_hover_recolours_without_restyling(qtbot: QtBot) -> None:
+    """Hovering should only change the painted text colour."""
+    palette = ColorPalette()
+    strip = ButtonStrip(palette_states=True)
+    qtbot.addWidget(strip)
+    strip.apply_palette(palette)
+    button = strip.custom_range_button
+    sheet = button.styleSheet()
+
+    _enter(button)
+    hover = cast(Any, button)._text_color
+    _leave(button)
+    default = cast(Any, button)._text_color
+
+    assert (hover, default) == (palette.button_hover_color, palette.button_default_color)
+    assert button.styleSheet() == sheet
+
+
+def test_strip_renders_like_stylesheet_strip(qtbot: QtBot) -> None:
+    """Both paths should draw the selected and default buttons identically."""
+    images = []
+    for palette_states in (False, True):
+        strip = ButtonStrip(palette_states=palette_states)
+        qtbot.addWidget(strip)
+        strip.apply_palette(ColorPalette())
+        strip.set_selected_button("custom_range")
+        strip.show()
+        qtbot.waitExposed(strip)
+        images.append(strip.grab().toImage())
+
+    assert images[0] == images[1]
+
+
+def test_day_cells_paint_states_without_stylesheets(qtbot: QtBot) -> None:
+    """Palette-mode cells carry no stylesheets and repaint on hover."""
+    view = _day_view(qtbot, palette_states=True)
+    cells = cast(Any, view)._cells
+    assert not any(cell._button.styleSheet() for cell in cells)
+
+    cell = next(cell for cell in cells if cell._date.day() == 15)
+    before = cell._button.grab().toImage()
+    _enter(cell._button)
+    hovered = cell._button.grab().toImage()
+    _leave(cell._button)
+
+    assert hovered != before
+    assert cell._button.grab().toImage() == before
+
+
+def test_day_cells_render_like_stylesheet_cells(qtbot: QtBot) -> None:
+    """The painted range, selection and today cells should match the stylesheet path."""
+    inline = _day_view(qtbot, palette_states=False).grab().toImage()
+    painted = _day_view(qtbot, palette_states=True).grab().toImage()
+
+    different = sum(
+        inline.pixel(x, y) != painted.pixel(x, y)
+        for y in range(inline.height())
+        for x in range(inline.width())
+    )
+    # Only anti-aliased underline edges may differ.
+    assert different <= 8
+
+
+def test_input_paints_border_states(qtbot: QtBot) -> None:
+    """Hover and focus should change the painted frame, not the stylesheet."""
+    style = StyleRegistry().input_config()
+    widget = InputWithIcon(style=style, palette_states=True)
+    qtbot.addWidget(widget)
+    widget.show()
+    internals = cast(Any, widget)
+
+    assert widget.styleSheet() == ""
+    assert internals._frame == (style.background, style.border_default, 1)
+    _enter(widget)
+    assert internals._frame == (style.background, style.border_hover, 1)
+    _leave(widget)
+    assert internals._frame == (style.background, style.border_default, 1)
+    assert widget.styleSheet() == ""
+
+
+def test_letter_icon_recolours_without_restyling(qtbot: QtBot) -> None:
+    """Inputs without an SVG icon repaint the letter in the hover colour."""
+    style = StyleRegistry().input_config()
+    widget = InputWithIcon(style=style, palette_states=True)
+    qtbot.addWidget(widget)
+    label = cast(Any, widget)._icon_widget
+    sheet = label.styleSheet()
+
+    _enter(widget)
+    assert label._text_color == style.icon_hover_color
+    assert label.styleSheet() == sheet
+
+
+def test_picker_forwards_palette_states(qtbot: QtBot) -> None:
+    """The rendering option should reach every palette-aware component."""
+    picker = DateRangePicker(DatePickerConfig(rendering=RenderingOptions(palette_states=True)))
+    qtbot.addWidget(picker)
+    internals = cast(Any, picker)
+
+    assert internals._button_strip._palette_states
+    assert all(field._palette_states for field in internals._date_time_selector._date_inputs)
+    assert internals._calendar._day_view._cells[0]._painted_button is not None
+
+
+def test_rendering_options_validate_palette_states() -> None:
+    """``palette_states`` must be a bool and excludes the compiled stylesheet."""
+    with pytest.raises(InvalidConfigurationError, match="palette_states must be a bool"):
+        RenderingOptions(palette_states=cast(Any, "yes"))
+    with pytest.raises(InvalidConfigurationError, match="cannot be combined"):
+        RenderingOptions(palette_states=True, compiled_stylesheet=True)
@@ -0,0 +1,134 @@
+"""Tests for the pre-built picker pool and in-place reconfiguration."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, DateRange, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.api.pool import DateRangePickerPool, PickerPoolStats
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.managers.state_manager import PickerMode
+from date_range_popover.styles.theme import ColorPalette, Theme
+from PySide6.QtCore import QDate
+from PySide6.QtWidgets import QWidget
+from pytestqt.qtbot import QtBot
+
+
+def _range_config(start: QDate, end: QDate, **kwargs: Any) -> DatePickerConfig:
+    return DatePickerConfig(
+        initial_range=DateRange(start_date=start, end_date=end),
+        mode=PickerMode.CUSTOM_RANGE,
+        **kwargs,
+    )
+
+
+def test_reconfigure_matches_a_freshly_built_picker(qtbot: QtBot) -> None:
+    """Bounds, theme, mode, selection and input texts all follow the new config."""
+    picker = DateRangePicker()
+    qtbot.addWidget(picker)
+    theme = Theme(palette=ColorPalette(window_background="#101010"))
+    config = _range_config(
+        QDate(2024, 6, 1),
+        QDate(2024, 6, 10),
+        min_date=QDate(2024, 1, 1),
+        max_date=QDate(2024, 12, 31),
+        theme=theme,
+    )
+
+    picker.reconfigure(config)
+
+    internals = cast(Any, picker)
+    assert picker.config is config
+    assert picker.theme is theme
+    assert picker.selected_range == DateRange(QDate(2024, 6, 1), QDate(2024, 6, 10))
+    assert internals._state_manager.state.mode is PickerMode.CUSTOM_RANGE
+    texts = [field.input.text() for field in internals._date_time_selector._date_inputs]
+    assert texts == ["2024-06-01", "2024-06-10"]
+
+    picker.reconfigure(DatePickerConfig(initial_date=QDate(2024, 2, 3)))
+    assert internals._state_manager.state.mode is PickerMode.DATE
+    assert picker.selected_date == QDate(2024, 2, 3)
+
+
+def test_reconfigure_rejects_structural_changes(qtbot: QtBot) -> None:
+    """Rendering options and the time step are fixed once the tree is built."""
+    picker = DateRangePicker()
+    qtbot.addWidget(picker)
+
+    with pytest.raises(InvalidConfigurationError):
+        picker.reconfigure(DatePickerConfig(time_step_minutes=30))
+    with pytest.raises(InvalidConfigurationError):
+        picker.reconfigure(DatePickerConfig(rendering=RenderingOptions(painted_day_grid=True)))
+    with pytest.raises(InvalidConfigurationError):
+        picker.reconfigure(cast(Any, object()))
+
+
+def test_prewarmed_pickers_are_handed_out_as_hits(qtbot: QtBot) -> None:
+    """Pre-warming fills the pool on the event loop; acquiring reuses those pickers."""
+    pool = DateRangePickerPool(size=2)
+    pool.prewarm()
+    qtbot.waitUntil(lambda: pool.stats().idle == 2, timeout=5000)
+
+    config = _range_config(QDate(2024, 3, 4), QDate(2024, 3, 8))
+    picker = pool.acquire(config)
+    qtbot.addWidget(picker)
+
+    assert not picker.isVisible()
+    assert picker.selected_range == DateRange(QDate(2024, 3, 4), QDate(2024, 3, 8))
+    assert pool.stats() == PickerPoolStats(hits=1, misses=0, prewarmed=2, idle=1, max_size=2)
+
+    mismatched = pool.acquire(DatePickerConfig(time_step_minutes=5))
+    qtbot.addWidget(mismatched)
+    assert mismatched.config.time_step_minutes == 5
+    assert pool.stats().misses == 1
+    pool.clear()
+
+
+def test_release_detaches_the_host_and_bounds_the_pool(qtbot: QtBot) -> None:
+    """Released pickers lose host connections and are reset on their next use."""
+    pool = DateRangePickerPool(size=1)
+    assert pool.config.mode is PickerMode.DATE and pool.max_size == 1
+    host = QWidget()
+    qtbot.addWidget(host)
+    picker = pool.acquire()
+    picker.setParent(host, picker.windowFlags())
+    received: list[object] = []
+    picker.date_selected.connect(received.append)
+    picker.register_selection_callback(received.append)
+    picker.select_date(QDate(2024, 5, 5))
+    received.clear()
+
+    pool.release(picker)
+    pool.release(picker)
+    assert picker.parent() is None and pool.stats().idle == 1
+
+    again = pool.acquire(DatePickerConfig(initial_date=QDate(2024, 7, 7)))
+    assert again is picker
+    assert again.selected_date == QDate(2024, 7, 7)
+    assert received == []
+
+    extra = DateRangePicker()
+    pool.release(again)
+    pool.release(extra)
+    with qtbot.waitSignal(extra.destroyed, timeout=1000):
+        pass
+    assert pool.stats().idle == 1
+    pool.clear()
+    assert pool.stats().idle == 0
+
+
+def test_pool_size_must_be_positive() -> None:
+    with pytest.raises(InvalidConfigurationError):
+        DateRangePickerPool(size=0)
+
+
+def test_prewarm_count_is_capped_by_the_pool_size(qtbot: QtBot) -> None:
+    pool = DateRangePickerPool(size=1)
+    pool.prewarm(5)
+    qtbot.waitUntil(lambda: pool.stats().prewarmed == 1, timeout=5000)
+    qtbot.wait(20)
+    pool.prewarm()
+    assert pool.stats().idle == 1
+    pool.clear()
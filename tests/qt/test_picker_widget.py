@@ -7,6 +7,7 @@ from typing import Any, cast
 from date_range_popover.api.config import DatePickerConfig, DateRange
 from date_range_popover.api.picker import DateRangePicker
 from date_range_popover.managers.state_manager import PickerMode
+from date_range_popover.styles.theme import Theme
 from PySide6.QtCore import QDate
 from pytestqt.qtbot import QtBot
 
@@ -71,3 +72,13 @@ def test_cancel_button_emits_cancelled_signal(qtbot: QtBot) -> None:
 
     with qtbot.waitSignal(picker.cancelled, timeout=1000):
         cast(Any, picker)._cancel_button.click()
+
+
+def test_pickers_share_style_registry_per_theme(qtbot: QtBot) -> None:
+    """Pickers with equal themes should reuse one registry and its rendered sheets."""
+    pickers = [DateRangePicker(DatePickerConfig(theme=Theme())) for _ in range(3)]
+    for picker in pickers:
+        qtbot.addWidget(picker)
+
+    registries = {id(cast(Any, picker)._style_manager._registry) for picker in pickers}
+    assert len(registries) == 1
@@ -0,0 +1,54 @@
+"""Time inputs across pickers share one completer per step size and theme."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from date_range_popover.api.config import DatePickerConfig
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.inputs import CUSTOM_DATE_RANGE, DateTimeSelector
+from date_range_popover.styles.theme import ColorPalette
+from PySide6.QtWidgets import QCompleter
+from pytestqt.qtbot import QtBot
+
+
+def _completers(selector: DateTimeSelector) -> set[QCompleter]:
+    return {
+        cast(QCompleter, field.input.completer())
+        for field in cast(Any, selector)._all_time_inputs()
+    }
+
+
+def _picker_completers(picker: DateRangePicker) -> set[QCompleter]:
+    return _completers(cast(Any, picker)._date_time_selector)
+
+
+def test_selectors_share_one_completer(qtbot: QtBot) -> None:
+    """Selectors with the same step and theme should reuse one unparented completer."""
+    selectors = [DateTimeSelector(mode=CUSTOM_DATE_RANGE) for _ in range(3)]
+    for selector in selectors:
+        qtbot.addWidget(selector)
+
+    assert len(set.union(*(_completers(selector) for selector in selectors))) == 1
+    assert not any(selector.findChildren(QCompleter) for selector in selectors)
+
+
+def test_completer_count_stays_flat_as_pickers_grow(qtbot: QtBot) -> None:
+    """Adding pickers should not add completers."""
+    pickers = [DateRangePicker(DatePickerConfig(time_step_minutes=20)) for _ in range(5)]
+    for picker in pickers:
+        qtbot.addWidget(picker)
+
+    assert len(set.union(*(_picker_completers(picker) for picker in pickers))) == 1
+
+
+def test_palette_change_moves_inputs_to_the_themed_completer(qtbot: QtBot) -> None:
+    """A palette change should switch inputs to the completer for the new popup style."""
+    selector = DateTimeSelector(mode=CUSTOM_DATE_RANGE)
+    qtbot.addWidget(selector)
+    (light,) = _completers(selector)
+
+    selector.apply_palette(ColorPalette(time_popup_background="#202020"))
+    (dark,) = _completers(selector)
+    assert dark is not light
+    assert "#202020" in dark.popup().styleSheet()
@@ -0,0 +1,126 @@
+"""Tests for stacked date/time input layouts."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.inputs import (
+    CUSTOM_DATE_RANGE,
+    GO_TO_DATE,
+    DateTimeSelector,
+    InputWithIcon,
+)
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.styles.style_registry import StyleRegistry
+from date_range_popover.styles.theme import ColorPalette
+from PySide6.QtCore import QDate, QEvent, QPoint, QTime
+from PySide6.QtWidgets import QApplication, QCompleter
+from pytestqt.qtbot import QtBot
+
+
+def _selector(qtbot: QtBot, *, stacked: bool) -> DateTimeSelector:
+    selector = DateTimeSelector(
+        primary_date=QDate(2024, 5, 1),
+        secondary_date=QDate(2024, 5, 9),
+        primary_time=QTime(9, 30),
+        stacked_layouts=stacked,
+    )
+    qtbot.addWidget(selector)
+    selector.resize(262, 84)
+    selector.show()
+    return selector
+
+
+def _geometry(selector: DateTimeSelector) -> list[tuple[tuple[int, int], str]]:
+    internals = cast(Any, selector)
+    inputs = [*internals._date_inputs, *internals._time_inputs]
+    return sorted(
+        (field.mapTo(selector, QPoint(0, 0)).toTuple(), field.input.text()) for field in inputs
+    )
+
+
+def test_switching_modes_reuses_the_inputs(qtbot: QtBot) -> None:
+    """Each mode's inputs are built once; toggling only swaps the visible page."""
+    selector = _selector(qtbot, stacked=True)
+    go_to_inputs = list(cast(Any, selector)._date_inputs)
+
+    selector.set_mode(CUSTOM_DATE_RANGE)
+    range_inputs = list(cast(Any, selector)._date_inputs)
+    selector.set_mode(GO_TO_DATE)
+    selector.set_mode(CUSTOM_DATE_RANGE)
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    assert cast(Any, selector)._date_inputs == range_inputs
+    assert len(selector.findChildren(InputWithIcon)) == 6
+    assert len({field.input.completer() for field in cast(Any, selector)._all_time_inputs()}) == 1
+    assert not any(field.isVisible() for field in go_to_inputs)
+    assert all(field.isVisible() for field in range_inputs)
+
+
+def test_stacked_pages_match_rebuilt_layouts(qtbot: QtBot) -> None:
+    """Input positions and seeded texts are the same as with rebuilt rows."""
+    rebuilt = _selector(qtbot, stacked=False)
+    stacked = _selector(qtbot, stacked=True)
+    for mode in (CUSTOM_DATE_RANGE, GO_TO_DATE, CUSTOM_DATE_RANGE):
+        for selector in (rebuilt, stacked):
+            selector.set_mode(mode)
+        qtbot.wait(1)
+        assert _geometry(stacked) == _geometry(rebuilt)
+
+
+def test_switching_back_reseeds_texts_without_emitting(qtbot: QtBot) -> None:
+    """A page shown again gets the default texts, silently, like a rebuilt row."""
+    selector = _selector(qtbot, stacked=True)
+    selector.set_mode(CUSTOM_DATE_RANGE)
+    cast(Any, selector)._date_inputs[0].set_text("2024-05-03")
+    selector.set_mode(GO_TO_DATE)
+
+    with qtbot.assertNotEmitted(selector.date_input_valid):
+        selector.set_mode(CUSTOM_DATE_RANGE)
+    assert [field.input.text() for field in cast(Any, selector)._date_inputs] == [
+        "2024-05-01",
+        "2024-05-09",
+    ]
+
+
+def test_styles_reach_hidden_pages(qtbot: QtBot) -> None:
+    """Palette and input style changes also restyle the page that is not shown."""
+    selector = _selector(qtbot, stacked=True)
+    selector.set_mode(CUSTOM_DATE_RANGE)
+    selector.set_mode(GO_TO_DATE)
+    style = replace(StyleRegistry().input_config(), border_default="#123456")
+    selector.apply_input_style(style)
+    selector.apply_palette(ColorPalette(time_popup_background="#654321"))
+
+    hidden = cast(Any, selector)._pages[CUSTOM_DATE_RANGE]
+    assert all(field._style == style for field in hidden.date_inputs)
+    completer = cast(QCompleter, hidden.time_inputs[0].input.completer())
+    assert "#654321" in completer.popup().styleSheet()
+
+
+def test_rebuilt_layouts_delete_their_old_inputs(qtbot: QtBot) -> None:
+    """Rebuilding rows must not leave the previous mode's inputs behind."""
+    selector = _selector(qtbot, stacked=False)
+    for mode in (CUSTOM_DATE_RANGE, GO_TO_DATE, CUSTOM_DATE_RANGE):
+        selector.set_mode(mode)
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    assert len(selector.findChildren(InputWithIcon)) == 4
+    assert not selector.findChildren(QCompleter)
+
+
+def test_picker_forwards_stacked_inputs(qtbot: QtBot) -> None:
+    picker = DateRangePicker(
+        DatePickerConfig(rendering=RenderingOptions(stacked_date_time_inputs=True))
+    )
+    qtbot.addWidget(picker)
+    assert cast(Any, picker)._date_time_selector._stacked_layouts is True
+
+
+def test_rendering_options_validate_stacked_inputs() -> None:
+    with pytest.raises(InvalidConfigurationError, match="stacked_date_time_inputs"):
+        RenderingOptions(stacked_date_time_inputs=cast(Any, "yes"))
@@ -0,0 +1,181 @@
+"""Tests for swapping a live picker's theme."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.managers.state_manager import PickerMode
+from date_range_popover.styles.theme import ColorPalette, LayoutConfig, Theme
+from date_range_popover.utils.icon_atlas import find_icon_atlas
+from pytestqt.qtbot import QtBot
+
+LIGHT = Theme(
+    palette=ColorPalette(
+        window_background="#ffffff",
+        button_container_background="#ffffff",
+        track_background="#d0d0d0",
+        track_indicator_color="#202020",
+        button_selected_color="#202020",
+        button_default_color="#404040",
+        calendar_background="#ffffff",
+        calendar_day_text_color="#101010",
+        calendar_header_text_color="#101010",
+    )
+)
+
+
+def _picker(qtbot: QtBot, *, theme: Theme | None = None, compiled: bool = False) -> DateRangePicker:
+    config = DatePickerConfig(
+        theme=theme or Theme(), rendering=RenderingOptions(compiled_stylesheet=compiled)
+    )
+    picker = DateRangePicker(config)
+    qtbot.addWidget(picker)
+    picker.show()
+    return picker
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_swapped_picker_renders_like_a_fresh_one(qtbot: QtBot, compiled: bool) -> None:
+    """A live swap should end up with the pixels of a picker built with the theme."""
+    swapped = _picker(qtbot, compiled=compiled)
+    fresh = _picker(qtbot, theme=LIGHT, compiled=compiled)
+    swapped.set_theme(LIGHT)
+    qtbot.waitExposed(swapped)
+
+    assert swapped.theme is LIGHT
+    for name in ("_header_strip", "_button_strip", "_sliding_track", "_calendar"):
+        expected = getattr(fresh, name).grab().toImage()
+        assert getattr(swapped, name).grab().toImage() == expected, name
+
+
+def test_swap_only_restyles_affected_components(qtbot: QtBot) -> None:
+    """A calendar-only change should leave every other component alone."""
+    picker = _picker(qtbot)
+    internals = cast(Any, picker)
+    strip_sheet = internals._button_strip.styleSheet()
+    calls: list[str] = []
+    for name in ("apply_header", "apply_button_strip", "apply_sliding_track", "apply_calendar"):
+        original = getattr(internals._style_manager, name)
+        setattr(
+            internals._style_manager,
+            name,
+            lambda widget, _name=name, _original=original: (calls.append(_name), _original(widget)),
+        )
+
+    diff = picker.set_theme(Theme(palette=ColorPalette(calendar_day_text_color="#123456")))
+
+    assert diff.restyle == {"calendar"}
+    assert calls == ["apply_calendar"]
+    assert internals._button_strip.styleSheet() == strip_sheet
+
+
+def test_swap_restyles_calendar_navigation_hover(qtbot: QtBot) -> None:
+    """The month arrows should pick up a new hover colour on a live swap."""
+    picker = _picker(qtbot)
+    navigation = cast(Any, picker)._calendar._navigation
+
+    picker.set_theme(Theme(palette=ColorPalette(calendar_day_hover_background="#ff0000")))
+
+    for button in (navigation._previous_button, navigation._next_button):
+        assert "#ff0000" in button.styleSheet()
+        assert "#2e2e2e" not in button.styleSheet()
+
+
+def test_swap_runs_inside_one_batch(qtbot: QtBot) -> None:
+    """Updates should stay suspended for the whole swap."""
+    picker = _picker(qtbot)
+    internals = cast(Any, picker)
+    seen: list[bool] = []
+    original = internals._restyle_components
+
+    def record(targets: frozenset[str]) -> None:
+        seen.append(picker.updatesEnabled())
+        original(targets)
+
+    internals._restyle_components = record
+    picker.set_theme(LIGHT)
+
+    assert seen == [False]
+    assert picker.updatesEnabled()
+
+
+def test_layout_tokens_relayout_the_picker(qtbot: QtBot) -> None:
+    """Geometry tokens should resize the window and move the track indicator."""
+    picker = _picker(qtbot)
+    picker.set_mode(PickerMode.CUSTOM_RANGE)
+    layout = LayoutConfig(
+        window_min_width=340,
+        window_min_height_custom_range=660,
+        button_gap=30,
+        action_button_height=40,
+    )
+
+    diff = picker.set_theme(Theme(layout=layout))
+
+    internals = cast(Any, picker)
+    assert "window" in diff.relayout
+    assert picker.width() == 340
+    assert picker.height() == 660
+    assert internals._sliding_track.current_position == layout.date_indicator_width + 30
+    assert internals._cancel_button.height() == 40
+
+
+@pytest.mark.parametrize("painted", [False, True])
+def test_calendar_layout_tokens_resize_the_calendar(qtbot: QtBot, painted: bool) -> None:
+    """Calendar geometry should match a picker built with the new layout."""
+    layout = LayoutConfig(
+        calendar_day_cell_size=40,
+        calendar_grid_spacing=2,
+        calendar_top_margin=8,
+        calendar_day_cell_radius=4,
+    )
+    rendering = RenderingOptions(painted_day_grid=painted)
+    swapped = DateRangePicker(DatePickerConfig(rendering=rendering))
+    fresh = DateRangePicker(DatePickerConfig(theme=Theme(layout=layout), rendering=rendering))
+    for picker in (swapped, fresh):
+        qtbot.addWidget(picker)
+        picker.show()
+    calendar = cast(Any, swapped)._calendar
+    calendar._switch_view(calendar._view_mode.MONTH)
+
+    diff = swapped.set_theme(Theme(layout=layout))
+    calendar._switch_view(calendar._view_mode.DAY)
+    fresh_calendar = cast(Any, fresh)._calendar
+    qtbot.waitUntil(lambda: calendar.size() == fresh_calendar.size())
+
+    assert "calendar" in diff.relayout
+    if not painted:
+        assert calendar._day_view._cells[0].size().width() == 40
+    assert calendar.grab().toImage() == fresh_calendar.grab().toImage()
+
+
+def test_equal_theme_is_a_no_op(qtbot: QtBot) -> None:
+    """Swapping to an equal theme should keep the current registry."""
+    picker = _picker(qtbot)
+    registry = cast(Any, picker)._style_manager._registry
+
+    assert picker.set_theme(Theme()).is_empty
+    assert cast(Any, picker)._style_manager._registry is registry
+
+
+def test_swap_keeps_other_pickers_icon_atlases(qtbot: QtBot) -> None:
+    """A theme swap must not unregister atlases or icons another picker still uses."""
+    atlas = cast(Any, _picker(qtbot))._icon_atlas
+    swapped = _picker(qtbot)
+    swapped.set_theme(LIGHT)
+
+    retired = atlas.variants - cast(Any, swapped)._icon_atlas.variants
+    assert retired
+    for variant in retired:
+        assert find_icon_atlas(variant, atlas.dpr) is atlas
+
+
+def test_set_theme_rejects_non_themes(qtbot: QtBot) -> None:
+    """Only ``Theme`` instances can be swapped in."""
+    picker = _picker(qtbot)
+    with pytest.raises(InvalidConfigurationError, match="theme"):
+        picker.set_theme(cast(Any, {"palette": {}}))
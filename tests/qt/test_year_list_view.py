@@ -0,0 +1,114 @@
+"""Tests for the scrollable, model-backed year picker."""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from date_range_popover.api.config import DatePickerConfig, RenderingOptions
+from date_range_popover.api.picker import DateRangePicker
+from date_range_popover.components.calendar import (
+    CalendarWidget,
+    CalendarYearListView,
+    YearListModel,
+)
+from date_range_popover.components.calendar.year_list_view import YEAR_ROLE
+from date_range_popover.exceptions import InvalidConfigurationError, InvalidDateError
+from PySide6.QtCore import QDate, Qt
+from pytestqt.qtbot import QtBot
+
+
+def test_model_derives_rows_from_bounds(qapp: Any) -> None:
+    """The model should expose one row per year without storing them."""
+    model = YearListModel(1990, 2030)
+    assert model.rowCount() == 41
+    assert model.data(model.index(0, 0)) == "1990"
+    assert model.data(model.index(40, 0), YEAR_ROLE) == 2030
+    assert model.data(model.index(41, 0)) is None
+    assert model.row_for_year(2000) == 10
+    assert model.row_for_year(1989) is None
+
+    model.set_year_bounds(1, 9999)
+    assert model.rowCount() == 9999
+
+
+def test_model_rejects_invalid_bounds(qapp: Any) -> None:
+    """Reversed or out-of-range bounds should raise ``InvalidDateError``."""
+    with pytest.raises(InvalidDateError):
+        YearListModel(2030, 1990)
+    with pytest.raises(InvalidDateError):
+        YearListModel(0, 10)
+
+
+def test_year_range_scrolls_to_start_year(qtbot: QtBot) -> None:
+    """``set_year_range`` should bring the start year to the top of the list."""
+    view = CalendarYearListView()
+    qtbot.addWidget(view)
+    view.show()
+
+    view.set_year_range(2021, current_year=2024)
+    assert view.visible_years() == (2021, 2040)
+    assert view.current_year == 2024
+
+
+def test_jump_to_year_respects_bounds(qtbot: QtBot) -> None:
+    """Jumping should scroll to in-range years and ignore the rest."""
+    view = CalendarYearListView()
+    qtbot.addWidget(view)
+    view.show()
+    view.set_year_bounds(1900, 2100)
+
+    assert view.jump_to_year(2075) is True
+    first, last = view.visible_years()
+    assert first <= 2075 <= last
+    assert view.current_year == 2075
+    assert view.jump_to_year(2500) is False
+    assert view.current_year == 2075
+
+
+def test_typed_year_is_selected(qtbot: QtBot) -> None:
+    """Pressing Enter in the jump field should emit the typed year."""
+    view = CalendarYearListView()
+    qtbot.addWidget(view)
+    view.show()
+    field = cast(Any, view)._jump_field
+
+    with qtbot.waitSignal(view.year_selected) as blocker:
+        qtbot.keyClicks(field, "1969")
+        qtbot.keyClick(field, Qt.Key.Key_Return)
+    assert blocker.args == [1969]
+    assert field.text() == ""
+
+
+def test_calendar_uses_year_list_within_constraints(qtbot: QtBot) -> None:
+    """The calendar should bound the list by its min/max dates and follow selections."""
+    calendar = CalendarWidget(scrollable_year_view=True)
+    qtbot.addWidget(calendar)
+    calendar.show()
+    calendar.set_constraints(min_date=QDate(1950, 1, 1), max_date=QDate(2050, 12, 31))
+    calendar.set_visible_month(QDate(2024, 6, 1))
+    internals = cast(Any, calendar)
+    internals._on_header_clicked()
+    internals._on_header_clicked()
+
+    year_view = internals._year_view
+    assert isinstance(year_view, CalendarYearListView)
+    assert (year_view.model.first_year, year_view.model.last_year) == (1950, 2050)
+
+    year_view.year_selected.emit(1961)
+    assert internals._visible_month == QDate(1961, 6, 1)
+
+
+def test_picker_forwards_scrollable_year_option(qtbot: QtBot) -> None:
+    """The picker should pass ``scrollable_year_picker`` to its calendar."""
+    picker = DateRangePicker(
+        DatePickerConfig(rendering=RenderingOptions(scrollable_year_picker=True))
+    )
+    qtbot.addWidget(picker)
+    assert cast(Any, picker)._calendar._scrollable_year_view is True
+
+
+def test_rendering_options_reject_non_bool_scrollable_year_picker() -> None:
+    """``scrollable_year_picker`` must be a real bool."""
+    with pytest.raises(InvalidConfigurationError, match="scrollable_year_picker"):
+        RenderingOptions(scrollable_year_picker=cast(Any, "yes"))
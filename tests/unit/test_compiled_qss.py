@@ -0,0 +1,94 @@
+"""Tests for the theme-compiled picker stylesheet."""
+
+from __future__ import annotations
+
+from itertools import product
+
+import pytest
+from date_range_popover.components.calendar.day_cell import resolve_day_cell_appearance
+from date_range_popover.styles.compiled_qss import (
+    DAY_CELL_STATES,
+    INPUT_STATES,
+    ROOT_OBJECT_NAME,
+    STATE_PROPERTY,
+    compile_stylesheet,
+    day_cell_state,
+    day_cell_style,
+    set_style_property,
+)
+from date_range_popover.styles.style_registry import StyleRegistry
+from date_range_popover.styles.theme import ColorPalette, Theme
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+@pytest.mark.parametrize("flags", list(product([False, True], repeat=5)))
+def test_day_cell_states_match_resolved_appearance(
+    flags: tuple[bool, bool, bool, bool, bool],
+) -> None:
+    """Every flag combination should compile to the colours the inline path resolves."""
+    is_selected, is_disabled, is_range_start, is_range_end, is_in_range = flags
+    style = StyleRegistry().calendar_config()
+    appearance = resolve_day_cell_appearance(
+        style,
+        is_selected=is_selected,
+        is_disabled=is_disabled,
+        is_range_start=is_range_start,
+        is_range_end=is_range_end,
+        is_in_range=is_in_range,
+    )
+    state = day_cell_state(
+        is_selected=is_selected,
+        is_disabled=is_disabled,
+        is_range_start=is_range_start,
+        is_range_end=is_range_end,
+        is_in_range=is_in_range,
+    )
+    compiled = day_cell_style(style, state, radius=8)
+
+    assert state in DAY_CELL_STATES
+    assert (
+        compiled.background,
+        compiled.text_color,
+        compiled.hover_background,
+        compiled.hover_text_color,
+    ) == (
+        appearance.background,
+        appearance.text_color,
+        appearance.hover_background,
+        appearance.hover_text_color,
+    )
+
+
+def test_compiled_stylesheet_covers_every_state() -> None:
+    """The sheet should be scoped to the root and carry a rule per property state."""
+    registry = StyleRegistry(Theme(palette=ColorPalette(input_border_focus="#123456")))
+    sheet = compile_stylesheet(
+        registry.theme,
+        calendar=registry.calendar_config(),
+        input_style=registry.input_config(),
+    )
+
+    assert sheet.startswith(f"#{ROOT_OBJECT_NAME}, #{ROOT_OBJECT_NAME} *")
+    for state in (*DAY_CELL_STATES, *INPUT_STATES):
+        assert f'[{STATE_PROPERTY}="{state}"]' in sheet
+    assert "border: 2px solid #123456;" in sheet
+
+
+def test_registry_caches_compiled_stylesheet() -> None:
+    """The registry should compile once and recompile after a style is re-registered."""
+    registry = StyleRegistry()
+    sheet = registry.compiled_stylesheet()
+    assert registry.compiled_stylesheet() is sheet
+
+    registry.register_input_style("default", registry.input_config())
+    assert registry.compiled_stylesheet() is not sheet
+    assert registry.compiled_stylesheet() == sheet
+
+
+def test_set_style_property_only_repolishes_changes(qapp: QApplication) -> None:
+    """Re-applying the current value should be a no-op."""
+    widget = QWidget()
+    assert set_style_property(widget, STATE_PROPERTY, "selected") is True
+    assert widget.property(STATE_PROPERTY) == "selected"
+    assert set_style_property(widget, STATE_PROPERTY, "selected") is False
+    assert set_style_property(widget, STATE_PROPERTY, "default") is True
@@ -0,0 +1,137 @@
+"""Tests for the pure day-grid state helpers."""
+
+from __future__ import annotations
+
+import pytest
+from date_range_popover.core import day_grid
+from date_range_popover.core.day_grid import (
+    CellUpdateStats,
+    DayCellFlag,
+    compute_day_flags,
+    make_day_cell_record,
+    numpy_available,
+    pack_day_flags,
+)
+from date_range_popover.exceptions import ValidationError
+
+
+def test_pack_day_flags_sets_expected_bits() -> None:
+    """Each boolean should map onto its own flag bit."""
+    flags = pack_day_flags(in_current_month=True, is_selected=True, is_today=True)
+
+    assert flags == DayCellFlag.IN_MONTH | DayCellFlag.SELECTED | DayCellFlag.TODAY
+    assert pack_day_flags(in_current_month=False) == DayCellFlag.NONE
+    every_flag = pack_day_flags(
+        in_current_month=True,
+        is_selected=True,
+        is_disabled=True,
+        is_range_start=True,
+        is_range_end=True,
+        is_in_range=True,
+        is_today=True,
+    )
+    assert every_flag == sum(DayCellFlag)
+
+
+def test_hidden_cells_share_a_single_record() -> None:
+    """Cells outside the visible month render identically and must compare equal."""
+    first = make_day_cell_record(30, pack_day_flags(in_current_month=False, is_today=True), 1)
+    second = make_day_cell_record(2, pack_day_flags(in_current_month=False), 1)
+
+    assert first == second
+    assert first != make_day_cell_record(2, pack_day_flags(in_current_month=False), 2)
+
+
+def test_cell_update_stats_total() -> None:
+    """The total should sum applied and skipped updates."""
+    assert CellUpdateStats(applied=3, skipped=39).total == 42
+
+
+def _grid() -> tuple[list[int], list[int]]:
+    julian_days = list(range(2_460_000, 2_460_042))
+    in_month = [0] * 5 + [1] * 30 + [0] * 7
+    return julian_days, in_month
+
+
+def test_compute_day_flags_marks_states() -> None:
+    """Selection, bounds, range and today should all be derived from ordinals."""
+    julian_days, in_month = _grid()
+    flags = compute_day_flags(
+        julian_days,
+        in_month,
+        selected=2_460_010,
+        today=2_460_011,
+        range_start=2_460_020,
+        range_end=2_460_015,
+        min_julian=2_460_003,
+        max_julian=2_460_030,
+    )
+
+    assert flags[0] == DayCellFlag.DISABLED
+    assert flags[10] == DayCellFlag.IN_MONTH | DayCellFlag.SELECTED
+    assert flags[11] == DayCellFlag.IN_MONTH | DayCellFlag.TODAY
+    assert flags[15] == DayCellFlag.IN_MONTH | DayCellFlag.RANGE_START
+    assert flags[17] == DayCellFlag.IN_MONTH | DayCellFlag.IN_RANGE
+    assert flags[20] == DayCellFlag.IN_MONTH | DayCellFlag.RANGE_END
+    assert flags[31] == DayCellFlag.IN_MONTH | DayCellFlag.DISABLED
+
+
+def test_compute_day_flags_suppresses_selection_on_disabled_cells() -> None:
+    """A selected date outside the bounds should not be flagged as selected."""
+    julian_days, in_month = _grid()
+    flags = compute_day_flags(julian_days, in_month, selected=2_460_001, min_julian=2_460_005)
+
+    assert flags[1] == DayCellFlag.DISABLED
+
+
+def test_compute_day_flags_rejects_mismatched_inputs() -> None:
+    """Both arrays must describe the same cells."""
+    with pytest.raises(ValidationError, match="same length"):
+        compute_day_flags([1, 2], [1])
+
+
+def test_numpy_backend_matches_pure_python() -> None:
+    """The optional NumPy path must produce identical flags."""
+    pytest.importorskip("numpy")
+    julian_days, in_month = _grid()
+    julian_days *= 12
+    in_month *= 12
+    kwargs = {
+        "selected": 2_460_010,
+        "today": 2_460_011,
+        "range_start": 2_460_015,
+        "range_end": 2_460_020,
+        "min_julian": 2_460_003,
+        "max_julian": 2_460_030,
+    }
+
+    expected = compute_day_flags(julian_days, in_month, use_numpy=False, **kwargs)
+
+    assert numpy_available()
+    assert compute_day_flags(julian_days, in_month, **kwargs) == expected
+    assert compute_day_flags(julian_days[:42], in_month[:42], use_numpy=True) == in_month[:42]
+
+
+def test_forcing_numpy_without_it_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Requesting the NumPy backend without NumPy installed should fail loudly."""
+    monkeypatch.setattr(day_grid, "_numpy", lambda: None)
+    julian_days, in_month = _grid()
+
+    assert not day_grid.numpy_available()
+    assert compute_day_flags(julian_days * 12, in_month * 12)[5] == DayCellFlag.IN_MONTH
+    with pytest.raises(ModuleNotFoundError, match="numpy"):
+        compute_day_flags(julian_days, in_month, use_numpy=True)
+
+
+def test_numpy_loader_handles_missing_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed import should leave the NumPy backend disabled."""
+
+    def _raise(name: str) -> None:
+        raise ImportError(name)
+
+    day_grid._numpy.cache_clear()
+    monkeypatch.setattr(day_grid.importlib, "import_module", _raise)
+    try:
+        assert day_grid._numpy() is None
+    finally:
+        day_grid._numpy.cache_clear()
@@ -0,0 +1,115 @@
+"""Tests for device-pixel-ratio aware icon atlases."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from date_range_popover.utils import icon_atlas as atlas_module
+from date_range_popover.utils import svg_loader
+from date_range_popover.utils.icon_atlas import (
+    ATLAS_MAX_ROW_WIDTH,
+    IconAtlas,
+    IconVariant,
+    clear_icon_atlases,
+    find_icon_atlas,
+    icon_atlas,
+)
+from date_range_popover.utils.svg_loader import SvgIconCache, clear_icon_cache
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+_ASSETS = Path(svg_loader.__file__).resolve().parents[1] / "assets"
+_LEFT = str(_ASSETS / "carrot_left.svg")
+_RIGHT = str(_ASSETS / "carrot_right.svg")
+_VARIANTS = (
+    IconVariant(_LEFT, 28, "#ffffff"),
+    IconVariant(_RIGHT, 28, "#ffffff"),
+    IconVariant(_LEFT, 16, "#123456"),
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_atlases() -> None:
+    clear_icon_cache()
+
+
+@pytest.mark.parametrize("dpr", [1.0, 1.5, 2.0])
+def test_variants_are_packed_at_device_resolution(dpr: float) -> None:
+    """Every variant gets its own device-pixel square and cuts keep the ratio."""
+    atlas = IconAtlas(_VARIANTS, dpr)
+
+    assert atlas.dpr == dpr and atlas.pixmap.devicePixelRatio() == dpr
+    assert atlas.variants == frozenset(_VARIANTS)
+    rects = [atlas.source_rect(variant) for variant in _VARIANTS]
+    for variant, rect in zip(_VARIANTS, rects):
+        assert rect.width() == rect.height() == round(variant.size * dpr)
+        assert atlas.pixmap.rect().contains(rect)
+    assert not any(a.intersects(b) for i, a in enumerate(rects) for b in rects[i + 1 :])
+
+    cut = atlas.cut(_VARIANTS[0])
+    assert cut.devicePixelRatio() == dpr
+    assert cut.width() == round(28 * dpr)
+
+
+@pytest.mark.parametrize("dpr", [1.0, 1.5, 2.0])
+def test_cut_matches_an_individual_render(dpr: float) -> None:
+    """Icons cut from the atlas are pixel-identical to ones rendered on their own."""
+    atlas = IconAtlas(_VARIANTS, dpr)
+    for variant in _VARIANTS:
+        single = svg_loader._render_colored_pixmap(variant.source, variant.size, variant.color, dpr)
+        assert atlas.cut(variant).toImage() == single.toImage()
+
+
+def test_wide_sets_wrap_onto_new_rows() -> None:
+    """The packer starts a new shelf instead of exceeding the maximum row width."""
+    colors = [f"#0000{index:02x}" for index in range(ATLAS_MAX_ROW_WIDTH // 28 + 4)]
+    atlas = IconAtlas((IconVariant(_LEFT, 28, color) for color in colors), 1.0)
+
+    assert atlas.pixmap.width() <= ATLAS_MAX_ROW_WIDTH
+    assert atlas.pixmap.height() > 28
+    assert len({atlas.source_rect(variant).y() for variant in atlas.variants}) == 2
+
+
+def test_unreadable_sources_leave_an_empty_slot() -> None:
+    """A missing SVG does not abort the atlas; its area just stays transparent."""
+    missing = IconVariant("/does/not/exist.svg", 16, "#ffffff")
+    atlas = IconAtlas([missing], 1.0)
+
+    assert missing in atlas
+    assert atlas.cut(missing).toImage().pixelColor(8, 8).alpha() == 0
+
+
+def test_shared_atlases_are_reused_per_ratio_and_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Equal variant sets share an atlas per ratio; the oldest atlas is evicted."""
+    first = icon_atlas(_VARIANTS, 1.0)
+    assert icon_atlas(reversed(_VARIANTS), 1.0) is first
+    assert icon_atlas(_VARIANTS, 2.0) is not first
+    assert find_icon_atlas(_VARIANTS[0], 2.0) is icon_atlas(_VARIANTS, 2.0)
+    assert find_icon_atlas(_VARIANTS[0], 1.25) is None
+
+    monkeypatch.setattr(atlas_module, "DEFAULT_ATLAS_CACHE_SIZE", 2)
+    icon_atlas(_VARIANTS, 1.5)
+    assert find_icon_atlas(_VARIANTS[0], 1.0) is None
+
+    clear_icon_atlases()
+    assert find_icon_atlas(_VARIANTS[0], 1.5) is None
+
+
+def test_icon_cache_cuts_from_a_matching_atlas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache misses for atlas variants never invoke the SVG renderer."""
+    icon_atlas(_VARIANTS, 2.0)
+
+    def fail(*_: object) -> None:
+        raise AssertionError("unexpected SVG render")
+
+    monkeypatch.setattr(svg_loader.shared_svg_assets(), "renderer", fail)
+    pixmap = SvgIconCache().pixmap(_LEFT, 16, "#123456", 2.0)
+    assert pixmap.width() == 32 and pixmap.devicePixelRatio() == 2.0
+
+
+def test_clear_icon_cache_drops_atlases() -> None:
+    """Clearing the icon cache drops the atlases with it."""
+    icon_atlas(_VARIANTS, 1.0)
+    clear_icon_cache()
+    assert find_icon_atlas(_VARIANTS[0], 1.0) is None
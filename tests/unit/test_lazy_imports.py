@@ -0,0 +1,66 @@
+"""Tests for the lazy (PEP 562) package exports."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+_PACKAGES = (
+    "date_range_popover",
+    "date_range_popover.animation",
+    "date_range_popover.api",
+    "date_range_popover.components",
+    "date_range_popover.components.buttons",
+    "date_range_popover.components.calendar",
+    "date_range_popover.components.inputs",
+    "date_range_popover.components.layout",
+    "date_range_popover.managers",
+    "date_range_popover.styles",
+    "date_range_popover.utils",
+)
+_HEAVY_MODULES = ("PySide6.QtGui", "PySide6.QtWidgets", "PySide6.QtSvg", "PySide6.QtSvgWidgets")
+
+
+def _loaded_after(statement: str) -> set[str]:
+    script = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    completed = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return set(json.loads(completed.stdout))
+
+
+def test_importing_the_package_loads_no_qt_modules() -> None:
+    loaded = _loaded_after("import date_range_popover")
+    assert not {module for module in loaded if module.startswith("PySide6")}
+
+
+def test_headless_names_load_only_qtcore() -> None:
+    """Selection types and the state logic must not pull in widgets, painting or SVG."""
+    loaded = _loaded_after(
+        "from date_range_popover import DateRange, PickerMode; "
+        "import date_range_popover.core.state_logic"
+    )
+    assert "PySide6.QtCore" in loaded
+    assert loaded.isdisjoint(_HEAVY_MODULES)
+    assert "date_range_popover.api.picker" not in loaded
+
+
+@pytest.mark.parametrize("package_name", _PACKAGES)
+def test_every_export_resolves(package_name: str) -> None:
+    """Each name in ``__all__`` maps to a real object and is listed by ``dir``."""
+    package = importlib.import_module(package_name)
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_attributes_raise_attribute_error() -> None:
+    import date_range_popover
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = date_range_popover.no_such_name  # type: ignore[attr-defined]
+    assert date_range_popover.styles.constants.__name__ == "date_range_popover.styles.constants"
@@ -0,0 +1,62 @@
+"""Tests for the cached month grid layouts."""
+
+from __future__ import annotations
+
+import pytest
+from date_range_popover.exceptions import InvalidDateError
+from date_range_popover.utils import iter_month_days
+from date_range_popover.utils.month_grid import (
+    GRID_CELLS,
+    clear_month_layout_cache,
+    month_layout,
+)
+from PySide6.QtCore import QDate
+
+
+def test_layout_matches_qdate_arithmetic() -> None:
+    """Julian days, day numbers and in-month flags should mirror QDate."""
+    layout = month_layout(2024, 3)
+    dates = list(iter_month_days(QDate(2024, 3, 15)))
+
+    assert len(layout.julian_days) == GRID_CELLS
+    assert [date.toJulianDay() for date in dates] == list(layout.julian_days)
+    assert [date.day() for date in dates] == list(layout.days)
+    assert [int(date.month() == 3) for date in dates] == list(layout.in_month)
+    assert layout.qdate(layout.days.index(1)) == QDate(2024, 3, 1)
+    assert layout.last_julian == QDate(2024, 3, 31).toJulianDay()
+
+
+def test_layout_honours_first_weekday() -> None:
+    """A Sunday-first grid should start on the Sunday before the first."""
+    layout = month_layout(2024, 6, first_weekday=6)
+
+    first = layout.qdate(0)
+    assert first.dayOfWeek() == 7
+    assert first == QDate(2024, 5, 26)
+
+
+def test_layouts_are_cached() -> None:
+    """Repeated lookups should return the same layout until the cache is cleared."""
+    clear_month_layout_cache()
+    first = month_layout(2025, 1)
+
+    assert month_layout(2025, 1) is first
+    assert month_layout.cache_info().hits >= 1
+    clear_month_layout_cache()
+    assert month_layout(2025, 1) is not first
+
+
+@pytest.mark.parametrize(
+    ("year", "month", "first_weekday"),
+    [(2024, 13, 0), (2024, 1, 7), (0, 1, 0)],
+)
+def test_layout_rejects_invalid_arguments(year: int, month: int, first_weekday: int) -> None:
+    """Out-of-range months, weekdays, or years should raise InvalidDateError."""
+    with pytest.raises(InvalidDateError):
+        month_layout(year, month, first_weekday)
+
+
+def test_iter_month_days_rejects_invalid_dates() -> None:
+    """iter_month_days should guard against invalid inputs."""
+    with pytest.raises(InvalidDateError):
+        list(iter_month_days(QDate()))
@@ -0,0 +1,73 @@
+"""Tests for the shared QSS string cache."""
+
+from __future__ import annotations
+
+import pytest
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.styles.qss_cache import (
+    QssCache,
+    apply_stylesheet,
+    cached_qss,
+    shared_qss_cache,
+)
+from date_range_popover.styles.style_templates import DayCellStyle, day_cell_qss
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+def _style(background: str) -> DayCellStyle:
+    return DayCellStyle(
+        background=background,
+        text_color="#f5f5f5",
+        hover_background="#2e2e2e",
+        hover_text_color="#ffffff",
+        radius=4,
+    )
+
+
+def test_render_returns_identical_string_for_equal_keys() -> None:
+    """Equal style tuples should map onto the same cached string object."""
+    cache = QssCache()
+
+    first = cache.render(day_cell_qss, _style("#111111"))
+    second = cache.render(day_cell_qss, _style("#111111"))
+
+    assert first is second
+    assert "#111111" in first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    """The cache must stay bounded and drop the stalest entry first."""
+    cache = QssCache(max_size=2)
+    first = cache.render(day_cell_qss, _style("#000001"))
+    cache.render(day_cell_qss, _style("#000002"))
+    cache.render(day_cell_qss, _style("#000001"))
+    cache.render(day_cell_qss, _style("#000003"))
+
+    assert cache.stats().size == 2
+    assert cache.render(day_cell_qss, _style("#000001")) is first
+    assert cache.stats().misses == 3
+    cache.render(day_cell_qss, _style("#000002"))
+    assert cache.stats().misses == 4
+
+    cache.clear()
+    assert cache.stats() == type(cache.stats())(hits=0, misses=0, size=0, max_size=2)
+
+
+def test_cache_rejects_non_positive_size() -> None:
+    """A zero-sized cache is a configuration error."""
+    with pytest.raises(InvalidConfigurationError, match="max_size"):
+        QssCache(max_size=0)
+
+
+def test_shared_cache_and_apply_stylesheet(qapp: QApplication) -> None:
+    """Re-applying the current sheet should be skipped."""
+    assert qapp is not None
+    widget = QWidget()
+    sheet = cached_qss(day_cell_qss, _style("#222222"))
+
+    assert shared_qss_cache().max_size > 0
+    assert apply_stylesheet(widget, sheet) is True
+    assert apply_stylesheet(widget, cached_qss(day_cell_qss, _style("#222222"))) is False
+    assert widget.styleSheet() == sheet
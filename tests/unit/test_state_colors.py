@@ -0,0 +1,13 @@
+"""Tests for the shared state colour cache."""
+
+from __future__ import annotations
+
+from date_range_popover.styles.state_colors import state_color
+
+
+def test_state_color_is_shared_per_token() -> None:
+    """The same token should always resolve to the same ``QColor`` object."""
+    color = state_color("#1a2b3c")
+
+    assert state_color("#1a2b3c") is color
+    assert color.name() == "#1a2b3c"
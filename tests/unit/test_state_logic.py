@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from date_range_popover.core.state_logic import clamp_visible_month
+from date_range_popover.core.state_logic import (
+    DatePickerState,
+    PickerMode,
+    apply_constraints,
+    clamp_visible_month,
+)
 from PySide6.QtCore import QDate
 
 
@@ -28,3 +33,18 @@ def test_clamp_visible_month_respects_max_bound() -> None:
     result = clamp_visible_month(requested_month, None, max_date)
 
     assert result == _first_day(max_date)
+
+
+def test_apply_constraints_clamps_selection_and_month() -> None:
+    """New bounds should clamp both range endpoints and the visible month."""
+    state = DatePickerState(
+        mode=PickerMode.CUSTOM_RANGE,
+        selected_dates=(QDate(2024, 1, 5), QDate(2024, 4, 10)),
+        visible_month=QDate(2024, 1, 1),
+    )
+
+    result = apply_constraints(state, QDate(2024, 2, 1), QDate(2024, 3, 31))
+
+    assert result.selected_dates == (QDate(2024, 2, 1), QDate(2024, 3, 31))
+    assert result.visible_month == QDate(2024, 2, 1)
+    assert result.mode is PickerMode.CUSTOM_RANGE
@@ -5,6 +5,7 @@ from __future__ import annotations
 import date_range_popover.managers.state_manager as state_manager_module
 import pytest
 from date_range_popover.core.state_logic import DatePickerState
+from date_range_popover.exceptions import InvalidDateError
 from date_range_popover.managers.state_manager import DatePickerStateManager, PickerMode
 from date_range_popover.utils import first_of_month
 from PySide6.QtCore import QDate
@@ -152,3 +153,41 @@ def test_reset_skips_selected_date_signal_when_start_missing(
     assert spy.count() == 0
     assert manager.state.selected_dates == (None, None)
     assert manager.state.visible_month == sentinel_month
+
+
+def test_set_constraints_clamps_single_date_and_emits() -> None:
+    """Tightening the bounds should clamp and re-emit the selected date."""
+    manager = DatePickerStateManager()
+    manager.select_date(QDate(2024, 5, 20))
+    date_spy = QSignalSpy(manager.selected_date_changed)
+    month_spy = QSignalSpy(manager.visible_month_changed)
+
+    manager.set_constraints(min_date=QDate(2024, 6, 1), max_date=QDate(2024, 6, 30))
+
+    assert _spy_payloads(date_spy) == [[QDate(2024, 6, 1)]]
+    assert _spy_payloads(month_spy) == [[QDate(2024, 6, 1)]]
+    assert manager.min_date == QDate(2024, 6, 1)
+    assert manager.max_date == QDate(2024, 6, 30)
+
+
+def test_set_constraints_clamps_range_and_skips_noops() -> None:
+    """Ranges are clamped as a whole; unchanged state emits nothing."""
+    manager = DatePickerStateManager()
+    manager.select_range(QDate(2024, 6, 1), QDate(2024, 6, 30))
+    range_spy = QSignalSpy(manager.selected_range_changed)
+    state_spy = QSignalSpy(manager.state_changed)
+
+    manager.set_constraints(min_date=None, max_date=QDate(2024, 6, 15))
+    manager.set_constraints(min_date=None, max_date=QDate(2024, 6, 15))
+
+    assert _spy_payloads(range_spy) == [[QDate(2024, 6, 1), QDate(2024, 6, 15)]]
+    assert state_spy.count() == 1
+
+
+def test_set_constraints_rejects_inverted_bounds() -> None:
+    """min_date after max_date should raise before mutating the state."""
+    manager = DatePickerStateManager()
+
+    with pytest.raises(InvalidDateError, match="min_date"):
+        manager.set_constraints(min_date=QDate(2024, 7, 1), max_date=QDate(2024, 6, 1))
+    assert manager.min_date is None
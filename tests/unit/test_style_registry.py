@@ -0,0 +1,84 @@
+"""Tests for process-wide sharing of style registries."""
+
+from __future__ import annotations
+
+from date_range_popover.managers.style_manager import StyleManager
+from date_range_popover.styles import style_registry
+from date_range_popover.styles.style_registry import StyleRegistry
+from date_range_popover.styles.theme import ButtonStyleConfig, ColorPalette, Theme
+
+
+def test_shared_registry_is_keyed_by_theme_value() -> None:
+    """Equal but distinct themes should map onto one registry."""
+    first = StyleRegistry.shared(Theme(palette=ColorPalette(divider_color="#010101")))
+    second = StyleRegistry.shared(Theme(palette=ColorPalette(divider_color="#010101")))
+    other = StyleRegistry.shared(Theme(palette=ColorPalette(divider_color="#020202")))
+
+    assert first is second
+    assert other is not first
+    assert StyleRegistry.shared() is StyleRegistry.shared(Theme())
+
+
+def test_shared_registry_is_evicted_when_unused() -> None:
+    """Dropping the last reference should remove the shared entry."""
+    theme = Theme(palette=ColorPalette(divider_color="#030303"))
+    registry = StyleRegistry.shared(theme)
+    assert style_registry._SHARED_REGISTRIES.get(theme) is registry
+
+    # Registries hold no reference cycles, so dropping the last one frees it.
+    del registry
+    assert theme not in style_registry._SHARED_REGISTRIES
+
+
+def test_rendered_button_stylesheets_are_reused() -> None:
+    """Rendered sheets should be cached until a variant is re-registered."""
+    registry = StyleRegistry()
+    sheet = registry.button_stylesheet(variant="accent", vertical_padding=4)
+    assert registry.button_stylesheet(variant="accent", vertical_padding=4) is sheet
+    assert registry.button_stylesheet(variant="accent", vertical_padding=6) != sheet
+
+    accent = registry.button_config("accent")
+    registry.register_button_style(
+        "accent",
+        ButtonStyleConfig(
+            background="#000000",
+            hover_background=accent.hover_background,
+            pressed_background=accent.pressed_background,
+            border_color=accent.border_color,
+            text_color=accent.text_color,
+            hover_text_color=accent.hover_text_color,
+            pressed_text_color=accent.pressed_text_color,
+            border_radius=accent.border_radius,
+        ),
+    )
+    assert "#000000" in registry.button_stylesheet(variant="accent", vertical_padding=4)
+
+
+def test_preloaded_stylesheets_are_served_without_rendering() -> None:
+    """Preloaded entries should be returned as-is and never replace rendered ones."""
+    registry = StyleRegistry()
+    rendered = registry.input_stylesheet()
+    registry.preload_stylesheets({("input", "default"): "stale", ("calendar", "default"): "x"})
+
+    assert registry.input_stylesheet() is rendered
+    assert registry.calendar_stylesheet() == "x"
+    assert registry.rendered_stylesheets() == {
+        ("input", "default"): rendered,
+        ("calendar", "default"): "x",
+    }
+
+
+def test_manager_registry_forks_before_custom_variants() -> None:
+    """Registering through ``StyleManager.registry`` must not leak into other managers."""
+    shared = StyleRegistry.shared()
+    first, second = StyleManager(), StyleManager()
+    danger = shared.button_config("accent")
+
+    registry = first.registry
+    assert registry is not shared and not registry.is_shared
+    registry.register_button_style("danger", danger)
+
+    assert registry.button_config("danger") is danger
+    assert "danger" not in shared.BUTTON_STYLES
+    assert "danger" not in second.registry.BUTTON_STYLES
+    assert first.registry is registry
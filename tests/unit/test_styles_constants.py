@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Any, cast
+
+import pytest
+from date_range_popover.exceptions import InvalidConfigurationError
 from date_range_popover.styles import constants
 from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QApplication
 
 
 def test_create_label_font_uses_expected_weight_and_spacing() -> None:
@@ -14,3 +19,43 @@ def test_create_label_font_uses_expected_weight_and_spacing() -> None:
     assert font.weight() == QFont.Weight.Bold
     assert font.letterSpacingType() == QFont.SpacingType.PercentageSpacing
     assert font.letterSpacing() == 96
+
+
+def test_shared_fonts_are_cached_per_role_and_size(qapp: QApplication) -> None:
+    constants.clear_font_cache()
+    day = constants.create_calendar_day_font()
+    again = constants.create_calendar_day_font()
+
+    assert day == again and day is not again
+    assert constants.font_cache_size() == 1
+    assert constants.shared_font("calendar_day", point_size=20).pointSize() == 20
+    assert constants.font_cache_size() == 2
+    assert constants.create_action_button_font().weight() == QFont.Weight.Normal
+
+
+def test_shared_font_copies_do_not_leak_changes(qapp: QApplication) -> None:
+    font = constants.create_button_font()
+    font.setWeight(QFont.Weight.Light)
+
+    assert constants.create_button_font().weight() == QFont.Weight.Bold
+
+
+def test_font_cache_clears_when_the_application_font_changes(qapp: QApplication) -> None:
+    constants.create_header_font()
+    assert constants.font_cache_size()
+
+    original = qapp.font()
+    try:
+        qapp.setFont(QFont("Arial", original.pointSize() + 1))
+        assert constants.font_cache_size() == 0
+    finally:
+        qapp.setFont(original)
+
+    constants.create_header_font()
+    qapp.screenAdded.emit(qapp.primaryScreen())
+    assert constants.font_cache_size() == 0
+
+
+def test_unknown_font_role_is_rejected() -> None:
+    with pytest.raises(InvalidConfigurationError):
+        constants.shared_font(cast(Any, "caption"))
@@ -0,0 +1,121 @@
+"""Tests for the shared SVG asset registry."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.utils import svg_assets
+from date_range_popover.utils.svg_assets import (
+    BUNDLED_ASSETS_DIR,
+    SVG_COLOR_PLACEHOLDER,
+    SvgAssetRegistry,
+    normalize_svg,
+    shared_svg_assets,
+)
+from date_range_popover.utils.svg_loader import load_svg_widget
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 4 4">'
+    '<path fill="#000" d="M0 0h4v4z"/></svg>'
+)
+
+
+def _write_icon(directory: Path, name: str) -> Path:
+    path = directory / f"{name}.svg"
+    path.write_text(_SVG, encoding="utf-8")
+    return path
+
+
+def test_normalize_replaces_authored_colours() -> None:
+    """Authored colours collapse onto the placeholder, long forms first."""
+    normalized = normalize_svg('stroke="currentColor" fill="#000000" a="#000" b="#8c8c8c"')
+    assert normalized.count(SVG_COLOR_PLACEHOLDER) == 4
+    assert "#" not in normalized
+
+
+def test_shared_registry_preloads_bundled_icons(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Bundled icons are reachable by name and path without further reads."""
+    assets = shared_svg_assets()
+    assert {"calender", "carrot_left", "carrot_right", "clock", "cross"} <= set(assets.names())
+
+    monkeypatch.setattr(svg_assets, "_read_source", lambda source: None)
+    clock = BUNDLED_ASSETS_DIR / "clock.svg"
+    assert assets.template(clock) == assets.template("clock")
+    assert load_svg_widget(clock, 28) is not None
+    svg = assets.svg_bytes("cross", "#123456")
+    assert svg is not None and b"#123456" in svg
+
+
+def test_renderers_are_shared_per_colour(tmp_path: Path) -> None:
+    """One parsed renderer is handed out per source and colour, within the LRU bound."""
+    assets = SvgAssetRegistry(max_renderers=2)
+    path = _write_icon(tmp_path, "square")
+
+    red = assets.renderer(path, "#ff0000")
+    assert red is not None and red.isValid()
+    assert assets.renderer(path, "#ff0000") is red
+    assert assets.renderer(path, "#00ff00") is not red
+    assert assets.renderer(path, "#0000ff") is not None
+    assert assets.renderer(path, "#ff0000") is not red
+    assert assets.loads == 1
+
+
+def test_unreadable_or_invalid_sources(tmp_path: Path) -> None:
+    """Missing files yield ``None``; invalid markup yields no renderer."""
+    assets = SvgAssetRegistry()
+    broken = tmp_path / "broken.svg"
+    broken.write_text("<svg", encoding="utf-8")
+
+    assert assets.template(tmp_path / "missing.svg") is None
+    assert assets.svg_bytes(tmp_path / "missing.svg", "#ffffff") is None
+    assert assets.renderer(tmp_path / "missing.svg", "#ffffff") is None
+    assert assets.renderer(broken, "#ffffff") is None
+    assert assets.renderer(broken, "#ffffff") is None
+    with pytest.raises(InvalidConfigurationError, match="Cannot read SVG icon"):
+        assets.register("missing", tmp_path / "missing.svg")
+    with pytest.raises(InvalidConfigurationError):
+        SvgAssetRegistry(max_renderers=0)
+
+
+def test_host_icon_sets_override_by_name(tmp_path: Path) -> None:
+    """Re-registering a name replaces its template and drops stale renderers."""
+    assets = SvgAssetRegistry()
+    assert assets.register_directory(tmp_path, prefix="host.") == []
+    _write_icon(tmp_path, "alpha")
+    _write_icon(tmp_path, "beta")
+    assert assets.register_directory(tmp_path, prefix="host.") == ["host.alpha", "host.beta"]
+
+    before = assets.renderer("host.alpha", "#ffffff")
+    replacement = tmp_path / "other.svg"
+    replacement.write_text(_SVG.replace("M0 0h4v4z", "M0 0h2v2z"), encoding="utf-8")
+    assets.register("host.alpha", replacement)
+
+    assert assets.renderer("host.alpha", "#ffffff") is not before
+    assert "M0 0h2v2z" in (assets.template("host.alpha") or "")
+
+
+@pytest.mark.skipif(shutil.which("pyside6-rcc") is None, reason="pyside6-rcc not available")
+def test_compiled_resource_bundle(tmp_path: Path) -> None:
+    """Icons from a binary ``.rcc`` bundle register under their resource names."""
+    _write_icon(tmp_path, "gamma")
+    qrc = tmp_path / "icons.qrc"
+    qrc.write_text(
+        '<RCC><qresource prefix="/drp-test-icons"><file>gamma.svg</file></qresource></RCC>',
+        encoding="utf-8",
+    )
+    rcc = tmp_path / "icons.rcc"
+    subprocess.run(["pyside6-rcc", "--binary", str(qrc), "-o", str(rcc)], check=True, cwd=tmp_path)
+
+    assets = SvgAssetRegistry()
+    names = assets.register_resource_bundle(rcc, root=":/drp-test-icons", prefix="rcc.")
+    assert names == ["rcc.gamma"]
+    assert assets.renderer("rcc.gamma", "#ffffff") is not None
+    assert assets.template(":/drp-test-icons/missing.svg") is None
+    with pytest.raises(InvalidConfigurationError, match="resource bundle"):
+        assets.register_resource_bundle(tmp_path / "missing.rcc")
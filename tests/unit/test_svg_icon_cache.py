@@ -0,0 +1,82 @@
+"""Tests for the recoloured SVG icon cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.utils import svg_assets, svg_loader
+from date_range_popover.utils.svg_loader import SvgIconCache, clear_icon_cache, shared_icon_cache
+from PySide6.QtCore import QSize
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+_ICON = Path(svg_loader.__file__).resolve().parents[1] / "assets" / "carrot_left.svg"
+
+
+def test_icons_are_rendered_once_per_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated requests should not touch the file or the SVG renderer again."""
+    cache = SvgIconCache()
+    first = cache.icon(_ICON, 16, "#ffffff")
+
+    def fail(source: str | Path) -> str | None:
+        raise AssertionError(f"unexpected read of {source}")
+
+    monkeypatch.setattr(svg_assets, "_read_source", fail)
+    assert cache.icon(_ICON, 16, "#ffffff") is first
+    assert cache.icon(str(_ICON), 16, "#ffffff") is first
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+
+
+def test_device_pixel_ratio_is_part_of_the_key() -> None:
+    """High-DPI requests rasterise at device resolution under the same logical size."""
+    cache = SvgIconCache()
+    standard = cache.icon(_ICON, 16, "#ffffff")
+    retina = cache.icon(_ICON, 16, "#ffffff", 2.0)
+
+    assert retina is not standard
+    pixmap = retina.pixmap(QSize(16, 16), 2.0)
+    assert pixmap.width() == 32 and pixmap.devicePixelRatio() == 2.0
+    assert cache.stats().misses == 2
+
+
+def test_cache_evicts_least_recently_used_and_clears() -> None:
+    """The cache stays bounded and ``clear`` resets entries and counters."""
+    cache = SvgIconCache(max_size=2)
+    cache.icon(_ICON, 16, "#000001")
+    cache.icon(_ICON, 16, "#000002")
+    cache.icon(_ICON, 16, "#000001")
+    cache.icon(_ICON, 16, "#000003")
+
+    assert cache.stats().size == 2
+    cache.icon(_ICON, 16, "#000002")
+    assert cache.stats().misses == 4
+
+    cache.clear()
+    assert cache.stats() == svg_loader.IconCacheStats(hits=0, misses=0, size=0, max_size=2)
+    with pytest.raises(InvalidConfigurationError):
+        SvgIconCache(max_size=0)
+
+
+def test_missing_svg_yields_null_icon(tmp_path: Path) -> None:
+    """Unreadable or invalid files produce null icons instead of raising."""
+    cache = SvgIconCache()
+    invalid = tmp_path / "broken.svg"
+    invalid.write_text("<svg", encoding="utf-8")
+
+    assert cache.icon(tmp_path / "missing.svg", 16, "#ffffff").isNull()
+    assert cache.icon(invalid, 16, "#ffffff").isNull()
+
+
+def test_shared_cache_backs_load_colored_svg_icon() -> None:
+    """The module helper should go through the shared cache and its clear hook."""
+    clear_icon_cache()
+    icon = svg_loader.load_colored_svg_icon(_ICON, 12, "#123456")
+    assert svg_loader.load_colored_svg_icon(_ICON, 12, "#123456") is icon
+    assert shared_icon_cache().stats().hits == 1
+
+    clear_icon_cache()
+    assert shared_icon_cache().stats().size == 0
@@ -0,0 +1,200 @@
+"""Tests for compiled theme bundles and theme import/export."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from date_range_popover.exceptions import InvalidThemeError
+from date_range_popover.styles import theme_bundle
+from date_range_popover.styles.style_registry import StyleRegistry
+from date_range_popover.styles.theme import ColorPalette, LayoutConfig, Theme
+from date_range_popover.styles.theme_bundle import (
+    compile_theme_bundle,
+    export_theme,
+    import_theme,
+    load_theme,
+    read_theme_bundle,
+    theme_source_hash,
+    write_theme_bundle,
+)
+
+_PAYLOAD = {"palette": {"divider_color": "#0a0b0c"}, "layout": {"window_radius": 5}}
+
+
+def _source(tmp_path: Path, payload: object = _PAYLOAD) -> Path:
+    path = tmp_path / "theme.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_compiled_bundle_preloads_every_variant() -> None:
+    """Compiling should render each registry stylesheet and seed the shared registry."""
+    bundle = compile_theme_bundle(_PAYLOAD)
+
+    assert bundle.theme.palette.divider_color == "#0a0b0c"
+    assert bundle.source_hash == theme_source_hash(_PAYLOAD)
+    assert ("compiled",) in bundle.stylesheets
+    assert ("button", "ghost", 0) in bundle.stylesheets
+    assert ("input", "default") in bundle.stylesheets
+    assert bundle.registry is StyleRegistry.shared(bundle.theme)
+    sheet = bundle.registry.button_stylesheet(variant="accent", vertical_padding=12)
+    assert sheet is bundle.stylesheets[("button", "accent", 12)]
+
+
+def test_bundle_round_trips_through_disk(tmp_path: Path) -> None:
+    """Reading a written bundle should restore the theme and every stylesheet."""
+    bundle = compile_theme_bundle(Theme(layout=LayoutConfig(window_radius=3)))
+    path = tmp_path / "theme.bundle"
+    write_theme_bundle(bundle, path)
+
+    restored = read_theme_bundle(path)
+    assert restored == bundle
+    assert restored.source_hash == theme_source_hash(theme_bundle.theme_to_mapping(bundle.theme))
+
+
+@pytest.mark.parametrize(
+    ("header", "message"),
+    [
+        ("not json", "not a theme bundle"),
+        ('{"format": "other"}', "not a theme bundle"),
+        (f'{{"format": "{theme_bundle.BUNDLE_FORMAT}", "version": 0}}', "bundle version 0"),
+        (
+            f'{{"format": "{theme_bundle.BUNDLE_FORMAT}", "version": 1, "templates": "old"}}',
+            "different stylesheet templates",
+        ),
+        (
+            f'{{"format": "{theme_bundle.BUNDLE_FORMAT}", "version": 1, '
+            f'"templates": "{theme_bundle.template_fingerprint()}", "content_hash": "x"}}',
+            "content hash",
+        ),
+    ],
+)
+def test_read_rejects_foreign_or_tampered_files(tmp_path: Path, header: str, message: str) -> None:
+    """Headers that do not match the format, version or body hash are rejected."""
+    path = tmp_path / "theme.bundle"
+    path.write_bytes(header.encode() + b"\n{}")
+    with pytest.raises(InvalidThemeError, match=message):
+        read_theme_bundle(path)
+
+
+def _rewrite_body(path: Path, edit: Callable[[dict[str, Any]], None]) -> None:
+    """Edit a bundle body and re-sign it so only the body's shape is wrong."""
+    raw_header, _, body = path.read_bytes().partition(b"\n")
+    header, payload = json.loads(raw_header), json.loads(body)
+    edit(payload)
+    new_body = json.dumps(payload).encode()
+    header["content_hash"] = hashlib.sha256(new_body).hexdigest()
+    path.write_bytes(json.dumps(header).encode() + b"\n" + new_body)
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda payload: payload.pop("stylesheets"),
+        lambda payload: payload["palette"].update(calendar_day_hover_background="not-a-colour"),
+        lambda payload: payload["layout"].update(window_min_width=-5),
+        lambda payload: payload.update(stylesheets=[["not", "a", "pair"]]),
+    ],
+)
+def test_load_theme_recompiles_malformed_bodies(
+    tmp_path: Path, edit: Callable[[dict[str, Any]], None]
+) -> None:
+    """A re-hashed body with a bad shape or invalid tokens is a cache miss, not a theme."""
+    source = _source(tmp_path)
+    bundle_path = tmp_path / "theme.json.bundle"
+    first = load_theme(source)
+    _rewrite_body(bundle_path, edit)
+
+    with pytest.raises(InvalidThemeError, match="malformed bundle body"):
+        read_theme_bundle(bundle_path)
+    assert load_theme(source) == first
+    assert read_theme_bundle(bundle_path) == first
+
+
+def test_load_theme_recompiles_bundles_from_other_templates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Bundles written by another template version must not be served after an upgrade."""
+    source = _source(tmp_path)
+    load_theme(source)
+    bundle_path = tmp_path / "theme.json.bundle"
+
+    monkeypatch.setattr(theme_bundle, "template_fingerprint", lambda: "upgraded")
+    with pytest.raises(InvalidThemeError, match="different stylesheet templates"):
+        read_theme_bundle(bundle_path)
+    load_theme(source)
+    assert json.loads(bundle_path.read_bytes().partition(b"\n")[0])["templates"] == "upgraded"
+
+
+def test_load_theme_reuses_bundle_until_source_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The bundle should be compiled once and rebuilt only when the source changes."""
+    source = _source(tmp_path)
+    first = load_theme(source)
+    bundle_path = tmp_path / "theme.json.bundle"
+    assert bundle_path.exists()
+
+    compiled: list[object] = []
+    original = theme_bundle.compile_theme_bundle
+
+    def counting(*args: object, **kwargs: object) -> theme_bundle.ThemeBundle:
+        compiled.append(args)
+        return original(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(theme_bundle, "compile_theme_bundle", counting)
+    assert load_theme(source) == first
+    assert compiled == []
+
+    _source(tmp_path, {"palette": {"divider_color": "#0d0e0f"}})
+    changed = load_theme(source)
+    assert len(compiled) == 1
+    assert changed.theme.palette.divider_color == "#0d0e0f"
+    assert read_theme_bundle(bundle_path).source_hash == changed.source_hash
+
+
+def test_load_theme_recovers_from_corrupt_bundle(tmp_path: Path) -> None:
+    """A damaged bundle is treated as a cache miss and rewritten."""
+    source = _source(tmp_path)
+    bundle_path = tmp_path / "cache.bundle"
+    bundle_path.write_bytes(b"garbage")
+
+    bundle = load_theme(source, bundle_path=bundle_path)
+    assert read_theme_bundle(bundle_path) == bundle
+
+
+def test_load_theme_survives_unwritable_cache(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Failing to write the bundle should only log a warning."""
+    source = _source(tmp_path)
+    missing_dir = tmp_path / "missing" / "theme.bundle"
+
+    with caplog.at_level(logging.WARNING):
+        bundle = load_theme(source, bundle_path=missing_dir)
+
+    assert bundle.theme.layout.window_radius == 5
+    assert "Could not write theme bundle" in caplog.text
+
+
+def test_export_and_import_round_trip(tmp_path: Path) -> None:
+    """Exported JSON should import back into an equal theme."""
+    theme = Theme(palette=ColorPalette(window_background="#101010"))
+    path = tmp_path / "export.json"
+    export_theme(theme, path)
+
+    assert import_theme(path) == theme
+    assert json.loads(path.read_text())["palette"]["window_background"] == "#101010"
+
+
+def test_import_rejects_non_object_json(tmp_path: Path) -> None:
+    """Theme files must contain a JSON object."""
+    path = _source(tmp_path, ["not", "a", "theme"])
+    with pytest.raises(InvalidThemeError, match="JSON object"):
+        import_theme(path)
@@ -0,0 +1,82 @@
+"""Tests for the field-by-field theme comparison."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+
+from date_range_popover.styles import theme_diff
+from date_range_popover.styles.theme import ColorPalette, LayoutConfig, Theme
+from date_range_popover.styles.theme_diff import diff_themes
+
+
+def test_equal_themes_produce_an_empty_diff() -> None:
+    """Equal tokens should leave nothing to restyle or relayout."""
+    diff = diff_themes(Theme(), Theme())
+
+    assert diff.is_empty
+    assert not diff.restyle
+    assert not diff.relayout
+
+
+def test_calendar_palette_change_only_restyles_the_calendar() -> None:
+    """A calendar colour should not touch any other component."""
+    new = Theme(palette=ColorPalette(calendar_day_text_color="#123456"))
+    diff = diff_themes(Theme(), new)
+
+    assert diff.palette_fields == {"calendar_day_text_color"}
+    assert diff.restyle == {"calendar"}
+    assert not diff.relayout
+
+
+def test_shared_tokens_fan_out_to_every_reader() -> None:
+    """The window background feeds several components' stylesheets."""
+    diff = diff_themes(Theme(), Theme(palette=ColorPalette(window_background="#000000")))
+
+    assert diff.restyle == {"window", "sliding_track", "inputs", "actions"}
+
+
+def test_geometry_tokens_trigger_relayout_only() -> None:
+    """Widths and gaps relayout their components without restyling them."""
+    diff = diff_themes(Theme(), Theme(layout=LayoutConfig(button_gap=24)))
+
+    assert diff.layout_fields == {"button_gap"}
+    assert diff.relayout == {"button_strip", "sliding_track"}
+    assert not diff.restyle
+
+
+def test_stylesheet_dimensions_restyle_their_components() -> None:
+    """Radii live in stylesheets, so they restyle rather than relayout."""
+    diff = diff_themes(Theme(), Theme(layout=LayoutConfig(window_radius=4)))
+
+    assert diff.restyle == {"window", "actions"}
+    assert not diff.relayout
+
+
+def test_token_tables_only_name_real_fields() -> None:
+    """Every mapped token should exist on the palette or layout."""
+    known = {definition.name for definition in fields(ColorPalette)} | {
+        definition.name for definition in fields(LayoutConfig)
+    }
+    for table in (theme_diff._STYLE_TOKENS, theme_diff._GEOMETRY_TOKENS):
+        for target, tokens in table.items():
+            assert tokens <= known, target
+
+
+def test_every_token_reaches_a_component_or_is_ignored() -> None:
+    """New palette/layout fields must be mapped to a target or listed as unmapped."""
+    mapped = set().union(*theme_diff._STYLE_TOKENS.values(), *theme_diff._GEOMETRY_TOKENS.values())
+    for cls in (ColorPalette, LayoutConfig):
+        for definition in fields(cls):
+            name = definition.name
+            assert (name in mapped) != (name in theme_diff.UNMAPPED_TOKENS), name
+
+
+def test_calendar_geometry_tokens_relayout_the_calendar() -> None:
+    """Cell size, spacing and margins must reach the calendar widget."""
+    diff = diff_themes(
+        Theme(),
+        Theme(layout=LayoutConfig(calendar_day_cell_size=50, calendar_top_margin=4)),
+    )
+
+    assert diff.relayout == {"calendar"}
+    assert not diff.restyle
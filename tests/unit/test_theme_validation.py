@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any
 
 import pytest
-from date_range_popover.exceptions import InvalidConfigurationError
+from date_range_popover.exceptions import InvalidConfigurationError, InvalidFieldsError
 from date_range_popover.styles.theme import ColorPalette, LayoutConfig
 
 
@@ -49,3 +50,25 @@ def test_layout_config_accepts_large_dimensions() -> None:
     config = LayoutConfig(window_min_height=900, action_button_height=80)
     assert config.window_min_height == 900
     assert config.action_button_height == 80
+
+
+def test_palette_reports_all_invalid_tokens_at_once() -> None:
+    """Every bad palette token should be listed in a single error."""
+    with pytest.raises(InvalidFieldsError) as excinfo:
+        ColorPalette(window_background="red", divider_color="#12")
+    assert set(excinfo.value.errors) == {"window_background", "divider_color"}
+
+
+def test_layout_reports_all_invalid_dimensions_at_once() -> None:
+    """Every bad layout value should be listed in a single error."""
+    with pytest.raises(InvalidFieldsError) as excinfo:
+        LayoutConfig(window_min_width=0, button_gap=-1)
+    assert set(excinfo.value.errors) == {"window_min_width", "button_gap"}
+
+
+def test_replaced_palette_keeps_shared_token_strings() -> None:
+    """Unchanged tokens of a derived palette should reuse the interned values."""
+    base = ColorPalette()
+    derived = replace(base, window_background="#101010")
+    assert derived.window_background == "#101010"
+    assert derived.divider_color is base.divider_color
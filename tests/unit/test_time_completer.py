@@ -7,14 +7,19 @@ from typing import cast
 
 import pytest
 from date_range_popover.components.inputs.time_completer import (
+    clear_time_completers,
     create_time_completer,
     dismiss_time_popup,
     generate_time_options,
+    shared_time_completer,
+    shared_time_model,
     show_time_popup,
+    time_options,
 )
 from date_range_popover.styles.theme import ColorPalette
-from PySide6.QtCore import QStringListModel
+from PySide6.QtCore import QStringListModel, Qt
 from PySide6.QtWidgets import QApplication, QLineEdit, QWidget
+from shiboken6 import Shiboken
 
 
 def test_generate_time_options_respects_step_bounds() -> None:
@@ -29,6 +34,76 @@ def test_generate_time_options_respects_step_bounds() -> None:
     assert half_hour_options[-1] == "23:30"
 
 
+def test_time_options_are_cached_per_clamped_step() -> None:
+    """Option lists should be built once per clamped step size."""
+
+    assert time_options(15) is time_options(15)
+    assert time_options(90) is time_options(60)
+    assert list(time_options(30)) == generate_time_options(30)
+
+
+def test_shared_time_model_is_read_only_and_keyed_by_step(qapp: QApplication) -> None:
+    """Shared models should be cached per step, app-owned and reject edits."""
+
+    model = shared_time_model(15)
+    assert shared_time_model(15) is model
+    assert shared_time_model(30) is not model
+    assert model.parent() is qapp
+
+    index = model.index(0)
+    assert not model.flags(index) & Qt.ItemFlag.ItemIsEditable
+    assert not model.setData(index, "99:99")
+    assert model.data(index) == "00:00"
+
+
+def test_shared_time_completer_is_keyed_by_step_and_popup_style(qapp: QApplication) -> None:
+    """Shared completers should be cached per step size and popup palette."""
+
+    light = ColorPalette()
+    dark = ColorPalette(time_popup_background="#101010")
+
+    completer = shared_time_completer(15, light)
+    assert shared_time_completer(15, ColorPalette()) is completer
+    assert shared_time_completer(15, dark) is not completer
+    assert shared_time_completer(30, light) is not completer
+    assert completer.model() is shared_time_model(15)
+    assert "#101010" in shared_time_completer(15, dark).popup().styleSheet()
+
+    clear_time_completers()
+    assert shared_time_completer(15, light) is not completer
+
+
+def test_clearing_shared_completers_keeps_live_inputs_working(qapp: QApplication) -> None:
+    """Clearing the cache should leave completers already in use intact."""
+
+    line_edit = QLineEdit()
+    line_edit.setCompleter(shared_time_completer(15, ColorPalette()))
+
+    clear_time_completers()
+    qapp.processEvents()
+
+    completer = line_edit.completer()
+    assert completer is not None and Shiboken.isValid(completer)
+    assert completer.model().rowCount() == len(time_options(15))
+
+
+def test_dismiss_ignores_line_edits_the_completer_is_not_serving(qapp: QApplication) -> None:
+    """Dismissing should only hide the popup for the line edit it is attached to."""
+
+    completer = shared_time_completer(15, ColorPalette())
+    first, second = QLineEdit(), QLineEdit()
+    first.setCompleter(completer)
+    second.setCompleter(completer)
+    completer.setWidget(first)
+    popup = completer.popup()
+    popup.show()
+
+    dismiss_time_popup(second)
+    assert popup.isVisible()
+    dismiss_time_popup(first)
+    assert not popup.isVisible()
+
+
 def test_create_time_completer_applies_palette_styles(qapp: QApplication) -> None:
     """The completer popup should inherit palette-driven styling."""
 
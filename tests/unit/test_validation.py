@@ -6,12 +6,15 @@ import pytest
 from date_range_popover.exceptions import (
     InvalidConfigurationError,
     InvalidDateError,
+    InvalidFieldsError,
     ValidationError,
 )
 from date_range_popover.validation import (
     validate_date_range,
     validate_dimension,
+    validate_dimensions,
     validate_hex_color,
+    validate_hex_colors,
     validate_qdate,
 )
 from PySide6.QtCore import QDate
@@ -32,6 +35,37 @@ def test_validate_hex_color_rejects_non_strings() -> None:
         validate_hex_color("#12345")
 
 
+def test_validate_hex_color_interns_repeated_values() -> None:
+    """Equal inputs should resolve to one shared, stripped string."""
+    first = validate_hex_color(" #a1b2c3 ")
+    second = validate_hex_color("".join(["#a1b2", "c3"]))
+    assert first == "#a1b2c3"
+    assert first is second
+
+
+def test_validate_hex_colors_reports_every_invalid_field() -> None:
+    """Bulk validation should collect all failures before raising."""
+    assert validate_hex_colors({"a": "#000000", "b": " #ffffff"}) == {
+        "a": "#000000",
+        "b": "#ffffff",
+    }
+    with pytest.raises(InvalidFieldsError) as excinfo:
+        validate_hex_colors({"a": "#000000", "b": "red", "c": 1})
+    assert set(excinfo.value.errors) == {"b", "c"}
+    assert "b must be" in str(excinfo.value) and "c must be" in str(excinfo.value)
+
+
+def test_validate_dimensions_applies_per_field_minimums() -> None:
+    """Bulk dimension validation should honour overrides and report all errors."""
+    assert validate_dimensions({"gap": 0, "width": 1}, min_values={"width": 1}) == {
+        "gap": 0,
+        "width": 1,
+    }
+    with pytest.raises(InvalidFieldsError) as excinfo:
+        validate_dimensions({"gap": -1, "width": 0, "height": "1"}, min_values={"width": 1})
+    assert list(excinfo.value.errors) == ["gap", "width", "height"]
+
+
 def test_validate_dimension_enforces_bounds() -> None:
     """Dimensions must be ints within the specified range."""
     assert validate_dimension(10, field_name="width", min_value=1, max_value=20) == 10